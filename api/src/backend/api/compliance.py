@@ -7,6 +7,7 @@ from api.models import Provider
 
 PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE = {}
 PROWLER_CHECKS = {}
+PROWLER_REQUIREMENTS_BY_CHECK = {}
 
 
 def get_prowler_provider_checks(provider_type: Provider.ProviderChoices):
@@ -50,11 +51,13 @@ def load_prowler_compliance():
 
     This function retrieves compliance data for all supported provider types,
     generates a compliance overview template, and populates the global variables
-    `PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE` and `PROWLER_CHECKS` with read-only mappings
-    of the compliance templates and checks, respectively.
+    `PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE`, `PROWLER_CHECKS` and `PROWLER_REQUIREMENTS_BY_CHECK`
+    with read-only mappings of the compliance templates, the checks and the requirements of each
+    check, respectively.
     """
     global PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE
     global PROWLER_CHECKS
+    global PROWLER_REQUIREMENTS_BY_CHECK
 
     prowler_compliance = {
         provider_type: get_prowler_provider_compliance(provider_type)
@@ -63,6 +66,9 @@ def load_prowler_compliance():
     template = generate_compliance_overview_template(prowler_compliance)
     PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE = MappingProxyType(template)
     PROWLER_CHECKS = MappingProxyType(load_prowler_checks(prowler_compliance))
+    PROWLER_REQUIREMENTS_BY_CHECK = MappingProxyType(
+        load_prowler_requirements_by_check(template)
+    )
 
 
 def load_prowler_checks(prowler_compliance):
@@ -98,38 +104,115 @@ def load_prowler_checks(prowler_compliance):
     return checks
 
 
-def generate_scan_compliance(
-    compliance_overview, provider_type: str, check_id: str, status: str
-):
+def load_prowler_requirements_by_check(template: dict) -> dict:
     """
-    Update the compliance overview with the status of a specific check.
+    Generate a mapping of checks to the compliance requirements that include them.
 
-    This function updates the compliance overview by setting the status of the given check
-    within all compliance frameworks and requirements that include it. It then updates the
-    requirement status to 'FAIL' if any of its checks have failed, and adjusts the counts
-    of passed and failed requirements in the compliance overview.
+    This function processes the compliance overview template and creates a dictionary
+    mapping each provider type to a dictionary where each check ID maps to the
+    (compliance name, requirement ID) pairs of the requirements that include that check.
 
     Args:
-        compliance_overview (dict): The compliance overview data structure to update.
-        provider_type (str): The provider type (e.g., 'aws', 'azure') associated with the check.
-        check_id (str): The identifier of the check whose status is being updated.
-        status (str): The status of the check (e.g., 'PASS', 'FAIL', 'MUTED').
+        template (dict): The compliance overview template for all provider types,
+            as returned by `generate_compliance_overview_template`.
 
     Returns:
-        None: This function modifies the compliance_overview in place.
+        dict: A nested dictionary where the first-level keys are provider types,
+            and the values are dictionaries mapping check IDs to tuples of
+            (compliance name, requirement ID) pairs.
+    """
+    requirements_by_check = {}
+    for provider_type, provider_compliance in template.items():
+        provider_requirements = {}
+        for compliance_name, compliance in provider_compliance.items():
+            for requirement_id, requirement in compliance["requirements"].items():
+                for check_id in requirement["checks"]:
+                    provider_requirements.setdefault(check_id, []).append(
+                        (compliance_name, requirement_id)
+                    )
+        requirements_by_check[provider_type] = {
+            check_id: tuple(requirements)
+            for check_id, requirements in provider_requirements.items()
+        }
+    return requirements_by_check
+
+
+def generate_scan_compliance_overviews(
+    compliance_template: dict,
+    provider_type: str,
+    check_status_by_region: dict,
+    regions=(),
+) -> dict:
+    """
+    Generate the compliance overview of every region from the status of its checks.
+
+    This function goes once over the check statuses of each region and, using
+    `PROWLER_REQUIREMENTS_BY_CHECK`, only visits the requirements that include each check.
+    A requirement is 'FAIL' if any of its checks have failed, and the counts of passed and
+    failed requirements are adjusted accordingly.
+
+    The template is never modified: only the compliance frameworks and requirements that
+    include a check with a status are copied, the rest is shared with the template. The
+    returned overviews must therefore be treated as read-only.
+
+    Args:
+        compliance_template (dict): The compliance overview template of the provider type.
+        provider_type (str): The provider type (e.g., 'aws', 'azure') associated with the checks.
+        check_status_by_region (dict): A dictionary mapping each region to a dictionary of
+            check IDs and their status (e.g., 'PASS', 'FAIL').
+        regions (Iterable[str]): Additional regions whose overview is the template, if they
+            have no check statuses.
+
+    Returns:
+        dict: A dictionary mapping each region to its compliance overview, structured by
+            compliance framework like the template.
     """
-    for compliance_id in PROWLER_CHECKS[provider_type][check_id]:
-        for requirement in compliance_overview[compliance_id]["requirements"].values():
-            if check_id in requirement["checks"]:
-                requirement["checks"][check_id] = status
-                requirement["checks_status"][status.lower()] += 1
-
-            if requirement["status"] != "FAIL" and any(
-                value == "FAIL" for value in requirement["checks"].values()
+    requirements_by_check = PROWLER_REQUIREMENTS_BY_CHECK[provider_type]
+    compliance_overview_by_region = {region: compliance_template for region in regions}
+
+    for region, check_status in check_status_by_region.items():
+        # Statuses of the checks of each requirement, by compliance name and requirement ID
+        requirement_checks = {}
+        for check_id, status in check_status.items():
+            for compliance_name, requirement_id in requirements_by_check.get(
+                check_id, ()
             ):
-                requirement["status"] = "FAIL"
-                compliance_overview[compliance_id]["requirements_status"]["passed"] -= 1
-                compliance_overview[compliance_id]["requirements_status"]["failed"] += 1
+                requirement_checks.setdefault(compliance_name, {}).setdefault(
+                    requirement_id, {}
+                )[check_id] = status
+
+        compliance_overview = dict(compliance_template)
+        for compliance_name, checks_by_requirement in requirement_checks.items():
+            compliance = compliance_template[compliance_name]
+            requirements = dict(compliance["requirements"])
+            failed_requirements = 0
+            for requirement_id, checks in checks_by_requirement.items():
+                requirement = requirements[requirement_id]
+                checks_status = dict(requirement["checks_status"])
+                for status in checks.values():
+                    checks_status[status.lower()] += 1
+                requirement_failed = checks_status["fail"] > 0
+                failed_requirements += requirement_failed
+                requirements[requirement_id] = {
+                    **requirement,
+                    "checks": {**requirement["checks"], **checks},
+                    "checks_status": checks_status,
+                    "status": "FAIL" if requirement_failed else requirement["status"],
+                }
+
+            requirements_status = compliance["requirements_status"]
+            compliance_overview[compliance_name] = {
+                **compliance,
+                "requirements": requirements,
+                "requirements_status": {
+                    **requirements_status,
+                    "passed": requirements_status["passed"] - failed_requirements,
+                    "failed": requirements_status["failed"] + failed_requirements,
+                },
+            }
+        compliance_overview_by_region[region] = compliance_overview
+
+    return compliance_overview_by_region
 
 
 def generate_compliance_overview_template(prowler_compliance: dict):
@@ -105,13 +105,14 @@ def generate_random_token(length: int = 14, symbols: str | None = None) -> str:
     return "".join(secrets.choice(symbols or _symbols) for _ in range(length))
 
 
-def batch_delete(queryset, batch_size=5000):
+def batch_delete(queryset, batch_size=5000, progress_callback=None):
     """
     Deletes objects in batches and returns the total number of deletions and a summary.
 
     Args:
         queryset (QuerySet): The queryset of objects to delete.
         batch_size (int): The number of objects to delete in each batch.
+        progress_callback (Callable[[dict], None] | None): Called with the deletion summary so far after each batch.
 
     Returns:
         tuple: (total_deleted, deletion_summary)
@@ -133,10 +134,62 @@ def batch_delete(queryset, batch_size=5000):
         total_deleted += deleted_count
         for model_label, count in deleted_info.items():
             deletion_summary[model_label] = deletion_summary.get(model_label, 0) + count
+        if progress_callback:
+            progress_callback(dict(deletion_summary))
 
     return total_deleted, deletion_summary
 
 
+def create_index_on_partitions(
+    apps, schema_editor, parent_table: str, index_name: str, index_details: str
+):
+    """
+    Create an index concurrently on every partition of a partitioned table.
+
+    PostgreSQL does not allow CONCURRENTLY inside a transaction, so the migration running this must set
+    `atomic = False`. The index on the parent table is added afterwards, in a separate migration, and attaches the
+    existing partition indexes instead of building them again.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT inhrelid::regclass::text
+            FROM pg_inherits
+            WHERE inhparent = %s::regclass;
+        """,
+            [parent_table],
+        )
+        partitions = [row[0] for row in cursor.fetchall()]
+
+    for partition in partitions:
+        sql = (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition.replace('.', '_')}_{index_name} ON {partition} "
+            f"{index_details};"
+        )
+        schema_editor.execute(sql)
+
+
+def drop_index_on_partitions(apps, schema_editor, parent_table: str, index_name: str):
+    """
+    Drop concurrently the index created with `create_index_on_partitions` on every partition of a partitioned table.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT inhrelid::regclass::text
+            FROM pg_inherits
+            WHERE inhparent = %s::regclass;
+        """,
+            [parent_table],
+        )
+        partitions = [row[0] for row in cursor.fetchall()]
+
+    for partition in partitions:
+        partition_index = f"{partition.replace('.', '_')}_{index_name}"
+        sql = f"DROP INDEX CONCURRENTLY IF EXISTS {partition_index};"
+        schema_editor.execute(sql)
+
+
 # Postgres Enums
 
 
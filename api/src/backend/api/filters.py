@@ -26,6 +26,7 @@ from api.models import (
     Finding,
     Integration,
     Invitation,
+    LatestScanSummary,
     Membership,
     PermissionChoices,
     Provider,
@@ -629,7 +630,20 @@ class ScanSummaryFilter(FilterSet):
         }
 
 
-class ServiceOverviewFilter(ScanSummaryFilter):
+class LatestScanSummaryFilter(ScanSummaryFilter):
+    provider_id = UUIDFilter(field_name="provider__id", lookup_expr="exact")
+    provider_type = ChoiceFilter(
+        field_name="provider__provider", choices=Provider.ProviderChoices.choices
+    )
+    provider_type__in = ChoiceInFilter(
+        field_name="provider__provider", choices=Provider.ProviderChoices.choices
+    )
+
+    class Meta(ScanSummaryFilter.Meta):
+        model = LatestScanSummary
+
+
+class ServiceOverviewFilter(LatestScanSummaryFilter):
     muted_findings = None
 
     def is_valid(self):
@@ -0,0 +1,167 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import api.db_utils
+from api.db_router import MainRouter
+from api.rls import RowLevelSecurityConstraint
+
+SUMMARY_FIELDS = (
+    "inserted_at",
+    "check_id",
+    "service",
+    "severity",
+    "region",
+    "_pass",
+    "fail",
+    "muted",
+    "total",
+    "new",
+    "changed",
+    "unchanged",
+    "fail_new",
+    "fail_changed",
+    "pass_new",
+    "pass_changed",
+    "muted_new",
+    "muted_changed",
+)
+
+
+def populate_latest_scan_summaries(apps, schema_editor):
+    Scan = apps.get_model("api", "Scan")
+    ScanSummary = apps.get_model("api", "ScanSummary")
+    LatestScanSummary = apps.get_model("api", "LatestScanSummary")
+
+    latest_scans = (
+        Scan.objects.using(MainRouter.admin_db)
+        .filter(state="completed")
+        .order_by("provider_id", "-inserted_at")
+        .distinct("provider_id")
+    )
+    for scan in latest_scans:
+        LatestScanSummary.objects.using(MainRouter.admin_db).bulk_create(
+            [
+                LatestScanSummary(
+                    tenant_id=scan.tenant_id,
+                    provider_id=scan.provider_id,
+                    scan_id=scan.id,
+                    **{field: getattr(summary, field) for field in SUMMARY_FIELDS},
+                )
+                for summary in ScanSummary.objects.using(MainRouter.admin_db).filter(
+                    scan_id=scan.id
+                )
+            ],
+            batch_size=3000,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0016_findings_inserted_at_index_parent"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LatestScanSummary",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("inserted_at", models.DateTimeField(editable=False)),
+                ("check_id", models.CharField(max_length=100)),
+                ("service", models.TextField()),
+                (
+                    "severity",
+                    api.db_utils.SeverityEnumField(
+                        choices=[
+                            ("critical", "Critical"),
+                            ("high", "High"),
+                            ("medium", "Medium"),
+                            ("low", "Low"),
+                            ("informational", "Informational"),
+                        ]
+                    ),
+                ),
+                ("region", models.TextField()),
+                ("_pass", models.IntegerField(db_column="pass", default=0)),
+                ("fail", models.IntegerField(default=0)),
+                ("muted", models.IntegerField(default=0)),
+                ("total", models.IntegerField(default=0)),
+                ("new", models.IntegerField(default=0)),
+                ("changed", models.IntegerField(default=0)),
+                ("unchanged", models.IntegerField(default=0)),
+                ("fail_new", models.IntegerField(default=0)),
+                ("fail_changed", models.IntegerField(default=0)),
+                ("pass_new", models.IntegerField(default=0)),
+                ("pass_changed", models.IntegerField(default=0)),
+                ("muted_new", models.IntegerField(default=0)),
+                ("muted_changed", models.IntegerField(default=0)),
+                (
+                    "provider",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="latest_scan_summaries",
+                        related_query_name="latest_scan_summary",
+                        to="api.provider",
+                    ),
+                ),
+                (
+                    "scan",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="latest_aggregations",
+                        related_query_name="latest_aggregation",
+                        to="api.scan",
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="api.tenant"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "latest_scan_summaries",
+                "abstract": False,
+                "indexes": [
+                    models.Index(
+                        fields=["tenant_id", "provider_id"],
+                        name="latest_summaries_tenant_prov",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "tenant",
+                            "provider",
+                            "check_id",
+                            "service",
+                            "severity",
+                            "region",
+                        ),
+                        name="unique_latest_scan_summary",
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="latestscansummary",
+            constraint=RowLevelSecurityConstraint(
+                "tenant_id",
+                name="rls_on_latestscansummary",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ),
+        migrations.RunPython(
+            populate_latest_scan_summaries, reverse_code=migrations.RunPython.noop
+        ),
+    ]
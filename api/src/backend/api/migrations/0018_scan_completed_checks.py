@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0017_latest_scan_summaries"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scan",
+            name="completed_checks",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -416,6 +416,8 @@ class Scan(RowLevelSecurityProtectedModel):
         PeriodicTask, on_delete=models.CASCADE, null=True, blank=True
     )
     output_location = models.CharField(blank=True, null=True, max_length=200)
+    # The checks completed by the scan, so the scan is resumed skipping them if it is interrupted
+    completed_checks = models.JSONField(default=list, blank=True)
     # TODO: mutelist foreign key
 
     class Meta(RowLevelSecurityProtectedModel.Meta):
@@ -720,6 +722,10 @@ class Finding(PostgresPartitionedModel, RowLevelSecurityProtectedModel):
                 condition=Q(delta="new"),
                 name="find_delta_new_idx",
             ),
+            models.Index(
+                fields=["tenant_id", "inserted_at", "id"],
+                name="find_tenant_inserted_id_idx",
+            ),
         ]
 
     class JSONAPIMeta:
@@ -1141,6 +1147,84 @@ class ScanSummary(RowLevelSecurityProtectedModel):
         resource_name = "scan-summaries"
 
 
+class LatestScanSummary(RowLevelSecurityProtectedModel):
+    """
+    Copy of the `ScanSummary` rows of the latest completed scan of each provider.
+
+    The `scan-summary` task replaces the rows of a provider when one of its scans completes, so the overview endpoints
+    aggregate this table directly instead of looking for the latest scan of every provider on each request.
+    """
+
+    objects = ActiveProviderManager()
+    all_objects = models.Manager()
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    # The `inserted_at` of the copied `ScanSummary` row
+    inserted_at = models.DateTimeField(editable=False)
+    check_id = models.CharField(max_length=100, blank=False, null=False)
+    service = models.TextField(blank=False)
+    severity = SeverityEnumField(choices=SeverityChoices)
+    region = models.TextField(blank=False)
+    _pass = models.IntegerField(db_column="pass", default=0)
+    fail = models.IntegerField(default=0)
+    muted = models.IntegerField(default=0)
+    total = models.IntegerField(default=0)
+    new = models.IntegerField(default=0)
+    changed = models.IntegerField(default=0)
+    unchanged = models.IntegerField(default=0)
+
+    fail_new = models.IntegerField(default=0)
+    fail_changed = models.IntegerField(default=0)
+    pass_new = models.IntegerField(default=0)
+    pass_changed = models.IntegerField(default=0)
+    muted_new = models.IntegerField(default=0)
+    muted_changed = models.IntegerField(default=0)
+
+    provider = models.ForeignKey(
+        Provider,
+        on_delete=models.CASCADE,
+        related_name="latest_scan_summaries",
+        related_query_name="latest_scan_summary",
+    )
+    scan = models.ForeignKey(
+        Scan,
+        on_delete=models.CASCADE,
+        related_name="latest_aggregations",
+        related_query_name="latest_aggregation",
+    )
+
+    class Meta(RowLevelSecurityProtectedModel.Meta):
+        db_table = "latest_scan_summaries"
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=(
+                    "tenant",
+                    "provider",
+                    "check_id",
+                    "service",
+                    "severity",
+                    "region",
+                ),
+                name="unique_latest_scan_summary",
+            ),
+            RowLevelSecurityConstraint(
+                field="tenant_id",
+                name="rls_on_%(class)s",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["tenant_id", "provider_id"],
+                name="latest_summaries_tenant_prov",
+            )
+        ]
+
+    class JSONAPIMeta:
+        resource_name = "latest-scan-summaries"
+
+
 class Integration(RowLevelSecurityProtectedModel):
     class IntegrationChoices(models.TextChoices):
         S3 = "amazon_s3", _("Amazon S3")
@@ -1,6 +1,194 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from uuid import UUID
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import DataError
+from django.db.models import Q
+from drf_spectacular_jsonapi.schemas.pagination import (
+    JsonApiPageNumberPagination as SpectacularJsonApiPageNumberPagination,
+)
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework_json_api.pagination import JsonApiPageNumberPagination
 
 
 class ComplianceOverviewPagination(JsonApiPageNumberPagination):
     page_size = 50
     max_page_size = 100
+
+
+class JsonApiKeysetPagination(SpectacularJsonApiPageNumberPagination):
+    """
+    Page number pagination that switches to keyset (cursor) pagination when the `page[cursor]` parameter is given.
+
+    The keyset pagination filters by the sort fields of the last row seen instead of using an OFFSET, so every page
+    costs the same however deep it is. The primary key is always added to the sort fields as a tie-breaker. The
+    `page[cursor]` parameter is empty for the first page, and the `next` and `prev` links carry the cursors of the
+    following pages. The sort fields must not be nullable.
+
+    The keyset page is the list of the primary keys of the rows, in order, so the view fetches the rows afterwards.
+    """
+
+    cursor_query_param = "page[cursor]"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor = None
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset, view)
+        self.cursor = self.decode_cursor(request.query_params[self.cursor_query_param])
+
+        reverse = self.cursor is not None and self.cursor["reverse"]
+        ordering = (
+            [self.invert_order(order) for order in self.ordering]
+            if reverse
+            else self.ordering
+        )
+        try:
+            if self.cursor is not None:
+                queryset = queryset.filter(
+                    self.get_keyset_filter(
+                        self.ordering, self.cursor["position"], reverse
+                    )
+                )
+            rows = list(
+                queryset.order_by(*ordering).values_list(
+                    *[order.lstrip("-") for order in self.ordering]
+                )[: self.page_size + 1]
+            )
+        except (DjangoValidationError, DataError, TypeError, ValueError):
+            # The values of the cursor are not valid for the sort fields
+            raise NotFound(self.invalid_cursor_message)
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # Going backwards there is always a next page, and going forwards there is a previous one unless it is the first
+        self.next_position = rows[-1] if rows and (has_more or reverse) else None
+        self.previous_position = (
+            rows[0]
+            if rows and self.cursor is not None and (has_more or not reverse)
+            else None
+        )
+        return [row[-1] for row in rows]
+
+    def get_paginated_response(self, data):
+        if self.cursor_query_param not in self.request.query_params:
+            return super().get_paginated_response(data)
+
+        return Response(
+            {
+                "results": data,
+                "meta": {"pagination": {"size": self.page_size}},
+                "links": {
+                    "first": self.build_cursor_link(""),
+                    "next": (
+                        self.build_cursor_link(
+                            self.encode_cursor(self.next_position, reverse=False)
+                        )
+                        if self.next_position is not None
+                        else None
+                    ),
+                    "prev": (
+                        self.build_cursor_link(
+                            self.encode_cursor(self.previous_position, reverse=True)
+                        )
+                        if self.previous_position is not None
+                        else None
+                    ),
+                },
+            }
+        )
+
+    @staticmethod
+    def get_ordering(queryset, view) -> list[str]:
+        ordering = [
+            order
+            for order in (
+                queryset.query.order_by or getattr(view, "ordering", None) or []
+            )
+            if isinstance(order, str)
+        ]
+        primary_key = queryset.model._meta.pk.name
+        if not {primary_key, f"-{primary_key}", "pk", "-pk"} & set(ordering):
+            # The primary key goes in the same direction as the last sort field, e.g. UUIDv7 IDs follow inserted_at
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append(f"-{primary_key}" if descending else primary_key)
+        return ordering
+
+    @staticmethod
+    def invert_order(order: str) -> str:
+        return order[1:] if order.startswith("-") else f"-{order}"
+
+    @staticmethod
+    def get_keyset_filter(ordering: list[str], position: list, reverse: bool) -> Q:
+        """
+        Build the filter of the rows after the given position, e.g. for `-inserted_at,-id`:
+        inserted_at <= position[0] AND (inserted_at < position[0] OR (inserted_at = position[0] AND id < position[1]))
+
+        The redundant bound on the first field lets the database start the index scan at the position.
+        """
+        keyset_filter = Q()
+        previous_fields = {}
+        for order, value in zip(ordering, position):
+            field = order.lstrip("-")
+            descending = order.startswith("-") != reverse
+            keyset_filter |= Q(
+                **previous_fields, **{f"{field}__{'lt' if descending else 'gt'}": value}
+            )
+            previous_fields[field] = value
+
+        first_field = ordering[0].lstrip("-")
+        first_descending = ordering[0].startswith("-") != reverse
+        return (
+            Q(**{f"{first_field}__{'lte' if first_descending else 'gte'}": position[0]})
+            & keyset_filter
+        )
+
+    @staticmethod
+    def _serialize_cursor_value(value):
+        """Serialize a value of the position to JSON, the dates in ISO format and the UUIDs as strings."""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, UUID):
+            return str(value)
+        return value
+
+    def encode_cursor(self, position: tuple, reverse: bool) -> str:
+        cursor = {
+            "o": self.ordering,
+            "p": [self._serialize_cursor_value(value) for value in position],
+            "r": reverse,
+        }
+        return base64.urlsafe_b64encode(
+            json.dumps(cursor, separators=(",", ":")).encode()
+        ).decode()
+
+    def decode_cursor(self, encoded_cursor: str) -> dict | None:
+        if not encoded_cursor:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded_cursor.encode()))
+            position = cursor["p"]
+            reverse = bool(cursor["r"])
+            # A cursor is only valid for the sort it was created with
+            if cursor["o"] != self.ordering or len(position) != len(self.ordering):
+                raise ValueError("The sort of the cursor does not match")
+        except (binascii.Error, TypeError, KeyError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return {"position": position, "reverse": reverse}
+
+    def build_cursor_link(self, cursor: str) -> str:
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.page_query_param
+        )
+        return replace_query_param(url, self.cursor_query_param, cursor)
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from unittest.mock import patch, MagicMock
 
 from api.compliance import (
@@ -5,7 +6,8 @@ from api.compliance import (
     get_prowler_provider_compliance,
     load_prowler_compliance,
     load_prowler_checks,
-    generate_scan_compliance,
+    load_prowler_requirements_by_check,
+    generate_scan_compliance_overviews,
     generate_compliance_overview_template,
 )
 from api.models import Provider
@@ -39,8 +41,10 @@ class TestCompliance:
     @patch("api.compliance.get_prowler_provider_compliance")
     @patch("api.compliance.generate_compliance_overview_template")
     @patch("api.compliance.load_prowler_checks")
+    @patch("api.compliance.load_prowler_requirements_by_check")
     def test_load_prowler_compliance(
         self,
+        mock_load_prowler_requirements_by_check,
         mock_load_prowler_checks,
         mock_generate_compliance_overview_template,
         mock_get_prowler_provider_compliance,
@@ -66,15 +70,25 @@ class TestCompliance:
         }
 
         mock_load_prowler_checks.return_value = {"checks_key": "checks_value"}
+        mock_load_prowler_requirements_by_check.return_value = {
+            "requirements_key": "requirements_value"
+        }
 
         load_prowler_compliance()
 
-        from api.compliance import PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE, PROWLER_CHECKS
+        from api.compliance import (
+            PROWLER_CHECKS,
+            PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE,
+            PROWLER_REQUIREMENTS_BY_CHECK,
+        )
 
         assert PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE == {
             "template_key": "template_value"
         }
         assert PROWLER_CHECKS == {"checks_key": "checks_value"}
+        assert PROWLER_REQUIREMENTS_BY_CHECK == {
+            "requirements_key": "requirements_value"
+        }
 
         expected_prowler_compliance = compliance_data_dict
         mock_get_prowler_provider_compliance.assert_any_call("aws")
@@ -83,6 +97,9 @@ class TestCompliance:
             expected_prowler_compliance
         )
         mock_load_prowler_checks.assert_called_once_with(expected_prowler_compliance)
+        mock_load_prowler_requirements_by_check.assert_called_once_with(
+            {"template_key": "template_value"}
+        )
 
     @patch("api.compliance.get_prowler_provider_checks")
     @patch("api.models.Provider.ProviderChoices")
@@ -117,14 +134,48 @@ class TestCompliance:
         assert checks == expected_checks
         mock_get_prowler_provider_checks.assert_called_once_with("aws")
 
-    @patch("api.compliance.PROWLER_CHECKS", new_callable=dict)
-    def test_generate_scan_compliance(self, mock_prowler_checks):
-        mock_prowler_checks["aws"] = {
-            "check1": {"compliance1"},
-            "check2": {"compliance1", "compliance2"},
+    def test_load_prowler_requirements_by_check(self):
+        template = {
+            "aws": {
+                "compliance1": {
+                    "requirements": {
+                        "requirement1": {"checks": {"check1": None, "check2": None}},
+                        "requirement2": {"checks": {"check2": None}},
+                        "requirement3": {"checks": {}},
+                    }
+                },
+                "compliance2": {
+                    "requirements": {"requirement1": {"checks": {"check2": None}}}
+                },
+            },
+            "azure": {},
         }
 
-        compliance_overview = {
+        requirements_by_check = load_prowler_requirements_by_check(template)
+
+        assert requirements_by_check == {
+            "aws": {
+                "check1": (("compliance1", "requirement1"),),
+                "check2": (
+                    ("compliance1", "requirement1"),
+                    ("compliance1", "requirement2"),
+                    ("compliance2", "requirement1"),
+                ),
+            },
+            "azure": {},
+        }
+
+    @patch("api.compliance.PROWLER_REQUIREMENTS_BY_CHECK", new_callable=dict)
+    def test_generate_scan_compliance_overviews(self, mock_requirements_by_check):
+        mock_requirements_by_check["aws"] = {
+            "check1": (("compliance1", "requirement1"),),
+            "check2": (
+                ("compliance1", "requirement1"),
+                ("compliance2", "requirement2"),
+            ),
+        }
+
+        compliance_template = {
             "compliance1": {
                 "requirements": {
                     "requirement1": {
@@ -156,13 +207,21 @@ class TestCompliance:
                 "requirements_status": {"passed": 1, "failed": 0, "manual": 0},
             },
         }
+        template_copy = deepcopy(compliance_template)
 
-        provider_type = "aws"
-        check_id = "check2"
-        status = "FAIL"
+        compliance_overview_by_region = generate_scan_compliance_overviews(
+            compliance_template,
+            "aws",
+            {"region1": {"check2": "FAIL"}, "region2": {"check1": "PASS"}},
+            ["region1", "region3"],
+        )
 
-        generate_scan_compliance(compliance_overview, provider_type, check_id, status)
+        assert set(compliance_overview_by_region) == {"region1", "region2", "region3"}
+        # The template is not modified, and is the overview of the regions without statuses
+        assert compliance_template == template_copy
+        assert compliance_overview_by_region["region3"] == compliance_template
 
+        compliance_overview = compliance_overview_by_region["region1"]
         assert (
             compliance_overview["compliance1"]["requirements"]["requirement1"][
                 "checks"
@@ -208,6 +267,15 @@ class TestCompliance:
             is None
         )
 
+        compliance_overview = compliance_overview_by_region["region2"]
+        requirement = compliance_overview["compliance1"]["requirements"]["requirement1"]
+        assert requirement["checks"] == {"check1": "PASS", "check2": None}
+        assert requirement["checks_status"]["pass"] == 1
+        assert requirement["status"] == "PASS"
+        assert compliance_overview["compliance1"]["requirements_status"]["passed"] == 1
+        assert compliance_overview["compliance1"]["requirements_status"]["failed"] == 0
+        assert compliance_overview["compliance2"] is compliance_template["compliance2"]
+
     @patch("api.models.Provider.ProviderChoices")
     def test_generate_compliance_overview_template(self, mock_provider_choices):
         mock_provider_choices.values = ["aws"]
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 from enum import Enum
-from unittest.mock import patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
@@ -137,3 +137,16 @@ class TestBatchDelete:
         )
         assert Provider.objects.all().count() == 0
         assert summary == {"api.Provider": create_test_providers}
+
+    @pytest.mark.django_db
+    def test_batch_delete_progress_callback(self, create_test_providers):
+        progress_callback = MagicMock()
+        batch_delete(
+            Provider.objects.all(),
+            batch_size=create_test_providers // 2,
+            progress_callback=progress_callback,
+        )
+        assert progress_callback.call_args_list == [
+            call({"api.Provider": create_test_providers // 2}),
+            call({"api.Provider": create_test_providers}),
+        ]
@@ -12,6 +12,7 @@ from conftest import API_JSON_CONTENT_TYPE, TEST_PASSWORD, TEST_USER
 from django.conf import settings
 from django.urls import reverse
 from rest_framework import status
+from tasks.jobs.scan import update_latest_scan_summaries
 
 from api.models import (
     Integration,
@@ -24,6 +25,7 @@ from api.models import (
     Role,
     RoleProviderGroupRelationship,
     Scan,
+    ScanSummary,
     StateChoices,
     Task,
     User,
@@ -2806,6 +2808,83 @@ class TestFindingViewSet:
             response.json()["errors"][0]["detail"] == "invalid sort parameter: invalid"
         )
 
+    @pytest.mark.parametrize(
+        "sort_field",
+        [
+            None,
+            "severity",
+            "-status,check_id",
+            "updated_at",
+        ],
+    )
+    def test_findings_list_cursor_pagination(
+        self, authenticated_client, findings_fixture, sort_field
+    ):
+        params = {"filter[inserted_at]": TODAY, "page[size]": 1, "page[cursor]": ""}
+        if sort_field:
+            params["sort"] = sort_field
+        response = authenticated_client.get(reverse("finding-list"), params)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["links"]["prev"] is None
+
+        # Walk the pages forwards
+        finding_ids = []
+        while True:
+            assert len(response.json()["data"]) == 1
+            finding_ids.append(response.json()["data"][0]["id"])
+            next_link = response.json()["links"]["next"]
+            if next_link is None:
+                break
+            response = authenticated_client.get(next_link)
+            assert response.status_code == status.HTTP_200_OK
+        assert sorted(finding_ids) == sorted(
+            str(finding.id) for finding in findings_fixture
+        )
+
+        # And backwards
+        previous_ids = [finding_ids[-1]]
+        while response.json()["links"]["prev"] is not None:
+            response = authenticated_client.get(response.json()["links"]["prev"])
+            assert response.status_code == status.HTTP_200_OK
+            previous_ids.append(response.json()["data"][0]["id"])
+        assert previous_ids == finding_ids[::-1]
+
+    def test_findings_list_cursor_pagination_order(
+        self, authenticated_client, findings_fixture
+    ):
+        finding_1, finding_2 = findings_fixture
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "sort": "severity", "page[cursor]": ""},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        # The severities sort in the order of the enum, critical before medium
+        assert [finding["id"] for finding in response.json()["data"]] == [
+            str(finding_1.id),
+            str(finding_2.id),
+        ]
+        assert response.json()["links"]["next"] is None
+        assert response.json()["meta"]["pagination"] == {"size": 10}
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "invalid",
+            # A cursor of another sort
+            "eyJvIjpbInN0YXR1cyIsImlkIl0sInAiOlsiRkFJTCIsImlkIl0sInIiOmZhbHNlfQ==",
+            # A cursor with invalid values
+            "eyJvIjpbIi1pbnNlcnRlZF9hdCIsIi1pZCJdLCJwIjpbImRhdGUiLCJpZCJdLCJyIjpmYWxzZX0=",
+        ],
+    )
+    def test_findings_list_cursor_pagination_invalid_cursor(
+        self, authenticated_client, findings_fixture, cursor
+    ):
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "page[cursor]": cursor},
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_findings_retrieve(self, authenticated_client, findings_fixture):
         finding_1, *_ = findings_fixture
         response = authenticated_client.get(
@@ -4529,6 +4608,58 @@ class TestOverviewViewSet:
             resources_fixture
         )
 
+    def test_overview_findings(self, authenticated_client, scan_summaries_fixture):
+        response = authenticated_client.get(reverse("overview-findings"))
+        assert response.status_code == status.HTTP_200_OK
+        attributes = response.json()["data"]["attributes"]
+        assert attributes["total"] == 4
+        assert attributes["pass"] == 2
+        assert attributes["fail"] == 1
+        assert attributes["muted"] == 1
+        assert attributes["new"] == 4
+
+    def test_overview_findings_severity(
+        self, authenticated_client, scan_summaries_fixture
+    ):
+        response = authenticated_client.get(reverse("overview-findings_severity"))
+        assert response.status_code == status.HTTP_200_OK
+        attributes = response.json()["data"]["attributes"]
+        assert attributes["critical"] == 1
+        assert attributes["high"] == 3
+        assert attributes["medium"] == 0
+
+    def test_overview_findings_latest_scan_only(
+        self, authenticated_client, scan_summaries_fixture, providers_fixture
+    ):
+        provider = providers_fixture[0]
+        scan = Scan.objects.create(
+            name="newer overview scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.COMPLETED,
+            tenant_id=provider.tenant_id,
+        )
+        ScanSummary.objects.create(
+            tenant_id=provider.tenant_id,
+            check_id="check1",
+            service="service1",
+            severity="high",
+            region="region1",
+            fail=5,
+            total=5,
+            scan=scan,
+        )
+        update_latest_scan_summaries(
+            tenant_id=str(provider.tenant_id), scan_id=str(scan.id)
+        )
+
+        response = authenticated_client.get(reverse("overview-findings"))
+        assert response.status_code == status.HTTP_200_OK
+        attributes = response.json()["data"]["attributes"]
+        assert attributes["total"] == 5
+        assert attributes["fail"] == 5
+        assert attributes["pass"] == 0
+
     def test_overview_services_list_no_required_filters(
         self, authenticated_client, scan_summaries_fixture
     ):
@@ -60,6 +60,7 @@ from api.filters import (
     FindingFilter,
     IntegrationFilter,
     InvitationFilter,
+    LatestScanSummaryFilter,
     MembershipFilter,
     ProviderFilter,
     ProviderGroupFilter,
@@ -67,7 +68,6 @@ from api.filters import (
     ResourceFilter,
     RoleFilter,
     ScanFilter,
-    ScanSummaryFilter,
     ServiceOverviewFilter,
     TaskFilter,
     TenantFilter,
@@ -78,6 +78,7 @@ from api.models import (
     Finding,
     Integration,
     Invitation,
+    LatestScanSummary,
     Membership,
     Provider,
     ProviderGroup,
@@ -88,14 +89,13 @@ from api.models import (
     Role,
     RoleProviderGroupRelationship,
     Scan,
-    ScanSummary,
     SeverityChoices,
     StateChoices,
     Task,
     User,
     UserRoleRelationship,
 )
-from api.pagination import ComplianceOverviewPagination
+from api.pagination import ComplianceOverviewPagination, JsonApiKeysetPagination
 from api.rbac.permissions import Permissions, get_providers, get_role
 from api.rls import Tenant
 from api.utils import CustomOAuth2Client, validate_invitation
@@ -1492,7 +1492,15 @@ class ResourceViewSet(BaseRLSViewSet):
                 description="At least one of the variations of the `filter[inserted_at]` filter must be provided.",
                 required=True,
                 type=OpenApiTypes.DATE,
-            )
+            ),
+            OpenApiParameter(
+                name="page[cursor]",
+                description="Use the cursor pagination instead of the page number, empty for the first page. The "
+                "`next` and `prev` links contain the cursors of the following pages. Its cost does not grow with the "
+                "depth of the page.",
+                required=False,
+                type=OpenApiTypes.STR,
+            ),
         ],
     ),
     retrieve=extend_schema(
@@ -1528,6 +1536,7 @@ class FindingViewSet(BaseRLSViewSet):
     queryset = Finding.all_objects.all()
     serializer_class = FindingSerializer
     filterset_class = FindingFilter
+    pagination_class = JsonApiKeysetPagination
     http_method_names = ["get"]
     ordering = ["-inserted_at"]
     ordering_fields = [
@@ -1609,8 +1618,13 @@ class FindingViewSet(BaseRLSViewSet):
                 .select_related("scan")
                 .prefetch_related("resources")
             )
-            # Re-sort in Python to preserve ordering:
-            findings = sorted(findings, key=lambda x: ids.index(x.id))
+            # Re-sort in Python to preserve ordering
+            findings_by_id = {finding.id: finding for finding in findings}
+            findings = [
+                findings_by_id[finding_id]
+                for finding_id in ids
+                if finding_id in findings_by_id
+            ]
             serializer = self.get_serializer(findings, many=True)
             return self.get_paginated_response(serializer.data)
         serializer = self.get_serializer(base_qs, many=True)
@@ -2196,7 +2210,7 @@ class OverviewViewSet(BaseRLSViewSet):
         if self.action == "providers":
             return _get_filtered_queryset(Finding)
         elif self.action in ("findings", "findings_severity", "services"):
-            return _get_filtered_queryset(ScanSummary)
+            return _get_filtered_queryset(LatestScanSummary)
         else:
             return super().get_queryset()
 
@@ -2215,7 +2229,7 @@ class OverviewViewSet(BaseRLSViewSet):
         if self.action == "providers":
             return None
         elif self.action in ["findings", "findings_severity"]:
-            return ScanSummaryFilter
+            return LatestScanSummaryFilter
         elif self.action == "services":
             return ServiceOverviewFilter
         return None
@@ -2232,19 +2246,9 @@ class OverviewViewSet(BaseRLSViewSet):
     def providers(self, request):
         tenant_id = self.request.tenant_id
 
-        latest_scan_ids = (
-            Scan.objects.filter(
-                tenant_id=tenant_id,
-                state=StateChoices.COMPLETED,
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
-
         findings_aggregated = (
-            ScanSummary.objects.filter(tenant_id=tenant_id, scan_id__in=latest_scan_ids)
-            .values("scan__provider__provider")
+            LatestScanSummary.objects.filter(tenant_id=tenant_id)
+            .values("provider__provider")
             .annotate(
                 findings_passed=Coalesce(Sum("_pass"), 0),
                 findings_failed=Coalesce(Sum("fail"), 0),
@@ -2265,7 +2269,7 @@ class OverviewViewSet(BaseRLSViewSet):
 
         overview = []
         for row in findings_aggregated:
-            provider_type = row["scan__provider__provider"]
+            provider_type = row["provider__provider"]
             overview.append(
                 {
                     "provider": provider_type,
@@ -2282,26 +2286,9 @@ class OverviewViewSet(BaseRLSViewSet):
 
     @action(detail=False, methods=["get"], url_name="findings")
     def findings(self, request):
-        tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
         filtered_queryset = self.filter_queryset(queryset)
 
-        latest_scan_subquery = (
-            Scan.objects.filter(
-                tenant_id=tenant_id,
-                state=StateChoices.COMPLETED,
-                provider_id=OuterRef("scan__provider_id"),
-            )
-            .order_by("-inserted_at")
-            .values("id")[:1]
-        )
-
-        annotated_queryset = filtered_queryset.annotate(
-            latest_scan_id=Subquery(latest_scan_subquery)
-        )
-
-        filtered_queryset = annotated_queryset.filter(scan_id=F("latest_scan_id"))
-
         aggregated_totals = filtered_queryset.aggregate(
             _pass=Sum("_pass") or 0,
             fail=Sum("fail") or 0,
@@ -2327,26 +2314,9 @@ class OverviewViewSet(BaseRLSViewSet):
 
     @action(detail=False, methods=["get"], url_name="findings_severity")
     def findings_severity(self, request):
-        tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
         filtered_queryset = self.filter_queryset(queryset)
 
-        latest_scan_subquery = (
-            Scan.objects.filter(
-                tenant_id=tenant_id,
-                state=StateChoices.COMPLETED,
-                provider_id=OuterRef("scan__provider_id"),
-            )
-            .order_by("-inserted_at")
-            .values("id")[:1]
-        )
-
-        annotated_queryset = filtered_queryset.annotate(
-            latest_scan_id=Subquery(latest_scan_subquery)
-        )
-
-        filtered_queryset = annotated_queryset.filter(scan_id=F("latest_scan_id"))
-
         severity_counts = (
             filtered_queryset.values("severity")
             .annotate(count=Sum("total"))
@@ -2363,26 +2333,9 @@ class OverviewViewSet(BaseRLSViewSet):
 
     @action(detail=False, methods=["get"], url_name="services")
     def services(self, request):
-        tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
         filtered_queryset = self.filter_queryset(queryset)
 
-        latest_scan_subquery = (
-            Scan.objects.filter(
-                tenant_id=tenant_id,
-                state=StateChoices.COMPLETED,
-                provider_id=OuterRef("scan__provider_id"),
-            )
-            .order_by("-inserted_at")
-            .values("id")[:1]
-        )
-
-        annotated_queryset = filtered_queryset.annotate(
-            latest_scan_id=Subquery(latest_scan_subquery)
-        )
-
-        filtered_queryset = annotated_queryset.filter(scan_id=F("latest_scan_id"))
-
         services_data = (
             filtered_queryset.values("service")
             .annotate(_pass=Sum("_pass"))
@@ -11,3 +11,6 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
 CELERY_DEADLOCK_ATTEMPTS = env.int("DJANGO_CELERY_DEADLOCK_ATTEMPTS", default=5)
+CELERY_SCAN_FINDINGS_BATCH_SIZE = env.int(
+    "DJANGO_CELERY_SCAN_FINDINGS_BATCH_SIZE", default=500
+)
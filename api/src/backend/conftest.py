@@ -10,6 +10,7 @@ from django.urls import reverse
 from django_celery_results.models import TaskResult
 from rest_framework import status
 from rest_framework.test import APIClient
+from tasks.jobs.scan import update_latest_scan_summaries
 
 from api.db_utils import rls_transaction
 from api.models import (
@@ -878,6 +879,8 @@ def scan_summaries_fixture(tenants_fixture, providers_fixture):
         scan=scan,
     )
 
+    update_latest_scan_summaries(tenant_id=str(tenant.id), scan_id=str(scan.id))
+
 
 @pytest.fixture
 def integrations_fixture(providers_fixture):
@@ -1,19 +1,148 @@
+import re
+from datetime import datetime, timezone
+from typing import Callable
+
 from celery.utils.log import get_task_logger
-from django.db import transaction
+from django.db import connections, transaction
+from uuid6 import UUID
 
 from api.db_router import MainRouter
 from api.db_utils import batch_delete, rls_transaction
-from api.models import Finding, Provider, Resource, Scan, ScanSummary, Tenant
+from api.models import (
+    Finding,
+    Provider,
+    Resource,
+    ResourceFindingMapping,
+    Scan,
+    ScanSummary,
+    Tenant,
+)
+from api.uuid_utils import datetime_from_uuid7
 
 logger = get_task_logger(__name__)
 
+PARTITION_UPPER_BOUND_PATTERN = re.compile(r"TO \('(?P<upper_bound>[0-9a-f-]{36})'\)")
+
+
+def _merge_deletion_summary(deletion_summary: dict, summary: dict) -> dict:
+    for model_label, count in summary.items():
+        deletion_summary[model_label] = deletion_summary.get(model_label, 0) + count
+    return deletion_summary
+
+
+def _get_closed_partitions(cursor, parent_table: str) -> list[str]:
+    """
+    Return the UUIDv7 range partitions of the given table whose whole range is before the current month.
 
-def delete_provider(pk: str):
+    The default partition, and the partitions of the current and upcoming months, are never returned:
+    `pgpartition` creates those partitions only once, so dropping them would send new rows to the default partition.
+    """
+    cursor.execute(
+        """
+        SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+        FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE pg_inherits.inhparent = %s::regclass
+        ORDER BY child.relname;
+        """,
+        [parent_table],
+    )
+    current_month = datetime.now(timezone.utc).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    partitions = []
+    for partition, partition_bound in cursor.fetchall():
+        match = PARTITION_UPPER_BOUND_PATTERN.search(partition_bound)
+        if match and datetime_from_uuid7(UUID(match["upper_bound"])) < current_month:
+            partitions.append(partition)
+    return partitions
+
+
+def drop_owned_partitions(
+    tenant_id: str,
+    scan_ids: list[str] | None = None,
+    progress_callback: Callable[[dict], None] | None = None,
+) -> dict:
+    """
+    Detach and drop the findings partitions that only contain findings of the given tenant, or of the given scans.
+
+    Dropping a partition removes its rows without deleting them one by one, so it does not generate WAL per row. The
+    `resource_finding_mappings` partition with the same range is dropped first, since it references the findings.
+    Only the partitions of past months are considered, see `_get_closed_partitions`. The partitions that also contain
+    findings of other tenants or scans are kept, and their findings must be deleted in batches afterwards.
+
+    Each partition is dropped in its own transaction using the admin database, which owns the tables.
+
+    Args:
+        tenant_id (str): The tenant whose findings are deleted.
+        scan_ids (list[str] | None): If given, only the partitions containing findings of these scans are dropped.
+        progress_callback (Callable[[dict], None] | None): Called with the deletion summary after each partition.
+
+    Returns:
+        dict: A dictionary with the count of deleted objects per model.
+    """
+    deletion_summary = {}
+    foreign_rows_condition = "tenant_id <> %s"
+    foreign_rows_params = [tenant_id]
+    if scan_ids is not None:
+        foreign_rows_condition += " OR NOT scan_id = ANY(%s::uuid[])"
+        foreign_rows_params.append([str(scan_id) for scan_id in scan_ids])
+
+    connection = connections[MainRouter.admin_db]
+    with connection.cursor() as cursor:
+        partitions = _get_closed_partitions(cursor, Finding._meta.db_table)
+
+    for partition in partitions:
+        mappings_partition = partition.replace(
+            Finding._meta.db_table, ResourceFindingMapping._meta.db_table, 1
+        )
+        with transaction.atomic(using=MainRouter.admin_db):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT EXISTS (SELECT 1 FROM {partition} WHERE {foreign_rows_condition});",
+                    foreign_rows_params,
+                )
+                if cursor.fetchone()[0]:
+                    continue
+                cursor.execute(f"SELECT count(*) FROM {partition};")
+                findings_count = cursor.fetchone()[0]
+                if not findings_count:
+                    continue
+
+                summary = {Finding._meta.label: findings_count}
+                cursor.execute("SELECT to_regclass(%s);", [mappings_partition])
+                if cursor.fetchone()[0] is not None:
+                    cursor.execute(f"SELECT count(*) FROM {mappings_partition};")
+                    summary[ResourceFindingMapping._meta.label] = cursor.fetchone()[0]
+                    cursor.execute(
+                        f"ALTER TABLE {ResourceFindingMapping._meta.db_table} "
+                        f"DETACH PARTITION {mappings_partition};"
+                    )
+                    cursor.execute(f"DROP TABLE {mappings_partition};")
+                cursor.execute(
+                    f"ALTER TABLE {Finding._meta.db_table} DETACH PARTITION {partition};"
+                )
+                cursor.execute(f"DROP TABLE {partition};")
+
+        logger.info(f"Dropped partition {partition} of tenant {tenant_id}")
+        _merge_deletion_summary(deletion_summary, summary)
+        if progress_callback:
+            progress_callback(dict(deletion_summary))
+
+    return deletion_summary
+
+
+def delete_provider(pk: str, progress_callback: Callable[[dict], None] | None = None):
     """
     Gracefully deletes an instance of a provider along with its related data.
 
+    The findings partitions that only contain findings of the provider are dropped first, see
+    `drop_owned_partitions`. The rest of the related data is deleted in batches.
+
     Args:
         pk (str): The primary key of the Provider instance to delete.
+        progress_callback (Callable[[dict], None] | None): Called with the deletion summary so far after each
+            dropped partition and each deleted batch.
 
     Returns:
         dict: A dictionary with the count of deleted objects per model,
@@ -25,39 +154,64 @@ def delete_provider(pk: str):
     instance = Provider.all_objects.get(pk=pk)
     deletion_summary = {}
 
+    def report_progress(summary: dict):
+        if progress_callback:
+            progress_callback(_merge_deletion_summary(dict(deletion_summary), summary))
+
+    # Drop the findings partitions owned by the provider
+    scan_ids = list(
+        Scan.all_objects.filter(provider=instance).values_list("id", flat=True)
+    )
+    if scan_ids:
+        partitions_summary = drop_owned_partitions(
+            str(instance.tenant_id), scan_ids, progress_callback=report_progress
+        )
+        _merge_deletion_summary(deletion_summary, partitions_summary)
+
     with transaction.atomic():
         # Delete Scan Summaries
         scan_summaries_qs = ScanSummary.all_objects.filter(scan__provider=instance)
-        _, scans_summ_summary = batch_delete(scan_summaries_qs)
-        deletion_summary.update(scans_summ_summary)
+        _, scans_summ_summary = batch_delete(
+            scan_summaries_qs, progress_callback=report_progress
+        )
+        _merge_deletion_summary(deletion_summary, scans_summ_summary)
 
         # Delete Findings
         findings_qs = Finding.all_objects.filter(scan__provider=instance)
-        _, findings_summary = batch_delete(findings_qs)
-        deletion_summary.update(findings_summary)
+        _, findings_summary = batch_delete(
+            findings_qs, progress_callback=report_progress
+        )
+        _merge_deletion_summary(deletion_summary, findings_summary)
 
         # Delete Resources
         resources_qs = Resource.all_objects.filter(provider=instance)
-        _, resources_summary = batch_delete(resources_qs)
-        deletion_summary.update(resources_summary)
+        _, resources_summary = batch_delete(
+            resources_qs, progress_callback=report_progress
+        )
+        _merge_deletion_summary(deletion_summary, resources_summary)
 
         # Delete Scans
         scans_qs = Scan.all_objects.filter(provider=instance)
-        _, scans_summary = batch_delete(scans_qs)
-        deletion_summary.update(scans_summary)
+        _, scans_summary = batch_delete(scans_qs, progress_callback=report_progress)
+        _merge_deletion_summary(deletion_summary, scans_summary)
 
         provider_deleted_count, provider_summary = instance.delete()
-        deletion_summary.update(provider_summary)
+        _merge_deletion_summary(deletion_summary, provider_summary)
 
     return deletion_summary
 
 
-def delete_tenant(pk: str):
+def delete_tenant(pk: str, progress_callback: Callable[[dict], None] | None = None):
     """
     Gracefully deletes an instance of a tenant along with its related data.
 
+    The findings partitions that only contain findings of the tenant are dropped first, see
+    `drop_owned_partitions`.
+
     Args:
         pk (str): The primary key of the Tenant instance to delete.
+        progress_callback (Callable[[dict], None] | None): Called with the deletion summary so far after each
+            dropped partition and each deleted batch.
 
     Returns:
         dict: A dictionary with the count of deleted objects per model,
@@ -65,10 +219,20 @@ def delete_tenant(pk: str):
     """
     deletion_summary = {}
 
+    def report_progress(summary: dict):
+        if progress_callback:
+            progress_callback(_merge_deletion_summary(dict(deletion_summary), summary))
+
+    if Provider.objects.using(MainRouter.admin_db).filter(tenant_id=pk).exists():
+        partitions_summary = drop_owned_partitions(
+            str(pk), progress_callback=report_progress
+        )
+        _merge_deletion_summary(deletion_summary, partitions_summary)
+
     for provider in Provider.objects.using(MainRouter.admin_db).filter(tenant_id=pk):
         with rls_transaction(pk):
-            summary = delete_provider(provider.id)
-            deletion_summary.update(summary)
+            summary = delete_provider(provider.id, progress_callback=report_progress)
+            _merge_deletion_summary(deletion_summary, summary)
 
     Tenant.objects.using(MainRouter.admin_db).filter(id=pk).delete()
 
@@ -1,23 +1,29 @@
 import time
-from copy import deepcopy
 from datetime import datetime, timezone
 
 from celery.utils.log import get_task_logger
-from config.settings.celery import CELERY_DEADLOCK_ATTEMPTS
+from config.settings.celery import (
+    CELERY_DEADLOCK_ATTEMPTS,
+    CELERY_SCAN_FINDINGS_BATCH_SIZE,
+)
 from django.db import IntegrityError, OperationalError
 from django.db.models import Case, Count, IntegerField, Sum, When
+from tasks.utils import batched
 
 from api.compliance import (
     PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE,
-    generate_scan_compliance,
+    generate_scan_compliance_overviews,
 )
 from api.db_utils import rls_transaction
 from api.models import (
     ComplianceOverview,
     Finding,
+    LatestScanSummary,
     Provider,
     Resource,
+    ResourceFindingMapping,
     ResourceTag,
+    ResourceTagMapping,
     Scan,
     ScanSummary,
     StateChoices,
@@ -26,6 +32,7 @@ from api.models import StatusChoices as FindingStatus
 from api.utils import initialize_prowler_provider
 from api.v1.serializers import ScanTaskSerializer
 from prowler.lib.outputs.finding import Finding as ProwlerFinding
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.lib.scan.scan import Scan as ProwlerScan
 
 logger = get_task_logger(__name__)
@@ -97,12 +104,365 @@ def _store_resources(
     return resource_instance, (resource_instance.uid, resource_instance.region)
 
 
+def _bulk_store_findings(
+    findings: list[ProwlerFinding],
+    tenant_id: str,
+    provider_instance: Provider,
+    scan_instance: Scan,
+    resource_cache: dict,
+    tag_cache: dict,
+    last_status_cache: dict,
+) -> tuple[set[tuple[str, str]], dict, dict, dict]:
+    """
+    Store a batch of findings with their resources and tags using bulk queries.
+
+    The caches are only read, the resources, tags and last statuses fetched from the database are returned so the
+    caller can add them to the caches once the transaction is committed.
+
+    Args:
+        findings (list[ProwlerFinding]): The findings of the batch.
+        tenant_id (str): The ID of the tenant owning the findings.
+        provider_instance (Provider): The provider instance associated with the resources.
+        scan_instance (Scan): The scan instance associated with the findings.
+        resource_cache (dict): The resources already stored, by UID.
+        tag_cache (dict): The tags already stored, by key and value.
+        last_status_cache (dict): The last status and first seen date of the findings already stored, by UID.
+
+    Returns:
+        tuple:
+            - set[tuple[str, str]]: The UID and region of the resources of the batch.
+            - dict: The resources fetched for the batch, by UID.
+            - dict: The tags fetched for the batch, by key and value.
+            - dict: The last status and first seen date of the findings of the batch, by UID.
+    """
+    # Process resources
+    new_resources = {}
+    missing_resource_uids = {
+        finding.resource_uid
+        for finding in findings
+        if finding.resource_uid not in resource_cache
+    }
+    if missing_resource_uids:
+        for resource_instance in Resource.objects.filter(
+            tenant_id=tenant_id,
+            provider=provider_instance,
+            uid__in=missing_resource_uids,
+        ):
+            new_resources[resource_instance.uid] = resource_instance
+
+        resources_to_create = {}
+        for finding in findings:
+            resource_uid = finding.resource_uid
+            if (
+                resource_uid in missing_resource_uids
+                and resource_uid not in new_resources
+                and resource_uid not in resources_to_create
+            ):
+                resources_to_create[resource_uid] = Resource(
+                    tenant_id=tenant_id,
+                    provider=provider_instance,
+                    uid=resource_uid,
+                    region=finding.region,
+                    service=finding.service_name,
+                    type=finding.resource_type,
+                    name=finding.resource_name,
+                )
+        if resources_to_create:
+            # The resources created by a concurrent scan are ignored and fetched below
+            Resource.objects.bulk_create(
+                resources_to_create.values(), ignore_conflicts=True
+            )
+            for resource_instance in Resource.objects.filter(
+                tenant_id=tenant_id,
+                provider=provider_instance,
+                uid__in=resources_to_create.keys(),
+            ):
+                new_resources[resource_instance.uid] = resource_instance
+
+    # Update resource fields if necessary, the last finding of each resource wins
+    batch_resources = {}
+    updated_fields = {"updated_at"}
+    for finding in findings:
+        resource_uid = finding.resource_uid
+        resource_instance = resource_cache.get(resource_uid) or new_resources.get(
+            resource_uid
+        )
+        if finding.region and resource_instance.region != finding.region:
+            resource_instance.region = finding.region
+            updated_fields.add("region")
+        if resource_instance.service != finding.service_name:
+            resource_instance.service = finding.service_name
+            updated_fields.add("service")
+        if resource_instance.type != finding.resource_type:
+            resource_instance.type = finding.resource_type
+            updated_fields.add("type")
+        batch_resources[resource_uid] = resource_instance
+    # Every resource seen by the scan is saved, as upsert_or_delete_tags() did, so updated_at tells when it was last seen.
+    # bulk_update doesn't set the auto_now fields, so updated_at is set here.
+    updated_at = datetime.now(tz=timezone.utc)
+    for resource_instance in batch_resources.values():
+        resource_instance.updated_at = updated_at
+    Resource.objects.bulk_update(batch_resources.values(), sorted(updated_fields))
+
+    unique_resources = {
+        (resource_instance.uid, resource_instance.region)
+        for resource_instance in batch_resources.values()
+    }
+
+    # Process tags
+    new_tags = {}
+    missing_tag_keys = {
+        (key, value)
+        for finding in findings
+        for key, value in finding.resource_tags.items()
+        if (key, value) not in tag_cache
+    }
+    if missing_tag_keys:
+        tags_filter = {
+            "tenant_id": tenant_id,
+            "key__in": {key for key, _ in missing_tag_keys},
+            "value__in": {value for _, value in missing_tag_keys},
+        }
+        for tag_instance in ResourceTag.objects.filter(**tags_filter):
+            tag_key = (tag_instance.key, tag_instance.value)
+            if tag_key in missing_tag_keys:
+                new_tags[tag_key] = tag_instance
+
+        tags_to_create = [
+            ResourceTag(tenant_id=tenant_id, key=key, value=value)
+            for key, value in missing_tag_keys
+            if (key, value) not in new_tags
+        ]
+        if tags_to_create:
+            ResourceTag.objects.bulk_create(tags_to_create, ignore_conflicts=True)
+            for tag_instance in ResourceTag.objects.filter(**tags_filter):
+                tag_key = (tag_instance.key, tag_instance.value)
+                if tag_key in missing_tag_keys:
+                    new_tags[tag_key] = tag_instance
+
+    tag_mappings = {}
+    for finding in findings:
+        resource_instance = batch_resources[finding.resource_uid]
+        for tag_key in finding.resource_tags.items():
+            tag_instance = tag_cache.get(tag_key) or new_tags[tag_key]
+            tag_mappings[(resource_instance.id, tag_instance.id)] = ResourceTagMapping(
+                tenant_id=tenant_id, resource=resource_instance, tag=tag_instance
+            )
+    if tag_mappings:
+        ResourceTagMapping.objects.bulk_create(
+            tag_mappings.values(), ignore_conflicts=True
+        )
+
+    # Prefetch the last status of the findings in a single query
+    new_last_statuses = {}
+    missing_finding_uids = {
+        finding.uid for finding in findings if finding.uid not in last_status_cache
+    }
+    if missing_finding_uids:
+        new_last_statuses = {
+            finding_uid: (None, None) for finding_uid in missing_finding_uids
+        }
+        most_recent_findings = (
+            Finding.all_objects.filter(
+                tenant_id=tenant_id, uid__in=missing_finding_uids
+            )
+            .order_by("uid", "-inserted_at")
+            .distinct("uid")
+            .values("uid", "status", "first_seen_at")
+        )
+        for most_recent_finding in most_recent_findings:
+            new_last_statuses[most_recent_finding["uid"]] = (
+                most_recent_finding["status"],
+                most_recent_finding["first_seen_at"],
+            )
+
+    # Process findings
+    finding_instances = []
+    resource_finding_mappings = []
+    for finding in findings:
+        finding_uid = finding.uid
+        if finding_uid in last_status_cache:
+            last_status, last_first_seen_at = last_status_cache[finding_uid]
+        else:
+            last_status, last_first_seen_at = new_last_statuses[finding_uid]
+
+        status = FindingStatus[finding.status]
+        delta = _create_finding_delta(last_status, status)
+        # For the findings prior to the change, when a first finding is found with delta!="new" it will be
+        # assigned a current date as first_seen_at and the successive findings with the same UID will
+        # always get the date of the previous finding.
+        # For new findings, when a finding (delta="new") is found for the first time, the first_seen_at
+        # attribute will be assigned the current date, the following findings will get that date.
+        if not last_first_seen_at:
+            last_first_seen_at = datetime.now(tz=timezone.utc)
+
+        finding_instance = Finding(
+            tenant_id=tenant_id,
+            uid=finding_uid,
+            delta=delta,
+            check_metadata=finding.get_metadata(),
+            status=status,
+            status_extended=finding.status_extended,
+            severity=finding.severity,
+            impact=finding.severity,
+            raw_result=finding.raw,
+            check_id=finding.check_id,
+            scan=scan_instance,
+            first_seen_at=last_first_seen_at,
+        )
+        finding_instances.append(finding_instance)
+        resource_finding_mappings.append(
+            ResourceFindingMapping(
+                tenant_id=tenant_id,
+                resource=batch_resources[finding.resource_uid],
+                finding=finding_instance,
+            )
+        )
+    Finding.objects.bulk_create(finding_instances)
+    ResourceFindingMapping.objects.bulk_create(resource_finding_mappings)
+
+    return unique_resources, new_resources, new_tags, new_last_statuses
+
+
+def _store_findings_batch(
+    findings: list[ProwlerFinding],
+    tenant_id: str,
+    scan_id: str,
+    provider_instance: Provider,
+    scan_instance: Scan,
+    resource_cache: dict,
+    tag_cache: dict,
+    last_status_cache: dict,
+) -> set[tuple[str, str]]:
+    """
+    Store a batch of findings in a single transaction, retrying the whole batch on deadlocks.
+
+    The caches are updated once the transaction is committed, so a retried batch never reads rolled back rows.
+
+    Args:
+        findings (list[ProwlerFinding]): The findings of the batch.
+        tenant_id (str): The ID of the tenant owning the findings.
+        scan_id (str): The ID of the scan instance.
+        provider_instance (Provider): The provider instance associated with the resources.
+        scan_instance (Scan): The scan instance associated with the findings.
+        resource_cache (dict): The resources already stored, by UID.
+        tag_cache (dict): The tags already stored, by key and value.
+        last_status_cache (dict): The last status and first seen date of the findings already stored, by UID.
+
+    Returns:
+        set[tuple[str, str]]: The UID and region of the resources of the batch.
+    """
+    for attempt in range(CELERY_DEADLOCK_ATTEMPTS):
+        try:
+            with rls_transaction(tenant_id):
+                unique_resources, new_resources, new_tags, new_last_statuses = (
+                    _bulk_store_findings(
+                        findings,
+                        tenant_id,
+                        provider_instance,
+                        scan_instance,
+                        resource_cache,
+                        tag_cache,
+                        last_status_cache,
+                    )
+                )
+        except (OperationalError, IntegrityError) as db_err:
+            if attempt < CELERY_DEADLOCK_ATTEMPTS - 1:
+                logger.warning(
+                    f"{'Deadlock error' if isinstance(db_err, OperationalError) else 'Integrity error'} "
+                    f"detected when storing {len(findings)} findings on scan {scan_id}. Retrying..."
+                )
+                time.sleep(0.1 * (2**attempt))
+                continue
+            else:
+                raise db_err
+
+        resource_cache.update(new_resources)
+        tag_cache.update(new_tags)
+        last_status_cache.update(new_last_statuses)
+        return unique_resources
+
+
+class DatabaseScanCheckpoint(ScanCheckpoint):
+    """
+    Records the checks completed by a scan in the scan instance, so the scan is resumed skipping them if it is
+    interrupted. The findings of the checks are not recorded, since they are already stored by the scan.
+
+    Attributes:
+        tenant_id (str): The ID of the tenant owning the scan.
+        scan_instance (Scan): The scan instance.
+    """
+
+    def __init__(self, tenant_id: str, scan_instance: Scan):
+        self._tenant_id = tenant_id
+        self._scan_instance = scan_instance
+        self._completed_checks = set(scan_instance.completed_checks)
+
+    @property
+    def completed_checks(self) -> set[str]:
+        return self._completed_checks
+
+    def add_check(self, check_name: str, findings: list[ProwlerFinding]) -> None:
+        self._completed_checks.add(check_name)
+        with rls_transaction(self._tenant_id):
+            self._scan_instance.completed_checks = sorted(self._completed_checks)
+            self._scan_instance.save(update_fields=["completed_checks", "updated_at"])
+
+
+def _get_completed_checks_results(
+    tenant_id: str, scan_id: str
+) -> tuple[set[tuple[str, str]], dict]:
+    """
+    Get the results of the checks completed by a scan before it was interrupted, removing the findings stored by
+    the checks that were not completed, since those checks are executed again, and the compliance overviews.
+
+    Args:
+        tenant_id (str): The ID of the tenant owning the scan.
+        scan_id (str): The ID of the scan instance.
+
+    Returns:
+        tuple: A tuple containing:
+            - set[tuple[str, str]]: The UID and region of the resources of the completed checks.
+            - dict: The status of the completed checks by region, for the compliance overviews.
+    """
+    unique_resources = set()
+    check_status_by_region = {}
+    with rls_transaction(tenant_id):
+        completed_checks = Scan.objects.get(pk=scan_id).completed_checks
+        Finding.all_objects.filter(scan_id=scan_id).exclude(
+            check_id__in=completed_checks
+        ).delete()
+        # The compliance overviews are generated again once all the checks are completed
+        ComplianceOverview.objects.filter(scan_id=scan_id).delete()
+
+        for region, resource_uid, check_id, status in (
+            ResourceFindingMapping.objects.filter(finding__scan_id=scan_id)
+            .values_list(
+                "resource__region",
+                "resource__uid",
+                "finding__check_id",
+                "finding__status",
+            )
+            .iterator()
+        ):
+            unique_resources.add((resource_uid, region))
+            if status == FindingStatus.MUTED:
+                continue
+            region_dict = check_status_by_region.setdefault(region, {})
+            if region_dict.get(check_id) != "FAIL":
+                region_dict[check_id] = status
+    return unique_resources, check_status_by_region
+
+
 def perform_prowler_scan(
     tenant_id: str, scan_id: str, provider_id: str, checks_to_execute: list[str] = None
 ):
     """
     Perform a scan using Prowler and store the findings and resources in the database.
 
+    Every completed check is recorded in the scan instance, so if the scan is performed again after being
+    interrupted, it is resumed skipping the checks completed before the interruption.
+
     Args:
         tenant_id (str): The ID of the tenant for which the scan is performed.
         scan_id (str): The ID of the scan instance.
@@ -124,10 +484,25 @@ def perform_prowler_scan(
     with rls_transaction(tenant_id):
         provider_instance = Provider.objects.get(pk=provider_id)
         scan_instance = Scan.objects.get(pk=scan_id)
+        # A scan already executing was interrupted and its task delivered again, even if it didn't complete any
+        # check, since the findings of the interrupted check may be stored
+        resumed = scan_instance.state == StateChoices.EXECUTING or bool(
+            scan_instance.completed_checks
+        )
+        previous_duration = (scan_instance.duration or 0) if resumed else 0
         scan_instance.state = StateChoices.EXECUTING
-        scan_instance.started_at = datetime.now(tz=timezone.utc)
+        if not resumed or not scan_instance.started_at:
+            scan_instance.started_at = datetime.now(tz=timezone.utc)
         scan_instance.save()
 
+    if resumed:
+        logger.info(
+            f"Resuming scan {scan_id}, {len(scan_instance.completed_checks)} checks were already completed"
+        )
+        unique_resources, check_status_by_region = _get_completed_checks_results(
+            tenant_id, scan_id
+        )
+
     try:
         with rls_transaction(tenant_id):
             try:
@@ -144,141 +519,50 @@ def perform_prowler_scan(
                 )
                 provider_instance.save()
 
-        prowler_scan = ProwlerScan(provider=prowler_provider, checks=checks_to_execute)
+        prowler_scan = ProwlerScan(
+            provider=prowler_provider,
+            checks=checks_to_execute,
+            checkpoint=DatabaseScanCheckpoint(tenant_id, scan_instance),
+        )
 
         resource_cache = {}
         tag_cache = {}
         last_status_cache = {}
 
         for progress, findings in prowler_scan.scan():
-            for finding in findings:
-                if finding is None:
-                    logger.error(f"None finding detected on scan {scan_id}.")
+            for batch, _ in batched(findings, CELERY_SCAN_FINDINGS_BATCH_SIZE):
+                batch_findings = []
+                for finding in batch:
+                    if finding is None:
+                        logger.error(f"None finding detected on scan {scan_id}.")
+                        continue
+                    batch_findings.append(finding)
+                if not batch_findings:
                     continue
-                for attempt in range(CELERY_DEADLOCK_ATTEMPTS):
-                    try:
-                        with rls_transaction(tenant_id):
-                            # Process resource
-                            resource_uid = finding.resource_uid
-                            if resource_uid not in resource_cache:
-                                # Get or create the resource
-                                resource_instance, _ = Resource.objects.get_or_create(
-                                    tenant_id=tenant_id,
-                                    provider=provider_instance,
-                                    uid=resource_uid,
-                                    defaults={
-                                        "region": finding.region,
-                                        "service": finding.service_name,
-                                        "type": finding.resource_type,
-                                        "name": finding.resource_name,
-                                    },
-                                )
-                                resource_cache[resource_uid] = resource_instance
-                            else:
-                                resource_instance = resource_cache[resource_uid]
-
-                        # Update resource fields if necessary
-                        updated_fields = []
-                        if (
-                            finding.region
-                            and resource_instance.region != finding.region
-                        ):
-                            resource_instance.region = finding.region
-                            updated_fields.append("region")
-                        if resource_instance.service != finding.service_name:
-                            resource_instance.service = finding.service_name
-                            updated_fields.append("service")
-                        if resource_instance.type != finding.resource_type:
-                            resource_instance.type = finding.resource_type
-                            updated_fields.append("type")
-                        if updated_fields:
-                            with rls_transaction(tenant_id):
-                                resource_instance.save(update_fields=updated_fields)
-                    except (OperationalError, IntegrityError) as db_err:
-                        if attempt < CELERY_DEADLOCK_ATTEMPTS - 1:
-                            logger.warning(
-                                f"{'Deadlock error' if isinstance(db_err, OperationalError) else 'Integrity error'} "
-                                f"detected when processing resource {resource_uid} on scan {scan_id}. Retrying..."
-                            )
-                            time.sleep(0.1 * (2**attempt))
-                            continue
-                        else:
-                            raise db_err
-
-                # Update tags
-                tags = []
-                with rls_transaction(tenant_id):
-                    for key, value in finding.resource_tags.items():
-                        tag_key = (key, value)
-                        if tag_key not in tag_cache:
-                            tag_instance, _ = ResourceTag.objects.get_or_create(
-                                tenant_id=tenant_id, key=key, value=value
-                            )
-                            tag_cache[tag_key] = tag_instance
-                        else:
-                            tag_instance = tag_cache[tag_key]
-                        tags.append(tag_instance)
-                    resource_instance.upsert_or_delete_tags(tags=tags)
-
-                unique_resources.add((resource_instance.uid, resource_instance.region))
-
-                # Process finding
-                with rls_transaction(tenant_id):
-                    finding_uid = finding.uid
-                    last_first_seen_at = None
-                    if finding_uid not in last_status_cache:
-                        most_recent_finding = (
-                            Finding.all_objects.filter(
-                                tenant_id=tenant_id, uid=finding_uid
-                            )
-                            .order_by("-inserted_at")
-                            .values("status", "first_seen_at")
-                            .first()
-                        )
-                        last_status = None
-                        if most_recent_finding:
-                            last_status = most_recent_finding["status"]
-                            last_first_seen_at = most_recent_finding["first_seen_at"]
-                        last_status_cache[finding_uid] = last_status, last_first_seen_at
-                    else:
-                        last_status, last_first_seen_at = last_status_cache[finding_uid]
-
-                    status = FindingStatus[finding.status]
-                    delta = _create_finding_delta(last_status, status)
-                    # For the findings prior to the change, when a first finding is found with delta!="new" it will be
-                    # assigned a current date as first_seen_at and the successive findings with the same UID will
-                    # always get the date of the previous finding.
-                    # For new findings, when a finding (delta="new") is found for the first time, the first_seen_at
-                    # attribute will be assigned the current date, the following findings will get that date.
-                    if not last_first_seen_at:
-                        last_first_seen_at = datetime.now(tz=timezone.utc)
-
-                    # Create the finding
-                    finding_instance = Finding.objects.create(
-                        tenant_id=tenant_id,
-                        uid=finding_uid,
-                        delta=delta,
-                        check_metadata=finding.get_metadata(),
-                        status=status,
-                        status_extended=finding.status_extended,
-                        severity=finding.severity,
-                        impact=finding.severity,
-                        raw_result=finding.raw,
-                        check_id=finding.check_id,
-                        scan=scan_instance,
-                        first_seen_at=last_first_seen_at,
+
+                unique_resources.update(
+                    _store_findings_batch(
+                        batch_findings,
+                        tenant_id,
+                        scan_id,
+                        provider_instance,
+                        scan_instance,
+                        resource_cache,
+                        tag_cache,
+                        last_status_cache,
                     )
-                    finding_instance.add_resources([resource_instance])
+                )
 
                 # Update compliance data if applicable
-                if finding.status.value == "MUTED":
-                    continue
+                for finding in batch_findings:
+                    if finding.status.value == "MUTED":
+                        continue
 
-                region_dict = check_status_by_region.setdefault(finding.region, {})
-                current_status = region_dict.get(finding.check_id)
-                if current_status == "FAIL":
-                    continue
-                region_dict[finding.check_id] = finding.status.value
+                    region_dict = check_status_by_region.setdefault(finding.region, {})
+                    current_status = region_dict.get(finding.check_id)
+                    if current_status == "FAIL":
+                        continue
+                    region_dict[finding.check_id] = finding.status.value
 
             # Update scan progress
             with rls_transaction(tenant_id):
@@ -294,7 +578,7 @@ def perform_prowler_scan(
 
     finally:
         with rls_transaction(tenant_id):
-            scan_instance.duration = time.time() - start_time
+            scan_instance.duration = previous_duration + time.time() - start_time
             scan_instance.completed_at = datetime.now(tz=timezone.utc)
             scan_instance.unique_resource_count = len(unique_resources)
             scan_instance.save()
@@ -308,21 +592,12 @@ def perform_prowler_scan(
         compliance_template = PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE[
             provider_instance.provider
         ]
-        compliance_overview_by_region = {
-            region: deepcopy(compliance_template) for region in regions
-        }
-
-        for region, check_status in check_status_by_region.items():
-            compliance_data = compliance_overview_by_region.setdefault(
-                region, deepcopy(compliance_template)
-            )
-            for check_name, status in check_status.items():
-                generate_scan_compliance(
-                    compliance_data,
-                    provider_instance.provider,
-                    check_name,
-                    status,
-                )
+        compliance_overview_by_region = generate_scan_compliance_overviews(
+            compliance_template,
+            provider_instance.provider,
+            check_status_by_region,
+            regions,
+        )
 
         # Prepare compliance overview objects
         compliance_overview_objects = []
@@ -370,7 +645,8 @@ def aggregate_findings(tenant_id: str, scan_id: str):
     This function retrieves all findings associated with a given `scan_id` and calculates various
     metrics such as counts of failed, passed, and muted findings, as well as their deltas (new,
     changed, unchanged). The results are grouped by `check_id`, `service`, `severity`, and `region`.
-    These aggregated metrics are then stored in the `ScanSummary` table.
+    These aggregated metrics are then stored in the `ScanSummary` table, and copied to the `LatestScanSummary` table
+    if the scan is the latest completed scan of its provider.
 
     Args:
         tenant_id (str): The ID of the tenant to which the scan belongs.
@@ -513,3 +789,69 @@ def aggregate_findings(tenant_id: str, scan_id: str):
             for agg in aggregation
         }
         ScanSummary.objects.bulk_create(scan_aggregations, batch_size=3000)
+
+    update_latest_scan_summaries(tenant_id=tenant_id, scan_id=scan_id)
+
+
+def update_latest_scan_summaries(tenant_id: str, scan_id: str):
+    """
+    Replaces the `LatestScanSummary` rows of the scan provider with the `ScanSummary` rows of the given scan.
+
+    Nothing changes if the scan is not the latest completed scan of its provider, e.g. when the scan failed or when
+    an older scan is summarized after a newer one.
+
+    Args:
+        tenant_id (str): The ID of the tenant to which the scan belongs.
+        scan_id (str): The ID of the scan whose summaries are now the latest ones of its provider.
+    """
+    with rls_transaction(tenant_id):
+        scan_instance = Scan.all_objects.get(pk=scan_id)
+        # Lock the provider so the summaries of two scans of the same provider are not replaced concurrently
+        Provider.all_objects.select_for_update().get(pk=scan_instance.provider_id)
+        latest_scan_id = (
+            Scan.all_objects.filter(
+                tenant_id=tenant_id,
+                provider_id=scan_instance.provider_id,
+                state=StateChoices.COMPLETED,
+            )
+            .order_by("-inserted_at")
+            .values_list("id", flat=True)
+            .first()
+        )
+        if latest_scan_id != scan_instance.id:
+            return
+
+        LatestScanSummary.all_objects.filter(
+            tenant_id=tenant_id, provider_id=scan_instance.provider_id
+        ).delete()
+        LatestScanSummary.all_objects.bulk_create(
+            [
+                LatestScanSummary(
+                    tenant_id=tenant_id,
+                    provider_id=scan_instance.provider_id,
+                    scan_id=scan_instance.id,
+                    inserted_at=summary.inserted_at,
+                    check_id=summary.check_id,
+                    service=summary.service,
+                    severity=summary.severity,
+                    region=summary.region,
+                    fail=summary.fail,
+                    _pass=summary._pass,
+                    muted=summary.muted,
+                    total=summary.total,
+                    new=summary.new,
+                    changed=summary.changed,
+                    unchanged=summary.unchanged,
+                    fail_new=summary.fail_new,
+                    fail_changed=summary.fail_changed,
+                    pass_new=summary.pass_new,
+                    pass_changed=summary.pass_changed,
+                    muted_new=summary.muted_new,
+                    muted_changed=summary.muted_changed,
+                )
+                for summary in ScanSummary.all_objects.filter(
+                    tenant_id=tenant_id, scan_id=scan_instance.id
+                )
+            ],
+            batch_size=3000,
+        )
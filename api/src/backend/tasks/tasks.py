@@ -1,3 +1,4 @@
+from functools import partial
 from pathlib import Path
 from shutil import rmtree
 
@@ -5,6 +6,7 @@ from celery import chain, shared_task
 from celery.utils.log import get_task_logger
 from config.celery import RLSTask
 from config.django.base import DJANGO_FINDINGS_BATCH_SIZE, DJANGO_TMP_OUTPUT_DIRECTORY
+from django.db.models import Prefetch
 from django_celery_beat.models import PeriodicTask
 from tasks.jobs.connection import check_provider_connection
 from tasks.jobs.deletion import delete_provider, delete_tenant
@@ -19,7 +21,7 @@ from tasks.utils import batched, get_next_execution_datetime
 
 from api.db_utils import rls_transaction
 from api.decorators import set_tenant
-from api.models import Finding, Provider, Scan, ScanSummary, StateChoices
+from api.models import Finding, Provider, Resource, Scan, ScanSummary, StateChoices
 from api.utils import initialize_prowler_provider
 from prowler.lib.outputs.finding import Finding as FindingOutput
 
@@ -43,13 +45,22 @@ def check_provider_connection_task(provider_id: str):
     return check_provider_connection(provider_id=provider_id)
 
 
-@shared_task(base=RLSTask, name="provider-deletion", queue="deletion")
+def report_deletion_progress(task, deletion_summary: dict):
+    """
+    Store the deletion summary so far as the `PROGRESS` state of the given deletion task.
+    """
+    if task.request.id:
+        task.update_state(state="PROGRESS", meta=deletion_summary)
+
+
+@shared_task(base=RLSTask, bind=True, name="provider-deletion", queue="deletion")
 @set_tenant
-def delete_provider_task(provider_id: str):
+def delete_provider_task(self, provider_id: str):
     """
     Task to delete a specific Provider instance.
 
-    It will delete in batches all the related resources first.
+    It will delete in batches all the related resources first, reporting the deletion summary so far as the task
+    progress.
 
     Args:
         provider_id (str): The primary key of the `Provider` instance to be deleted.
@@ -60,10 +71,20 @@ def delete_provider_task(provider_id: str):
             - A dictionary with the count of deleted instances per model,
               including related models if cascading deletes were triggered.
     """
-    return delete_provider(pk=provider_id)
+    return delete_provider(
+        pk=provider_id,
+        progress_callback=partial(report_deletion_progress, self),
+    )
 
 
-@shared_task(base=RLSTask, name="scan-perform", queue="scans")
+# The task is delivered again if the worker running it is lost, resuming the scan from its completed checks
+@shared_task(
+    base=RLSTask,
+    name="scan-perform",
+    queue="scans",
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
 def perform_scan_task(
     tenant_id: str, scan_id: str, provider_id: str, checks_to_execute: list[str] = None
 ):
@@ -100,7 +121,14 @@ def perform_scan_task(
     return result
 
 
-@shared_task(base=RLSTask, bind=True, name="scan-perform-scheduled", queue="scans")
+@shared_task(
+    base=RLSTask,
+    bind=True,
+    name="scan-perform-scheduled",
+    queue="scans",
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
 def perform_scheduled_scan_task(self, tenant_id: str, provider_id: str):
     """
     Task to perform a scheduled Prowler scan on a given provider.
@@ -127,14 +155,22 @@ def perform_scheduled_scan_task(self, tenant_id: str, provider_id: str):
             name=f"scan-perform-scheduled-{provider_id}"
         )
         next_scan_datetime = get_next_execution_datetime(task_id, provider_id)
-        scan_instance, _ = Scan.objects.get_or_create(
+        # If the task is delivered again after its worker was lost, its scan is resumed
+        scan_instance = Scan.objects.filter(
             tenant_id=tenant_id,
             provider_id=provider_id,
-            trigger=Scan.TriggerChoices.SCHEDULED,
-            state__in=(StateChoices.SCHEDULED, StateChoices.AVAILABLE),
-            scheduler_task_id=periodic_task_instance.id,
-            defaults={"state": StateChoices.SCHEDULED},
-        )
+            task_id=task_id,
+            state=StateChoices.EXECUTING,
+        ).first()
+        if scan_instance is None:
+            scan_instance, _ = Scan.objects.get_or_create(
+                tenant_id=tenant_id,
+                provider_id=provider_id,
+                trigger=Scan.TriggerChoices.SCHEDULED,
+                state__in=(StateChoices.SCHEDULED, StateChoices.AVAILABLE),
+                scheduler_task_id=periodic_task_instance.id,
+                defaults={"state": StateChoices.SCHEDULED},
+            )
 
         scan_instance.task_id = task_id
         scan_instance.save()
@@ -174,9 +210,11 @@ def perform_scan_summary_task(tenant_id: str, scan_id: str):
     return aggregate_findings(tenant_id=tenant_id, scan_id=scan_id)
 
 
-@shared_task(name="tenant-deletion", queue="deletion")
-def delete_tenant_task(tenant_id: str):
-    return delete_tenant(pk=tenant_id)
+@shared_task(bind=True, name="tenant-deletion", queue="deletion")
+def delete_tenant_task(self, tenant_id: str):
+    return delete_tenant(
+        pk=tenant_id, progress_callback=partial(report_deletion_progress, self)
+    )
 
 
 @shared_task(
@@ -190,7 +228,8 @@ def generate_outputs(scan_id: str, provider_id: str, tenant_id: str):
     Process findings in batches and generate output files in multiple formats.
 
     This function retrieves findings associated with a scan, processes them
-    in batches of 50, and writes each batch to the corresponding output files.
+    in batches of `DJANGO_FINDINGS_BATCH_SIZE`, prefetching their resources and tags,
+    and writes each batch to the corresponding output files.
     It reuses output writer instances across batches, updates them with each
     batch of transformed findings, and uses a flag to indicate when the final
     batch is being processed. Finally, the output files are compressed and
@@ -202,10 +241,11 @@ def generate_outputs(scan_id: str, provider_id: str, tenant_id: str):
         provider_id (str): The provider_id id to be used in generating outputs.
     """
     # Initialize the prowler provider
-    prowler_provider = initialize_prowler_provider(Provider.objects.get(id=provider_id))
+    provider = Provider.objects.get(id=provider_id)
+    prowler_provider = initialize_prowler_provider(provider)
 
     # Get the provider UID
-    provider_uid = Provider.objects.get(id=provider_id).uid
+    provider_uid = provider.uid
 
     # Generate and ensure the output directory exists
     output_directory = _generate_output_directory(
@@ -218,15 +258,27 @@ def generate_outputs(scan_id: str, provider_id: str, tenant_id: str):
         ScanSummary.objects.filter(scan_id=scan_id)
     )
 
-    # Retrieve findings queryset
-    findings_qs = Finding.all_objects.filter(scan_id=scan_id).order_by("uid")
+    # Retrieve findings queryset, prefetching the resources and tags of each batch. The resources are ordered so
+    # `resources.first()` reads them from the prefetched rows.
+    findings_qs = (
+        Finding.all_objects.filter(scan_id=scan_id)
+        .order_by("uid")
+        .prefetch_related(
+            Prefetch("resources", queryset=Resource.all_objects.order_by("id")),
+            "resources__tags",
+        )
+    )
+    check_metadata_cache = {}
 
     # Process findings in batches
     for batch, is_last_batch in batched(
-        findings_qs.iterator(), DJANGO_FINDINGS_BATCH_SIZE
+        findings_qs.iterator(chunk_size=DJANGO_FINDINGS_BATCH_SIZE),
+        DJANGO_FINDINGS_BATCH_SIZE,
     ):
         finding_outputs = [
-            FindingOutput.transform_api_finding(finding, prowler_provider)
+            FindingOutput.transform_api_finding(
+                finding, prowler_provider, check_metadata_cache
+            )
             for finding in batch
         ]
 
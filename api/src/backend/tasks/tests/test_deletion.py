@@ -1,8 +1,18 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
 import pytest
+from dateutil.relativedelta import relativedelta
 from django.core.exceptions import ObjectDoesNotExist
-from tasks.jobs.deletion import delete_provider, delete_tenant
+from tasks.jobs.deletion import (
+    _get_closed_partitions,
+    delete_provider,
+    delete_tenant,
+    drop_owned_partitions,
+)
 
-from api.models import Provider, Tenant
+from api.models import Finding, Provider, Scan, Tenant
+from api.uuid_utils import datetime_to_uuid7
 
 
 @pytest.mark.django_db
@@ -15,6 +25,38 @@ class TestDeleteProvider:
         with pytest.raises(ObjectDoesNotExist):
             Provider.objects.get(pk=instance.id)
 
+    def test_delete_provider_drops_owned_partitions(self, findings_fixture):
+        provider = findings_fixture[0].scan.provider
+        scan_ids = set(
+            Scan.all_objects.filter(provider=provider).values_list("id", flat=True)
+        )
+        progress_callback = MagicMock()
+
+        with patch(
+            "tasks.jobs.deletion.drop_owned_partitions",
+            return_value={"api.Finding": 10, "api.ResourceFindingMapping": 20},
+        ) as drop_owned_partitions_mock:
+            result = delete_provider(provider.id, progress_callback=progress_callback)
+
+        (tenant_id, partition_scan_ids), _ = drop_owned_partitions_mock.call_args
+        assert tenant_id == str(provider.tenant_id)
+        assert set(partition_scan_ids) == scan_ids
+        # The findings left in the default partition are deleted in batches
+        assert result["api.Finding"] == 10 + len(findings_fixture)
+        assert result["api.ResourceFindingMapping"] >= 20
+        assert not Finding.all_objects.filter(scan__provider=provider).exists()
+        # The last progress report includes the dropped partitions
+        last_progress = progress_callback.call_args_list[-1].args[0]
+        assert last_progress["api.Finding"] == 10 + len(findings_fixture)
+
+    def test_delete_provider_without_scans(self, providers_fixture):
+        with patch(
+            "tasks.jobs.deletion.drop_owned_partitions"
+        ) as drop_owned_partitions_mock:
+            delete_provider(providers_fixture[0].id)
+
+        drop_owned_partitions_mock.assert_not_called()
+
     def test_delete_provider_does_not_exist(self):
         non_existent_pk = "babf6796-cfcc-4fd3-9dcf-88d012247645"
 
@@ -58,3 +100,35 @@ class TestDeleteTenant:
 
         assert deletion_summary == {}  # No providers, so empty summary
         assert not Tenant.objects.filter(id=tenant.id).exists()
+
+
+class TestDropOwnedPartitions:
+    @staticmethod
+    def partition_bound(start: datetime) -> str:
+        end = start + relativedelta(months=1) - relativedelta(microseconds=1)
+        return (
+            f"FOR VALUES FROM ('{datetime_to_uuid7(start)}') "
+            f"TO ('{datetime_to_uuid7(end)}')"
+        )
+
+    def test_get_closed_partitions(self):
+        current_month = datetime.now(timezone.utc).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        previous_month = current_month - relativedelta(months=1)
+        next_month = current_month + relativedelta(months=1)
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [
+            ("findings_default", "DEFAULT"),
+            ("findings_previous", self.partition_bound(previous_month)),
+            ("findings_current", self.partition_bound(current_month)),
+            ("findings_next", self.partition_bound(next_month)),
+        ]
+
+        assert _get_closed_partitions(cursor, "findings") == ["findings_previous"]
+
+    @pytest.mark.django_db
+    def test_drop_owned_partitions_without_partitions(self, findings_fixture):
+        # The test database only has the default partitions, which are never dropped
+        assert drop_owned_partitions(str(findings_fixture[0].tenant_id)) == {}
+        assert Finding.all_objects.count() == len(findings_fixture)
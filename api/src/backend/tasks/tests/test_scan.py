@@ -1,17 +1,24 @@
 import uuid
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 from tasks.jobs.scan import (
+    DatabaseScanCheckpoint,
     _create_finding_delta,
     _store_resources,
     perform_prowler_scan,
+    update_latest_scan_summaries,
 )
 
 from api.models import (
     Finding,
+    LatestScanSummary,
     Provider,
     Resource,
+    ResourceFindingMapping,
+    Scan,
+    ScanSummary,
     Severity,
     StateChoices,
     StatusChoices,
@@ -37,13 +44,13 @@ class TestPerformScan:
                 new_callable=dict,
             ) as mock_prowler_compliance_overview_template,
             patch(
-                "api.compliance.PROWLER_CHECKS", new_callable=dict
-            ) as mock_prowler_checks,
+                "api.compliance.PROWLER_REQUIREMENTS_BY_CHECK", new_callable=dict
+            ) as mock_prowler_requirements_by_check,
         ):
-            # Set up the mock PROWLER_CHECKS
-            mock_prowler_checks["aws"] = {
-                "check1": {"compliance1"},
-                "check2": {"compliance1", "compliance2"},
+            # Set up the mock PROWLER_REQUIREMENTS_BY_CHECK
+            mock_prowler_requirements_by_check["aws"] = {
+                "check1": (("compliance1", "requirement1"),),
+                "check2": (("compliance1", "requirement1"),),
             }
 
             # Set up the mock PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE
@@ -191,6 +198,308 @@ class TestPerformScan:
         scan.refresh_from_db()
         assert scan.state == StateChoices.FAILED
 
+    def test_perform_prowler_scan_stores_findings_in_batches(
+        self,
+        tenants_fixture,
+        scans_fixture,
+        providers_fixture,
+    ):
+        tenant = tenants_fixture[0]
+        scan, previous_scan, _ = scans_fixture
+        provider = providers_fixture[0]
+        provider.provider = Provider.ProviderChoices.AWS
+        provider.save()
+
+        previous_finding = Finding.objects.create(
+            tenant_id=tenant.id,
+            uid="finding_uid_1",
+            scan=previous_scan,
+            delta=None,
+            status=StatusChoices.FAIL,
+            status_extended="test status extended",
+            impact=Severity.medium,
+            severity=Severity.medium,
+            raw_result={},
+            check_id="check1",
+            check_metadata={},
+            first_seen_at="2024-01-02T00:00:00Z",
+        )
+
+        # An existing resource whose fields do not change
+        existing_resource = Resource.objects.create(
+            tenant_id=tenant.id,
+            provider=provider,
+            uid="resource_uid_2",
+            region="region",
+            service="service_name",
+            type="resource_type",
+            name="resource_uid_2",
+        )
+
+        def build_finding(uid, resource_uid, resource_tags):
+            finding = MagicMock()
+            finding.uid = uid
+            finding.status = StatusChoices.PASS
+            finding.status_extended = "test status extended"
+            finding.severity = Severity.medium
+            finding.check_id = "check1"
+            finding.get_metadata.return_value = {"key": "value"}
+            finding.resource_uid = resource_uid
+            finding.resource_name = resource_uid
+            finding.region = "region"
+            finding.service_name = "service_name"
+            finding.resource_type = "resource_type"
+            finding.resource_tags = resource_tags
+            finding.raw = {}
+            return finding
+
+        findings = [
+            build_finding("finding_uid_1", "resource_uid_1", {"tag1": "value1"}),
+            build_finding("finding_uid_2", "resource_uid_1", {"tag2": "value2"}),
+            build_finding("finding_uid_3", "resource_uid_2", {"tag1": "value1"}),
+        ]
+
+        with (
+            patch(
+                "tasks.jobs.scan.initialize_prowler_provider"
+            ) as mock_initialize_prowler_provider,
+            patch("tasks.jobs.scan.ProwlerScan") as mock_prowler_scan_class,
+            patch("tasks.jobs.scan.CELERY_SCAN_FINDINGS_BATCH_SIZE", 2),
+            patch(
+                "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE",
+                {"aws": {}},
+            ),
+            patch("api.compliance.PROWLER_REQUIREMENTS_BY_CHECK", {"aws": {}}),
+        ):
+            mock_prowler_scan_class.return_value.scan.return_value = [(100, findings)]
+            mock_initialize_prowler_provider.return_value.get_regions.return_value = [
+                "region"
+            ]
+
+            perform_prowler_scan(str(tenant.id), str(scan.id), str(provider.id))
+
+        scan.refresh_from_db()
+        previous_finding.refresh_from_db()
+        assert scan.state == StateChoices.COMPLETED
+        assert scan.unique_resource_count == 2
+
+        scan_findings = {
+            finding.uid: finding for finding in Finding.objects.filter(scan=scan)
+        }
+        assert set(scan_findings) == {"finding_uid_1", "finding_uid_2", "finding_uid_3"}
+        assert scan_findings["finding_uid_1"].delta == Finding.DeltaChoices.CHANGED
+        assert (
+            scan_findings["finding_uid_1"].first_seen_at
+            == previous_finding.first_seen_at
+        )
+        assert scan_findings["finding_uid_2"].delta == Finding.DeltaChoices.NEW
+        assert scan_findings["finding_uid_3"].delta == Finding.DeltaChoices.NEW
+        assert [
+            resource.uid for resource in scan_findings["finding_uid_3"].resources.all()
+        ] == ["resource_uid_2"]
+
+        # The resources seen by the scan are refreshed even if their fields do not change
+        assert (
+            Resource.objects.get(id=existing_resource.id).updated_at
+            > existing_resource.updated_at
+        )
+        resource = Resource.objects.get(provider=provider, uid="resource_uid_1")
+        assert resource.get_tags(tenant.id) == {"tag1": "value1", "tag2": "value2"}
+        assert Resource.objects.filter(provider=provider).count() == 2
+
+    def test_perform_prowler_scan_resumes_completed_checks(
+        self,
+        tenants_fixture,
+        scans_fixture,
+        providers_fixture,
+    ):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+        provider = providers_fixture[0]
+        provider.provider = Provider.ProviderChoices.AWS
+        provider.save()
+
+        # The scan was interrupted after completing check1 and while storing the findings of check2
+        scan.completed_checks = ["check1"]
+        scan.duration = 10
+        scan.save()
+        resource = Resource.objects.create(
+            tenant_id=tenant.id,
+            provider=provider,
+            uid="resource_uid_1",
+            region="region",
+            service="service_name",
+            type="resource_type",
+            name="resource_uid_1",
+        )
+        stored_findings = {}
+        for check_id in ("check1", "check2"):
+            stored_findings[check_id] = Finding.objects.create(
+                tenant_id=tenant.id,
+                uid=f"{check_id}_finding_uid",
+                scan=scan,
+                delta=Finding.DeltaChoices.NEW,
+                status=StatusChoices.FAIL,
+                status_extended="test status extended",
+                impact=Severity.medium,
+                severity=Severity.medium,
+                raw_result={},
+                check_id=check_id,
+                check_metadata={},
+            )
+            ResourceFindingMapping.objects.create(
+                tenant_id=tenant.id,
+                resource=resource,
+                finding=stored_findings[check_id],
+            )
+
+        finding = MagicMock()
+        finding.uid = "check2_finding_uid"
+        finding.status = StatusChoices.PASS
+        finding.status_extended = "test status extended"
+        finding.severity = Severity.medium
+        finding.check_id = "check2"
+        finding.get_metadata.return_value = {"key": "value"}
+        finding.resource_uid = "resource_uid_2"
+        finding.resource_name = "resource_uid_2"
+        finding.region = "region"
+        finding.service_name = "service_name"
+        finding.resource_type = "resource_type"
+        finding.resource_tags = {}
+        finding.raw = {}
+
+        with (
+            patch(
+                "tasks.jobs.scan.initialize_prowler_provider"
+            ) as mock_initialize_prowler_provider,
+            patch("tasks.jobs.scan.ProwlerScan") as mock_prowler_scan_class,
+            patch(
+                "tasks.jobs.scan.generate_scan_compliance_overviews",
+                return_value={},
+            ) as mock_generate_scan_compliance_overviews,
+            patch(
+                "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE",
+                {"aws": {}},
+            ),
+        ):
+            mock_prowler_scan_class.return_value.scan.return_value = [(100, [finding])]
+            mock_initialize_prowler_provider.return_value.get_regions.return_value = [
+                "region"
+            ]
+
+            perform_prowler_scan(
+                str(tenant.id), str(scan.id), str(provider.id), ["check1", "check2"]
+            )
+
+        checkpoint = mock_prowler_scan_class.call_args.kwargs["checkpoint"]
+        assert checkpoint.completed_checks == {"check1"}
+
+        scan.refresh_from_db()
+        assert scan.state == StateChoices.COMPLETED
+        assert scan.duration >= 10
+        assert scan.unique_resource_count == 2
+
+        # The findings of the interrupted check are stored again
+        scan_findings = Finding.objects.filter(scan=scan)
+        assert {
+            (scan_finding.check_id, scan_finding.status)
+            for scan_finding in scan_findings
+        } == {("check1", StatusChoices.FAIL), ("check2", StatusChoices.PASS)}
+        assert stored_findings["check1"].id in {
+            scan_finding.id for scan_finding in scan_findings
+        }
+        # The compliance overviews include the checks completed before resuming
+        assert mock_generate_scan_compliance_overviews.call_args.args[2] == {
+            "region": {"check1": StatusChoices.FAIL, "check2": "PASS"}
+        }
+
+    def test_perform_prowler_scan_resumes_before_completing_checks(
+        self,
+        tenants_fixture,
+        scans_fixture,
+        providers_fixture,
+    ):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+        provider = providers_fixture[0]
+        provider.provider = Provider.ProviderChoices.AWS
+        provider.save()
+
+        # The worker was lost while storing the findings of the first check
+        scan.state = StateChoices.EXECUTING
+        scan.completed_checks = []
+        scan.save()
+        interrupted_finding = Finding.objects.create(
+            tenant_id=tenant.id,
+            uid="check1_finding_uid",
+            scan=scan,
+            delta=Finding.DeltaChoices.NEW,
+            status=StatusChoices.FAIL,
+            status_extended="test status extended",
+            impact=Severity.medium,
+            severity=Severity.medium,
+            raw_result={},
+            check_id="check1",
+            check_metadata={},
+        )
+
+        finding = MagicMock()
+        finding.uid = "check1_finding_uid"
+        finding.status = StatusChoices.PASS
+        finding.status_extended = "test status extended"
+        finding.severity = Severity.medium
+        finding.check_id = "check1"
+        finding.get_metadata.return_value = {"key": "value"}
+        finding.resource_uid = "resource_uid_1"
+        finding.resource_name = "resource_uid_1"
+        finding.region = "region"
+        finding.service_name = "service_name"
+        finding.resource_type = "resource_type"
+        finding.resource_tags = {}
+        finding.raw = {}
+
+        with (
+            patch(
+                "tasks.jobs.scan.initialize_prowler_provider"
+            ) as mock_initialize_prowler_provider,
+            patch("tasks.jobs.scan.ProwlerScan") as mock_prowler_scan_class,
+            patch(
+                "tasks.jobs.scan.generate_scan_compliance_overviews",
+                return_value={},
+            ),
+            patch(
+                "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE",
+                {"aws": {}},
+            ),
+        ):
+            mock_prowler_scan_class.return_value.scan.return_value = [(100, [finding])]
+            mock_initialize_prowler_provider.return_value.get_regions.return_value = [
+                "region"
+            ]
+
+            perform_prowler_scan(str(tenant.id), str(scan.id), str(provider.id))
+
+        scan.refresh_from_db()
+        assert scan.state == StateChoices.COMPLETED
+        # The findings stored before the interruption are not duplicated
+        scan_findings = list(Finding.objects.filter(scan=scan))
+        assert len(scan_findings) == 1
+        assert scan_findings[0].id != interrupted_finding.id
+        assert scan_findings[0].status == StatusChoices.PASS
+
+    def test_database_scan_checkpoint(self, tenants_fixture, scans_fixture):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+        scan.completed_checks = ["check1"]
+        scan.save()
+
+        checkpoint = DatabaseScanCheckpoint(str(tenant.id), scan)
+        assert checkpoint.completed_checks == {"check1"}
+        checkpoint.add_check("check2", [])
+
+        scan.refresh_from_db()
+        assert scan.completed_checks == ["check1", "check2"]
+
     @pytest.mark.parametrize(
         "last_status, new_status, expected_delta",
         [
@@ -362,3 +671,64 @@ class TestPerformScan:
 
 
 # TODO Add tests for aggregations
+
+
+@pytest.mark.django_db
+class TestUpdateLatestScanSummaries:
+    @staticmethod
+    def create_scan_with_summary(provider, state, total):
+        scan = Scan.objects.create(
+            name="Scan",
+            provider=provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=state,
+            tenant_id=provider.tenant_id,
+        )
+        ScanSummary.objects.create(
+            tenant_id=provider.tenant_id,
+            scan=scan,
+            check_id="check1",
+            service="service1",
+            severity=Severity.high,
+            region="region1",
+            fail=total,
+            total=total,
+        )
+        return scan
+
+    def test_update_latest_scan_summaries(self, providers_fixture):
+        provider = providers_fixture[0]
+        tenant_id = str(provider.tenant_id)
+        old_scan = self.create_scan_with_summary(provider, StateChoices.COMPLETED, 1)
+        update_latest_scan_summaries(tenant_id=tenant_id, scan_id=str(old_scan.id))
+
+        new_scan = self.create_scan_with_summary(provider, StateChoices.COMPLETED, 2)
+        update_latest_scan_summaries(tenant_id=tenant_id, scan_id=str(new_scan.id))
+
+        latest_summary = LatestScanSummary.objects.get(provider=provider)
+        assert latest_summary.scan_id == new_scan.id
+        assert latest_summary.total == 2
+        assert latest_summary.inserted_at == new_scan.aggregations.get().inserted_at
+
+    @pytest.mark.parametrize("older_completed", [True, False])
+    def test_update_latest_scan_summaries_not_latest_scan(
+        self, providers_fixture, older_completed
+    ):
+        provider = providers_fixture[0]
+        tenant_id = str(provider.tenant_id)
+        latest_scan = self.create_scan_with_summary(provider, StateChoices.COMPLETED, 1)
+        update_latest_scan_summaries(tenant_id=tenant_id, scan_id=str(latest_scan.id))
+        if older_completed:
+            # An older scan summarized after the latest one
+            scan = self.create_scan_with_summary(provider, StateChoices.COMPLETED, 2)
+            Scan.objects.filter(id=scan.id).update(
+                inserted_at=latest_scan.inserted_at - timedelta(days=1)
+            )
+        else:
+            scan = self.create_scan_with_summary(provider, StateChoices.FAILED, 2)
+
+        update_latest_scan_summaries(tenant_id=tenant_id, scan_id=str(scan.id))
+
+        latest_summary = LatestScanSummary.objects.get(provider=provider)
+        assert latest_summary.scan_id == latest_scan.id
+        assert latest_summary.total == 1
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from tasks.tasks import generate_outputs
+
+
+@pytest.mark.django_db
+class TestGenerateOutputs:
+    def test_generate_outputs_prefetches_resources_and_tags(
+        self, findings_fixture, resources_fixture
+    ):
+        finding1, finding2 = findings_fixture
+        scan = finding1.scan
+        transformed = []
+        check_metadata_caches = set()
+
+        def transform_api_finding(finding, provider, check_metadata_cache):
+            with CaptureQueriesContext(connection) as queries:
+                resource = finding.resources.first()
+                tags = {tag.key for tag in resource.tags.all()}
+            transformed.append((finding.uid, resource.uid, tags, len(queries)))
+            check_metadata_caches.add(id(check_metadata_cache))
+            return finding.uid
+
+        with (
+            patch("tasks.tasks.initialize_prowler_provider"),
+            patch("tasks.tasks.OUTPUT_FORMATS_MAPPING", {}),
+            patch("tasks.tasks.DJANGO_FINDINGS_BATCH_SIZE", 1),
+            patch("tasks.tasks._generate_output_directory", return_value="/tmp/out"),
+            patch("tasks.tasks._compress_output_files", return_value="/tmp/out.zip"),
+            patch("tasks.tasks._upload_to_s3", return_value=None),
+            patch("tasks.tasks.FindingOutput") as mock_finding_output,
+        ):
+            mock_finding_output.transform_api_finding.side_effect = (
+                transform_api_finding
+            )
+            result = generate_outputs(
+                scan_id=str(scan.id),
+                provider_id=str(scan.provider_id),
+                tenant_id=str(scan.tenant_id),
+            )
+
+        assert result == {"upload": False}
+        assert transformed == [
+            (finding1.uid, resources_fixture[0].uid, {"key", "key2"}, 0),
+            (finding2.uid, resources_fixture[1].uid, {"key", "key2"}, 0),
+        ]
+        # The check metadata cache is shared by all the batches
+        assert len(check_metadata_caches) == 1
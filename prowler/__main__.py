@@ -2,17 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import sys
-from os import environ
+from os import environ, path
 
 from colorama import Fore, Style
 from colorama import init as colorama_init
 
 from prowler.config.config import (
-    csv_file_suffix,
+    checkpoint_file_suffix,
     get_available_compliance_frameworks,
-    html_file_suffix,
-    json_asff_file_suffix,
-    json_ocsf_file_suffix,
+    output_file_timestamp,
 )
 from prowler.lib.banner import print_banner
 from prowler.lib.check.check import (
@@ -43,42 +41,18 @@ from prowler.lib.check.custom_checks_metadata import (
 from prowler.lib.check.models import CheckMetadata
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
-from prowler.lib.outputs.asff.asff import ASFF
-from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
-    AWSWellArchitected,
-)
-from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
-from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
-from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
-from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
-from prowler.lib.outputs.compliance.cis.cis_microsoft365 import Microsoft365CIS
 from prowler.lib.outputs.compliance.compliance import display_compliance_table
-from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
-from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
-from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
-from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
-from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
-    KubernetesISO27001,
-)
-from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
-    AzureMitreAttack,
-)
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
-from prowler.lib.outputs.csv.csv import CSV
-from prowler.lib.outputs.finding import Finding
-from prowler.lib.outputs.html.html import HTML
-from prowler.lib.outputs.ocsf.ocsf import OCSF
-from prowler.lib.outputs.outputs import extract_findings_statistics
 from prowler.lib.outputs.slack.slack import Slack
+from prowler.lib.outputs.stream import OutputStream, generate_output_writers
 from prowler.lib.outputs.summary_table import display_summary_table
+from prowler.lib.scan.checkpoint import SQLiteScanCheckpoint
+from prowler.lib.scan.exceptions.exceptions import ScanCheckpointMismatchError
+from prowler.providers.aws.lib.organizations.organizations_scan import (
+    scan_organizations,
+)
 from prowler.providers.aws.lib.s3.s3 import S3
 from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
-from prowler.providers.aws.models import AWSOutputOptions
+from prowler.providers.aws.models import AWSOrganizationsScanCatalog, AWSOutputOptions
 from prowler.providers.azure.models import AzureOutputOptions
 from prowler.providers.common.provider import Provider
 from prowler.providers.common.quick_inventory import run_provider_quick_inventory
@@ -276,16 +250,100 @@ def prowler():
         run_provider_quick_inventory(global_provider, args)
         sys.exit()
 
+    # Scan all the accounts of the AWS Organization, the outputs of this execution aggregate their findings
+    organizations_scan = provider == "aws" and args.organizations_scan_role
+    if organizations_scan and not args.output_filename:
+        organization = (
+            getattr(global_provider.organizations_metadata, "organization_id", "")
+            or global_provider.identity.account
+        )
+        output_options.output_filename = (
+            f"prowler-output-organization-{organization}-{output_file_timestamp}"
+        )
+
+    # A resumed scan writes to the outputs of the interrupted scan, named after its ID
+    if args.resume:
+        output_options.output_filename = args.resume
+
+    # Record the completed checks, so the scan can be resumed if it is interrupted
+    checkpoint = None
+    if args.checkpoint or args.resume:
+        checkpoint_file_path = f"{output_options.output_directory}/{output_options.output_filename}{checkpoint_file_suffix}"
+        if args.resume and not path.exists(checkpoint_file_path):
+            logger.critical(
+                f"There is no checkpoint of the scan {args.resume} in {output_options.output_directory}, it can't be resumed."
+            )
+            sys.exit(1)
+        if not args.resume and path.exists(checkpoint_file_path):
+            logger.critical(
+                f"The scan {output_options.output_filename} already has a checkpoint, resume it with --resume {output_options.output_filename} or remove {checkpoint_file_path}."
+            )
+            sys.exit(1)
+        try:
+            checkpoint = SQLiteScanCheckpoint(checkpoint_file_path, provider)
+        except ScanCheckpointMismatchError as error:
+            logger.critical(error)
+            sys.exit(1)
+        if not args.only_logs:
+            print(
+                f"{Style.BRIGHT}Checkpoint of the scan: {Fore.YELLOW}{checkpoint_file_path}{Style.RESET_ALL}, if the scan is interrupted resume it with {Fore.YELLOW}--resume {output_options.output_filename}{Style.RESET_ALL}\n"
+            )
+
+    generated_outputs = generate_output_writers(
+        provider,
+        args.output_formats,
+        output_options,
+        bulk_compliance_frameworks,
+    )
+
+    # Write the findings of each check to the outputs as soon as the check is completed, unless the fixer needs them
+    output_stream = None
+    if not output_options.fixer:
+        output_stream = OutputStream(
+            global_provider,
+            output_options,
+            generated_outputs,
+            keep_asff_findings=getattr(args, "security_hub", False),
+        )
+        # The checks completed before the interruption are not executed again
+        if args.resume:
+            output_stream.restore(checkpoint)
+
     # Execute checks
     findings = []
 
-    if len(checks_to_execute):
+    # The fixers use the service clients once the checks are completed
+    evict_completed_services = args.evict_completed_services
+    if evict_completed_services and output_options.fixer:
+        logger.warning(
+            "--evict-completed-services is ignored with --fixer, since the fixers need the service clients"
+        )
+        evict_completed_services = False
+
+    if len(checks_to_execute) and organizations_scan:
+        scan_organizations(
+            args,
+            global_provider,
+            AWSOrganizationsScanCatalog(
+                bulk_checks_metadata=bulk_checks_metadata,
+                bulk_compliance_frameworks=bulk_compliance_frameworks,
+                checks_to_execute=checks_to_execute,
+                custom_checks_metadata=custom_checks_metadata,
+            ),
+            output_stream.add_finding_outputs,
+        )
+    elif len(checks_to_execute):
         findings = execute_checks(
             checks_to_execute,
             global_provider,
             custom_checks_metadata,
             args.config_file,
             output_options,
+            args.max_parallel_checks,
+            args.prefetch_services,
+            evict_completed_services,
+            output_stream.add_findings if output_stream else None,
+            checkpoint,
         )
     else:
         logger.error(
@@ -310,20 +368,15 @@ def prowler():
             print(f"{Style.BRIGHT}{Fore.GREEN}\nNo findings to fix!{Style.RESET_ALL}\n")
         sys.exit()
 
-    # Outputs
-    # TODO: this part is needed since the checks generates a Check_Report_XXX and the output uses Finding
-    # This will be refactored for the outputs generate directly the Finding
-    finding_outputs = []
-    for finding in findings:
-        try:
-            finding_outputs.append(
-                Finding.generate_output(global_provider, finding, output_options)
-            )
-        except Exception:
-            continue
+    # Complete the output files
+    output_stream.close()
+
+    # The scan is completed, so it doesn't need to be resumed
+    if checkpoint:
+        checkpoint.delete()
 
     # Extract findings stats
-    stats = extract_findings_statistics(finding_outputs)
+    stats = output_stream.stats
 
     if args.slack:
         # TODO: this should be also in a config file
@@ -346,348 +399,6 @@ def prowler():
             )
             sys.exit(1)
 
-    generated_outputs = {"regular": [], "compliance": []}
-
-    if args.output_formats:
-        for mode in args.output_formats:
-            filename = (
-                f"{output_options.output_directory}/{output_options.output_filename}"
-            )
-            if mode == "csv":
-                csv_output = CSV(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{csv_file_suffix}",
-                )
-                generated_outputs["regular"].append(csv_output)
-                # Write CSV Finding Object to file
-                csv_output.batch_write_data_to_file()
-
-            if mode == "json-asff":
-                asff_output = ASFF(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{json_asff_file_suffix}",
-                )
-                generated_outputs["regular"].append(asff_output)
-                # Write ASFF Finding Object to file
-                asff_output.batch_write_data_to_file()
-
-            if mode == "json-ocsf":
-                json_output = OCSF(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{json_ocsf_file_suffix}",
-                )
-                generated_outputs["regular"].append(json_output)
-                json_output.batch_write_data_to_file()
-            if mode == "html":
-                html_output = HTML(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{html_file_suffix}",
-                )
-                generated_outputs["regular"].append(html_output)
-                html_output.batch_write_data_to_file(
-                    provider=global_provider, stats=stats
-                )
-
-    # Compliance Frameworks
-    input_compliance_frameworks = set(output_options.output_modes).intersection(
-        get_available_compliance_frameworks(provider)
-    )
-    if provider == "aws":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = AWSCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_aws":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = AWSMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = AWSENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("aws_well_architected_framework"):
-                # Generate AWS Well-Architected Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                aws_well_architected = AWSWellArchitected(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(aws_well_architected)
-                aws_well_architected.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = AWSISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name.startswith("kisa"):
-                # Generate KISA-ISMS-P Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                kisa_ismsp = AWSKISAISMSP(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(kisa_ismsp)
-                kisa_ismsp.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "azure":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = AzureCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_azure":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = AzureMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = AzureENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = AzureISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "gcp":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = GCPCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_gcp":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = GCPMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = GCPENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = GCPISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "kubernetes":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = KubernetesCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = KubernetesISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "microsoft365":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = Microsoft365CIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
     # AWS Security Hub Integration
     if provider == "aws":
         # Send output to S3 if needed (-B / -D) for all the output formats
@@ -723,7 +434,7 @@ def prowler():
                 aws_account_id=global_provider.identity.account,
                 aws_partition=global_provider.identity.partition,
                 aws_session=global_provider.session.current_session,
-                findings=asff_output.data,
+                findings=output_stream.asff_findings,
                 send_only_fails=output_options.send_sh_only_fails,
                 aws_security_hub_available_regions=security_hub_regions,
             )
@@ -745,17 +456,16 @@ def prowler():
                     f"{Style.BRIGHT}{Fore.GREEN}\n{findings_archived_in_security_hub} findings archived in AWS Security Hub!{Style.RESET_ALL}"
                 )
 
-    # Display summary table
-    if not args.only_logs:
+    # Display summary table, the findings of the accounts of the AWS Organization are summarized by account
+    if not args.only_logs and not organizations_scan:
+        findings_summary = output_stream.summary
         display_summary_table(
-            findings,
+            findings_summary,
             global_provider,
             output_options,
         )
         # Only display compliance table if there are findings (not all MANUAL) and it is a default execution
-        if (
-            findings and not all(finding.status == "MANUAL" for finding in findings)
-        ) and default_execution:
+        if not findings_summary.all_manual and default_execution:
             compliance_overview = False
             if not compliance_framework:
                 compliance_framework = get_available_compliance_frameworks(provider)
@@ -766,7 +476,7 @@ def prowler():
             for compliance in sorted(compliance_framework):
                 # Display compliance table
                 display_compliance_table(
-                    findings,
+                    findings_summary.get_findings(),
                     bulk_checks_metadata,
                     compliance,
                     output_options.output_filename,
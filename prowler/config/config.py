@@ -66,6 +66,7 @@ json_file_suffix = ".json"
 json_asff_file_suffix = ".asff.json"
 json_ocsf_file_suffix = ".ocsf.json"
 html_file_suffix = ".html"
+checkpoint_file_suffix = ".checkpoint.db"
 default_config_file_path = (
     f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/config.yaml"
 )
@@ -76,6 +77,16 @@ encoding_format_utf_8 = "utf-8"
 available_output_formats = ["csv", "json-asff", "json-ocsf", "html"]
 
 
+def get_default_metadata_cache_directory() -> str:
+    """
+    get_default_metadata_cache_directory returns the directory of the pre-parsed checks metadata and compliance frameworks
+    """
+    return os.path.join(
+        os.getenv("XDG_CACHE_HOME", os.path.join(pathlib.Path.home(), ".cache")),
+        "prowler",
+    )
+
+
 def get_default_mute_file_path(provider: str):
     """
     get_default_mute_file_path returns the default mute file path for the provider
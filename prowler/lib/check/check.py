@@ -5,8 +5,10 @@ import re
 import shutil
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 from types import ModuleType
-from typing import Any
+from typing import Any, Callable, Generator
 
 from alive_progress import alive_bar
 from colorama import Fore, Style
@@ -14,10 +16,13 @@ from colorama import Fore, Style
 import prowler
 from prowler.config.config import orange_color
 from prowler.lib.check.custom_checks_metadata import update_check_metadata
+from prowler.lib.check.eviction import ServiceClientEvictor, print_service_memory_usage
 from prowler.lib.check.models import Check
+from prowler.lib.check.prefetch import ServiceClientPrefetcher
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import report
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.common.models import Audit_Metadata
 
@@ -383,13 +388,167 @@ def run_fixer(check_findings: list) -> int:
         )
 
 
+def run_check(
+    check_name: str,
+    global_provider: Any,
+    custom_checks_metadata: Any,
+    output_options: Any,
+    verbose: bool = False,
+):
+    """
+    Import, instantiate and execute a single check
+
+    Args:
+        check_name (str): check name
+        global_provider (Any): provider object
+        custom_checks_metadata (Any): custom checks metadata
+        output_options (Any): output options, depending on the provider
+        verbose (bool): print the check information before executing it
+
+    Returns:
+        list: list of findings, or None if the check was not found
+    """
+    # Recover service from check name
+    service = check_name.split("_")[0]
+    try:
+        # Import check module
+        check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
+        lib = import_check(check_module_path)
+        # Recover functions from check
+        check_to_execute = getattr(lib, check_name)
+        check = check_to_execute()
+    except ModuleNotFoundError:
+        logger.error(
+            f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
+        )
+        return None
+    if verbose:
+        print(
+            f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
+        )
+    return execute(
+        check,
+        global_provider,
+        custom_checks_metadata,
+        output_options,
+    )
+
+
+def run_checks(
+    checks_to_execute: list,
+    check_runner: Callable[[str], Any],
+    max_parallel_checks: int = 1,
+    prefetcher: ServiceClientPrefetcher = None,
+) -> Generator[tuple[str, Any], None, None]:
+    """
+    Run the checks with the given check_runner and yield the result of each one as soon as it is completed
+
+    With max_parallel_checks set to 1 the checks are executed one after another following the
+    given order. Otherwise the checks are grouped by service and every group is executed in a
+    worker thread, so the service clients of different services are loaded concurrently while
+    the checks of the same service keep running sequentially. In that case the checks are
+    yielded in completion order.
+
+    If a prefetcher is given, it is notified every time a service starts so the clients of the upcoming
+    services are built in the background. It is shut down once all the checks are completed.
+
+    Args:
+        checks_to_execute (list): checks to execute
+        check_runner (Callable[[str], Any]): function that executes a check given its name and returns its findings
+        max_parallel_checks (int): maximum number of services whose checks run concurrently
+        prefetcher (ServiceClientPrefetcher): optional prefetcher of the upcoming services' clients
+
+    Yields:
+        tuple[str, Any]: the check name and the value returned by the check_runner, None if it raised an exception
+    """
+
+    def execute_check(check_name: str):
+        try:
+            if prefetcher:
+                prefetcher.service_started(check_name.split("_")[0])
+            return check_runner(check_name)
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
+    try:
+        if not max_parallel_checks or max_parallel_checks <= 1:
+            for check_name in checks_to_execute:
+                yield check_name, execute_check(check_name)
+        else:
+            yield from _run_checks_in_parallel(
+                checks_to_execute, execute_check, max_parallel_checks
+            )
+    finally:
+        if prefetcher:
+            prefetcher.shutdown()
+
+
+def _run_checks_in_parallel(
+    checks_to_execute: list,
+    execute_check: Callable[[str], Any],
+    max_parallel_checks: int,
+) -> Generator[tuple[str, Any], None, None]:
+    """Execute each service's checks in a worker thread and yield them in completion order"""
+    # Group the checks by service keeping the execution order within each service
+    service_checks = {}
+    for check_name in checks_to_execute:
+        service_checks.setdefault(check_name.split("_")[0], []).append(check_name)
+
+    completed_checks = Queue()
+
+    def execute_service_checks(checks: list):
+        for check_name in checks:
+            check_findings = None
+            try:
+                check_findings = execute_check(check_name)
+            finally:
+                # Always report the check back, otherwise the consumer would wait forever
+                completed_checks.put((check_name, check_findings))
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_parallel_checks, len(service_checks))
+    ) as executor:
+        for checks in service_checks.values():
+            executor.submit(execute_service_checks, checks)
+        for _ in range(len(checks_to_execute)):
+            yield completed_checks.get()
+
+
 def execute_checks(
     checks_to_execute: list,
     global_provider: Any,
     custom_checks_metadata: Any,
     config_file: str,
     output_options: Any,
+    max_parallel_checks: int = 1,
+    prefetch_services: int = 0,
+    evict_completed_services: bool = False,
+    findings_handler: Callable[[list], None] = None,
+    checkpoint: ScanCheckpoint = None,
 ) -> list:
+    """
+    Execute the checks and report their findings.
+
+    If a findings_handler is passed, the findings of each check are passed to it as soon as the check is completed
+    and they are not returned, so they don't need to be kept in memory until all the checks are executed.
+
+    If a checkpoint is passed, the checks it already completed are skipped and every check is recorded in it, with
+    the Finding objects returned by the findings_handler, once the findings_handler has processed its findings.
+    """
+    # Skip the checks completed before the scan was interrupted
+    completed_checks_num = 0
+    if checkpoint:
+        remaining_checks = [
+            check
+            for check in checks_to_execute
+            if check not in checkpoint.completed_checks
+        ]
+        completed_checks_num = len(checks_to_execute) - len(remaining_checks)
+        checks_to_execute = remaining_checks
+
     # List to store all the check's findings
     all_findings = []
     # Services and checks executed for the Audit Status
@@ -431,49 +590,53 @@ def execute_checks(
     elif hasattr(output_options, "fixer"):
         verbose = output_options.fixer
 
+    # Build the clients of the upcoming services in the background
+    prefetcher = None
+    if prefetch_services:
+        prefetcher = ServiceClientPrefetcher(
+            global_provider.type,
+            checks_to_execute,
+            prefetch_services,
+        )
+
+    # Release the service clients once their checks are completed
+    evictor = None
+    if evict_completed_services:
+        evictor = ServiceClientEvictor(global_provider.type, checks_to_execute)
+
     # Execution with the --only-logs flag
     if output_options.only_logs:
-        for check_name in checks_to_execute:
-            # Recover service from check name
-            service = check_name.split("_")[0]
+        for check_name, check_findings in run_checks(
+            checks_to_execute,
+            lambda check_name: run_check(
+                check_name,
+                global_provider,
+                custom_checks_metadata,
+                output_options,
+                verbose,
+            ),
+            max_parallel_checks,
+            prefetcher,
+        ):
+            if evictor:
+                evictor.check_completed(check_name)
+            if check_findings is None:
+                continue
             try:
-                try:
-                    # Import check module
-                    check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                    lib = import_check(check_module_path)
-                    # Recover functions from check
-                    check_to_execute = getattr(lib, check_name)
-                    check = check_to_execute()
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                    continue
-                if verbose:
-                    print(
-                        f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
-                    )
-                check_findings = execute(
-                    check,
-                    global_provider,
-                    custom_checks_metadata,
-                    output_options,
-                )
                 report(check_findings, global_provider, output_options)
-                all_findings.extend(check_findings)
+                if findings_handler:
+                    finding_outputs = findings_handler(check_findings)
+                    if checkpoint:
+                        checkpoint.add_check(check_name, finding_outputs or [])
+                else:
+                    all_findings.extend(check_findings)
 
                 # Update Audit Status
-                services_executed.add(service)
+                services_executed.add(check_name.split("_")[0])
                 checks_executed.add(check_name)
                 global_provider.audit_metadata = update_audit_metadata(
                     global_provider.audit_metadata, services_executed, checks_executed
                 )
-
-            # If check does not exists in the provider or is from another provider
-            except ModuleNotFoundError:
-                logger.error(
-                    f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                )
             except Exception as error:
                 logger.error(
                     f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -489,6 +652,18 @@ def execute_checks(
             messages.append(
                 f"Scanning unused services and resources: {Fore.YELLOW}{global_provider.scan_unused_services}{Style.RESET_ALL}"
             )
+        if max_parallel_checks and max_parallel_checks > 1:
+            messages.append(
+                f"Maximum services scanned in parallel: {Fore.YELLOW}{max_parallel_checks}{Style.RESET_ALL}"
+            )
+        if prefetch_services:
+            messages.append(
+                f"Services prefetched in the background: {Fore.YELLOW}{prefetch_services}{Style.RESET_ALL}"
+            )
+        if completed_checks_num:
+            messages.append(
+                f"Checks completed before resuming the scan: {Fore.YELLOW}{completed_checks_num}{Style.RESET_ALL}"
+            )
         report_title = (
             f"{Style.BRIGHT}Using the following configuration:{Style.RESET_ALL}"
         )
@@ -510,61 +685,55 @@ def execute_checks(
             stats=False,
             enrich_print=False,
         ) as bar:
-            for check_name in checks_to_execute:
+            if checks_to_execute:
+                bar.title = f"-> Scanning {orange_color}{checks_to_execute[0].split('_')[0]}{Style.RESET_ALL} service"
+            for check_name, check_findings in run_checks(
+                checks_to_execute,
+                lambda check_name: run_check(
+                    check_name,
+                    global_provider,
+                    custom_checks_metadata,
+                    output_options,
+                    verbose,
+                ),
+                max_parallel_checks,
+                prefetcher,
+            ):
                 # Recover service from check name
                 service = check_name.split("_")[0]
                 bar.title = (
                     f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
                 )
-                try:
+                if evictor:
+                    evictor.check_completed(check_name)
+                if check_findings is not None:
                     try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
+                        report(check_findings, global_provider, output_options)
+
+                        if findings_handler:
+                            finding_outputs = findings_handler(check_findings)
+                            if checkpoint:
+                                checkpoint.add_check(check_name, finding_outputs or [])
+                        else:
+                            all_findings.extend(check_findings)
+                        services_executed.add(service)
+                        checks_executed.add(check_name)
+                        global_provider.audit_metadata = update_audit_metadata(
+                            global_provider.audit_metadata,
+                            services_executed,
+                            checks_executed,
                         )
-                        continue
-                    if verbose:
-                        print(
-                            f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity.value}]{Style.RESET_ALL}"
+                    except Exception as error:
+                        # TODO: add more loggin here, we need the original exception -- traceback.print_last()
+                        logger.error(
+                            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
-                    check_findings = execute(
-                        check,
-                        global_provider,
-                        custom_checks_metadata,
-                        output_options,
-                    )
-
-                    report(check_findings, global_provider, output_options)
-
-                    all_findings.extend(check_findings)
-                    services_executed.add(service)
-                    checks_executed.add(check_name)
-                    global_provider.audit_metadata = update_audit_metadata(
-                        global_provider.audit_metadata,
-                        services_executed,
-                        checks_executed,
-                    )
-
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                except Exception as error:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
                 bar()
             bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
 
+        if evictor:
+            print_service_memory_usage(evictor.service_memory_usage)
+
     return all_findings
 
 
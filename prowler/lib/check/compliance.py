@@ -4,6 +4,42 @@ from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.logger import logger
 
 
+def get_checks_compliance_index(bulk_compliance_frameworks: dict) -> dict:
+    """
+    Build the inverted index of the compliance frameworks by check in a single pass over their requirements
+    Args:
+        bulk_compliance_frameworks (dict): The compliance frameworks
+
+    Returns:
+        dict: The compliance frameworks, with only the requirement that includes the check, by check ID
+
+    Example:
+        {
+            "accessanalyzer_enabled": [
+                Compliance(Framework="CIS", Version="1.4", Requirements=[<Requirement 1.20>], ...),
+                ...
+            ],
+        }
+    """
+    checks_compliance = {}
+    for framework in bulk_compliance_frameworks.values():
+        for requirement in framework.Requirements:
+            # A check listed twice in a requirement is only included once
+            for check in dict.fromkeys(requirement.Checks):
+                # Each check gets its own Compliance, so a check's metadata can be modified without affecting the
+                # other checks. The framework is already validated.
+                checks_compliance.setdefault(check, []).append(
+                    Compliance.construct(
+                        Framework=framework.Framework,
+                        Provider=framework.Provider,
+                        Version=framework.Version,
+                        Description=framework.Description,
+                        Requirements=[requirement],
+                    )
+                )
+    return checks_compliance
+
+
 def update_checks_metadata_with_compliance(
     bulk_compliance_frameworks: dict, bulk_checks_metadata: dict
 ) -> dict:
@@ -17,27 +53,12 @@ def update_checks_metadata_with_compliance(
         dict: The checks metadata with the compliance frameworks
     """
     try:
+        checks_compliance = get_checks_compliance_index(bulk_compliance_frameworks)
         for check in bulk_checks_metadata:
-            check_compliance = []
-            for framework in bulk_compliance_frameworks.values():
-                for requirement in framework.Requirements:
-                    compliance_requirements = []
-                    # Verify if check is in the requirement
-                    if check in requirement.Checks:
-                        # Include the requirement into the check's framework requirements
-                        compliance_requirements.append(requirement)
-                        # Create the Compliance
-                        compliance = Compliance(
-                            Framework=framework.Framework,
-                            Provider=framework.Provider,
-                            Version=framework.Version,
-                            Description=framework.Description,
-                            Requirements=compliance_requirements,
-                        )
-                        # Include the compliance framework for the check
-                        check_compliance.append(compliance)
             # Save it into the check's metadata
-            bulk_checks_metadata[check].Compliance = check_compliance
+            bulk_checks_metadata[check].Compliance = list(
+                checks_compliance.get(check, [])
+            )
         return bulk_checks_metadata
     except Exception as e:
         logger.critical(f"{e.__class__.__name__}[{e.__traceback__.tb_lineno}] -- {e}")
@@ -5,6 +5,7 @@ from typing import Optional, Union
 
 from pydantic import BaseModel, ValidationError, root_validator
 
+from prowler.lib.check.metadata_cache import MetadataCache
 from prowler.lib.check.utils import list_compliance_modules
 from prowler.lib.logger import logger
 
@@ -328,6 +329,7 @@ class Compliance(BaseModel):
         """Bulk load all compliance frameworks specification into a dict"""
         try:
             bulk_compliance_frameworks = {}
+            metadata_cache = MetadataCache(f"{provider}_compliance")
             available_compliance_framework_modules = list_compliance_modules()
             for compliance_framework in available_compliance_framework_modules:
                 if provider in compliance_framework.name:
@@ -346,8 +348,9 @@ class Compliance(BaseModel):
                             compliance_framework_name = filename.split(".json")[0]
                             # Store the compliance info
                             bulk_compliance_frameworks[compliance_framework_name] = (
-                                load_compliance_framework(file_path)
+                                metadata_cache.get(file_path, load_compliance_framework)
                             )
+            metadata_cache.save()
         except Exception as e:
             logger.error(f"{e.__class__.__name__}[{e.__traceback__.tb_lineno}] -- {e}")
 
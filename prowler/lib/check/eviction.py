@@ -0,0 +1,187 @@
+import gc
+import os
+import re
+import sys
+
+from colorama import Style
+from tabulate import tabulate
+
+import prowler
+from prowler.lib.logger import logger
+
+client_import_regex = re.compile(r"from\s+(prowler\.providers\.[\w.]+_client)\s+import")
+
+
+def get_memory_usage() -> int:
+    """
+    get_memory_usage returns the current resident set size of the process in bytes, or None if it is not available.
+    """
+    try:
+        with open("/proc/self/statm", "r") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        # /proc is only available on Linux
+        return None
+
+
+def get_check_client_modules(provider: str, check_name: str) -> set[str]:
+    """
+    get_check_client_modules returns the client modules imported by the given check reading its source file.
+
+    Example:
+        get_check_client_modules("aws", "ec2_instance_port_ssh_exposed_to_internet") -> {
+            "prowler.providers.aws.services.ec2.ec2_client",
+            "prowler.providers.aws.services.vpc.vpc_client",
+        }
+    """
+    service = check_name.split("_")[0]
+    check_path = os.path.join(
+        prowler.__path__[0],
+        "providers",
+        provider,
+        "services",
+        service,
+        check_name,
+        f"{check_name}.py",
+    )
+    try:
+        with open(check_path, "r") as check_file:
+            return set(client_import_regex.findall(check_file.read()))
+    except OSError as error:
+        logger.warning(
+            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return set()
+
+
+def unload_module(module_name: str) -> bool:
+    """
+    unload_module removes the module from sys.modules and from its parent package so it can be garbage collected.
+
+    Returns True if the module was loaded.
+    """
+    module = sys.modules.pop(module_name, None)
+    if module is None:
+        return False
+    parent_name, _, child_name = module_name.rpartition(".")
+    parent = sys.modules.get(parent_name)
+    if parent is not None and getattr(parent, child_name, None) is module:
+        delattr(parent, child_name)
+    return True
+
+
+class ServiceClientEvictor:
+    """
+    ServiceClientEvictor releases the service clients, and all the resources they collected, once they are no longer needed.
+
+    Every <service>_client module keeps its service object, with all the collected resources, alive until the
+    process exits. The evictor keeps track of the pending checks importing each client module and unloads the
+    client once all of them are completed, along with the completed check modules that reference it. It also
+    records the memory usage of the process once each service's checks are completed and its clients released.
+
+    Attributes:
+        provider (str): The provider type, e.g. aws
+        checks_to_execute (list[str]): The checks to execute
+    """
+
+    def __init__(self, provider: str, checks_to_execute: list[str]):
+        self._provider = provider
+        self._check_client_modules = {}
+        self._client_module_pending_checks = {}
+        self._service_pending_checks = {}
+        self._service_memory_usage = {}
+        for check_name in checks_to_execute:
+            client_modules = get_check_client_modules(provider, check_name)
+            self._check_client_modules[check_name] = client_modules
+            for client_module in client_modules:
+                self._client_module_pending_checks.setdefault(client_module, set()).add(
+                    check_name
+                )
+            self._service_pending_checks.setdefault(
+                check_name.split("_")[0], set()
+            ).add(check_name)
+
+    @property
+    def service_memory_usage(self) -> dict[str, int]:
+        """The resident memory of the process in bytes once each service's checks were completed and its clients released"""
+        return self._service_memory_usage
+
+    def check_completed(self, check_name: str) -> None:
+        """
+        check_completed unloads the check module and the client modules that no pending check needs.
+
+        Args:
+            check_name (str): The completed check
+        """
+        try:
+            service = check_name.split("_")[0]
+            service_module_path = (
+                f"prowler.providers.{self._provider}.services.{service}"
+            )
+            # The check module keeps a reference to the clients it imported
+            unload_module(f"{service_module_path}.{check_name}.{check_name}")
+
+            evicted_client_modules = []
+            for client_module in self._check_client_modules.pop(check_name, set()):
+                pending_checks = self._client_module_pending_checks.get(
+                    client_module, set()
+                )
+                pending_checks.discard(check_name)
+                if not pending_checks and unload_module(client_module):
+                    evicted_client_modules.append(client_module)
+
+            pending_service_checks = self._service_pending_checks.get(service, set())
+            pending_service_checks.discard(check_name)
+            if not pending_service_checks:
+                # Unload the remaining clients of the service, e.g. the ones loaded by the prefetch
+                for module_name in list(sys.modules):
+                    if (
+                        module_name.startswith(f"{service_module_path}.")
+                        and module_name.endswith("_client")
+                        and not self._client_module_pending_checks.get(module_name)
+                        and unload_module(module_name)
+                    ):
+                        evicted_client_modules.append(module_name)
+
+            if evicted_client_modules:
+                gc.collect()
+                logger.info(
+                    f"{service.upper()} - Released {', '.join(sorted(evicted_client_modules))}"
+                )
+
+            if not pending_service_checks:
+                self._service_pending_checks.pop(service, None)
+                self._service_memory_usage[service] = get_memory_usage()
+                logger.info(
+                    f"{service.upper()} - Checks completed, memory usage: {self._service_memory_usage[service]} bytes"
+                )
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+
+def print_service_memory_usage(service_memory_usage: dict[str, int]):
+    """
+    print_service_memory_usage prints the memory usage of the process once each service's checks were completed.
+
+    Args:
+        service_memory_usage (dict[str, int]): The resident memory in bytes by service
+    """
+    if not service_memory_usage:
+        return
+    table = [
+        [service, f"{memory_usage / 1024 / 1024:.1f}"]
+        for service, memory_usage in service_memory_usage.items()
+        if memory_usage is not None
+    ]
+    if table:
+        print(f"\n{Style.BRIGHT}Memory usage by service:{Style.RESET_ALL}")
+        print(
+            tabulate(
+                table,
+                headers=["Service", "RSS after release (MiB)"],
+                tablefmt="rounded_grid",
+            )
+        )
@@ -0,0 +1,147 @@
+import os
+import pickle
+import stat
+import tempfile
+from typing import Any, Callable
+
+from pydantic import VERSION as pydantic_version
+
+from prowler.config.config import get_default_metadata_cache_directory, prowler_version
+from prowler.lib.logger import logger
+
+# Increase it when the format of the cache changes
+METADATA_CACHE_FORMAT_VERSION = 1
+# Set it to "true" to always parse the metadata files
+METADATA_CACHE_DISABLED_ENV = "PROWLER_DISABLE_METADATA_CACHE"
+
+
+class MetadataCache:
+    """
+    MetadataCache stores the already validated models parsed from the metadata files in a single file.
+
+    Each model is stored with the modification time and size of its file, so it is only parsed again if the
+    file changes. The whole cache is discarded when the Prowler or pydantic versions change.
+
+    The cache file is a pickle, and unpickling runs code, so it is only loaded if it is owned by the current
+    user and it is not writable by group or others. The cache directory is created only accessible by the user.
+    It is disabled setting the PROWLER_DISABLE_METADATA_CACHE environment variable to true.
+
+    Attributes:
+        name (str): The name of the cache file, e.g. aws_checks_metadata
+        cache_directory (str): The directory of the cache file, by default the Prowler directory of the user's cache
+    """
+
+    def __init__(self, name: str, cache_directory: str = None):
+        self._cache_file = os.path.join(
+            cache_directory or get_default_metadata_cache_directory(), f"{name}.pickle"
+        )
+        self._version = (
+            METADATA_CACHE_FORMAT_VERSION,
+            prowler_version,
+            pydantic_version,
+        )
+        self._enabled = os.getenv(METADATA_CACHE_DISABLED_ENV, "").lower() not in (
+            "true",
+            "1",
+        )
+        self._entries = {}
+        self._updated = False
+        if self._enabled:
+            self._load()
+
+    @property
+    def cache_file(self) -> str:
+        return self._cache_file
+
+    def _load(self) -> None:
+        try:
+            with open(self._cache_file, "rb") as cache_file:
+                if not self._is_trusted(os.fstat(cache_file.fileno())):
+                    logger.warning(
+                        f"{self._cache_file} - Ignoring the cache file since it is not owned by the current user or it is writable by others"
+                    )
+                    return
+                cache = pickle.load(cache_file)
+            if cache.get("version") == self._version:
+                self._entries = cache["entries"]
+        except FileNotFoundError:
+            pass
+        except Exception as error:
+            # A corrupted or incompatible cache is discarded
+            logger.warning(
+                f"{self._cache_file} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    @staticmethod
+    def _is_trusted(file_stat: os.stat_result) -> bool:
+        if file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return False
+        # os.getuid is not available on Windows
+        return not hasattr(os, "getuid") or file_stat.st_uid == os.getuid()
+
+    def get(self, file_path: str, load: Callable[[str], Any]) -> Any:
+        """
+        get returns the model of the given file from the cache, loading it if the file has changed.
+
+        Args:
+            file_path (str): The path of the metadata file
+            load (Callable[[str], Any]): The function that parses and validates the metadata file
+
+        Returns:
+            Any: The model of the metadata file
+        """
+        if not self._enabled:
+            return load(file_path)
+        try:
+            file_stat = os.stat(file_path)
+            file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            return load(file_path)
+
+        entry = self._entries.get(file_path)
+        if entry is not None and entry[0] == file_version:
+            return entry[1]
+
+        model = load(file_path)
+        self._entries[file_path] = (file_version, model)
+        self._updated = True
+        return model
+
+    def save(self) -> None:
+        """save writes the cache file if any model was loaded or any cached file was removed"""
+        if not self._enabled:
+            return
+        try:
+            # Only the entries of removed files are dropped, since a load may not cover all the files
+            removed_entries = [
+                file_path
+                for file_path in self._entries
+                if not os.path.isfile(file_path)
+            ]
+            if not self._updated and not removed_entries:
+                return
+            for file_path in removed_entries:
+                del self._entries[file_path]
+
+            cache_directory = os.path.dirname(self._cache_file)
+            os.makedirs(cache_directory, mode=0o700, exist_ok=True)
+            # Write it to a temporary file first so other processes never read a partial cache
+            with tempfile.NamedTemporaryFile(
+                dir=cache_directory, suffix=".tmp", delete=False
+            ) as cache_file:
+                try:
+                    pickle.dump(
+                        {"version": self._version, "entries": self._entries},
+                        cache_file,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                except Exception:
+                    cache_file.close()
+                    os.remove(cache_file.name)
+                    raise
+            os.replace(cache_file.name, self._cache_file)
+            self._updated = False
+        except Exception as error:
+            logger.warning(
+                f"{self._cache_file} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
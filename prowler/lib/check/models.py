@@ -7,10 +7,11 @@ from dataclasses import asdict, dataclass, is_dataclass
 from enum import Enum
 from typing import Any, Dict, Set
 
-from pydantic import BaseModel, ValidationError, validator
+from pydantic import BaseModel, PrivateAttr, ValidationError, validator
 
 from prowler.config.config import Provider
 from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.check.metadata_cache import MetadataCache
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 
@@ -152,6 +153,7 @@ class CheckMetadata(BaseModel):
         """
 
         bulk_check_metadata = {}
+        metadata_cache = MetadataCache(f"{provider}_checks_metadata")
         checks = recover_checks_from_provider(provider)
         # Build list of check's metadata files
         for check_info in checks:
@@ -164,8 +166,9 @@ class CheckMetadata(BaseModel):
             # Append metadata file extension
             metadata_file = f"{check_path}/{check_name}.metadata.json"
             # Load metadata
-            check_metadata = load_check_metadata(metadata_file)
+            check_metadata = metadata_cache.get(metadata_file, load_check_metadata)
             bulk_check_metadata[check_metadata.CheckID] = check_metadata
+        metadata_cache.save()
 
         return bulk_check_metadata
 
@@ -382,6 +385,8 @@ class CheckMetadata(BaseModel):
 class Check(ABC, CheckMetadata):
     """Prowler Check"""
 
+    _metadata: CheckMetadata = PrivateAttr(default=None)
+
     def __init__(self, **data):
         """Check's init function. Calls the CheckMetadataModel init."""
         # Parse the Check's metadata file
@@ -396,9 +401,15 @@ class Check(ABC, CheckMetadata):
         # TODO: verify that the CheckID is the same as the filename and classname
         # to mimic the test done at test_<provider>_checks_metadata_is_valid
 
-    def metadata(self) -> dict:
-        """Return the JSON representation of the check's metadata"""
-        return self.json()
+    def metadata(self) -> CheckMetadata:
+        """Return the check's metadata, shared by all the findings of the check.
+
+        It is built the first time it is requested, after any custom metadata has been applied to the check,
+        and it must not be modified: each Check_Report keeps its own copy of it.
+        """
+        if self._metadata is None:
+            self._metadata = CheckMetadata.parse_raw(self.json())
+        return self._metadata
 
     @abstractmethod
     def execute(self) -> list:
@@ -412,39 +423,57 @@ class Check_Report:
     status: str
     status_extended: str
     check_metadata: CheckMetadata
-    resource: dict
     resource_details: str
     resource_tags: list
     muted: bool
 
-    def __init__(self, metadata: Dict, resource: Any) -> None:
+    def __init__(self, metadata: CheckMetadata, resource: Any) -> None:
         """Initialize the Check's finding information.
 
         Args:
-            metadata: The metadata of the check.
+            metadata: The metadata of the check, as returned by Check.metadata(). Its JSON representation is also accepted.
             resource: Basic information about the resource. Defaults to None.
                       Only accepted dict, list, BaseModels (dict attribute), custom models (with to_dict attribute) and dataclasses.
         """
         self.status = ""
-        self.check_metadata = CheckMetadata.parse_raw(metadata)
-        if isinstance(resource, dict):
-            self.resource = resource
-        elif hasattr(resource, "dict"):
-            self.resource = resource.dict()
-        elif hasattr(resource, "to_dict"):
-            self.resource = resource.to_dict()
-        elif is_dataclass(resource):
-            self.resource = asdict(resource)
+        if isinstance(metadata, CheckMetadata):
+            # A shallow copy is enough for the checks that change a field, like the Severity, of a single finding
+            self.check_metadata = metadata.copy()
         else:
-            logger.error(
-                f"Resource metadata {type(resource)} in {self.check_metadata.CheckID} could not be converted to dict"
-            )
-            self.resource = {}
+            # Custom checks may still pass the JSON representation of the metadata
+            self.check_metadata = CheckMetadata.parse_raw(metadata)
+        # The resource is converted to a dict the first time it is read
+        self._resource = resource
+        self._resource_dict = None
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = getattr(resource, "tags", []) if resource else []
         self.muted = False
 
+    @property
+    def resource(self) -> dict:
+        """The attributes of the resource, converted to a dict the first time they are read."""
+        if self._resource_dict is None:
+            resource = self._resource
+            if isinstance(resource, dict):
+                self._resource_dict = resource
+            elif hasattr(resource, "dict"):
+                self._resource_dict = resource.dict()
+            elif hasattr(resource, "to_dict"):
+                self._resource_dict = resource.to_dict()
+            elif is_dataclass(resource):
+                self._resource_dict = asdict(resource)
+            else:
+                logger.error(
+                    f"Resource metadata {type(resource)} in {self.check_metadata.CheckID} could not be converted to dict"
+                )
+                self._resource_dict = {}
+        return self._resource_dict
+
+    @resource.setter
+    def resource(self, resource: dict) -> None:
+        self._resource_dict = resource
+
 
 @dataclass
 class Check_Report_AWS(Check_Report):
@@ -0,0 +1,120 @@
+import importlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+
+from prowler.lib.check.eviction import get_check_client_modules
+from prowler.lib.logger import logger
+
+
+def get_services_client_modules(
+    provider: str, checks_to_execute: list[str]
+) -> dict[str, list[str]]:
+    """
+    get_services_client_modules returns the client modules imported by the checks of each service, in execution order
+
+    The client modules are read from the checks' own imports, so they include the clients of other services.
+
+    Example:
+        get_services_client_modules("aws", ["ec2_instance_port_ssh_exposed_to_internet"]) -> {
+            "ec2": [
+                "prowler.providers.aws.services.ec2.ec2_client",
+                "prowler.providers.aws.services.vpc.vpc_client",
+            ]
+        }
+    """
+    services_client_modules = {}
+    for check_name in checks_to_execute:
+        services_client_modules.setdefault(check_name.split("_")[0], set()).update(
+            get_check_client_modules(provider, check_name)
+        )
+    return {
+        service: sorted(client_modules)
+        for service, client_modules in services_client_modules.items()
+    }
+
+
+class ServiceClientPrefetcher:
+    """
+    ServiceClientPrefetcher builds the service clients of the upcoming services in background threads.
+
+    Each <service>_client module instantiates its service the first time it is imported, so all the
+    API calls to collect the service's resources block the first check of that service. When the checks
+    of a service start, the prefetcher imports the client modules used by the checks of the next services in the background,
+    overlapping their resource collection with the evaluation of the current service's checks. Once a
+    service starts, its prefetch is released since its clients are already loaded or being loaded.
+
+    Attributes:
+        provider (str): The provider type, e.g. aws
+        checks_to_execute (list[str]): The checks to execute, in execution order
+        max_prefetched_services (int): The number of upcoming services to prefetch
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        checks_to_execute: list[str],
+        max_prefetched_services: int = 1,
+    ):
+        self._provider = provider
+        self._services_client_modules = get_services_client_modules(
+            provider, checks_to_execute
+        )
+        self._services = list(self._services_client_modules.keys())
+        self._services_position = {
+            service: position for position, service in enumerate(self._services)
+        }
+        self._max_prefetched_services = max_prefetched_services
+        self._started_services = set()
+        self._prefetching: dict[str, Future] = {}
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_prefetched_services)
+
+    @property
+    def prefetching(self) -> set[str]:
+        with self._lock:
+            return set(self._prefetching.keys())
+
+    def service_started(self, service: str) -> None:
+        """
+        service_started releases the prefetch of the given service and starts prefetching the next services.
+
+        Args:
+            service (str): The service whose checks are starting
+        """
+        with self._lock:
+            if service in self._started_services:
+                return
+            self._started_services.add(service)
+            # The service clients are already loaded or being loaded, the import lock makes the checks wait for them
+            self._prefetching.pop(service, None)
+
+            position = self._services_position.get(service)
+            if position is None:
+                return
+            upcoming_services = [
+                upcoming_service
+                for upcoming_service in self._services[position + 1 :]
+                if upcoming_service not in self._started_services
+            ][: self._max_prefetched_services]
+            for upcoming_service in upcoming_services:
+                if upcoming_service not in self._prefetching:
+                    self._prefetching[upcoming_service] = self._executor.submit(
+                        self._prefetch_service, upcoming_service
+                    )
+
+    def shutdown(self) -> None:
+        """shutdown cancels the pending prefetches and releases the worker threads"""
+        with self._lock:
+            self._prefetching.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prefetch_service(self, service: str) -> None:
+        try:
+            for client_module in self._services_client_modules.get(service, []):
+                logger.debug(f"Prefetching {client_module}")
+                importlib.import_module(client_module)
+        except Exception as error:
+            # The checks will import the client again and report the error
+            logger.warning(
+                f"{service} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
@@ -1,6 +1,6 @@
 import argparse
 import sys
-from argparse import RawTextHelpFormatter
+from argparse import ArgumentTypeError, RawTextHelpFormatter
 
 from dashboard.lib.arguments.arguments import init_dashboard_parser
 from prowler.config.config import (
@@ -121,6 +121,17 @@ Detailed documentation at https://docs.prowler.com
         if not valid:
             self.parser.error(f"{args.provider}: {message}")
 
+        # The checkpoint of a scan is stored next to its outputs, which are named after the scan ID
+        if getattr(args, "resume", None) and args.output_filename:
+            self.parser.error(
+                "--resume can't be used with -F/--output-filename, the outputs of the resumed scan are used"
+            )
+        checkpoint = getattr(args, "checkpoint", False) or getattr(args, "resume", None)
+        if checkpoint and getattr(args, "fixer", False):
+            self.parser.error(
+                "--checkpoint and --resume can't be used with --fixer, since the fixer needs all the findings"
+            )
+
         return args
 
     def __set_default_provider__(self, args: list) -> list:
@@ -287,6 +298,34 @@ Detailed documentation at https://docs.prowler.com
             nargs="?",
             help="Specify external directory with custom checks (each check must have a folder with the required files, see more in https://docs.prowler.cloud/en/latest/tutorials/misc/#custom-checks).",
         )
+        common_checks_parser.add_argument(
+            "--max-parallel-checks",
+            type=validate_max_parallel_checks,
+            default=1,
+            help="Maximum number of services whose checks are executed in parallel. Checks from the same service always run sequentially. By default 1, which runs every check sequentially.",
+        )
+        common_checks_parser.add_argument(
+            "--prefetch-services",
+            type=validate_prefetch_services,
+            default=0,
+            help="Number of upcoming services whose resources are collected in the background while the current service's checks are executed. By default 0, which disables the prefetch.",
+        )
+        common_checks_parser.add_argument(
+            "--evict-completed-services",
+            action="store_true",
+            help="Release the resources collected by each service once all the checks using them are completed, reducing the memory usage of large scans. A report of the memory usage after each service is shown at the end of the scan. It is ignored with --fixer, since the fixers need the service clients.",
+        )
+        common_checks_parser.add_argument(
+            "--checkpoint",
+            action="store_true",
+            help="Record every completed check and its findings in a checkpoint file next to the output files, so the scan can be resumed with --resume if it is interrupted. The checkpoint is removed once the scan is completed.",
+        )
+        common_checks_parser.add_argument(
+            "--resume",
+            metavar="SCAN_ID",
+            default=None,
+            help="Resume an interrupted scan that was started with --checkpoint, skipping the checks already completed. The scan ID is the output filename of the interrupted scan, and the same --output-directory must be used.",
+        )
 
     def __init_list_checks_parser__(self):
         # List checks options
@@ -385,3 +424,25 @@ Detailed documentation at https://docs.prowler.com
             action="store_true",
             help="Send a summary of the execution with a Slack APP in your channel. Environment variables SLACK_API_TOKEN and SLACK_CHANNEL_NAME are required (see more in https://docs.prowler.cloud/en/latest/tutorials/integrations/#slack).",
         )
+
+
+def validate_max_parallel_checks(max_parallel_checks: str) -> int:
+    """validate_max_parallel_checks validates that the input value is a positive integer"""
+    try:
+        max_parallel_checks = int(max_parallel_checks)
+    except ValueError:
+        raise ArgumentTypeError("--max-parallel-checks must be an integer")
+    if max_parallel_checks < 1:
+        raise ArgumentTypeError("--max-parallel-checks must be greater than 0")
+    return max_parallel_checks
+
+
+def validate_prefetch_services(prefetch_services: str) -> int:
+    """validate_prefetch_services validates that the input value is a non-negative integer"""
+    try:
+        prefetch_services = int(prefetch_services)
+    except ValueError:
+        raise ArgumentTypeError("--prefetch-services must be an integer")
+    if prefetch_services < 0:
+        raise ArgumentTypeError("--prefetch-services must be 0 or greater")
+    return prefetch_services
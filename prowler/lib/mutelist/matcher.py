@@ -0,0 +1,262 @@
+import re
+
+from prowler.lib.logger import logger
+
+
+class ItemMatcher:
+    """
+    ItemMatcher matches a finding value against a list of Mutelist patterns compiled once.
+
+    The patterns are regular expressions searched in the finding value, a leading `*` matches any prefix.
+
+    Attributes:
+        items (list): The Mutelist patterns, e.g. the Regions, Resources or Tags of a muted check
+        tag (bool): If True all the patterns must match (AND logic), otherwise any of them (OR logic)
+    """
+
+    __slots__ = ("_patterns", "_tag")
+
+    def __init__(self, items, tag: bool = False):
+        self._tag = tag
+        self._patterns = []
+        for item in items or []:
+            try:
+                if item.startswith("*"):
+                    item = ".*" + item[1:]
+                self._patterns.append(re.compile(item))
+            except Exception as error:
+                # The error is raised when the pattern is reached, like an uncompiled search would do
+                self._patterns.append(error)
+
+    def __bool__(self) -> bool:
+        return bool(self._patterns)
+
+    def matches(self, finding_items) -> bool:
+        """
+        matches returns True if the finding value matches the patterns.
+
+        Args:
+            finding_items (str): The finding value, e.g. the region, resource or unrolled tags of the finding
+
+        Returns:
+            bool: True if the finding value matches the patterns, otherwise False.
+        """
+        try:
+            is_item_matched = False
+            if self._patterns and (finding_items or finding_items == ""):
+                if self._tag:
+                    is_item_matched = True
+                for pattern in self._patterns:
+                    if isinstance(pattern, Exception):
+                        raise pattern
+                    if self._tag:
+                        if not pattern.search(finding_items):
+                            is_item_matched = False
+                            break
+                    else:
+                        if pattern.search(finding_items):
+                            is_item_matched = True
+                            break
+            return is_item_matched
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+            )
+            return False
+
+
+class ExceptionsMatcher:
+    """
+    ExceptionsMatcher evaluates the Exceptions of a muted check with its patterns compiled once.
+
+    Attributes:
+        exceptions (dict): The Exceptions of the muted check, with optional Accounts, Regions, Resources and Tags
+    """
+
+    __slots__ = ("_accounts", "_regions", "_resources", "_tags", "_exceptions")
+
+    def __init__(self, exceptions: dict):
+        self._exceptions = bool(exceptions)
+        exceptions = exceptions or {}
+        self._accounts = ItemMatcher(exceptions.get("Accounts", []))
+        self._regions = ItemMatcher(exceptions.get("Regions", []))
+        self._resources = ItemMatcher(exceptions.get("Resources", []))
+        self._tags = ItemMatcher(exceptions.get("Tags", []), tag=True)
+
+    def is_excepted(
+        self, audited_account, finding_region, finding_resource, finding_tags
+    ) -> bool:
+        """
+        is_excepted returns True if the account, region, resource, and tags are excepted.
+
+        A finding is excepted if it matches at least one of the exception fields and all the fields that are present.
+        """
+        if not self._exceptions:
+            return False
+        is_account_excepted = self._accounts.matches(audited_account)
+        is_region_excepted = self._regions.matches(finding_region)
+        is_resource_excepted = self._resources.matches(finding_resource)
+        is_tag_excepted = self._tags.matches(finding_tags)
+        if (
+            not is_account_excepted
+            and not is_region_excepted
+            and not is_resource_excepted
+            and not is_tag_excepted
+        ):
+            return False
+        return (
+            (is_account_excepted or not self._accounts)
+            and (is_region_excepted or not self._regions)
+            and (is_resource_excepted or not self._resources)
+            and (is_tag_excepted or not self._tags)
+        )
+
+
+def is_check_matched(muted_check: str, check: str) -> bool:
+    """
+    is_check_matched returns True if the muted check pattern of the Mutelist applies to the given check.
+
+    A `*` applies to all checks and `lambda` is mapped to `awslambda`.
+    """
+    muted_check = re.sub("^lambda", "awslambda", muted_check)
+    return (
+        "*" == muted_check
+        or check == muted_check
+        or ItemMatcher([muted_check]).matches(check)
+    )
+
+
+class MutedCheckMatcher:
+    """
+    MutedCheckMatcher evaluates a muted check entry of the Mutelist with its patterns compiled once.
+
+    Attributes:
+        muted_check (str): The check pattern of the entry, `lambda` is mapped to `awslambda`
+        muted_check_info (dict): The Regions, Resources, Tags and Exceptions of the entry
+    """
+
+    __slots__ = ("check", "_check", "_exceptions", "_regions", "_resources", "_tags")
+
+    def __init__(self, muted_check: str, muted_check_info: dict):
+        # map lambda to awslambda
+        self.check = re.sub("^lambda", "awslambda", muted_check)
+        self._check = ItemMatcher([self.check])
+        self._exceptions = ExceptionsMatcher(muted_check_info.get("Exceptions"))
+        self._regions = ItemMatcher(muted_check_info.get("Regions"))
+        self._resources = ItemMatcher(muted_check_info.get("Resources"))
+        muted_tags = muted_check_info.get("Tags", "*")
+        # We need to set the muted_tags if None, "" or [], so the falsy helps
+        if not muted_tags:
+            muted_tags = "*"
+        self._tags = ItemMatcher(muted_tags, tag=True)
+
+    def matches_check(self, check: str) -> bool:
+        """matches_check returns True if the entry applies to the given check, a `*` applies to all checks"""
+        return "*" == self.check or check == self.check or self._check.matches(check)
+
+    def is_excepted(
+        self, audited_account, finding_region, finding_resource, finding_tags
+    ) -> bool:
+        return self._exceptions.is_excepted(
+            audited_account, finding_region, finding_resource, finding_tags
+        )
+
+    def is_muted(self, finding_region, finding_resource, finding_tags) -> bool:
+        return (
+            self._regions.matches(finding_region)
+            and self._tags.matches(finding_tags)
+            and self._resources.matches(finding_resource)
+        )
+
+
+def is_muted_by_checks(
+    muted_checks: list[MutedCheckMatcher],
+    audited_account,
+    finding_region,
+    finding_resource,
+    finding_tags,
+) -> bool:
+    """
+    is_muted_by_checks returns True if the finding is muted by the given entries, which must apply to the finding's check.
+
+    The entries are evaluated in the Mutelist order, the first entry that excepts the finding stops the evaluation.
+    """
+    is_check_muted = False
+    for muted_check in muted_checks:
+        if muted_check.is_excepted(
+            audited_account, finding_region, finding_resource, finding_tags
+        ):
+            break
+        if muted_check.is_muted(finding_region, finding_resource, finding_tags):
+            is_check_muted = True
+    return is_check_muted
+
+
+class MutelistIndex:
+    """
+    MutelistIndex is the Mutelist compiled once, with its entries indexed by account and check.
+
+    The checks of the Mutelist are regular expressions searched in the check name, so the entries that apply to
+    each check are resolved the first time the check is looked up, keeping the Mutelist order, and reused for the
+    rest of its findings.
+
+    Attributes:
+        mutelist (dict): The Mutelist the index was built from
+    """
+
+    def __init__(self, mutelist: dict):
+        self._mutelist = mutelist
+        self._accounts = {
+            account: [
+                MutedCheckMatcher(muted_check, muted_check_info)
+                for muted_check, muted_check_info in account_info["Checks"].items()
+            ]
+            for account, account_info in mutelist.get("Accounts", {}).items()
+        }
+        self._account_checks = {}
+
+    @property
+    def mutelist(self) -> dict:
+        return self._mutelist
+
+    def get_muted_checks(self, account: str, check: str) -> tuple[MutedCheckMatcher]:
+        """
+        get_muted_checks returns the entries of the given Mutelist account that apply to the given check.
+
+        Args:
+            account (str): The account key of the Mutelist, e.g. `*` or the account ID
+            check (str): The check name
+
+        Returns:
+            tuple[MutedCheckMatcher]: The entries that apply to the check in the Mutelist order.
+        """
+        key = (account, check)
+        muted_checks = self._account_checks.get(key)
+        if muted_checks is None:
+            muted_checks = tuple(
+                muted_check
+                for muted_check in self._accounts.get(account, [])
+                if muted_check.matches_check(check)
+            )
+            self._account_checks[key] = muted_checks
+        return muted_checks
+
+    def is_muted(
+        self,
+        audited_account: str,
+        check: str,
+        finding_region: str,
+        finding_resource: str,
+        finding_tags,
+    ) -> bool:
+        """is_muted returns True if the finding is muted by the entries of the audited account or of all the accounts (`*`)"""
+        for account in {audited_account, "*"}:
+            if account in self._accounts and is_muted_by_checks(
+                self.get_muted_checks(account, check),
+                audited_account,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            ):
+                return True
+        return False
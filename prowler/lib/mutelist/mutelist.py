@@ -1,10 +1,17 @@
-import re
 from abc import ABC, abstractmethod
 
 import yaml
 from jsonschema import validate
 
 from prowler.lib.logger import logger
+from prowler.lib.mutelist.matcher import (
+    ExceptionsMatcher,
+    ItemMatcher,
+    MutedCheckMatcher,
+    MutelistIndex,
+    is_check_matched,
+    is_muted_by_checks,
+)
 from prowler.lib.outputs.common import Status
 from prowler.lib.outputs.utils import unroll_dict, unroll_tags
 
@@ -106,6 +113,7 @@ class Mutelist(ABC):
 
     _mutelist: dict = {}
     _mutelist_file_path: str = None
+    _mutelist_index: MutelistIndex = None
 
     MUTELIST_KEY = "Mutelist"
 
@@ -129,6 +137,19 @@ class Mutelist(ABC):
     def mutelist_file_path(self) -> dict:
         return self._mutelist_file_path
 
+    @property
+    def mutelist_index(self) -> MutelistIndex:
+        """
+        The Mutelist compiled and indexed by account and check.
+
+        It is built the first time it is requested and rebuilt only if the mutelist is replaced.
+        """
+        if self._mutelist_index is None or self._mutelist_index.mutelist is not (
+            self._mutelist
+        ):
+            self._mutelist_index = MutelistIndex(self._mutelist)
+        return self._mutelist_index
+
     @abstractmethod
     def is_finding_muted(self) -> bool:
         raise NotImplementedError
@@ -196,25 +217,15 @@ class Mutelist(ABC):
             bool: True if the finding is muted for the audited account, check, region, resource and tags., otherwise False.
         """
         try:
-            # By default is not muted
-            is_finding_muted = False
-
-            # We always check all the accounts present in the mutelist
+            # We always check the audited account and all the accounts (*) present in the mutelist
             # if one mutes the finding we set the finding as muted
-            for account in self._mutelist.get("Accounts", []):
-                if account == audited_account or account == "*":
-                    if self.is_muted_in_check(
-                        self._mutelist["Accounts"][account]["Checks"],
-                        audited_account,
-                        check,
-                        finding_region,
-                        finding_resource,
-                        finding_tags,
-                    ):
-                        is_finding_muted = True
-                        break
-
-            return is_finding_muted
+            return self.mutelist_index.is_muted(
+                audited_account,
+                check,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
@@ -245,69 +256,18 @@ class Mutelist(ABC):
             bool: True if the check is muted, otherwise False.
         """
         try:
-            # Default value is not muted
-            is_check_muted = False
-
-            for muted_check, muted_check_info in muted_checks.items():
-                # map lambda to awslambda
-                muted_check = re.sub("^lambda", "awslambda", muted_check)
-
-                check_match = (
-                    "*" == muted_check
-                    or check == muted_check
-                    or self.is_item_matched([muted_check], check)
-                )
-
-                # Check if the finding is excepted
-                exceptions = muted_check_info.get("Exceptions")
-                if (
-                    self.is_excepted(
-                        exceptions,
-                        audited_account,
-                        finding_region,
-                        finding_resource,
-                        finding_tags,
-                    )
-                    and check_match
-                ):
-                    # Break loop and return default value since is excepted
-                    break
-
-                muted_regions = muted_check_info.get("Regions")
-                muted_resources = muted_check_info.get("Resources")
-                muted_tags = muted_check_info.get("Tags", "*")
-                # We need to set the muted_tags if None, "" or [], so the falsy helps
-                if not muted_tags:
-                    muted_tags = "*"
-                # If there is a *, it affects to all checks
-                if check_match:
-                    muted_in_check = True
-                    muted_in_region = self.is_item_matched(
-                        muted_regions, finding_region
-                    )
-                    muted_in_resource = self.is_item_matched(
-                        muted_resources, finding_resource
-                    )
-                    muted_in_tags = self.is_item_matched(
-                        muted_tags, finding_tags, tag=True
-                    )
-
-                    # For a finding to be muted requires the following set to True:
-                    # - muted_in_check -> True
-                    # - muted_in_region -> True
-                    # - muted_in_tags -> True
-                    # - muted_in_resource -> True
-                    # - excepted -> False
-
-                    if (
-                        muted_in_check
-                        and muted_in_region
-                        and muted_in_tags
-                        and muted_in_resource
-                    ):
-                        is_check_muted = True
-
-            return is_check_muted
+            # The muted checks are compiled on every call, use is_muted to reuse the compiled mutelist
+            return is_muted_by_checks(
+                [
+                    MutedCheckMatcher(muted_check, muted_check_info)
+                    for muted_check, muted_check_info in muted_checks.items()
+                    if is_check_matched(muted_check, check)
+                ],
+                audited_account,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
@@ -365,47 +325,9 @@ class Mutelist(ABC):
             bool: True if the account, region, resource, and tags are excepted based on the exceptions, otherwise False.
         """
         try:
-            excepted = False
-            is_account_excepted = False
-            is_region_excepted = False
-            is_resource_excepted = False
-            is_tag_excepted = False
-            if exceptions:
-                excepted_accounts = exceptions.get("Accounts", [])
-                is_account_excepted = self.is_item_matched(
-                    excepted_accounts, audited_account
-                )
-
-                excepted_regions = exceptions.get("Regions", [])
-                is_region_excepted = self.is_item_matched(
-                    excepted_regions, finding_region
-                )
-
-                excepted_resources = exceptions.get("Resources", [])
-                is_resource_excepted = self.is_item_matched(
-                    excepted_resources, finding_resource
-                )
-
-                excepted_tags = exceptions.get("Tags", [])
-                is_tag_excepted = self.is_item_matched(
-                    excepted_tags, finding_tags, tag=True
-                )
-
-                if (
-                    not is_account_excepted
-                    and not is_region_excepted
-                    and not is_resource_excepted
-                    and not is_tag_excepted
-                ):
-                    excepted = False
-                elif (
-                    (is_account_excepted or not excepted_accounts)
-                    and (is_region_excepted or not excepted_regions)
-                    and (is_resource_excepted or not excepted_resources)
-                    and (is_tag_excepted or not excepted_tags)
-                ):
-                    excepted = True
-            return excepted
+            return ExceptionsMatcher(exceptions).is_excepted(
+                audited_account, finding_region, finding_resource, finding_tags
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
@@ -427,25 +349,4 @@ class Mutelist(ABC):
         Returns:
             bool: True if any of the matched_items are present in finding_items, otherwise False.
         """
-        try:
-            is_item_matched = False
-            if matched_items and (finding_items or finding_items == ""):
-                if tag:
-                    is_item_matched = True
-                for item in matched_items:
-                    if item.startswith("*"):
-                        item = ".*" + item[1:]
-                    if tag:
-                        if not re.search(item, finding_items):
-                            is_item_matched = False
-                            break
-                    else:
-                        if re.search(item, finding_items):
-                            is_item_matched = True
-                            break
-            return is_item_matched
-        except Exception as error:
-            logger.error(
-                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
-            )
-            return False
+        return ItemMatcher(matched_items, tag).matches(finding_items)
@@ -31,9 +31,23 @@ class ComplianceOutput(Output):
         compliance: Compliance,
         file_path: str = None,
         file_extension: str = "",
+        from_cli: bool = True,
     ) -> None:
         self._data = []
         self.file_descriptor = None
+        self.file_path = file_path
+        # The file is closed after writing the data unless more batches are going to be written
+        self.close_file = from_cli
+        self._from_cli = from_cli
+        self._compliance = compliance
+        # Get the compliance name of the model
+        self._compliance_name = (
+            compliance.Framework + "-" + compliance.Version
+            if compliance.Version
+            else compliance.Framework
+        )
+        self._manual_requirements = []
+        self._manual_requirements_transformed = False
 
         if not file_extension and file_path:
             self._file_extension = "".join(Path(file_path).suffixes)
@@ -41,20 +55,25 @@ class ComplianceOutput(Output):
             self._file_extension = file_extension
 
         if findings:
-            # Get the compliance name of the model
-            compliance_name = (
-                compliance.Framework + "-" + compliance.Version
-                if compliance.Version
-                else compliance.Framework
-            )
-            self.transform(findings, compliance, compliance_name)
+            self.transform(findings, compliance, self._compliance_name)
             if not self._file_descriptor and file_path:
                 self.create_file_descriptor(file_path)
 
+    @property
+    def compliance(self) -> Compliance:
+        return self._compliance
+
+    @property
+    def compliance_name(self) -> str:
+        return self._compliance_name
+
     def batch_write_data_to_file(self) -> None:
         """
         Writes the findings data to a CSV file in the specific compliance format.
 
+        Every transform adds the manual requirements after the findings, so when writing in batches the ones of the
+        first batch are kept and written once at the end of the file, when `close_file` is set.
+
         Returns:
             - None
         """
@@ -62,19 +81,36 @@ class ComplianceOutput(Output):
             if (
                 getattr(self, "_file_descriptor", None)
                 and not self._file_descriptor.closed
-                and self._data
+                and (self._data or self.close_file)
             ):
-                csv_writer = DictWriter(
-                    self._file_descriptor,
-                    fieldnames=[field.upper() for field in self._data[0].dict().keys()],
-                    delimiter=";",
-                )
-                csv_writer.writeheader()
-                for finding in self._data:
-                    csv_writer.writerow(
-                        {k.upper(): v for k, v in finding.dict().items()}
+                compliance_rows = []
+                for compliance_row in self._data:
+                    if getattr(compliance_row, "ResourceId", None) == "manual_check":
+                        if not self._manual_requirements_transformed:
+                            self._manual_requirements.append(compliance_row)
+                    else:
+                        compliance_rows.append(compliance_row)
+                if self._data:
+                    self._manual_requirements_transformed = True
+                if self.close_file:
+                    compliance_rows.extend(self._manual_requirements)
+
+                if compliance_rows:
+                    csv_writer = DictWriter(
+                        self._file_descriptor,
+                        fieldnames=[
+                            field.upper() for field in compliance_rows[0].dict().keys()
+                        ],
+                        delimiter=";",
                     )
-                self._file_descriptor.close()
+                    if self._file_descriptor.tell() == 0:
+                        csv_writer.writeheader()
+                    for compliance_row in compliance_rows:
+                        csv_writer.writerow(
+                            {k.upper(): v for k, v in compliance_row.dict().items()}
+                        )
+                if self.close_file:
+                    self._file_descriptor.close()
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
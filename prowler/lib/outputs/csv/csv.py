@@ -91,18 +91,19 @@ class CSV(Output):
             if (
                 getattr(self, "_file_descriptor", None)
                 and not self._file_descriptor.closed
-                and self._data
+                and (self._data or self.close_file)
             ):
-                csv_writer = DictWriter(
-                    self._file_descriptor,
-                    fieldnames=self._data[0].keys(),
-                    delimiter=";",
-                )
-                if self._file_descriptor.tell() == 0:
-                    csv_writer.writeheader()
-                for finding in self._data:
-                    csv_writer.writerow(finding)
-                if self.close_file or self._from_cli:
+                if self._data:
+                    csv_writer = DictWriter(
+                        self._file_descriptor,
+                        fieldnames=self._data[0].keys(),
+                        delimiter=";",
+                    )
+                    if self._file_descriptor.tell() == 0:
+                        csv_writer.writeheader()
+                    for finding in self._data:
+                        csv_writer.writerow(finding)
+                if self.close_file:
                     self._file_descriptor.close()
         except Exception as error:
             logger.error(
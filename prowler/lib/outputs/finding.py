@@ -20,6 +20,119 @@ from prowler.lib.utils.utils import dict_to_lowercase, get_nested_attribute
 from prowler.providers.common.provider import Provider
 
 
+class FindingOutputContext:
+    """
+    Holds the data shared by all the findings of a scan when they are transformed into Finding objects.
+
+    The provider fields of the findings and the compliance of each check are resolved only once, and after a
+    check has one finding fully validated, the rest of its findings are built without validation if the values
+    that change between findings have the expected types.
+
+    Attributes:
+        - provider (Provider): the provider object.
+        - unix_timestamp (bool): whether the timestamp of the findings is in Unix format.
+        - bulk_checks_metadata (dict): the metadata of the checks, to get their compliance.
+    """
+
+    def __init__(self, provider: Provider, output_options=None):
+        self.provider = provider
+        self.unix_timestamp = getattr(output_options, "unix_timestamp", False)
+        self.bulk_checks_metadata = getattr(output_options, "bulk_checks_metadata", {})
+        self._provider_data = None
+        self._compliance = {}
+        self._validated_checks = set()
+        self._timestamps = {}
+
+    @property
+    def provider_data(self) -> dict:
+        """
+        Returns the fields of the findings that only depend on the provider.
+        """
+        if self._provider_data is None:
+            self._provider_data = Finding.get_provider_data(self.provider)
+        return self._provider_data
+
+    def get_check_compliance(self, check_output: Check_Report) -> dict:
+        """
+        Returns the compliance of the check of the finding, resolved once per check.
+        """
+        check_id = check_output.check_metadata.CheckID
+        if check_id not in self._compliance:
+            self._compliance[check_id] = get_check_compliance(
+                check_output, self.provider.type, self.bulk_checks_metadata
+            )
+        return self._compliance[check_id]
+
+    def build_finding(self, cls, check_output: Check_Report, output_data: dict):
+        """
+        Returns the Finding of the output data, validating it only if it is the first finding of its check or
+        if any of its values does not have the expected type.
+        """
+        check_id = check_output.check_metadata.CheckID
+        if (
+            check_id in self._validated_checks
+            and output_data.get("timestamp") in self._timestamps
+            and self._is_valid(output_data)
+        ):
+            finding_data = {
+                field: value
+                for field, value in output_data.items()
+                if field in cls.__fields__
+            }
+            finding_data["status"] = Status(output_data["status"])
+            # The timestamp is the same for all the findings, but the validation parses it
+            finding_data["timestamp"] = self._timestamps[output_data["timestamp"]]
+            return cls.construct(**finding_data)
+
+        finding = cls(**output_data)
+        self._validated_checks.add(check_id)
+        self._timestamps[output_data.get("timestamp")] = finding.timestamp
+        return finding
+
+    @staticmethod
+    def _is_valid(output_data: dict) -> bool:
+        """
+        Returns whether the values that change between the findings of a check have the types that the
+        validation of the Finding would return unchanged.
+        """
+        for field in (
+            "uid",
+            "status_extended",
+            "resource_uid",
+            "resource_name",
+            "resource_details",
+            "region",
+            "account_uid",
+        ):
+            if type(output_data.get(field)) is not str:
+                return False
+        for field in (
+            "account_name",
+            "account_email",
+            "account_organization_uid",
+            "account_organization_name",
+            "partition",
+        ):
+            if (
+                output_data.get(field) is not None
+                and type(output_data[field]) is not str
+            ):
+                return False
+        for field in (
+            "resource_metadata",
+            "resource_tags",
+            "account_tags",
+            "compliance",
+        ):
+            if field in output_data and type(output_data[field]) is not dict:
+                return False
+        return (
+            type(output_data.get("muted")) is bool
+            and type(output_data.get("metadata")) is CheckMetadata
+            and output_data.get("status") in Status._value2member_map_
+        )
+
+
 class Finding(BaseModel):
     """
     Represents the output model for a finding across different providers.
@@ -99,7 +212,11 @@ class Finding(BaseModel):
 
     @classmethod
     def generate_output(
-        cls, provider: Provider, check_output: Check_Report, output_options
+        cls,
+        provider: Provider,
+        check_output: Check_Report,
+        output_options,
+        context: "FindingOutputContext" = None,
     ) -> "Finding":
         """Generates the output for a finding based on the provider and output options
 
@@ -107,70 +224,34 @@ class Finding(BaseModel):
             provider (Provider): the provider object
             check_output (Check_Report): the check output object
             output_options: the output options object, depending on the provider
+            context (FindingOutputContext): optional per-scan context, to resolve the provider fields and the
+                compliance of each check only once. If not passed, they are resolved for this finding.
         Returns:
             finding_output (Finding): the finding output object
 
         """
-        # TODO: move fill_common_finding_data
-        unix_timestamp = False
-        if hasattr(output_options, "unix_timestamp"):
-            unix_timestamp = output_options.unix_timestamp
+        if context is None:
+            context = FindingOutputContext(provider, output_options)
 
-        common_finding_data = fill_common_finding_data(check_output, unix_timestamp)
+        # TODO: move fill_common_finding_data
+        common_finding_data = fill_common_finding_data(
+            check_output, context.unix_timestamp
+        )
         output_data = {}
         output_data.update(common_finding_data)
 
-        bulk_checks_metadata = {}
-        if hasattr(output_options, "bulk_checks_metadata"):
-            bulk_checks_metadata = output_options.bulk_checks_metadata
-
-        output_data["compliance"] = get_check_compliance(
-            check_output, provider.type, bulk_checks_metadata
-        )
+        output_data["compliance"] = context.get_check_compliance(check_output)
         try:
             output_data["provider"] = provider.type
             output_data["resource_metadata"] = check_output.resource
+            output_data.update(context.provider_data)
 
             if provider.type == "aws":
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.account"
-                )
-                output_data["account_name"] = get_nested_attribute(
-                    provider, "organizations_metadata.account_name"
-                )
-                output_data["account_email"] = get_nested_attribute(
-                    provider, "organizations_metadata.account_email"
-                )
-                output_data["account_organization_uid"] = get_nested_attribute(
-                    provider, "organizations_metadata.organization_arn"
-                )
-                output_data["account_organization_name"] = get_nested_attribute(
-                    provider, "organizations_metadata.organization_id"
-                )
-                output_data["account_tags"] = get_nested_attribute(
-                    provider, "organizations_metadata.account_tags"
-                )
-                output_data["partition"] = get_nested_attribute(
-                    provider, "identity.partition"
-                )
-
-                # TODO: probably Organization UID is without the account id
-                output_data["auth_method"] = (
-                    f"profile: {get_nested_attribute(provider, 'identity.profile')}"
-                )
                 output_data["resource_name"] = check_output.resource_id
                 output_data["resource_uid"] = check_output.resource_arn
                 output_data["region"] = check_output.region
 
             elif provider.type == "azure":
-                # TODO: we should show the authentication method used I think
-                output_data["auth_method"] = (
-                    f"{provider.identity.identity_type}: {provider.identity.identity_id}"
-                )
-                # Get the first tenant domain ID, just in case
-                output_data["account_organization_uid"] = get_nested_attribute(
-                    provider, "identity.tenant_ids"
-                )[0]
                 output_data["account_uid"] = (
                     output_data["account_organization_uid"]
                     if "Tenant:" in check_output.subscription
@@ -180,25 +261,8 @@ class Finding(BaseModel):
                 output_data["resource_name"] = check_output.resource_name
                 output_data["resource_uid"] = check_output.resource_id
                 output_data["region"] = check_output.location
-                # TODO: check the tenant_ids
-                # TODO: we have to get the account organization, the tenant is not that
-                output_data["account_organization_name"] = get_nested_attribute(
-                    provider, "identity.tenant_domain"
-                )
-
-                output_data["partition"] = get_nested_attribute(
-                    provider, "region_config.name"
-                )
-                # TODO: pending to get the subscription tags
-                # "account_tags": "organizations_metadata.account_details_tags",
-                # TODO: store subscription_name + id pairs
-                # "account_name": "organizations_metadata.account_details_name",
-                # "account_email": "organizations_metadata.account_details_email",
 
             elif provider.type == "gcp":
-                output_data["auth_method"] = (
-                    f"Principal: {get_nested_attribute(provider, 'identity.profile')}"
-                )
                 output_data["account_uid"] = provider.projects[
                     check_output.project_id
                 ].id
@@ -230,28 +294,11 @@ class Finding(BaseModel):
                     ].organization.display_name
 
             elif provider.type == "kubernetes":
-                if provider.identity.context == "In-Cluster":
-                    output_data["auth_method"] = "in-cluster"
-                else:
-                    output_data["auth_method"] = "kubeconfig"
                 output_data["resource_name"] = check_output.resource_name
                 output_data["resource_uid"] = check_output.resource_id
-                output_data["account_name"] = f"context: {provider.identity.context}"
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.cluster"
-                )
                 output_data["region"] = f"namespace: {check_output.namespace}"
 
             elif provider.type == "microsoft365":
-                output_data["auth_method"] = (
-                    f"{provider.identity.identity_type}: {provider.identity.identity_id}"
-                )
-                output_data["account_uid"] = get_nested_attribute(
-                    provider, "identity.tenant_id"
-                )
-                output_data["account_name"] = get_nested_attribute(
-                    provider, "identity.tenant_domain"
-                )
                 output_data["resource_name"] = check_output.resource_name
                 output_data["resource_uid"] = check_output.resource_id
                 output_data["region"] = check_output.location
@@ -264,7 +311,7 @@ class Finding(BaseModel):
                 f"{output_data['region']}-{output_data['resource_name']}"
             )
 
-            return cls(**output_data)
+            return context.build_finding(cls, check_output, output_data)
         except ValidationError as validation_error:
             logger.error(
                 f"{validation_error.__class__.__name__}[{validation_error.__traceback__.tb_lineno}]: {validation_error} - {output_data}"
@@ -276,8 +323,101 @@ class Finding(BaseModel):
             )
             raise error
 
+    @staticmethod
+    def get_provider_data(provider: Provider) -> dict:
+        """Returns the fields of the findings that only depend on the provider, like the account or the
+        authentication method, so they are the same for all the findings of a scan.
+
+        Args:
+            provider (Provider): the provider object
+        Returns:
+            dict: the provider fields of the findings
+        """
+        provider_data = {}
+        if provider.type == "aws":
+            provider_data["account_uid"] = get_nested_attribute(
+                provider, "identity.account"
+            )
+            provider_data["account_name"] = get_nested_attribute(
+                provider, "organizations_metadata.account_name"
+            )
+            provider_data["account_email"] = get_nested_attribute(
+                provider, "organizations_metadata.account_email"
+            )
+            provider_data["account_organization_uid"] = get_nested_attribute(
+                provider, "organizations_metadata.organization_arn"
+            )
+            provider_data["account_organization_name"] = get_nested_attribute(
+                provider, "organizations_metadata.organization_id"
+            )
+            provider_data["account_tags"] = get_nested_attribute(
+                provider, "organizations_metadata.account_tags"
+            )
+            provider_data["partition"] = get_nested_attribute(
+                provider, "identity.partition"
+            )
+
+            # TODO: probably Organization UID is without the account id
+            provider_data["auth_method"] = (
+                f"profile: {get_nested_attribute(provider, 'identity.profile')}"
+            )
+
+        elif provider.type == "azure":
+            # TODO: we should show the authentication method used I think
+            provider_data["auth_method"] = (
+                f"{provider.identity.identity_type}: {provider.identity.identity_id}"
+            )
+            # Get the first tenant domain ID, just in case
+            provider_data["account_organization_uid"] = get_nested_attribute(
+                provider, "identity.tenant_ids"
+            )[0]
+            # TODO: check the tenant_ids
+            # TODO: we have to get the account organization, the tenant is not that
+            provider_data["account_organization_name"] = get_nested_attribute(
+                provider, "identity.tenant_domain"
+            )
+
+            provider_data["partition"] = get_nested_attribute(
+                provider, "region_config.name"
+            )
+            # TODO: pending to get the subscription tags
+            # "account_tags": "organizations_metadata.account_details_tags",
+            # TODO: store subscription_name + id pairs
+            # "account_name": "organizations_metadata.account_details_name",
+            # "account_email": "organizations_metadata.account_details_email",
+
+        elif provider.type == "gcp":
+            provider_data["auth_method"] = (
+                f"Principal: {get_nested_attribute(provider, 'identity.profile')}"
+            )
+
+        elif provider.type == "kubernetes":
+            if provider.identity.context == "In-Cluster":
+                provider_data["auth_method"] = "in-cluster"
+            else:
+                provider_data["auth_method"] = "kubeconfig"
+            provider_data["account_name"] = f"context: {provider.identity.context}"
+            provider_data["account_uid"] = get_nested_attribute(
+                provider, "identity.cluster"
+            )
+
+        elif provider.type == "microsoft365":
+            provider_data["auth_method"] = (
+                f"{provider.identity.identity_type}: {provider.identity.identity_id}"
+            )
+            provider_data["account_uid"] = get_nested_attribute(
+                provider, "identity.tenant_id"
+            )
+            provider_data["account_name"] = get_nested_attribute(
+                provider, "identity.tenant_domain"
+            )
+
+        return provider_data
+
     @classmethod
-    def transform_api_finding(cls, finding, provider) -> "Finding":
+    def transform_api_finding(
+        cls, finding, provider, check_metadata_cache: dict = None
+    ) -> "Finding":
         """
         Transform a FindingModel instance into an API-friendly Finding object.
 
@@ -291,6 +431,8 @@ class Finding(BaseModel):
         Args:
             finding (API Finding): An API Finding instance containing data from the database.
             provider (Provider): the provider object.
+            check_metadata_cache (dict): optional cache of the CheckMetadata objects by check ID, to build them
+                only once per check when transforming many findings.
 
         Returns:
             Finding: A new Finding instance populated with data from the provided model.
@@ -319,46 +461,60 @@ class Finding(BaseModel):
         elif provider.type == "gcp":
             finding.project_id = list(provider.projects.keys())[0]
 
-        finding.check_metadata = CheckMetadata(
-            Provider=finding.check_metadata["provider"],
-            CheckID=finding.check_metadata["checkid"],
-            CheckTitle=finding.check_metadata["checktitle"],
-            CheckType=finding.check_metadata["checktype"],
-            ServiceName=finding.check_metadata["servicename"],
-            SubServiceName=finding.check_metadata["subservicename"],
-            Severity=finding.check_metadata["severity"],
-            ResourceType=finding.check_metadata["resourcetype"],
-            Description=finding.check_metadata["description"],
-            Risk=finding.check_metadata["risk"],
-            RelatedUrl=finding.check_metadata["relatedurl"],
+        if check_metadata_cache is None:
+            check_metadata_cache = {}
+        check_id = finding.check_metadata["checkid"]
+        if check_id not in check_metadata_cache:
+            check_metadata_cache[check_id] = cls._transform_api_check_metadata(
+                finding.check_metadata
+            )
+        finding.check_metadata = check_metadata_cache[check_id]
+        finding.resource_tags = unroll_tags(
+            [{"key": tag.key, "value": tag.value} for tag in resource.tags.all()]
+        )
+        return cls.generate_output(provider, finding, SimpleNamespace())
+
+    @staticmethod
+    def _transform_api_check_metadata(check_metadata: dict) -> CheckMetadata:
+        """
+        Build the CheckMetadata object from the check metadata stored in an API Finding.
+
+        Args:
+            check_metadata (dict): The check metadata of the API Finding, with lowercase keys.
+
+        Returns:
+            CheckMetadata: The check metadata object.
+        """
+        return CheckMetadata(
+            Provider=check_metadata["provider"],
+            CheckID=check_metadata["checkid"],
+            CheckTitle=check_metadata["checktitle"],
+            CheckType=check_metadata["checktype"],
+            ServiceName=check_metadata["servicename"],
+            SubServiceName=check_metadata["subservicename"],
+            Severity=check_metadata["severity"],
+            ResourceType=check_metadata["resourcetype"],
+            Description=check_metadata["description"],
+            Risk=check_metadata["risk"],
+            RelatedUrl=check_metadata["relatedurl"],
             Remediation=Remediation(
                 Recommendation=Recommendation(
-                    Text=finding.check_metadata["remediation"]["recommendation"][
-                        "text"
-                    ],
-                    Url=finding.check_metadata["remediation"]["recommendation"]["url"],
+                    Text=check_metadata["remediation"]["recommendation"]["text"],
+                    Url=check_metadata["remediation"]["recommendation"]["url"],
                 ),
                 Code=Code(
-                    NativeIaC=finding.check_metadata["remediation"]["code"][
-                        "nativeiac"
-                    ],
-                    Terraform=finding.check_metadata["remediation"]["code"][
-                        "terraform"
-                    ],
-                    CLI=finding.check_metadata["remediation"]["code"]["cli"],
-                    Other=finding.check_metadata["remediation"]["code"]["other"],
+                    NativeIaC=check_metadata["remediation"]["code"]["nativeiac"],
+                    Terraform=check_metadata["remediation"]["code"]["terraform"],
+                    CLI=check_metadata["remediation"]["code"]["cli"],
+                    Other=check_metadata["remediation"]["code"]["other"],
                 ),
             ),
-            ResourceIdTemplate=finding.check_metadata["resourceidtemplate"],
-            Categories=finding.check_metadata["categories"],
-            DependsOn=finding.check_metadata["dependson"],
-            RelatedTo=finding.check_metadata["relatedto"],
-            Notes=finding.check_metadata["notes"],
+            ResourceIdTemplate=check_metadata["resourceidtemplate"],
+            Categories=check_metadata["categories"],
+            DependsOn=check_metadata["dependson"],
+            RelatedTo=check_metadata["relatedto"],
+            Notes=check_metadata["notes"],
         )
-        finding.resource_tags = unroll_tags(
-            [{"key": tag.key, "value": tag.value} for tag in resource.tags.all()]
-        )
-        return cls.generate_output(provider, finding, SimpleNamespace())
 
     def _transform_findings_stats(scan_summaries: list[dict]) -> dict:
         """
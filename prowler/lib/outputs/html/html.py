@@ -1,6 +1,8 @@
 import html
 import sys
 from io import TextIOWrapper
+from shutil import copyfileobj
+from tempfile import TemporaryFile
 
 from prowler.config.config import (
     html_logo_url,
@@ -15,6 +17,8 @@ from prowler.providers.common.provider import Provider
 
 
 class HTML(Output):
+    _pending_rows_file: TextIOWrapper = None
+
     def transform(self, findings: list[Finding]) -> None:
         """Transforms the findings into the HTML format.
 
@@ -58,29 +62,47 @@ class HTML(Output):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def batch_write_data_to_file(self, provider: Provider, stats: dict) -> None:
+    def batch_write_data_to_file(self, provider: Provider, stats: dict = None) -> None:
         """
         Writes the findings to a file using the HTML format using the `Output._file_descriptor`.
 
+        The header of the HTML file contains the statistics of the findings, if they are not known yet the rows are
+        kept in a temporary file and written after the header once the statistics are passed.
+
         Args:
             provider (Provider): the provider object
-            output_filename (str): the name of the output file
-            output_directory (str): the directory where the output file will be saved
-            stats (dict): the statistics of the findings
+            stats (dict): the statistics of the findings, None if they are not known yet
         """
         try:
             if (
                 getattr(self, "_file_descriptor", None)
                 and not self._file_descriptor.closed
-                and self._data
+                and (self._data or self.close_file)
             ):
+                if (
+                    stats is None
+                    and not self.close_file
+                    and self._file_descriptor.tell() == 0
+                ):
+                    if self._pending_rows_file is None:
+                        self._pending_rows_file = TemporaryFile(
+                            mode="w+", encoding="utf-8"
+                        )
+                    for finding in self._data:
+                        self._pending_rows_file.write(finding)
+                    return
                 if self._file_descriptor.tell() == 0:
                     HTML.write_header(
-                        self._file_descriptor, provider, stats, self._from_cli
+                        self._file_descriptor, provider, stats or {}, self._from_cli
                     )
+                if self._pending_rows_file is not None:
+                    self._pending_rows_file.seek(0)
+                    copyfileobj(self._pending_rows_file, self._file_descriptor)
+                    self._pending_rows_file.close()
+                    self._pending_rows_file = None
                 for finding in self._data:
                     self._file_descriptor.write(finding)
-                if self.close_file or self._from_cli:
+                if self.close_file:
                     HTML.write_footer(self._file_descriptor)
                     self._file_descriptor.close()
         except Exception as error:
@@ -37,10 +37,10 @@ class Output(ABC):
         from_cli: bool = True,
     ) -> None:
         self._data = []
-        self.close_file = False
+        # The file is closed after writing the data unless more batches are going to be written
+        self.close_file = from_cli
         self.file_path = file_path
         self._file_descriptor = None
-        # This parameter is to avoid refactoring more code, the CLI does not write in batches, the API does
         self._from_cli = from_cli
 
         if not file_extension and file_path:
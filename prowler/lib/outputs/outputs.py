@@ -92,6 +92,80 @@ def set_report_color(status: str, muted: bool = False) -> str:
     return color
 
 
+class FindingsStatistics:
+    """
+    FindingsStatistics aggregates the statistics of the findings as they are added, so the findings don't need to be
+    kept in memory to get the statistics of the whole execution.
+
+    Only the unique resources are kept to count them.
+    """
+
+    def __init__(self):
+        self._total_pass = 0
+        self._total_fail = 0
+        self._muted_pass = 0
+        self._muted_fail = 0
+        self._resources = set()
+        self._findings_count = 0
+        self._all_fails_are_muted = True
+        self._severity_pass = {severity: 0 for severity in Severity}
+        self._severity_fail = {severity: 0 for severity in Severity}
+
+    def add(self, findings: list[Finding]) -> None:
+        """add aggregates the statistics of the given findings"""
+        for finding in findings:
+            self._resources.add(finding.resource_uid)
+
+            if finding.status == Status.PASS:
+                self._findings_count += 1
+                self._total_pass += 1
+                if finding.metadata.Severity in self._severity_pass:
+                    self._severity_pass[finding.metadata.Severity] += 1
+
+                if finding.muted is True:
+                    self._muted_pass += 1
+
+            if finding.status == Status.FAIL:
+                self._findings_count += 1
+                self._total_fail += 1
+                if finding.metadata.Severity in self._severity_fail:
+                    self._severity_fail[finding.metadata.Severity] += 1
+
+                if finding.muted is True:
+                    self._muted_fail += 1
+
+                if not finding.muted and self._all_fails_are_muted:
+                    self._all_fails_are_muted = False
+
+    @property
+    def stats(self) -> dict:
+        """stats returns the aggregated statistics with the format of extract_findings_statistics"""
+        stats = {}
+        stats["total_pass"] = self._total_pass
+        stats["total_muted_pass"] = self._muted_pass
+        stats["total_fail"] = self._total_fail
+        stats["total_muted_fail"] = self._muted_fail
+        stats["resources_count"] = len(self._resources)
+        stats["findings_count"] = self._findings_count
+        stats["total_critical_severity_fail"] = self._severity_fail[Severity.critical]
+        stats["total_critical_severity_pass"] = self._severity_pass[Severity.critical]
+        stats["total_high_severity_fail"] = self._severity_fail[Severity.high]
+        stats["total_high_severity_pass"] = self._severity_pass[Severity.high]
+        stats["total_medium_severity_fail"] = self._severity_fail[Severity.medium]
+        stats["total_medium_severity_pass"] = self._severity_pass[Severity.medium]
+        stats["total_low_severity_fail"] = self._severity_fail[Severity.low]
+        stats["total_low_severity_pass"] = self._severity_pass[Severity.low]
+        stats["total_informational_severity_pass"] = self._severity_pass[
+            Severity.informational
+        ]
+        stats["total_informational_severity_fail"] = self._severity_fail[
+            Severity.informational
+        ]
+        stats["all_fails_are_muted"] = self._all_fails_are_muted
+
+        return stats
+
+
 def extract_findings_statistics(findings: list[Finding]) -> dict:
     """
     extract_findings_statistics takes a list of findings and returns the following dict with the aggregated statistics
@@ -108,81 +182,6 @@ def extract_findings_statistics(findings: list[Finding]) -> dict:
     }
     """
     logger.info("Extracting audit statistics...")
-    stats = {}
-    total_pass = 0
-    total_fail = 0
-    muted_pass = 0
-    muted_fail = 0
-    resources = set()
-    findings_count = 0
-    all_fails_are_muted = True
-    critical_severity_pass = 0
-    critical_severity_fail = 0
-    high_severity_pass = 0
-    high_severity_fail = 0
-    medium_severity_pass = 0
-    medium_severity_fail = 0
-    low_severity_pass = 0
-    low_severity_fail = 0
-    informational_severity_pass = 0
-    informational_severity_fail = 0
-
-    for finding in findings:
-        resources.add(finding.resource_uid)
-
-        if finding.status == Status.PASS:
-            findings_count += 1
-            total_pass += 1
-            if finding.metadata.Severity == Severity.critical:
-                critical_severity_pass += 1
-            if finding.metadata.Severity == Severity.high:
-                high_severity_pass += 1
-            if finding.metadata.Severity == Severity.medium:
-                medium_severity_pass += 1
-            if finding.metadata.Severity == Severity.low:
-                low_severity_pass += 1
-            if finding.metadata.Severity == Severity.informational:
-                informational_severity_pass += 1
-
-            if finding.muted is True:
-                muted_pass += 1
-
-        if finding.status == Status.FAIL:
-            findings_count += 1
-            total_fail += 1
-            if finding.metadata.Severity == Severity.critical:
-                critical_severity_fail += 1
-            if finding.metadata.Severity == Severity.high:
-                high_severity_fail += 1
-            if finding.metadata.Severity == Severity.medium:
-                medium_severity_fail += 1
-            if finding.metadata.Severity == Severity.low:
-                low_severity_fail += 1
-            if finding.metadata.Severity == Severity.informational:
-                informational_severity_fail += 1
-
-            if finding.muted is True:
-                muted_fail += 1
-
-            if not finding.muted and all_fails_are_muted:
-                all_fails_are_muted = False
-
-    stats["total_pass"] = total_pass
-    stats["total_muted_pass"] = muted_pass
-    stats["total_fail"] = total_fail
-    stats["total_muted_fail"] = muted_fail
-    stats["resources_count"] = len(resources)
-    stats["findings_count"] = findings_count
-    stats["total_critical_severity_fail"] = critical_severity_fail
-    stats["total_critical_severity_pass"] = critical_severity_pass
-    stats["total_high_severity_fail"] = high_severity_fail
-    stats["total_high_severity_pass"] = high_severity_pass
-    stats["total_medium_severity_fail"] = medium_severity_fail
-    stats["total_medium_severity_pass"] = medium_severity_pass
-    stats["total_low_severity_fail"] = low_severity_fail
-    stats["total_low_severity_pass"] = low_severity_pass
-    stats["total_informational_severity_pass"] = informational_severity_pass
-    stats["total_informational_severity_fail"] = informational_severity_fail
-    stats["all_fails_are_muted"] = all_fails_are_muted
-
-    return stats
+    findings_statistics = FindingsStatistics()
+    findings_statistics.add(findings)
+    return findings_statistics.stats
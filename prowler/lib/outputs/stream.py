@@ -0,0 +1,538 @@
+import os
+from typing import Any
+
+from prowler.config.config import (
+    csv_file_suffix,
+    get_available_compliance_frameworks,
+    html_file_suffix,
+    json_asff_file_suffix,
+    json_ocsf_file_suffix,
+)
+from prowler.lib.logger import logger
+from prowler.lib.outputs.asff.asff import ASFF
+from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
+    AWSWellArchitected,
+)
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
+from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
+from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
+from prowler.lib.outputs.compliance.cis.cis_microsoft365 import Microsoft365CIS
+from prowler.lib.outputs.compliance.compliance_output import ComplianceOutput
+from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
+from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
+from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
+from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
+    KubernetesISO27001,
+)
+from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
+    AzureMitreAttack,
+)
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.finding import Finding, FindingOutputContext
+from prowler.lib.outputs.html.html import HTML
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.output import Output
+from prowler.lib.outputs.outputs import FindingsStatistics
+from prowler.lib.outputs.summary_table import CheckFindingSummary, FindingsSummary
+from prowler.lib.scan.checkpoint import SQLiteScanCheckpoint
+
+
+class OutputStream:
+    """
+    OutputStream writes the findings of each check to the output files as soon as the check is completed.
+
+    The output writers are created without findings and every batch of findings is transformed and written to them
+    following the `close_file` protocol, so the files are only completed when the stream is closed. The statistics
+    and the summary tables are aggregated as the findings are written, so the findings are not kept in memory.
+
+    Attributes:
+        provider (Any): The provider object
+        output_options (Any): The output options object, depending on the provider
+        generated_outputs (dict): The output writers, {"regular": [...], "compliance": [...]}
+        keep_asff_findings (bool): If True the ASFF findings are kept to be sent to AWS Security Hub
+    """
+
+    def __init__(
+        self,
+        provider: Any,
+        output_options: Any,
+        generated_outputs: dict,
+        keep_asff_findings: bool = False,
+    ):
+        self._provider = provider
+        self._output_options = output_options
+        self._finding_output_context = FindingOutputContext(provider, output_options)
+        self._writers = generated_outputs.get("regular", []) + generated_outputs.get(
+            "compliance", []
+        )
+        for writer in self._writers:
+            writer.close_file = False
+        self._keep_asff_findings = keep_asff_findings
+        self._asff_findings = []
+        self._statistics = FindingsStatistics()
+        self._summary = FindingsSummary()
+
+    @property
+    def stats(self) -> dict:
+        return self._statistics.stats
+
+    @property
+    def summary(self) -> FindingsSummary:
+        return self._summary
+
+    @property
+    def asff_findings(self) -> list:
+        return self._asff_findings
+
+    def add_findings(self, check_findings: list) -> list[Finding]:
+        """
+        add_findings writes the findings of a check to all the output files.
+
+        Args:
+            check_findings (list): The Check_Report findings of the check
+
+        Returns:
+            list[Finding]: The findings of the check transformed to the output model
+        """
+        self._summary.add(check_findings)
+
+        # TODO: this part is needed since the checks generates a Check_Report_XXX and the output uses Finding
+        # This will be refactored for the outputs generate directly the Finding
+        finding_outputs = []
+        for finding in check_findings:
+            try:
+                finding_outputs.append(
+                    Finding.generate_output(
+                        self._provider,
+                        finding,
+                        self._output_options,
+                        self._finding_output_context,
+                    )
+                )
+            except Exception:
+                continue
+        self.add_finding_outputs(finding_outputs)
+        return finding_outputs
+
+    def add_finding_outputs(self, finding_outputs: list[Finding]) -> None:
+        """
+        add_finding_outputs writes findings already transformed to the output model to all the output files, like the
+        findings of other streams aggregated in this one. They are not added to the summary tables.
+
+        Args:
+            finding_outputs (list[Finding]): The Finding objects
+        """
+        if not finding_outputs:
+            return
+
+        self._statistics.add(finding_outputs)
+        for writer in self._writers:
+            self._write(writer, finding_outputs)
+
+    def restore(self, checkpoint: SQLiteScanCheckpoint) -> None:
+        """
+        restore writes the findings of the checks completed before a scan was interrupted to all the output files
+        and the summary tables. The output files written before the interruption are replaced, since they are not
+        completed.
+
+        Args:
+            checkpoint (SQLiteScanCheckpoint): The checkpoint of the scan resumed
+        """
+        for writer in self._writers:
+            if writer.file_path and os.path.exists(writer.file_path):
+                os.remove(writer.file_path)
+        for finding_outputs in checkpoint.get_findings():
+            self._summary.add(
+                CheckFindingSummary(
+                    check_metadata=finding.metadata,
+                    status=finding.status.value,
+                    muted=finding.muted,
+                )
+                for finding in finding_outputs
+            )
+            self.add_finding_outputs(finding_outputs)
+
+    def _write(self, writer: Output, finding_outputs: list[Finding]) -> None:
+        try:
+            if isinstance(writer, ComplianceOutput):
+                writer.transform(
+                    finding_outputs, writer.compliance, writer.compliance_name
+                )
+            else:
+                writer.transform(finding_outputs)
+            if isinstance(writer, ASFF) and self._keep_asff_findings:
+                self._asff_findings.extend(writer.data)
+
+            if not writer.file_descriptor and writer.file_path:
+                writer.create_file_descriptor(writer.file_path)
+            if isinstance(writer, HTML):
+                # The statistics of the header are passed when the file is closed
+                writer.batch_write_data_to_file(provider=self._provider, stats=None)
+            else:
+                writer.batch_write_data_to_file()
+        except Exception as error:
+            logger.error(
+                f"{writer.__class__.__name__} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        finally:
+            writer.data.clear()
+
+    def close(self) -> None:
+        """close completes and closes the output files with the findings written"""
+        stats = self.stats
+        for writer in self._writers:
+            writer.close_file = True
+            try:
+                if writer.file_descriptor and not writer.file_descriptor.closed:
+                    if isinstance(writer, HTML):
+                        writer.batch_write_data_to_file(
+                            provider=self._provider, stats=stats
+                        )
+                    else:
+                        writer.batch_write_data_to_file()
+            except Exception as error:
+                logger.error(
+                    f"{writer.__class__.__name__} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+
+def generate_output_writers(
+    provider: str,
+    output_formats: list,
+    output_options: Any,
+    bulk_compliance_frameworks: dict,
+) -> dict:
+    """
+    generate_output_writers creates the writers of the output formats and of the compliance frameworks requested,
+    without findings, so the OutputStream writes the findings to them.
+
+    Args:
+        provider (str): The provider type
+        output_formats (list): The output formats, including the compliance frameworks
+        output_options (Any): The output options object, depending on the provider
+        bulk_compliance_frameworks (dict): The compliance frameworks of the provider
+
+    Returns:
+        dict: The output writers, {"regular": [...], "compliance": [...]}
+    """
+    generated_outputs = {"regular": [], "compliance": []}
+
+    if output_formats:
+        for mode in output_formats:
+            filename = (
+                f"{output_options.output_directory}/{output_options.output_filename}"
+            )
+            if mode == "csv":
+                csv_output = CSV(
+                    findings=[],
+                    file_path=f"{filename}{csv_file_suffix}",
+                )
+                generated_outputs["regular"].append(csv_output)
+
+            if mode == "json-asff":
+                asff_output = ASFF(
+                    findings=[],
+                    file_path=f"{filename}{json_asff_file_suffix}",
+                )
+                generated_outputs["regular"].append(asff_output)
+
+            if mode == "json-ocsf":
+                json_output = OCSF(
+                    findings=[],
+                    file_path=f"{filename}{json_ocsf_file_suffix}",
+                )
+                generated_outputs["regular"].append(json_output)
+            if mode == "html":
+                html_output = HTML(
+                    findings=[],
+                    file_path=f"{filename}{html_file_suffix}",
+                )
+                generated_outputs["regular"].append(html_output)
+
+    # Compliance Frameworks
+    input_compliance_frameworks = set(output_options.output_modes).intersection(
+        get_available_compliance_frameworks(provider)
+    )
+    if provider == "aws":
+        for compliance_name in input_compliance_frameworks:
+            if compliance_name.startswith("cis_"):
+                # Generate CIS Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                cis = AWSCIS(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(cis)
+            elif compliance_name == "mitre_attack_aws":
+                # Generate MITRE ATT&CK Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                mitre_attack = AWSMitreAttack(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(mitre_attack)
+            elif compliance_name.startswith("ens_"):
+                # Generate ENS Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                ens = AWSENS(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(ens)
+            elif compliance_name.startswith("aws_well_architected_framework"):
+                # Generate AWS Well-Architected Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                aws_well_architected = AWSWellArchitected(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(aws_well_architected)
+            elif compliance_name.startswith("iso27001_"):
+                # Generate ISO27001 Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                iso27001 = AWSISO27001(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(iso27001)
+            elif compliance_name.startswith("kisa"):
+                # Generate KISA-ISMS-P Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                kisa_ismsp = AWSKISAISMSP(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(kisa_ismsp)
+            else:
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                generic_compliance = GenericCompliance(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(generic_compliance)
+
+    elif provider == "azure":
+        for compliance_name in input_compliance_frameworks:
+            if compliance_name.startswith("cis_"):
+                # Generate CIS Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                cis = AzureCIS(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(cis)
+            elif compliance_name == "mitre_attack_azure":
+                # Generate MITRE ATT&CK Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                mitre_attack = AzureMitreAttack(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(mitre_attack)
+            elif compliance_name.startswith("ens_"):
+                # Generate ENS Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                ens = AzureENS(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(ens)
+            elif compliance_name.startswith("iso27001_"):
+                # Generate ISO27001 Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                iso27001 = AzureISO27001(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(iso27001)
+            else:
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                generic_compliance = GenericCompliance(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(generic_compliance)
+
+    elif provider == "gcp":
+        for compliance_name in input_compliance_frameworks:
+            if compliance_name.startswith("cis_"):
+                # Generate CIS Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                cis = GCPCIS(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(cis)
+            elif compliance_name == "mitre_attack_gcp":
+                # Generate MITRE ATT&CK Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                mitre_attack = GCPMitreAttack(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(mitre_attack)
+            elif compliance_name.startswith("ens_"):
+                # Generate ENS Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                ens = GCPENS(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(ens)
+            elif compliance_name.startswith("iso27001_"):
+                # Generate ISO27001 Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                iso27001 = GCPISO27001(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(iso27001)
+            else:
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                generic_compliance = GenericCompliance(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(generic_compliance)
+
+    elif provider == "kubernetes":
+        for compliance_name in input_compliance_frameworks:
+            if compliance_name.startswith("cis_"):
+                # Generate CIS Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                cis = KubernetesCIS(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(cis)
+            elif compliance_name.startswith("iso27001_"):
+                # Generate ISO27001 Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                iso27001 = KubernetesISO27001(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(iso27001)
+            else:
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                generic_compliance = GenericCompliance(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(generic_compliance)
+
+    elif provider == "microsoft365":
+        for compliance_name in input_compliance_frameworks:
+            if compliance_name.startswith("cis_"):
+                # Generate CIS Finding Object
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                cis = Microsoft365CIS(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(cis)
+            else:
+                filename = (
+                    f"{output_options.output_directory}/compliance/"
+                    f"{output_options.output_filename}_{compliance_name}.csv"
+                )
+                generic_compliance = GenericCompliance(
+                    findings=[],
+                    compliance=bulk_compliance_frameworks[compliance_name],
+                    file_path=filename,
+                )
+                generated_outputs["compliance"].append(generic_compliance)
+
+    return generated_outputs
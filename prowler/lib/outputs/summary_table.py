@@ -1,4 +1,6 @@
 import sys
+from types import SimpleNamespace
+from typing import Iterator, NamedTuple, Union
 
 from colorama import Fore, Style
 from tabulate import tabulate
@@ -13,8 +15,125 @@ from prowler.config.config import (
 from prowler.lib.logger import logger
 
 
+class CheckFindingSummary(NamedTuple):
+    """CheckFindingSummary is the part of a finding used by the compliance tables"""
+
+    check_metadata: SimpleNamespace
+    status: str
+    muted: bool
+
+
+class FindingsSummary:
+    """
+    FindingsSummary aggregates the findings of the summary and compliance tables as they are added, so the findings
+    don't need to be kept in memory to display the tables at the end of the execution.
+
+    The summary table aggregates the findings of each service in a single row, even if the checks of the services
+    are completed interleaved, and the compliance tables only need the number of findings of each check by status.
+    """
+
+    def __init__(self):
+        self._findings_count = 0
+        self._manual_count = 0
+        self._pass_count = 0
+        self._fail_count = 0
+        self._muted_count = 0
+        # The rows of the summary table by service, in the order the services are reported
+        self._services = {}
+        self._checks_findings_count = {}
+
+    @property
+    def findings_count(self) -> int:
+        return self._findings_count
+
+    @property
+    def all_manual(self) -> bool:
+        """all_manual returns True if all the findings are MANUAL, also if there are no findings"""
+        return self._manual_count == self._findings_count
+
+    @property
+    def pass_count(self) -> int:
+        return self._pass_count
+
+    @property
+    def fail_count(self) -> int:
+        return self._fail_count
+
+    @property
+    def muted_count(self) -> int:
+        return self._muted_count
+
+    @property
+    def services(self) -> list[dict]:
+        """services returns the rows of the summary table, one per service"""
+        return [dict(service) for service in self._services.values()]
+
+    def add(self, findings: list) -> None:
+        """add aggregates the given findings into the row of their service"""
+        for finding in findings:
+            self._findings_count += 1
+            if finding.status == "MANUAL":
+                self._manual_count += 1
+
+            check_finding = (
+                finding.check_metadata.CheckID,
+                finding.status,
+                finding.muted,
+            )
+            self._checks_findings_count[check_finding] = (
+                self._checks_findings_count.get(check_finding, 0) + 1
+            )
+
+            service_name = finding.check_metadata.ServiceName
+            service = self._services.get(service_name)
+            if service is None:
+                service = self._services[service_name] = {
+                    "Service": service_name,
+                    "Provider": finding.check_metadata.Provider,
+                    "Total": 0,
+                    "Pass": 0,
+                    "Critical": 0,
+                    "High": 0,
+                    "Medium": 0,
+                    "Low": 0,
+                    "Muted": 0,
+                }
+
+            service["Total"] += 1
+            if finding.muted:
+                self._muted_count += 1
+                service["Muted"] += 1
+            if finding.status == "PASS":
+                self._pass_count += 1
+                service["Pass"] += 1
+            elif finding.status == "FAIL":
+                self._fail_count += 1
+                if finding.check_metadata.Severity == "critical":
+                    service["Critical"] += 1
+                elif finding.check_metadata.Severity == "high":
+                    service["High"] += 1
+                elif finding.check_metadata.Severity == "medium":
+                    service["Medium"] += 1
+                elif finding.check_metadata.Severity == "low":
+                    service["Low"] += 1
+
+    def get_findings(self) -> Iterator[CheckFindingSummary]:
+        """
+        get_findings yields a CheckFindingSummary for every finding added, with the check ID, status and muted fields
+        used by the compliance tables, grouped by check in the order they were reported.
+        """
+        for (check_id, status, muted), count in self._checks_findings_count.items():
+            check_finding = CheckFindingSummary(
+                check_metadata=SimpleNamespace(CheckID=check_id),
+                status=status,
+                muted=muted,
+            )
+            for _ in range(count):
+                yield check_finding
+
+
 def display_summary_table(
-    findings: list,
+    findings: Union[list, FindingsSummary],
     provider,
     output_options,
 ):
@@ -44,19 +163,14 @@ def display_summary_table(
             entity_type = "Tenant Domain"
             audited_entities = provider.identity.tenant_domain
 
+        if not isinstance(findings, FindingsSummary):
+            findings_summary = FindingsSummary()
+            findings_summary.add(findings)
+        else:
+            findings_summary = findings
+
         # Check if there are findings and that they are not all MANUAL
-        if findings and not all(finding.status == "MANUAL" for finding in findings):
-            current = {
-                "Service": "",
-                "Provider": "",
-                "Total": 0,
-                "Pass": 0,
-                "Critical": 0,
-                "High": 0,
-                "Medium": 0,
-                "Low": 0,
-                "Muted": 0,
-            }
+        if not findings_summary.all_manual:
             findings_table = {
                 "Provider": [],
                 "Service": [],
@@ -67,50 +181,20 @@ def display_summary_table(
                 "Low": [],
                 "Muted": [],
             }
-            pass_count = fail_count = muted_count = 0
-            for finding in findings:
-                # If new service and not first, add previous row
-                if (
-                    current["Service"] != finding.check_metadata.ServiceName
-                    and current["Service"]
-                ):
-                    add_service_to_table(findings_table, current)
-
-                    current["Total"] = current["Pass"] = current["Muted"] = current[
-                        "Critical"
-                    ] = current["High"] = current["Medium"] = current["Low"] = 0
-
-                current["Service"] = finding.check_metadata.ServiceName
-                current["Provider"] = finding.check_metadata.Provider
-
-                current["Total"] += 1
-                if finding.muted:
-                    muted_count += 1
-                    current["Muted"] += 1
-                if finding.status == "PASS":
-                    pass_count += 1
-                    current["Pass"] += 1
-                elif finding.status == "FAIL":
-                    fail_count += 1
-                    if finding.check_metadata.Severity == "critical":
-                        current["Critical"] += 1
-                    elif finding.check_metadata.Severity == "high":
-                        current["High"] += 1
-                    elif finding.check_metadata.Severity == "medium":
-                        current["Medium"] += 1
-                    elif finding.check_metadata.Severity == "low":
-                        current["Low"] += 1
-
-            # Add final service
-
-            add_service_to_table(findings_table, current)
+            for service in findings_summary.services:
+                add_service_to_table(findings_table, service)
+
+            findings_count = findings_summary.findings_count
+            pass_count = findings_summary.pass_count
+            fail_count = findings_summary.fail_count
+            muted_count = findings_summary.muted_count
 
             print("\nOverview Results:")
             overview_table = [
                 [
-                    f"{Fore.RED}{round(fail_count / len(findings) * 100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
-                    f"{Fore.GREEN}{round(pass_count / len(findings) * 100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
-                    f"{orange_color}{round(muted_count / len(findings) * 100, 2)}% ({muted_count}) Muted{Style.RESET_ALL}",
+                    f"{Fore.RED}{round(fail_count / findings_count * 100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
+                    f"{Fore.GREEN}{round(pass_count / findings_count * 100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
+                    f"{orange_color}{round(muted_count / findings_count * 100, 2)}% ({muted_count}) Muted{Style.RESET_ALL}",
                 ]
             ]
             print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -0,0 +1,155 @@
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+from prowler.lib.check.models import CheckMetadata
+from prowler.lib.outputs.finding import Finding
+from prowler.lib.scan.exceptions.exceptions import ScanCheckpointMismatchError
+
+
+class ScanCheckpoint(ABC):
+    """
+    ScanCheckpoint records the checks completed by a scan, so an interrupted scan can be resumed skipping them.
+
+    A check is recorded once its findings are processed, so the checks interrupted before being recorded are executed
+    again when the scan is resumed.
+    """
+
+    @property
+    @abstractmethod
+    def completed_checks(self) -> set[str]:
+        """completed_checks returns the checks already completed by the scan"""
+
+    @abstractmethod
+    def add_check(self, check_name: str, findings: list[Finding]) -> None:
+        """
+        add_check records the check as completed.
+
+        Args:
+            check_name (str): The name of the check.
+            findings (list[Finding]): The findings of the check.
+        """
+
+
+class SQLiteScanCheckpoint(ScanCheckpoint):
+    """
+    SQLiteScanCheckpoint stores the completed checks and their findings in a local SQLite database, so the outputs of
+    a resumed scan can be written again with the findings of the checks completed before the interruption.
+
+    Every check is stored with its findings in a single transaction. The metadata of the checks is stored once per
+    check instead of once per finding.
+
+    Attributes:
+        file_path (str): The path of the SQLite database.
+        provider (str): The provider of the scan, a checkpoint can only be resumed by the same provider.
+    """
+
+    def __init__(self, file_path: str, provider: str):
+        self._file_path = file_path
+        self._connection = sqlite3.connect(file_path)
+        # The write-ahead log keeps the committed checks when the process dies, without syncing every commit
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS scan (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS checks (check_name TEXT PRIMARY KEY, metadata TEXT)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS findings (check_name TEXT, finding TEXT)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS findings_check_name ON findings (check_name)"
+            )
+            self._connection.execute(
+                "INSERT OR IGNORE INTO scan (key, value) VALUES ('provider', ?)",
+                (provider,),
+            )
+        (checkpoint_provider,) = self._connection.execute(
+            "SELECT value FROM scan WHERE key = 'provider'"
+        ).fetchone()
+        if checkpoint_provider != provider:
+            self._connection.close()
+            raise ScanCheckpointMismatchError(
+                file=file_path,
+                message=f"The checkpoint belongs to a scan of the {checkpoint_provider} provider, not {provider}.",
+            )
+        self._completed_checks = {
+            check_name
+            for (check_name,) in self._connection.execute(
+                "SELECT check_name FROM checks"
+            )
+        }
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def completed_checks(self) -> set[str]:
+        return self._completed_checks
+
+    def add_check(self, check_name: str, findings: list[Finding]) -> None:
+        """
+        add_check stores the check as completed with its findings.
+
+        Args:
+            check_name (str): The name of the check.
+            findings (list[Finding]): The findings of the check.
+        """
+        metadata = findings[0].metadata.json() if findings else None
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checks (check_name, metadata) VALUES (?, ?)",
+                (check_name, metadata),
+            )
+            self._connection.execute(
+                "DELETE FROM findings WHERE check_name = ?", (check_name,)
+            )
+            self._connection.executemany(
+                "INSERT INTO findings (check_name, finding) VALUES (?, ?)",
+                (
+                    (check_name, finding.json(exclude={"metadata"}))
+                    for finding in findings
+                ),
+            )
+        self._completed_checks.add(check_name)
+
+    def get_findings(self) -> Iterator[list[Finding]]:
+        """
+        get_findings yields the findings of every completed check, in the order the checks were completed.
+
+        Yields:
+            list[Finding]: The findings of a check.
+        """
+        checks = self._connection.execute(
+            "SELECT check_name, metadata FROM checks ORDER BY rowid"
+        ).fetchall()
+        for check_name, metadata in checks:
+            if metadata is None:
+                continue
+            check_metadata = CheckMetadata.parse_raw(metadata)
+            findings = []
+            for (finding,) in self._connection.execute(
+                "SELECT finding FROM findings WHERE check_name = ? ORDER BY rowid",
+                (check_name,),
+            ):
+                finding = json.loads(finding)
+                finding["metadata"] = check_metadata
+                findings.append(Finding(**finding))
+            yield findings
+
+    def close(self) -> None:
+        """close closes the database, keeping the checkpoint to resume the scan"""
+        self._connection.close()
+
+    def delete(self) -> None:
+        """delete closes and removes the database, once the scan is completed"""
+        self._connection.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(f"{self._file_path}{suffix}"):
+                os.remove(f"{self._file_path}{suffix}")
@@ -30,6 +30,10 @@ class ScanBaseException(ProwlerException):
             "message": "Invalid status provided.",
             "remediation": "Please provide a valid status: FAIL, PASS, MANUAL.",
         },
+        (5006, "ScanCheckpointMismatchError"): {
+            "message": "The checkpoint belongs to another scan.",
+            "remediation": "Please resume the scan with the same provider it was started with.",
+        },
     }
 
     def __init__(self, code, file=None, original_exception=None, message=None):
@@ -86,3 +90,10 @@ class ScanInvalidStatusError(ScanBaseException):
         super().__init__(
             5005, file=file, original_exception=original_exception, message=message
         )
+
+
+class ScanCheckpointMismatchError(ScanBaseException):
+    def __init__(self, file=None, original_exception=None, message=None):
+        super().__init__(
+            5006, file=file, original_exception=original_exception, message=message
+        )
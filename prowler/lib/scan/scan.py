@@ -6,15 +6,19 @@ from prowler.lib.check.check import (
     execute,
     import_check,
     list_services,
+    run_checks,
     update_audit_metadata,
 )
 from prowler.lib.check.checks_loader import load_checks_to_execute
 from prowler.lib.check.compliance import update_checks_metadata_with_compliance
 from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.check.eviction import ServiceClientEvictor
 from prowler.lib.check.models import CheckMetadata, Severity
+from prowler.lib.check.prefetch import ServiceClientPrefetcher
 from prowler.lib.logger import logger
 from prowler.lib.outputs.common import Status
-from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.finding import Finding, FindingOutputContext
+from prowler.lib.scan.checkpoint import ScanCheckpoint
 from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidCategoryError,
     ScanInvalidCheckError,
@@ -41,6 +45,11 @@ class Scan:
     _status: list[str] = None
     _bulk_checks_metadata: dict[str, CheckMetadata]
     _bulk_compliance_frameworks: dict
+    _max_parallel_checks: int = 1
+    _prefetch_services: int = 0
+    _evict_completed_services: bool = False
+    _service_memory_usage: dict[str, int]
+    _checkpoint: ScanCheckpoint = None
 
     def __init__(
         self,
@@ -53,6 +62,10 @@ class Scan:
         excluded_checks: list[str] = None,
         excluded_services: list[str] = None,
         status: list[str] = None,
+        max_parallel_checks: int = 1,
+        prefetch_services: int = 0,
+        evict_completed_services: bool = False,
+        checkpoint: ScanCheckpoint = None,
     ):
         """
         Scan is the class that executes the checks and yields the progress and the findings.
@@ -67,6 +80,10 @@ class Scan:
             excluded_checks: list[str] -> The checks to exclude
             excluded_services: list[str] -> The services to exclude
             status: list[str] -> The status of the checks
+            max_parallel_checks: int -> The maximum number of services whose checks are executed concurrently
+            prefetch_services: int -> The number of upcoming services whose clients are built in the background
+            evict_completed_services: bool -> Release the service clients and their data once their checks are completed
+            checkpoint: ScanCheckpoint -> Records the completed checks, the checks it already completed are skipped
 
         Raises:
             ScanInvalidCheckError: If the check does not exist in the provider or is from another provider.
@@ -77,6 +94,11 @@ class Scan:
             ScanInvalidStatusError: If the status does not exist in the provider.
         """
         self._provider = provider
+        self._max_parallel_checks = max_parallel_checks
+        self._prefetch_services = prefetch_services
+        self._evict_completed_services = evict_completed_services
+        self._service_memory_usage = {}
+        self._checkpoint = checkpoint
 
         # Validate the status
         if status:
@@ -192,6 +214,12 @@ class Scan:
         self._service_checks_to_execute = service_checks_to_execute
         self._service_checks_completed = service_checks_completed
 
+        # The checks completed before the scan was interrupted count as completed
+        if checkpoint:
+            for check_name in self._checks_to_execute:
+                if check_name in checkpoint.completed_checks:
+                    self._complete_check(check_name)
+
     @property
     def checks_to_execute(self) -> list[str]:
         return self._checks_to_execute
@@ -214,6 +242,19 @@ class Scan:
             self._number_of_checks_completed / self._number_of_checks_to_execute * 100
         )
 
+    @property
+    def max_parallel_checks(self) -> int:
+        return self._max_parallel_checks
+
+    @property
+    def prefetch_services(self) -> int:
+        return self._prefetch_services
+
+    @property
+    def service_memory_usage(self) -> dict[str, int]:
+        """The resident memory of the process in bytes once each service's checks were completed, only recorded with evict_completed_services"""
+        return self._service_memory_usage
+
     @property
     def duration(self) -> int:
         return self._duration
@@ -252,8 +293,17 @@ class Scan:
                 arguments=arguments,
                 bulk_checks_metadata=self.bulk_checks_metadata,
             )
+            finding_output_context = FindingOutputContext(
+                self._provider, output_options
+            )
 
             checks_to_execute = self.checks_to_execute
+            if self._checkpoint:
+                checks_to_execute = [
+                    check_name
+                    for check_name in checks_to_execute
+                    if check_name not in self._checkpoint.completed_checks
+                ]
             # Initialize the Audit Metadata
             # TODO: this should be done in the provider class
             # Refactor(Core): Audit manager?
@@ -264,47 +314,44 @@ class Scan:
                 audit_progress=0,
             )
 
+            # Build the clients of the upcoming services in the background
+            prefetcher = None
+            if self._prefetch_services:
+                prefetcher = ServiceClientPrefetcher(
+                    self._provider.type,
+                    checks_to_execute,
+                    self._prefetch_services,
+                )
+
+            # Release the service clients once their checks are completed
+            evictor = None
+            if self._evict_completed_services:
+                evictor = ServiceClientEvictor(self._provider.type, checks_to_execute)
+                self._service_memory_usage = evictor.service_memory_usage
+
             start_time = datetime.datetime.now()
 
-            for check_name in checks_to_execute:
+            for check_name, check_findings in run_checks(
+                checks_to_execute,
+                lambda check_name: self._execute_check(
+                    check_name, custom_checks_metadata
+                ),
+                self._max_parallel_checks,
+                prefetcher,
+            ):
+                if evictor:
+                    evictor.check_completed(check_name)
+                # If check does not exists in the provider or is from another provider
+                if check_findings is None:
+                    continue
                 try:
-                    # Recover service from check name
-                    service = get_service_name_from_check_name(check_name)
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                        )
-                        continue
-                    # Execute the check
-                    check_findings = execute(
-                        check,
-                        self._provider,
-                        custom_checks_metadata,
-                        output_options=None,
-                    )
-
                     # Filter the findings by the status
                     if self._status:
                         for finding in check_findings:
                             if finding.status not in self._status:
                                 check_findings.remove(finding)
 
-                    # Remove the executed check
-                    self._service_checks_to_execute[service].remove(check_name)
-                    if len(self._service_checks_to_execute[service]) == 0:
-                        self._service_checks_to_execute.pop(service, None)
-                    # Add the completed check
-                    if service not in self._service_checks_completed:
-                        self._service_checks_completed[service] = set()
-                    self._service_checks_completed[service].add(check_name)
-                    self._number_of_checks_completed += 1
+                    self._complete_check(check_name)
 
                     # This should be done just once all the service's checks are completed
                     # This metadata needs to get to the services not within the provider
@@ -323,17 +370,17 @@ class Scan:
                                     self.provider,
                                     finding,
                                     output_options=output_options,
+                                    context=finding_output_context,
                                 )
                             )
                         except Exception:
                             continue
 
                     yield self.progress, findings
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
-                    )
+
+                    # The check is recorded once the caller has processed its findings
+                    if self._checkpoint:
+                        self._checkpoint.add_check(check_name, findings)
                 except Exception as error:
                     logger.error(
                         f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -345,6 +392,49 @@ class Scan:
                 f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def _complete_check(self, check_name: str) -> None:
+        """_complete_check moves the given check from the checks to execute to the completed checks"""
+        service = get_service_name_from_check_name(check_name)
+        # Remove the executed check
+        self._service_checks_to_execute[service].remove(check_name)
+        if len(self._service_checks_to_execute[service]) == 0:
+            self._service_checks_to_execute.pop(service, None)
+        # Add the completed check
+        if service not in self._service_checks_completed:
+            self._service_checks_completed[service] = set()
+        self._service_checks_completed[service].add(check_name)
+        self._number_of_checks_completed += 1
+
+    def _execute_check(self, check_name: str, custom_checks_metadata: dict) -> list:
+        """
+        _execute_check imports and executes the given check, returning its findings.
+        Returns None if the check does not exist in the provider.
+
+        This is called from the worker threads when the scan runs with max_parallel_checks greater than 1,
+        so it must not update the scan progress.
+        """
+        # Recover service from check name
+        service = get_service_name_from_check_name(check_name)
+        try:
+            # Import check module
+            check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
+            lib = import_check(check_module_path)
+            # Recover functions from check
+            check_to_execute = getattr(lib, check_name)
+            check = check_to_execute()
+        except ModuleNotFoundError:
+            logger.error(
+                f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
+            )
+            return None
+        # Execute the check
+        return execute(
+            check,
+            self._provider,
+            custom_checks_metadata,
+            output_options=None,
+        )
+
     def get_completed_services(self) -> set[str]:
         """
         get_completed_services returns the services that have been completed.
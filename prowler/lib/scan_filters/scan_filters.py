@@ -1,16 +1,125 @@
+from bisect import bisect_left
+from collections import defaultdict
+from threading import Lock
+from typing import Union
+
 from prowler.lib.logger import logger
 
+# The length of the substrings indexed to look up the resources within the audit resources
+NGRAM_SIZE = 3
+
+
+class AuditResourcesFilter:
+    """
+    AuditResourcesFilter is the list of resources to audit compiled once to look up the collected resources.
+
+    A resource is filtered if it is part of any of the audit resources, e.g. an ARN or a resource name within an ARN:
+        - Exact resources are looked up in a set.
+        - Prefixes of the audit resources are looked up in the sorted audit resources with a binary search.
+        - ARNs can only be found in the middle of the audit resources containing another ARN.
+        - Any other substring, e.g. a resource name or ID, is looked up in an index of the n-grams of the audit
+          resources, so it is only compared with the audit resources containing all its n-grams.
+
+    Attributes:
+        audit_resources (list[str]): The resources to audit, e.g. the ARNs passed with --resource-arn
+    """
+
+    def __init__(self, audit_resources: list[str]):
+        self._audit_resources = audit_resources
+        self._resources = frozenset(audit_resources)
+        self._sorted_resources = sorted(self._resources)
+        self._nested_arn_resources = [
+            resource for resource in self._sorted_resources if "arn:" in resource[1:]
+        ]
+        self._ngrams = defaultdict(set)
+        for index, audit_resource in enumerate(self._sorted_resources):
+            for position in range(len(audit_resource) - NGRAM_SIZE + 1):
+                self._ngrams[audit_resource[position : position + NGRAM_SIZE]].add(
+                    index
+                )
+
+    @property
+    def audit_resources(self) -> list[str]:
+        return self._audit_resources
+
+    def __bool__(self) -> bool:
+        return bool(self._resources)
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def is_prefix(self, resource: str) -> bool:
+        """is_prefix returns True if the resource is the prefix of any of the audit resources"""
+        position = bisect_left(self._sorted_resources, resource)
+        return position < len(self._sorted_resources) and self._sorted_resources[
+            position
+        ].startswith(resource)
 
-def is_resource_filtered(resource: str, audit_resources: list) -> bool:
+    def is_filtered(self, resource: str) -> bool:
+        """is_filtered returns True if the resource is part of any of the audit resources"""
+        if resource in self._resources or self.is_prefix(resource):
+            return True
+        if resource.startswith("arn:"):
+            return any(
+                resource in audit_resource
+                for audit_resource in self._nested_arn_resources
+            )
+        return self.is_substring(resource)
+
+    def is_substring(self, resource: str) -> bool:
+        """is_substring returns True if the resource is a substring of any of the audit resources"""
+        if len(resource) < NGRAM_SIZE:
+            return any(
+                resource in audit_resource for audit_resource in self._sorted_resources
+            )
+        ngram_indexes = []
+        for position in range(len(resource) - NGRAM_SIZE + 1):
+            indexes = self._ngrams.get(resource[position : position + NGRAM_SIZE])
+            if not indexes:
+                return False
+            ngram_indexes.append(indexes)
+        # Intersect the fewest audit resources first
+        ngram_indexes.sort(key=len)
+        candidates = ngram_indexes[0]
+        for indexes in ngram_indexes[1:]:
+            candidates = candidates & indexes
+            if not candidates:
+                return False
+        return any(resource in self._sorted_resources[index] for index in candidates)
+
+
+_audit_resources_filter: AuditResourcesFilter = None
+_audit_resources_filter_lock = Lock()
+
+
+def get_audit_resources_filter(audit_resources: list[str]) -> AuditResourcesFilter:
+    """
+    get_audit_resources_filter returns the compiled filter of the given audit resources.
+
+    The filter of the last audit resources is kept, so all the services sharing the provider's audit resources reuse it.
+    """
+    global _audit_resources_filter
+    with _audit_resources_filter_lock:
+        if (
+            _audit_resources_filter is None
+            or _audit_resources_filter.audit_resources is not audit_resources
+        ):
+            _audit_resources_filter = AuditResourcesFilter(audit_resources)
+        return _audit_resources_filter
+
+
+def is_resource_filtered(
+    resource: str, audit_resources: Union[list, AuditResourcesFilter]
+) -> bool:
     """
     Check if the resource passed as argument is present in the audit_resources.
 
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
-        if resource in str(audit_resources):
-            return True
-        return False
+        if not isinstance(audit_resources, AuditResourcesFilter):
+            audit_resources = get_audit_resources_filter(audit_resources)
+        return audit_resources.is_filtered(resource)
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} ({resource})"
@@ -1,8 +1,11 @@
 import os
 import pathlib
 from datetime import datetime
+from functools import lru_cache
 from re import fullmatch
-from typing import Optional
+from threading import Condition, Lock
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 from boto3.session import Session
 from botocore.config import Config
@@ -21,6 +24,10 @@ from prowler.config.config import (
 )
 from prowler.lib.check.utils import list_modules, recover_checks_from_service
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import (
+    AuditResourcesFilter,
+    get_audit_resources_filter,
+)
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.aws.config import (
     AWS_REGION_US_EAST_1,
@@ -54,6 +61,14 @@ from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
     parse_organizations_metadata,
 )
+from prowler.providers.aws.lib.regions.regions import AWSRegionsIndex
+from prowler.providers.aws.lib.service.concurrency import (
+    DEFAULT_INITIAL_WORKERS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MIN_WORKERS,
+    ConcurrencyController,
+    is_throttling_response,
+)
 from prowler.providers.aws.models import (
     AWSAssumeRoleConfiguration,
     AWSAssumeRoleInfo,
@@ -81,11 +96,14 @@ class AwsProvider(Provider):
         _identity (AWSIdentityInfo): The AWS provider identity information.
         _session (AWSSession): The AWS provider session.
         _organizations_metadata (AWSOrganizationsInfo): The AWS Organizations metadata.
+        _organizations_session (Session): The session used to get the AWS Organizations metadata.
         _audit_resources (list): The list of resources to audit.
         _audit_config (dict): The audit configuration.
         _scan_unused_services (bool): A boolean indicating whether to scan unused services.
         _enabled_regions (set): The set of enabled regions.
         _mutelist (AWSMutelist): The AWS provider mutelist.
+        _clients (dict): The boto3 clients created by get_client, by service, region and configuration.
+        _concurrency_controllers (dict): The concurrency controllers of the AWS API calls, by service and region.
         audit_metadata (Audit_Metadata): The audit metadata.
     """
 
@@ -93,8 +111,9 @@ class AwsProvider(Provider):
     _identity: AWSIdentityInfo
     _session: AWSSession
     _organizations_metadata: AWSOrganizationsInfo
+    _organizations_session: Session = None
     _audit_resources: list = []
-    _audit_config: dict
+    _audit_config: dict = {}
     _scan_unused_services: bool = False
     _enabled_regions: set = set()
     _mutelist: AWSMutelist
@@ -190,6 +209,14 @@ class AwsProvider(Provider):
 
         logger.info("Initializing AWS provider ...")
 
+        # Clients shared by the services, see get_client
+        self._clients = {}
+        self._clients_session = None
+        self._clients_lock = Lock()
+        # Concurrency controllers shared by the services calling the same API, notified when a call completes
+        self._concurrency_condition = Condition()
+        self._concurrency_controllers = {}
+
         ######## AWS Session
         logger.info("Generating original session ...")
 
@@ -323,6 +350,7 @@ class AwsProvider(Provider):
                 "Generated new session for to get the AWS Organizations metadata"
             )
 
+        self._organizations_session = aws_organizations_session
         self._organizations_metadata = self.get_organizations_info(
             aws_organizations_session, self._identity.account
         )
@@ -389,10 +417,19 @@ class AwsProvider(Provider):
     def organizations_metadata(self):
         return self._organizations_metadata
 
+    @property
+    def organizations_session(self):
+        return self._organizations_session
+
     @property
     def audit_resources(self):
         return self._audit_resources
 
+    @property
+    def audit_resources_filter(self) -> AuditResourcesFilter:
+        """The audit resources compiled to look up the collected resources with is_resource_filtered"""
+        return get_audit_resources_filter(self._audit_resources)
+
     @property
     def scan_unused_services(self):
         return self._scan_unused_services
@@ -738,9 +775,7 @@ class AwsProvider(Provider):
                 enabled_regions = service_regions
 
             for region in enabled_regions:
-                regional_client = self._session.current_session.client(
-                    service, region_name=region, config=self._session.session_config
-                )
+                regional_client = self.get_client(service, region)
                 regional_client.region = region
                 regional_clients[region] = regional_client
 
@@ -750,6 +785,119 @@ class AwsProvider(Provider):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def get_client(self, service: str, region: str = None, config: Config = None):
+        """
+        get_client returns the boto3 client of the service in the region, created only once per configuration.
+
+        The clients are shared by all the services of the scan, so the endpoint resolution, the loaded service models
+        and the pool of connections of each client are reused. The pool of connections is sized to the maximum number
+        of concurrent calls of a service in a region, the threading_max_workers of the audit config.
+
+        Args:
+            - service: The AWS service name.
+            - region: The AWS region name, the region of the session by default.
+            - config: The botocore configuration merged into the session configuration, if any.
+
+        Returns:
+            - The boto3 client of the service in the region.
+        """
+        max_pool_connections = (self._audit_config or {}).get(
+            "threading_max_workers", DEFAULT_MAX_WORKERS
+        )
+        key = (service, region, max_pool_connections, self._get_config_key(config))
+        with self._clients_lock:
+            # The clients are only valid for the session they were created with, e.g. before assuming a role
+            if self._clients_session is not self._session.current_session:
+                self._clients = {}
+                self._clients_session = self._session.current_session
+            if key not in self._clients:
+                client_config = Config(max_pool_connections=max_pool_connections)
+                if self._session.session_config:
+                    client_config = self._session.session_config.merge(client_config)
+                if config:
+                    client_config = client_config.merge(config)
+                client = self._session.current_session.client(
+                    service, region_name=region, config=client_config
+                )
+                self._track_throttling(service, client)
+                self._clients[key] = client
+            return self._clients[key]
+
+    def _track_throttling(self, service: str, client) -> None:
+        """_track_throttling makes the concurrency controller of the client's service and region back off when a request is throttled"""
+        region = client.meta.region_name
+
+        def on_needs_retry(response=None, **kwargs):
+            if is_throttling_response(response):
+                self.get_concurrency_controller(service, region).throttled()
+
+        # It is registered first to see every response, the retry handler stops the event when it retries a request
+        client.meta.events.register_first("needs-retry", on_needs_retry)
+
+    @property
+    def concurrency_condition(self) -> Condition:
+        return self._concurrency_condition
+
+    def get_concurrency_controller(
+        self, service: str, region: str
+    ) -> ConcurrencyController:
+        """
+        get_concurrency_controller returns the concurrency controller of the API of the service in the region.
+
+        The controller is shared by all the services of the scan calling the same API, e.g. EC2 and VPC, since the
+        AWS API rate limits apply to the account and region.
+
+        Args:
+            - service: The AWS service name.
+            - region: The AWS region name.
+
+        Returns:
+            - The concurrency controller of the service in the region.
+        """
+        with self._concurrency_condition:
+            if (service, region) not in self._concurrency_controllers:
+                audit_config = self._audit_config or {}
+                self._concurrency_controllers[(service, region)] = (
+                    ConcurrencyController(
+                        self._concurrency_condition,
+                        initial=audit_config.get(
+                            "threading_initial_workers", DEFAULT_INITIAL_WORKERS
+                        ),
+                        minimum=audit_config.get(
+                            "threading_min_workers", DEFAULT_MIN_WORKERS
+                        ),
+                        maximum=audit_config.get(
+                            "threading_max_workers", DEFAULT_MAX_WORKERS
+                        ),
+                    )
+                )
+            return self._concurrency_controllers[(service, region)]
+
+    def get_concurrency_stats(self, service: str) -> dict:
+        """get_concurrency_stats returns the calls, throttled requests, latency in seconds and concurrency limit of the service by region"""
+        with self._concurrency_condition:
+            controllers = {
+                region: controller
+                for (
+                    controller_service,
+                    region,
+                ), controller in self._concurrency_controllers.items()
+                if controller_service == service
+            }
+        return {region: controller.stats for region, controller in controllers.items()}
+
+    @staticmethod
+    def _get_config_key(config: Config = None) -> tuple:
+        if not config:
+            return ()
+        # The options can be dictionaries, e.g. retries, so they are compared by their representation
+        return tuple(
+            sorted(
+                (option, repr(value))
+                for option, value in config._user_provided_options.items()
+            )
+        )
+
     @staticmethod
     def get_available_aws_service_regions(
         service: str, partition: str = "aws", audited_regions: set = None
@@ -765,8 +913,9 @@ class AwsProvider(Provider):
         Returns:
             - A set of strings representing the available regions for the given service and partition.
         """
-        data = read_aws_regions_file()
-        json_regions = set(data["services"][service]["regions"][partition])
+        json_regions = set(
+            get_aws_regions_index().get_service_regions(service, partition)
+        )
         if audited_regions:
             # Get common regions between input and json
             regions = json_regions.intersection(audited_regions)
@@ -1490,19 +1639,10 @@ class AwsProvider(Provider):
         """
 
         try:
-            regions = set()
-            data = read_aws_regions_file()
-
-            if partition is None:
-                for service in data["services"].values():
-                    for partition in service["regions"]:
-                        regions.update(service["regions"][partition])
-            else:
-                partition = Partition(partition)
-                for service in data["services"].values():
-                    regions.update(service["regions"][partition.value])
+            if partition is not None:
+                partition = Partition(partition).value
 
-            return regions
+            return set(get_aws_regions_index().get_partition_regions(partition))
         except ValueError as value_error:
             logger.error(
                 f"{value_error.__class__.__name__}[{value_error.__traceback__.tb_lineno}]: {value_error}"
@@ -1524,19 +1664,65 @@ class AwsProvider(Provider):
             raise error
 
 
-def read_aws_regions_file() -> dict:
+def _read_only(data: Any) -> Any:
+    """Returns a read-only view of the parsed JSON data, with the objects as mapping proxies and the arrays as tuples"""
+    if isinstance(data, dict):
+        return MappingProxyType({key: _read_only(value) for key, value in data.items()})
+    if isinstance(data, list):
+        return tuple(_read_only(value) for value in data)
+    return data
+
+
+@lru_cache(maxsize=1)
+def read_aws_regions_file() -> Mapping:
     """
-    Reads the AWS services JSON file and returns the parsed data as a dictionary.
+    Reads the AWS services JSON file and returns a read-only view of the parsed data.
+
+    The file is read only once, the parsed data is cached and shared by all the callers, so it is returned read-only.
+    Use invalidate_aws_regions_cache to read it again.
 
     Returns:
-        dict: The parsed data from the AWS services JSON file.
+        Mapping: The parsed data from the AWS services JSON file.
     """
     # Get JSON locally
     actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
     with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
         data = parse_json_file(f)
 
-    return data
+    return _read_only(data)
+
+
+_aws_regions_index: AWSRegionsIndex = None
+_aws_regions_index_lock = Lock()
+
+
+def get_aws_regions_index() -> AWSRegionsIndex:
+    """
+    Returns the index of the AWS regions by service and partition of the AWS services JSON file.
+
+    The index is built the first time it is requested and rebuilt only if the data returned by read_aws_regions_file changes.
+
+    Returns:
+        AWSRegionsIndex: The index of the AWS regions by service and partition.
+    """
+    global _aws_regions_index
+    data = read_aws_regions_file()
+    with _aws_regions_index_lock:
+        if _aws_regions_index is None or _aws_regions_index.source is not data:
+            _aws_regions_index = AWSRegionsIndex(data)
+        return _aws_regions_index
+
+
+def invalidate_aws_regions_cache() -> None:
+    """
+    Discards the cached AWS services JSON file data and its index, so they are read again from the file the next time.
+
+    It must be called if the AWS services JSON file is updated while Prowler is loaded in the same process.
+    """
+    global _aws_regions_index
+    with _aws_regions_index_lock:
+        read_aws_regions_file.cache_clear()
+        _aws_regions_index = None
 
 
 # TODO: This can be moved to another class since it doesn't need self
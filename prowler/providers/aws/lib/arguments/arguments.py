@@ -74,6 +74,26 @@ def init_parser(self):
         nargs="?",
         help="Specify AWS Organizations management role ARN to be assumed, to get Organization metadata",
     )
+    aws_orgs_subparser.add_argument(
+        "--organizations-scan-role",
+        nargs="?",
+        default=None,
+        help="Scan all the active accounts of the AWS Organization in parallel, assuming the IAM role with this name in each of them. The accounts are listed with the -O/--organizations-role or with the initial credentials, that need organizations:ListAccounts",
+    )
+    aws_orgs_subparser.add_argument(
+        "--organizations-scan-processes",
+        nargs="?",
+        default=4,
+        type=int,
+        help="Number of AWS accounts scanned in parallel with --organizations-scan-role. Default: 4",
+    )
+    aws_orgs_subparser.add_argument(
+        "--organizations-scan-excluded-account",
+        "--organizations-scan-excluded-accounts",
+        nargs="+",
+        default=None,
+        help="AWS account IDs to leave out of the scan with --organizations-scan-role",
+    )
     # AWS Security Hub
     aws_security_hub_subparser = aws_parser.add_argument_group("AWS Security Hub")
     aws_security_hub_subparser.add_argument(
@@ -207,18 +227,44 @@ def validate_role_session_name(session_name) -> str:
 def validate_arguments(arguments: Namespace) -> tuple[bool, str]:
     """validate_arguments returns {True, "} if the provider arguments passed are valid and can be used together. It performs an extra validation, specific for the AWS provider, apart from the argparse lib."""
 
+    organizations_scan_role = getattr(arguments, "organizations_scan_role", None)
+
     # Handle if session_duration is not the default value or external_id is set
     if (
         (arguments.session_duration and arguments.session_duration != 3600)
         or arguments.external_id
         or arguments.role_session_name != ROLE_SESSION_NAME
     ):
-        if not arguments.role:
+        if not arguments.role and not organizations_scan_role:
             return (
                 False,
                 "To use -I/--external-id, -T/--session-duration or --role-session-name options -R/--role option is needed",
             )
 
+    if organizations_scan_role:
+        # The role of every account is assumed in a process of its own, without a terminal
+        unsupported_options = {
+            "-R/--role": arguments.role,
+            "--mfa": arguments.mfa,
+            "--resource-arn": arguments.resource_arn,
+            "--quick-inventory": arguments.quick_inventory,
+            "--security-hub": arguments.security_hub,
+            "--fixer": arguments.fixer,
+            "--checkpoint": getattr(arguments, "checkpoint", False),
+            "--resume": getattr(arguments, "resume", None),
+        }
+        for option, value in unsupported_options.items():
+            if value:
+                return (
+                    False,
+                    f"{option} option can't be used with --organizations-scan-role",
+                )
+        if arguments.organizations_scan_processes < 1:
+            return (
+                False,
+                "--organizations-scan-processes must be greater than 0",
+            )
+
     return (True, "")
 
 
@@ -52,3 +52,26 @@ def parse_organizations_metadata(metadata: dict, tags: dict) -> AWSOrganizations
         logger.warning(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
         )
+
+
+def list_organizations_accounts(
+    session: session.Session, excluded_accounts: list[str] = None
+) -> list[dict]:
+    """
+    list_organizations_accounts returns the active accounts of the AWS Organization.
+
+    Args:
+        session (Session): needs to be a Session object with permissions to do organizations:ListAccounts, from the management account or a delegated administrator.
+        excluded_accounts (list[str]): the IDs of the accounts to leave out.
+
+    Returns:
+        list[dict]: the accounts, with the format of the organizations:ListAccounts response.
+    """
+    excluded_accounts = set(excluded_accounts or [])
+    organizations_client = session.client("organizations")
+    accounts = []
+    for page in organizations_client.get_paginator("list_accounts").paginate():
+        for account in page["Accounts"]:
+            if account["Status"] == "ACTIVE" and account["Id"] not in excluded_accounts:
+                accounts.append(account)
+    return accounts
@@ -0,0 +1,383 @@
+import random
+import time
+from argparse import Namespace
+from collections import deque
+from copy import copy
+from multiprocessing import get_context
+from queue import Empty
+from typing import Callable
+
+from botocore.exceptions import ClientError
+from colorama import Fore, Style
+from tabulate import tabulate
+
+from prowler.config.config import load_and_validate_config_file
+from prowler.lib.check.check import execute_checks
+from prowler.lib.logger import logger
+from prowler.lib.outputs.stream import OutputStream, generate_output_writers
+from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.lib.organizations.organizations import (
+    list_organizations_accounts,
+)
+from prowler.providers.aws.models import (
+    AWSOrganizationsAccountScan,
+    AWSOrganizationsScanCatalog,
+    AWSOutputOptions,
+)
+from prowler.providers.common.provider import Provider
+
+# Error codes returned by AWS STS when the requests are throttled
+STS_THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+}
+STS_THROTTLING_MAX_ATTEMPTS = 8
+STS_THROTTLING_BASE_DELAY = 1
+STS_THROTTLING_MAX_DELAY = 60
+
+# The state of the process scanning an account, set by _init_worker
+_arguments: Namespace = None
+_catalog: AWSOrganizationsScanCatalog = None
+_findings_queue = None
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """
+    is_throttling_error returns True if the error, or any error that caused it, is an AWS throttling error.
+
+    Args:
+        error (BaseException): the error raised.
+
+    Returns:
+        bool: True if the request was throttled.
+    """
+    checked = set()
+    while error is not None and id(error) not in checked:
+        checked.add(id(error))
+        if (
+            isinstance(error, ClientError)
+            and error.response.get("Error", {}).get("Code")
+            in STS_THROTTLING_ERROR_CODES
+        ):
+            return True
+        error = (
+            getattr(error, "original_exception", None)
+            or error.__cause__
+            or error.__context__
+        )
+    return False
+
+
+def init_organizations_account_provider(
+    arguments: Namespace, account_id: str, partition: str
+) -> AwsProvider:
+    """
+    init_organizations_account_provider initializes the provider of an account of the AWS Organization assuming the
+    --organizations-scan-role in it, retrying with exponential backoff while AWS STS throttles the requests.
+
+    Args:
+        arguments (Namespace): the arguments of the execution.
+        account_id (str): the ID of the account to scan.
+        partition (str): the AWS partition of the AWS Organization.
+
+    Returns:
+        AwsProvider: the provider of the account, which is also the global provider.
+    """
+    role_arn = (
+        f"arn:{partition}:iam::{account_id}:role/{arguments.organizations_scan_role}"
+    )
+    fixer_config = load_and_validate_config_file("aws", arguments.fixer_config)
+    for attempt in range(1, STS_THROTTLING_MAX_ATTEMPTS + 1):
+        try:
+            return AwsProvider(
+                retries_max_attempts=arguments.aws_retries_max_attempts,
+                role_arn=role_arn,
+                session_duration=arguments.session_duration,
+                external_id=arguments.external_id,
+                role_session_name=arguments.role_session_name,
+                profile=arguments.profile,
+                regions=set(arguments.region) if arguments.region else None,
+                organizations_role_arn=arguments.organizations_role,
+                scan_unused_services=arguments.scan_unused_services,
+                resource_tags=arguments.resource_tag,
+                config_path=arguments.config_file,
+                mutelist_path=arguments.mutelist_file,
+                fixer_config=fixer_config,
+            )
+        except Exception as error:
+            if attempt == STS_THROTTLING_MAX_ATTEMPTS or not is_throttling_error(error):
+                raise error
+            # Full jitter, so the processes throttled at the same time don't retry at the same time
+            delay = random.uniform(
+                0,
+                min(
+                    STS_THROTTLING_MAX_DELAY,
+                    STS_THROTTLING_BASE_DELAY * 2 ** (attempt - 1),
+                ),
+            )
+            logger.warning(
+                f"{account_id} -- AWS STS throttled the request, retrying in {delay:.1f} seconds ({attempt}/{STS_THROTTLING_MAX_ATTEMPTS})"
+            )
+            time.sleep(delay)
+
+
+def _init_worker(
+    arguments: Namespace, catalog: AWSOrganizationsScanCatalog, findings_queue
+) -> None:
+    """_init_worker stores the state shared by all the accounts in the process scanning an account"""
+    global _arguments, _catalog, _findings_queue
+    _arguments = arguments
+    _catalog = catalog
+    _findings_queue = findings_queue
+    # A forked process inherits the provider of the parent, but it has to use the one of its account
+    Provider.set_global_provider(None)
+
+
+def scan_organizations_account(
+    account: dict, partition: str
+) -> AWSOrganizationsAccountScan:
+    """
+    scan_organizations_account scans an account of the AWS Organization in its own process, writing its findings to
+    the outputs of the account and sending them to the aggregated outputs through the findings queue.
+
+    The errors of the account are not raised, they are sent as its result so the other accounts are scanned.
+
+    Args:
+        account (dict): the account, with the format of the organizations:ListAccounts response.
+        partition (str): the AWS partition of the AWS Organization.
+
+    Returns:
+        AWSOrganizationsAccountScan: the result of the scan of the account.
+    """
+    account_scan = AWSOrganizationsAccountScan(
+        account_id=account["Id"], account_name=account.get("Name", "")
+    )
+    try:
+        arguments = copy(_arguments)
+        # The progress of the accounts scanned in parallel can't be displayed
+        arguments.only_logs = True
+        if arguments.output_filename:
+            arguments.output_filename = (
+                f"{arguments.output_filename}-{account_scan.account_id}"
+            )
+
+        provider = init_organizations_account_provider(
+            arguments, account_scan.account_id, partition
+        )
+        output_options = AWSOutputOptions(
+            arguments, _catalog.bulk_checks_metadata, provider.identity
+        )
+        generated_outputs = generate_output_writers(
+            "aws",
+            arguments.output_formats,
+            output_options,
+            _catalog.bulk_compliance_frameworks,
+        )
+        output_stream = OutputStream(provider, output_options, generated_outputs)
+
+        def add_findings(check_findings: list) -> None:
+            finding_outputs = output_stream.add_findings(check_findings)
+            if finding_outputs:
+                _findings_queue.put((account_scan.account_id, finding_outputs))
+
+        execute_checks(
+            _catalog.checks_to_execute,
+            provider,
+            _catalog.custom_checks_metadata,
+            arguments.config_file,
+            output_options,
+            arguments.max_parallel_checks,
+            arguments.prefetch_services,
+            arguments.evict_completed_services,
+            add_findings,
+        )
+        output_stream.close()
+
+        account_scan.status = "completed"
+        account_scan.stats = output_stream.stats
+        account_scan.output_files = [
+            writer.file_path
+            for writer in generated_outputs["regular"] + generated_outputs["compliance"]
+        ]
+    # The provider exits if it can't be initialized
+    except (Exception, SystemExit) as error:
+        logger.error(
+            f"{account_scan.account_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        account_scan.status = "failed"
+        account_scan.error = f"{error.__class__.__name__}: {error}"
+    finally:
+        # Notify that all the findings of the account were sent, with the result of its scan
+        _findings_queue.put((account_scan.account_id, account_scan))
+    return account_scan
+
+
+def _scan_organizations_account_process(
+    arguments: Namespace,
+    catalog: AWSOrganizationsScanCatalog,
+    findings_queue,
+    account: dict,
+    partition: str,
+) -> None:
+    """_scan_organizations_account_process is the target of the process scanning an account"""
+    _init_worker(arguments, catalog, findings_queue)
+    scan_organizations_account(account, partition)
+
+
+def scan_organizations_accounts(
+    arguments: Namespace,
+    accounts: list[dict],
+    partition: str,
+    catalog: AWSOrganizationsScanCatalog,
+    findings_handler: Callable[[list], None],
+    processes: int = 1,
+) -> list[AWSOrganizationsAccountScan]:
+    """
+    scan_organizations_accounts scans the accounts of the AWS Organization in parallel processes.
+
+    Every account is scanned in a new process, since the service clients of the checks are global, and the processes
+    share the checks and the compliance frameworks loaded in the catalog. The findings of every account are written to
+    its own outputs and passed to the findings_handler as soon as each check is completed.
+
+    A process killed before sending the result of its account, e.g. by the OS when it runs out of memory, is reported
+    as a failed account instead of waiting for it.
+
+    Args:
+        arguments (Namespace): the arguments of the execution.
+        accounts (list[dict]): the accounts to scan, with the format of the organizations:ListAccounts response.
+        partition (str): the AWS partition of the AWS Organization.
+        catalog (AWSOrganizationsScanCatalog): the checks and compliance frameworks to scan the accounts.
+        findings_handler (Callable): called with the Finding objects of each check of every account.
+        processes (int): the number of accounts scanned in parallel.
+
+    Returns:
+        list[AWSOrganizationsAccountScan]: the result of the scan of every account.
+    """
+    if not accounts:
+        return []
+
+    context = get_context()
+    findings_queue = context.Queue()
+    pending_accounts = deque(accounts)
+    running_accounts = {}
+    exited_accounts = set()
+    account_scans = {}
+    try:
+        while pending_accounts or running_accounts:
+            while pending_accounts and len(running_accounts) < processes:
+                account = pending_accounts.popleft()
+                process = context.Process(
+                    target=_scan_organizations_account_process,
+                    args=(arguments, catalog, findings_queue, account, partition),
+                    daemon=True,
+                )
+                process.start()
+                running_accounts[account["Id"]] = (account, process)
+
+            # Consume the findings while the accounts are scanned, so the processes are not blocked sending them
+            try:
+                account_id, message = findings_queue.get(timeout=1)
+            except Empty:
+                for account_id, (account, process) in list(running_accounts.items()):
+                    if process.is_alive():
+                        continue
+                    # The messages sent before the process exited are received before the next timeout
+                    if account_id not in exited_accounts:
+                        exited_accounts.add(account_id)
+                        continue
+                    error = f"The process scanning the account exited with code {process.exitcode}"
+                    logger.error(f"{account_id} -- {error}")
+                    account_scans[account_id] = AWSOrganizationsAccountScan(
+                        account_id=account_id,
+                        account_name=account.get("Name", ""),
+                        status="failed",
+                        error=error,
+                    )
+                    del running_accounts[account_id]
+                continue
+
+            if isinstance(message, AWSOrganizationsAccountScan):
+                account_scans[account_id] = message
+                _, process = running_accounts.pop(account_id)
+                process.join()
+                continue
+            try:
+                findings_handler(message)
+            except Exception as error:
+                logger.error(
+                    f"{account_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+    finally:
+        for _, process in running_accounts.values():
+            process.terminate()
+    return [account_scans[account["Id"]] for account in accounts]
+
+
+def scan_organizations(
+    arguments: Namespace,
+    provider: AwsProvider,
+    catalog: AWSOrganizationsScanCatalog,
+    findings_handler: Callable[[list], None],
+) -> list[AWSOrganizationsAccountScan]:
+    """
+    scan_organizations scans all the active accounts of the AWS Organization with the --organizations-scan-role.
+
+    Args:
+        arguments (Namespace): the arguments of the execution.
+        provider (AwsProvider): the provider of the account used to list the accounts of the AWS Organization.
+        catalog (AWSOrganizationsScanCatalog): the checks and compliance frameworks to scan the accounts.
+        findings_handler (Callable): called with the Finding objects of each check of every account.
+
+    Returns:
+        list[AWSOrganizationsAccountScan]: the result of the scan of every account.
+    """
+    accounts = list_organizations_accounts(
+        provider.organizations_session,
+        arguments.organizations_scan_excluded_account,
+    )
+    if not arguments.only_logs:
+        print(
+            f"{Style.BRIGHT}\nScanning {len(accounts)} accounts of the AWS Organization, {arguments.organizations_scan_processes} in parallel, please wait...{Style.RESET_ALL}"
+        )
+    account_scans = scan_organizations_accounts(
+        arguments,
+        accounts,
+        provider.identity.partition,
+        catalog,
+        findings_handler,
+        arguments.organizations_scan_processes,
+    )
+    if not arguments.only_logs:
+        print_organizations_scan(account_scans)
+    return account_scans
+
+
+def print_organizations_scan(account_scans: list[AWSOrganizationsAccountScan]) -> None:
+    """print_organizations_scan prints the result of the scan of every account of the AWS Organization"""
+    accounts_table = []
+    for account_scan in account_scans:
+        if account_scan.status == "completed":
+            status = f"{Fore.GREEN}{account_scan.status}{Style.RESET_ALL}"
+        else:
+            status = f"{Fore.RED}{account_scan.status}{Style.RESET_ALL}"
+        accounts_table.append(
+            {
+                "Account": account_scan.account_id,
+                "Name": account_scan.account_name,
+                "Status": status,
+                "Pass": account_scan.stats.get("total_pass", 0),
+                "Fail": account_scan.stats.get("total_fail", 0),
+                "Muted": account_scan.stats.get("total_muted_pass", 0)
+                + account_scan.stats.get("total_muted_fail", 0),
+                "Error": account_scan.error,
+            }
+        )
+    failed_accounts = sum(
+        account_scan.status != "completed" for account_scan in account_scans
+    )
+    print(
+        f"\n{Style.BRIGHT}AWS Organizations scan: {len(account_scans) - failed_accounts} accounts scanned, {failed_accounts} failed{Style.RESET_ALL}"
+    )
+    print(tabulate(accounts_table, headers="keys", tablefmt="rounded_grid"))
@@ -27,9 +27,7 @@ def quick_inventory(provider: AwsProvider, args):
         # If not inputed regions, check all of them
         if not provider.identity.audited_regions:
             # EC2 client for describing all regions
-            ec2_client = provider.session.current_session.client(
-                "ec2", region_name=provider.identity.profile_region
-            )
+            ec2_client = provider.get_client("ec2", provider.identity.profile_region)
             # Get all the available regions
             provider.identity.audited_regions = [
                 region["RegionName"]
@@ -62,9 +60,7 @@ def quick_inventory(provider: AwsProvider, args):
                     # Get regional S3 buckets since none-tagged buckets are not supported by the resourcegroupstaggingapi
                     resources_in_region.extend(get_regional_buckets(provider, region))
 
-                    client = provider.session.current_session.client(
-                        "resourcegroupstaggingapi", region_name=region
-                    )
+                    client = provider.get_client("resourcegroupstaggingapi", region)
                     # Get all the resources
                     resources_count = 0
                     try:
@@ -337,7 +333,7 @@ def create_output(resources: list, provider: AwsProvider, args):
 
 def get_regional_buckets(provider: AwsProvider, region: str) -> list:
     regional_buckets = []
-    s3_client = provider.session.current_session.client("s3", region_name=region)
+    s3_client = provider.get_client("s3", region)
     try:
         buckets = s3_client.list_buckets()
         for bucket in buckets["Buckets"]:
@@ -0,0 +1,72 @@
+from types import MappingProxyType
+
+
+class AWSRegionsIndex:
+    """
+    AWSRegionsIndex is an immutable index of the AWS regions by service and partition built from the AWS services JSON file.
+
+    The index is built once and answers the region lookups without walking all the services of the file again.
+
+    Attributes:
+        source (dict): The parsed data of the AWS services JSON file the index was built from
+        services (frozenset[str]): The AWS services
+        partitions (frozenset[str]): The AWS partitions
+    """
+
+    def __init__(self, data: dict):
+        self._source = data
+        service_regions = {}
+        partition_regions = {}
+        for service, service_data in data["services"].items():
+            service_regions[service] = MappingProxyType(
+                {
+                    partition: frozenset(regions)
+                    for partition, regions in service_data["regions"].items()
+                }
+            )
+            for partition, regions in service_regions[service].items():
+                partition_regions.setdefault(partition, set()).update(regions)
+        self._service_regions = MappingProxyType(service_regions)
+        self._partition_regions = MappingProxyType(
+            {
+                partition: frozenset(regions)
+                for partition, regions in partition_regions.items()
+            }
+        )
+        self._regions = frozenset().union(*self._partition_regions.values())
+
+    @property
+    def source(self) -> dict:
+        return self._source
+
+    @property
+    def services(self) -> frozenset[str]:
+        return frozenset(self._service_regions)
+
+    @property
+    def partitions(self) -> frozenset[str]:
+        return frozenset(self._partition_regions)
+
+    def is_service(self, service: str) -> bool:
+        """is_service returns True if the service is present in the AWS services JSON file"""
+        return service in self._service_regions
+
+    def get_service_regions(self, service: str, partition: str) -> frozenset[str]:
+        """
+        get_service_regions returns the regions of the given service in the given partition.
+
+        Raises:
+            KeyError: If the service or the partition is not present in the AWS services JSON file
+        """
+        return self._service_regions[service][partition]
+
+    def get_partition_regions(self, partition: str = None) -> frozenset[str]:
+        """
+        get_partition_regions returns the regions of all the services in the given partition, or in all the partitions if it is None.
+
+        Raises:
+            KeyError: If the partition is not present in the AWS services JSON file
+        """
+        if partition is None:
+            return self._regions
+        return self._partition_regions[partition]
@@ -1,4 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from threading import BoundedSemaphore
+from time import sleep
+from typing import Callable, Iterable, Iterator
 
 from boto3 import Session
 from botocore.client import ClientError
@@ -15,6 +19,16 @@ from prowler.providers.common.models import Connection
 
 SECURITY_HUB_INTEGRATION_NAME = "prowler/prowler"
 SECURITY_HUB_MAX_BATCH = 100
+# BatchImportFindings accepts 10 requests per second, with bursts of 30, per account and region
+SECURITY_HUB_MAX_CONCURRENT_BATCHES = 3
+SECURITY_HUB_MAX_RETRIES = 3
+SECURITY_HUB_RETRY_DELAY = 1
+# Errors of the findings that fail again if they are sent again
+SECURITY_HUB_NON_RETRYABLE_ERRORS = {
+    "AccessDeniedException",
+    "InvalidInput",
+    "InvalidInputException",
+}
 
 
 @dataclass
@@ -45,9 +59,10 @@ class SecurityHub:
         __init__: Initializes the SecurityHub object with necessary attributes.
         filter: Filters findings based on region, returning a dictionary with findings per region.
         verify_enabled_per_region: Verifies and stores enabled regions with SecurityHub clients.
-        batch_send_to_security_hub: Sends findings to Security Hub and returns the count of successfully sent findings.
-        archive_previous_findings: Archives findings that are not present in the current execution.
-        _send_findings_to_security_hub: Sends findings to AWS Security Hub in batches and returns the count of successfully sent findings.
+        batch_send_to_security_hub: Sends findings to Security Hub, in parallel per region, and returns the count of successfully sent findings.
+        archive_previous_findings: Archives findings that are not present in the current execution, in parallel per region.
+        _send_findings_in_batches: Sends findings to AWS Security Hub in concurrent batches and returns the count of successfully sent findings.
+        _batch_import_findings: Sends a batch of findings to AWS Security Hub, retrying the findings that failed to be imported.
     """
 
     _session: Session
@@ -193,95 +208,175 @@ class SecurityHub:
         self,
     ) -> int:
         """
-        Sends the findings to AWS Security Hub in batches for each region and returns the count of successfully sent findings.
+        Sends the findings to AWS Security Hub in batches, sending to all the regions in parallel, and returns the count of successfully sent findings.
 
         Returns:
             int: Number of successfully sent findings to AWS Security Hub.
         """
-        success_count = 0
-        try:
-            # Iterate findings by region
-            for region, findings in self._findings_per_region.items():
-                # Send findings to Security Hub
-                logger.info(
-                    f"Sending {len(findings)} findings to Security Hub in the region {region}"
-                )
+        return self._call_per_region(self._send_region_findings)
 
-                # Convert findings to dict
-                findings = [finding.dict(exclude_none=True) for finding in findings]
-                success_count += self._send_findings_in_batches(
-                    findings,
-                    region,
-                )
+    def archive_previous_findings(self) -> int:
+        """
+        Checks previous findings in Security Hub to archive them, checking all the regions in parallel.
+
+        Returns:
+            int: Number of successfully archived findings.
+        """
+        logger.info("Checking previous findings in Security Hub to archive them.")
+        return self._call_per_region(self._archive_region_previous_findings)
+
+    def _call_per_region(self, call: Callable[[str], int]) -> int:
+        """
+        Calls the given function for every region with findings in parallel and returns the sum of the results.
+
+        Args:
+            call (Callable[[str], int]): Function called with every region, it must handle its own errors.
 
+        Returns:
+            int: Sum of the results of every region.
+        """
+        if not self._findings_per_region:
+            return 0
+        with ThreadPoolExecutor(max_workers=len(self._findings_per_region)) as executor:
+            return sum(executor.map(call, self._findings_per_region.keys()))
+
+    def _send_region_findings(self, region: str) -> int:
+        """
+        Sends the findings of a region to AWS Security Hub and returns the count of successfully sent findings.
+
+        Args:
+            region (str): The AWS region where the findings will be sent.
+
+        Returns:
+            int: Number of successfully sent findings to AWS Security Hub.
+        """
+        try:
+            findings = self._findings_per_region[region]
+            logger.info(
+                f"Sending {len(findings)} findings to Security Hub in the region {region}"
+            )
+            # The findings are converted to dict while the previous batches are sent
+            return self._send_findings_in_batches(
+                (finding.dict(exclude_none=True) for finding in findings),
+                region,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
             )
-        return success_count
+            return 0
 
-    def archive_previous_findings(self) -> int:
+    def _archive_region_previous_findings(self, region: str) -> int:
         """
-        Checks previous findings in Security Hub to archive them.
+        Archives the findings of a region in Security Hub that are not present in the current execution, archiving
+        every page of findings as soon as it is fetched.
+
+        Args:
+            region (str): The AWS region where the findings will be archived.
 
         Returns:
             int: Number of successfully archived findings.
         """
-        logger.info("Checking previous findings in Security Hub to archive them.")
-        success_count = 0
-        for region in self._findings_per_region.keys():
-            try:
-                current_findings = self._findings_per_region[region]
-                # Get current findings IDs
-                current_findings_ids = []
-                for finding in current_findings:
-                    current_findings_ids.append(finding.Id)
-                # Get findings of that region
-                findings_filter = {
-                    "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
-                    "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
-                    "AwsAccountId": [
-                        {"Value": self._aws_account_id, "Comparison": "EQUALS"}
-                    ],
-                    "Region": [{"Value": region, "Comparison": "EQUALS"}],
-                }
-                get_findings_paginator = self._enabled_regions[region].get_paginator(
-                    "get_findings"
-                )
-                findings_to_archive = []
-                for page in get_findings_paginator.paginate(
-                    Filters=findings_filter, PaginationConfig={"PageSize": 100}
-                ):
-                    # Archive findings that have not appear in this execution
-                    for finding in page["Findings"]:
-                        if finding["Id"] not in current_findings_ids:
-                            finding["RecordState"] = "ARCHIVED"
-                            finding["UpdatedAt"] = timestamp_utc.strftime(
-                                "%Y-%m-%dT%H:%M:%SZ"
-                            )
-
-                            findings_to_archive.append(finding)
-                logger.info(f"Archiving {len(findings_to_archive)} findings.")
-
-                # Send archive findings to SHub
-                success_count += self._send_findings_in_batches(
-                    findings_to_archive,
-                    region,
-                )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
-                )
-        return success_count
+        try:
+            current_findings_ids = {
+                finding.Id for finding in self._findings_per_region[region]
+            }
+            archived_count = self._send_findings_in_batches(
+                self._get_findings_to_archive(region, current_findings_ids),
+                region,
+            )
+            logger.info(f"Archived {archived_count} findings in region {region}.")
+            return archived_count
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            )
+            return 0
 
-    def _send_findings_in_batches(
-        self, findings: list[AWSSecurityFindingFormat], region: str
-    ) -> int:
+    def _get_findings_to_archive(
+        self, region: str, current_findings_ids: set[str]
+    ) -> Iterator[dict]:
+        """
+        Yields the active Prowler findings of a region in Security Hub that are not present in the current execution, marked as archived.
+
+        Args:
+            region (str): The AWS region of the findings.
+            current_findings_ids (set[str]): IDs of the findings of the current execution in the region.
+
+        Yields:
+            dict: Finding to archive.
+        """
+        findings_filter = {
+            "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
+            "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
+            "AwsAccountId": [{"Value": self._aws_account_id, "Comparison": "EQUALS"}],
+            "Region": [{"Value": region, "Comparison": "EQUALS"}],
+        }
+        updated_at = timestamp_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+        get_findings_paginator = self._enabled_regions[region].get_paginator(
+            "get_findings"
+        )
+        for page in get_findings_paginator.paginate(
+            Filters=findings_filter, PaginationConfig={"PageSize": 100}
+        ):
+            # Archive findings that have not appear in this execution
+            for finding in page["Findings"]:
+                if finding["Id"] not in current_findings_ids:
+                    finding["RecordState"] = "ARCHIVED"
+                    finding["UpdatedAt"] = updated_at
+                    yield finding
+
+    def _send_findings_in_batches(self, findings: Iterable[dict], region: str) -> int:
         """
         Sends the given findings to AWS Security Hub in batches for a specific region and returns the count of successfully sent findings.
 
+        The batches are sent concurrently as soon as they are filled, with up to SECURITY_HUB_MAX_CONCURRENT_BATCHES
+        batches in flight per region, so the findings can be produced while the previous batches are sent.
+
         Args:
-            findings (list[AWSSecurityFindingFormat]): List of findings to send to AWS Security Hub.
+            findings (Iterable[dict]): Findings to send to AWS Security Hub.
+            region (str): The AWS region where the findings will be sent.
+
+        Returns:
+            int: Number of successfully sent findings to AWS Security Hub.
+        """
+        batches = []
+        # Limit the batches waiting to be sent, so the findings are not produced faster than they are sent
+        pending_batches = BoundedSemaphore(2 * SECURITY_HUB_MAX_CONCURRENT_BATCHES)
+        try:
+            with ThreadPoolExecutor(
+                max_workers=SECURITY_HUB_MAX_CONCURRENT_BATCHES
+            ) as executor:
+
+                def send_batch(batch: list[dict]) -> None:
+                    pending_batches.acquire()
+                    future = executor.submit(self._batch_import_findings, batch, region)
+                    future.add_done_callback(lambda _: pending_batches.release())
+                    batches.append(future)
+
+                batch = []
+                for finding in findings:
+                    batch.append(finding)
+                    if len(batch) == SECURITY_HUB_MAX_BATCH:
+                        send_batch(batch)
+                        batch = []
+                if batch:
+                    send_batch(batch)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            )
+        return sum(future.result() for future in batches)
+
+    def _batch_import_findings(self, findings: list[dict], region: str) -> int:
+        """
+        Sends a batch of findings to AWS Security Hub and returns the count of successfully sent findings.
+
+        The findings that fail to be imported are sent again, up to SECURITY_HUB_MAX_RETRIES times with exponential
+        backoff, unless their error can't be solved by sending them again.
+
+        Args:
+            findings (list[dict]): Findings to send to AWS Security Hub, at most SECURITY_HUB_MAX_BATCH.
             region (str): The AWS region where the findings will be sent.
 
         Returns:
@@ -289,26 +384,39 @@ class SecurityHub:
         """
         success_count = 0
         try:
-            list_chunked = [
-                findings[i : i + SECURITY_HUB_MAX_BATCH]
-                for i in range(0, len(findings), SECURITY_HUB_MAX_BATCH)
-            ]
-            for findings in list_chunked:
+            for attempt in range(SECURITY_HUB_MAX_RETRIES + 1):
                 batch_import = self._enabled_regions[region].batch_import_findings(
                     Findings=findings
                 )
-                if batch_import["FailedCount"] > 0:
-                    failed_import = batch_import["FailedFindings"][0]
+                success_count += batch_import["SuccessCount"]
+                if batch_import["FailedCount"] == 0:
+                    break
+
+                failed_findings = batch_import.get("FailedFindings", [])
+                retryable_findings_ids = {
+                    failed_finding["Id"]
+                    for failed_finding in failed_findings
+                    if failed_finding.get("ErrorCode")
+                    not in SECURITY_HUB_NON_RETRYABLE_ERRORS
+                }
+                if attempt == SECURITY_HUB_MAX_RETRIES or not retryable_findings_ids:
+                    failed_import = failed_findings[0] if failed_findings else {}
                     logger.error(
-                        f"Failed to send findings to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
+                        f"Failed to send {batch_import['FailedCount']} findings to AWS Security Hub in region {region} -- {failed_import.get('ErrorCode')} -- {failed_import.get('ErrorMessage')}"
                     )
-                success_count += batch_import["SuccessCount"]
-            return success_count
+                    break
+
+                findings = [
+                    finding
+                    for finding in findings
+                    if finding["Id"] in retryable_findings_ids
+                ]
+                sleep(SECURITY_HUB_RETRY_DELAY * 2**attempt)
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
             )
-            return success_count
+        return success_count
 
     @staticmethod
     def test_connection(
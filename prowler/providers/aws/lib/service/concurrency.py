@@ -0,0 +1,130 @@
+from threading import Condition
+from time import monotonic
+
+# Error codes returned by the AWS APIs when a request is throttled
+THROTTLING_ERROR_CODES = frozenset(
+    [
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "BandwidthLimitExceeded",
+        "SlowDown",
+        "EC2ThrottledException",
+    ]
+)
+
+# Seconds after a back off in which new throttled requests belong to the same burst
+THROTTLING_COOLDOWN = 1.0
+
+DEFAULT_MIN_WORKERS = 1
+DEFAULT_INITIAL_WORKERS = 10
+DEFAULT_MAX_WORKERS = 10
+
+
+def is_throttling_response(response) -> bool:
+    """
+    is_throttling_response returns True if the botocore response is a throttling error.
+
+    Args:
+        response (tuple): The (http_response, parsed_response) of a botocore request, None if it failed to be sent
+
+    Returns:
+        bool: True if the error code of the response is a throttling error code
+    """
+    if not response:
+        return False
+    return (
+        response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+        if isinstance(response[1], dict)
+        else False
+    )
+
+
+class ConcurrencyController:
+    """
+    ConcurrencyController limits the concurrent calls of a service in a region to what its API can take.
+
+    The limit grows while the calls succeed, by one concurrent call per window of completed calls (additive
+    increase), and it is halved when the API throttles a request (multiplicative decrease), within the minimum and
+    maximum. The requests throttled within THROTTLING_COOLDOWN seconds of a back off belong to the same burst and do
+    not halve the limit again. The latency of the calls and the throttled requests are recorded to tune the bounds.
+
+    Attributes:
+        condition (Condition): The condition shared by the controllers of a service, notified when a call completes
+        initial (int): The initial number of concurrent calls
+        minimum (int): The minimum number of concurrent calls
+        maximum (int): The maximum number of concurrent calls
+    """
+
+    def __init__(
+        self,
+        condition: Condition,
+        initial: int = DEFAULT_INITIAL_WORKERS,
+        minimum: int = DEFAULT_MIN_WORKERS,
+        maximum: int = DEFAULT_MAX_WORKERS,
+    ):
+        self._condition = condition
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._limit = float(min(max(initial, self._minimum), self._maximum))
+        self._in_flight = 0
+        self._last_back_off = None
+        self._calls = 0
+        self._throttles = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                "calls": self._calls,
+                "throttles": self._throttles,
+                "average_latency": (
+                    self._total_latency / self._calls if self._calls else 0.0
+                ),
+                "max_latency": self._max_latency,
+                "limit": self.limit,
+            }
+
+    def try_acquire(self) -> bool:
+        """try_acquire reserves a concurrent call if the limit allows it, the caller must hold the condition"""
+        if self._in_flight < self.limit:
+            self._in_flight += 1
+            return True
+        return False
+
+    def release(self, latency: float) -> None:
+        """release frees a concurrent call, recording its latency in seconds"""
+        with self._condition:
+            self._in_flight -= 1
+            self._calls += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+            self._limit = min(self._maximum, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def throttled(self) -> None:
+        """throttled records a throttled request and backs off once per burst of throttled requests"""
+        with self._condition:
+            self._throttles += 1
+            now = monotonic()
+            if (
+                self._last_back_off is None
+                or now - self._last_back_off > THROTTLING_COOLDOWN
+            ):
+                self._limit = max(self._minimum, self._limit / 2)
+                self._last_back_off = now
@@ -1,7 +1,13 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from time import perf_counter
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.lib.service.concurrency import (
+    DEFAULT_MAX_WORKERS,
+    ConcurrencyController,
+)
 
 # TODO: review the following code
 # from prowler.providers.aws.aws_provider import (
@@ -9,15 +15,13 @@ from prowler.providers.aws.aws_provider import AwsProvider
 #     get_default_region,
 # )
 
-MAX_WORKERS = 10
-
 
 class AWSService:
     """The AWSService class offers a parent class for each AWS Service to generate:
     - AWS Regional Clients
     - Shared information like the account ID and ARN, the AWS partition and the checks audited
     - AWS Session
-    - Thread pool for the __threading_call__
+    - Thread pool for the __threading_call__, with the concurrency of each region adapted to the API rate limits
     - Also handles if the AWS Service is Global
     """
 
@@ -62,14 +66,77 @@ class AWSService:
         # We cannot include this within an else because some services needs both the regional_clients
         # and a single client like S3
         self.region = provider.get_default_region(self.service)
-        self.client = self.session.client(self.service, self.region)
+        self.client = provider.get_client(self.service, self.region)
 
         # Thread pool for __threading_call__
-        self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self.max_workers = (self.audit_config or {}).get(
+            "threading_max_workers", DEFAULT_MAX_WORKERS
+        )
+        self.thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        # The concurrency controllers are shared by the services calling the same API, see AwsProvider
+        self._concurrency_condition = provider.concurrency_condition
 
     def __get_session__(self):
         return self.session
 
+    def get_concurrency_controller(self, region: str = None) -> ConcurrencyController:
+        """get_concurrency_controller returns the concurrency controller of the given region, the service's region by default"""
+        return self.provider.get_concurrency_controller(
+            self.service, region or self.region
+        )
+
+    def get_concurrency_stats(self) -> dict:
+        """get_concurrency_stats returns the calls, throttled requests, latency in seconds and concurrency limit by region"""
+        return self.provider.get_concurrency_stats(self.service)
+
+    def _get_item_region(self, item) -> str:
+        # The regional clients and most of the resources have their region
+        return getattr(item, "region", None) or self.region
+
+    def _call_with_controller(self, controller: ConcurrencyController, call, *args):
+        start = perf_counter()
+        try:
+            return call(*args)
+        finally:
+            controller.release(perf_counter() - start)
+
+    def _submit_calls(self, calls: list) -> list[Future]:
+        """
+        _submit_calls submits the calls to the thread pool as their regions' concurrency limits allow them.
+
+        The calls of each region are submitted in order, waiting for the calls in flight to complete when all the
+        regions with pending calls are at their limits.
+
+        Args:
+            calls (list): The (region, function, args) of each call
+
+        Returns:
+            list[Future]: The futures of the calls in the same order
+        """
+        futures = [None] * len(calls)
+        pending = {}
+        for index, (region, call, args) in enumerate(calls):
+            pending.setdefault(region, deque()).append((index, call, args))
+        controllers = {
+            region: self.get_concurrency_controller(region) for region in pending
+        }
+
+        with self._concurrency_condition:
+            while pending:
+                for region in list(pending):
+                    controller = controllers[region]
+                    region_calls = pending[region]
+                    while region_calls and controller.try_acquire():
+                        index, call, args = region_calls.popleft()
+                        futures[index] = self.thread_pool.submit(
+                            self._call_with_controller, controller, call, *args
+                        )
+                    if not region_calls:
+                        del pending[region]
+                if pending:
+                    self._concurrency_condition.wait()
+        return futures
+
     def __threading_call__(self, call, iterator=None):
         # Use the provided iterator, or default to self.regional_clients
         items = iterator if iterator is not None else self.regional_clients.values()
@@ -91,16 +158,24 @@ class AWSService:
                 f"{self.service.upper()} - Starting threads for '{call_name}' function to process {item_count} items..."
             )
 
-        # Submit tasks to the thread pool
-        futures = [self.thread_pool.submit(call, item) for item in items]
+        # Submit tasks to the thread pool as the concurrency of each region allows it
+        futures = self._submit_calls(
+            [(self._get_item_region(item), call, (item,)) for item in items]
+        )
 
         # Wait for all tasks to complete
-        for future in as_completed(futures):
-            try:
-                future.result()  # Raises exceptions from the thread, if any
-            except Exception:
-                # Handle exceptions if necessary
-                pass  # Replace 'pass' with any additional exception handling logic. Currently handled within the called function
+        wait(futures)
+        for future in futures:
+            error = future.exception()
+            # The errors are expected to be handled within the called function
+            if error:
+                logger.error(
+                    f"{self.service.upper()} - {call_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+        logger.debug(
+            f"{self.service.upper()} - '{call_name}' concurrency stats: {self.get_concurrency_stats()}"
+        )
 
     def get_unknown_arn(self, resource_type: str = None, region: str = None) -> str:
         """
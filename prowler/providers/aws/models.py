@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
@@ -21,6 +21,32 @@ class AWSOrganizationsInfo:
     account_tags: list[str]
 
 
+@dataclass
+class AWSOrganizationsScanCatalog:
+    """
+    AWSOrganizationsScanCatalog stores the checks and compliance frameworks loaded once to scan all the accounts of the AWS Organization.
+    """
+
+    bulk_checks_metadata: dict
+    bulk_compliance_frameworks: dict
+    checks_to_execute: list
+    custom_checks_metadata: dict = None
+
+
+@dataclass
+class AWSOrganizationsAccountScan:
+    """
+    AWSOrganizationsAccountScan stores the result of the scan of an account of the AWS Organization.
+    """
+
+    account_id: str
+    account_name: str
+    status: str = "pending"
+    error: str = ""
+    stats: dict = field(default_factory=dict)
+    output_files: list[str] = field(default_factory=list)
+
+
 @dataclass
 class AWSCredentials:
     aws_access_key_id: str
@@ -3,7 +3,6 @@ from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 from prowler.providers.aws.services.ec2.ec2_securitygroup_allow_ingress_from_internet_to_all_ports import (
     ec2_securitygroup_allow_ingress_from_internet_to_all_ports,
 )
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
 from prowler.providers.aws.services.vpc.vpc_client import vpc_client
 
 
@@ -32,14 +31,12 @@ class ec2_securitygroup_allow_ingress_from_internet_to_high_risk_tcp_ports(Check
                         "ec2_high_risk_ports",
                         [25, 110, 135, 143, 445, 3000, 4333, 5000, 5500, 8080, 8088],
                     )
-                    # Loop through every security group's ingress rule and check it
-                    open_ports = []
-                    for ingress_rule in security_group.ingress_rules:
-                        for port in check_ports:
-                            if check_security_group(
-                                ingress_rule, "tcp", [port], any_address=True
-                            ):
-                                open_ports.append(port)
+                    # Look up every port in the ingress rules open to the Internet
+                    open_ports = [
+                        port
+                        for port in check_ports
+                        if security_group.exposure.is_open("tcp", [port])
+                    ]
 
                     if open_ports:
                         report.status = "FAIL"
@@ -3,7 +3,6 @@ from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 from prowler.providers.aws.services.ec2.ec2_securitygroup_allow_ingress_from_internet_to_all_ports import (
     ec2_securitygroup_allow_ingress_from_internet_to_all_ports,
 )
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
 from prowler.providers.aws.services.vpc.vpc_client import vpc_client
 
 
@@ -29,14 +28,10 @@ class ec2_securitygroup_allow_ingress_from_internet_to_port_mongodb_27017_27018(
                     ec2_securitygroup_allow_ingress_from_internet_to_all_ports.__name__,
                     security_group_arn,
                 ):
-                    # Loop through every security group's ingress rule and check it
-                    for ingress_rule in security_group.ingress_rules:
-                        if check_security_group(
-                            ingress_rule, "tcp", check_ports, any_address=True
-                        ):
-                            report.status = "FAIL"
-                            report.status_extended = f"Security group {security_group.name} ({security_group.id}) has MongoDB ports 27017 and 27018 open to the Internet."
-                            break
+                    # Look up the ports in the ingress rules open to the Internet
+                    if security_group.exposure.is_open("tcp", check_ports):
+                        report.status = "FAIL"
+                        report.status_extended = f"Security group {security_group.name} ({security_group.id}) has MongoDB ports 27017 and 27018 open to the Internet."
                 else:
                     report.status_extended = f"Security group {security_group.name} ({security_group.id}) has all ports open to the Internet and therefore was not checked against the specific MongoDB ports 27017 and 27018."
 
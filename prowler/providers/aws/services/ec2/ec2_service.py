@@ -3,11 +3,12 @@ from ipaddress import IPv4Address, IPv6Address, ip_address
 from typing import Optional, Union
 
 from botocore.client import ClientError
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.services.ec2.lib.security_groups import SecurityGroupExposure
 
 
 class EC2(AWSService):
@@ -717,6 +718,20 @@ class SecurityGroup(BaseModel):
     ingress_rules: list[dict]
     egress_rules: list[dict]
     tags: Optional[list] = []
+    # The ingress rules the exposure was indexed from, and the exposure
+    _exposure: Optional[tuple[list[dict], SecurityGroupExposure]] = PrivateAttr(
+        default=None
+    )
+
+    @property
+    def exposure(self) -> SecurityGroupExposure:
+        """The ingress rules open to the Internet, indexed once for all the checks and again if the rules are replaced"""
+        if self._exposure is None or self._exposure[0] is not self.ingress_rules:
+            self._exposure = (
+                self.ingress_rules,
+                SecurityGroupExposure(self.ingress_rules),
+            )
+        return self._exposure[1]
 
 
 class NetworkACL(BaseModel):
@@ -1,5 +1,9 @@
 import ipaddress
-from typing import Any
+from bisect import bisect_right
+from typing import Any, Iterator
+
+# Number of ports of a range with all the ports open, 0-65535
+ALL_PORTS_COUNT = 65536
 
 
 def check_security_group(
@@ -38,59 +42,28 @@ def check_security_group(
     """
     # Check for all traffic ingress rules regardless of the protocol
     if ingress_rule["IpProtocol"] == "-1":
-        for ip_ingress_rule in ingress_rule["IpRanges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
-                return True
-        for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIpv6"], any_address):
+        for cidr in _get_rule_cidrs(ingress_rule):
+            if _is_cidr_public(cidr, any_address):
                 return True
 
     # Check for specific ports in ingress rules
     if "FromPort" in ingress_rule:
-        # If there is a port range
-        if ingress_rule["FromPort"] != ingress_rule["ToPort"]:
-            # Calculate port range, adding 1
-            diff = (ingress_rule["ToPort"] - ingress_rule["FromPort"]) + 1
-            ingress_port_range = []
-            for x in range(diff):
-                ingress_port_range.append(int(ingress_rule["FromPort"]) + x)
-        # If FromPort and ToPort are the same
-        else:
-            ingress_port_range = []
-            ingress_port_range.append(int(ingress_rule["FromPort"]))
-
-        # Test Security Group
-        # IPv4
-        for ip_ingress_rule in ingress_rule["IpRanges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If empty input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
-                    return True
-                # If None input ports check if any port is open
-                if ports is None:
-                    return True
+        from_port = int(ingress_rule["FromPort"])
+        to_port = int(ingress_rule["ToPort"])
 
-        # IPv6
-        for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIpv6"], any_address):
+        # Test Security Group, IPv4 and IPv6
+        for cidr in _get_rule_cidrs(ingress_rule):
+            if _is_cidr_public(cidr, any_address):
                 # If there are input ports to check
                 if ports:
                     for port in ports:
                         if (
-                            port in ingress_port_range
+                            from_port <= port <= to_port
                             and ingress_rule["IpProtocol"] == protocol
                         ):
                             return True
                 # If empty input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
+                if to_port - from_port + 1 == ALL_PORTS_COUNT:
                     return True
                 # If None input ports check if any port is open
                 if ports is None:
@@ -99,6 +72,97 @@ def check_security_group(
     return False
 
 
+class SecurityGroupExposure:
+    """
+    SecurityGroupExposure is the exposure to the Internet of the ingress rules of a security group, indexed once.
+
+    Only the ingress rules open to any address (0.0.0.0/0 or ::/0) are indexed, keeping the merged port intervals
+    per protocol, so the ports open to the Internet are looked up with a binary search. is_open answers the same
+    as check_security_group(..., any_address=True) for any of the ingress rules.
+
+    Attributes:
+        ingress_rules (list[dict]): The AWS Security Group IpPermissions Ingress Rules
+    """
+
+    __slots__ = ("all_traffic", "all_ports", "any_port", "_port_ranges")
+
+    def __init__(self, ingress_rules: list[dict]):
+        # A rule for all the traffic regardless of the protocol
+        self.all_traffic = False
+        # A rule with all the ports open regardless of the protocol
+        self.all_ports = False
+        # A rule with ports, of any protocol
+        self.any_port = False
+        port_ranges = {}
+        for ingress_rule in ingress_rules:
+            if not any(
+                _is_cidr_public(cidr, any_address=True)
+                for cidr in _get_rule_cidrs(ingress_rule)
+            ):
+                continue
+            if ingress_rule["IpProtocol"] == "-1":
+                self.all_traffic = True
+            if "FromPort" in ingress_rule:
+                from_port = int(ingress_rule["FromPort"])
+                to_port = int(ingress_rule["ToPort"])
+                self.any_port = True
+                if to_port - from_port + 1 == ALL_PORTS_COUNT:
+                    self.all_ports = True
+                port_ranges.setdefault(ingress_rule["IpProtocol"], []).append(
+                    (from_port, to_port)
+                )
+        self._port_ranges = {
+            protocol: _merge_port_ranges(ranges)
+            for protocol, ranges in port_ranges.items()
+        }
+
+    def is_port_open(self, protocol: str, port: int) -> bool:
+        """is_port_open returns True if a rule of the protocol has the port open to the Internet"""
+        port_ranges = self._port_ranges.get(protocol)
+        if not port_ranges:
+            return False
+        from_ports, to_ports = port_ranges
+        position = bisect_right(from_ports, port) - 1
+        return position >= 0 and port <= to_ports[position]
+
+    def is_open(self, protocol: str, ports: list = []) -> bool:
+        """
+        is_open returns True if the security group has public access to the ports using the protocol
+
+        @param protocol: Protocol to check. If -1, all protocols will be checked.
+
+        @param ports: List of ports to check. If empty, all ports must be open. If None, any port will be checked. (Default: [])
+        """
+        if self.all_traffic or self.all_ports:
+            return True
+        if ports is None:
+            return self.any_port
+        return any(self.is_port_open(protocol, port) for port in ports)
+
+
+def _merge_port_ranges(port_ranges: list[tuple]) -> tuple[list, list]:
+    """Merge the overlapping port ranges, returning the sorted start and end ports of the merged ranges"""
+    from_ports = []
+    to_ports = []
+    for from_port, to_port in sorted(port_ranges):
+        if from_port > to_port:
+            continue
+        if to_ports and from_port <= to_ports[-1] + 1:
+            to_ports[-1] = max(to_ports[-1], to_port)
+        else:
+            from_ports.append(from_port)
+            to_ports.append(to_port)
+    return from_ports, to_ports
+
+
+def _get_rule_cidrs(ingress_rule: Any) -> Iterator[str]:
+    """Yield the IPv4 and then the IPv6 CIDRs of the security group ingress rule"""
+    for ip_ingress_rule in ingress_rule["IpRanges"]:
+        yield ip_ingress_rule["CidrIp"]
+    for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
+        yield ip_ingress_rule["CidrIpv6"]
+
+
 def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
     """
     Check if an input CIDR is public
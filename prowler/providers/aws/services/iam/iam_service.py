@@ -1,8 +1,11 @@
 import csv
+from concurrent.futures import Future
 from datetime import datetime
+from functools import partial
 from typing import Optional
 
 from botocore.client import ClientError
+from botocore.config import Config
 from pydantic import BaseModel
 
 from prowler.config.config import encoding_format_utf_8
@@ -56,68 +59,214 @@ class IAM(AWSService):
         self.mfa_arn_template = (
             f"arn:{self.audited_partition}:iam:{self.region}:{self.audited_account}:mfa"
         )
-        self.users = self._get_users()
-        self.roles = self._get_roles()
-        self.account_summary = self._get_account_summary()
-        self.virtual_mfa_devices = self._list_virtual_mfa_devices()
-        self.credential_report = self._get_credential_report()
-        self.groups = self._get_groups()
-        self._get_group_users()
-        self._list_attached_group_policies()
-        self._list_attached_user_policies()
-        self._list_attached_role_policies()
-        self._list_mfa_devices()
-        self.password_policy = self._get_password_policy()
+        # IAM has low API rate limits, so the client rate limits itself when it is throttled
+        self.client = provider.get_client(
+            self.service,
+            self.region,
+            config=self._get_client_config(provider.session.session_config),
+        )
+
+        # The IAM collection runs in phases, all the calls of a phase run at the same time in the thread pool
+        # and each phase only depends on the results of the previous ones.
+        # 1. List the IAM entities and the account information
         support_policy_arn = (
             f"arn:{self.audited_partition}:iam::aws:policy/AWSSupportAccess"
         )
-        self.entities_role_attached_to_support_policy = (
-            self._list_entities_role_for_policy(support_policy_arn)
-        )
         securityaudit_policy_arn = (
             f"arn:{self.audited_partition}:iam::aws:policy/SecurityAudit"
         )
-        self.entities_role_attached_to_securityaudit_policy = (
-            self._list_entities_role_for_policy(securityaudit_policy_arn)
-        )
         cloudshell_admin_policy_arn = (
             f"arn:{self.audited_partition}:iam::aws:policy/AWSCloudShellFullAccess"
         )
-        self.entities_attached_to_cloudshell_policy = self._list_entities_for_policy(
-            cloudshell_admin_policy_arn
+        entities = self._run_phase(
+            {
+                "users": self._get_users,
+                "roles": self._get_roles,
+                "groups": self._get_groups,
+                "account_summary": self._get_account_summary,
+                "virtual_mfa_devices": self._list_virtual_mfa_devices,
+                "credential_report": self._get_credential_report,
+                "password_policy": self._get_password_policy,
+                "entities_role_attached_to_support_policy": partial(
+                    self._list_entities_role_for_policy, support_policy_arn
+                ),
+                "entities_role_attached_to_securityaudit_policy": partial(
+                    self._list_entities_role_for_policy, securityaudit_policy_arn
+                ),
+                "entities_attached_to_cloudshell_policy": partial(
+                    self._list_entities_for_policy, cloudshell_admin_policy_arn
+                ),
+                "aws_policies": partial(self._list_policies, "AWS"),
+                "custom_policies": partial(self._list_policies, "Local"),
+                "saml_providers": self._list_saml_providers,
+                "server_certificates": self._list_server_certificates,
+                "organization_features": self._list_organizations_features,
+            }
         )
+        self.users = entities["users"]
+        self.roles = entities["roles"]
+        self.groups = entities["groups"]
+        self.account_summary = entities["account_summary"]
+        self.virtual_mfa_devices = entities["virtual_mfa_devices"]
+        self.credential_report = entities["credential_report"]
+        self.password_policy = entities["password_policy"]
+        self.entities_role_attached_to_support_policy = entities[
+            "entities_role_attached_to_support_policy"
+        ]
+        self.entities_role_attached_to_securityaudit_policy = entities[
+            "entities_role_attached_to_securityaudit_policy"
+        ]
+        self.entities_attached_to_cloudshell_policy = entities[
+            "entities_attached_to_cloudshell_policy"
+        ]
         # List both Customer (attached and unattached) and AWS Managed (only attached) policies
-        self.policies = []
-        self.policies.extend(self._list_policies("AWS"))
-        self.policies.extend(self._list_policies("Local"))
-        self._list_policies_version(self.policies)
-        self._list_inline_user_policies()
-        self._list_inline_group_policies()
-        self._list_inline_role_policies()
-        self.saml_providers = self._list_saml_providers()
-        self.server_certificates = self._list_server_certificates()
+        self.policies = entities["aws_policies"] + entities["custom_policies"]
+        self.saml_providers = entities["saml_providers"]
+        self.server_certificates = entities["server_certificates"]
+        self.organization_features = entities["organization_features"]
+
+        # 2. Get the details of each entity
+        details = self._run_phase(
+            {
+                "login_profiles": (self._get_login_profile, self.users),
+                "group_users": (self._get_group_users, self.groups),
+                "attached_group_policies": (
+                    self._list_attached_group_policies,
+                    self.groups,
+                ),
+                "attached_user_policies": (
+                    self._list_attached_user_policies,
+                    self.users,
+                ),
+                "attached_role_policies": (
+                    self._list_attached_role_policies,
+                    self.roles or [],
+                ),
+                "mfa_devices": (self._list_mfa_devices, self.users),
+                "policies_version": (self._list_policies_version, self.policies),
+                "inline_user_policies": (self._list_inline_user_policies, self.users),
+                "inline_group_policies": (
+                    self._list_inline_group_policies,
+                    self.groups,
+                ),
+                "inline_role_policies": (
+                    self._list_inline_role_policies,
+                    self.roles or [],
+                ),
+                "access_keys_metadata": (self._get_access_keys_metadata, self.users),
+                "last_accessed_services": (
+                    self._get_last_accessed_services,
+                    self.users,
+                ),
+                # List missing tags
+                "user_tags": (self._list_tags, self.users),
+                "role_tags": (self._list_tags, self.roles or []),
+                "policy_tags": (
+                    self._list_tags,
+                    [policy for policy in self.policies if policy.type == "Custom"],
+                ),
+                "server_certificate_tags": (self._list_tags, self.server_certificates),
+                "saml_provider_tags": (
+                    self._list_tags,
+                    (
+                        list(self.saml_providers.values())
+                        if self.saml_providers is not None
+                        else []
+                    ),
+                ),
+            }
+        )
+        # The inline policies are added after the managed policies in the order of their entities
+        for step in [
+            "inline_user_policies",
+            "inline_group_policies",
+            "inline_role_policies",
+        ]:
+            for inline_policies in details[step]:
+                self.policies.extend(inline_policies or [])
         self.access_keys_metadata = {}
-        self._get_access_keys_metadata()
+        for user, access_keys_metadata in zip(
+            self.users, details["access_keys_metadata"]
+        ):
+            self.access_keys_metadata[(user.name, user.arn)] = (
+                access_keys_metadata or []
+            )
         self.last_accessed_services = {}
-        self._get_last_accessed_services()
+        for user, last_accessed_services in zip(
+            self.users, details["last_accessed_services"]
+        ):
+            if last_accessed_services is not None:
+                self.last_accessed_services[(user.name, user.arn)] = (
+                    last_accessed_services
+                )
+
+        # 3. Aggregate the details of the entities
         self.user_temporary_credentials_usage = {}
         self._get_user_temporary_credentials_usage()
-        self.organization_features = []
-        self._list_organizations_features()
-        # List missing tags
-        self.__threading_call__(self._list_tags, self.users)
-        self.__threading_call__(self._list_tags, self.roles)
-        self.__threading_call__(
-            self._list_tags,
-            [policy for policy in self.policies if policy.type == "Custom"],
-        )
-        self.__threading_call__(self._list_tags, self.server_certificates)
-        if self.saml_providers is not None:
-            self.__threading_call__(self._list_tags, self.saml_providers.values())
 
     def _get_client(self):
         return self.client
 
+    @staticmethod
+    def _get_client_config(session_config: Config = None) -> Config:
+        """
+        _get_client_config returns the session's botocore Config with the adaptive retry mode.
+
+        In the adaptive mode the client also rate limits its requests when it gets throttled, so all the threads
+        calling IAM at the same time back off together instead of exhausting their retries.
+        """
+        session_config = session_config or Config()
+        retries = {"max_attempts": 3, **(session_config.retries or {})}
+        retries["mode"] = "adaptive"
+        return session_config.merge(Config(retries=retries))
+
+    def _run_phase(self, steps: dict) -> dict:
+        """
+        _run_phase runs all the calls of the steps of an IAM collection phase at the same time in the thread pool.
+
+        Args:
+            steps (dict): The steps of the phase by name, each step is a function called once or a tuple of a function
+                and the list of items it is called with, one call per item.
+
+        Returns:
+            dict: The result of each step by name, for the steps with items the list of results in the order of the items.
+        """
+        calls = []
+        positions = {}
+        for name, step in steps.items():
+            if isinstance(step, tuple):
+                call, items = step
+                logger.info(
+                    f"IAM - Starting threads for '{name}' to process {len(items)} items..."
+                )
+                positions[name] = slice(len(calls), len(calls) + len(items))
+                calls.extend((self.region, call, (item,)) for item in items)
+            else:
+                positions[name] = len(calls)
+                calls.append((self.region, step, ()))
+        # The calls are limited by the concurrency controller of the IAM region
+        futures = self._submit_calls(calls)
+
+        results = {}
+        for name, position in positions.items():
+            if isinstance(position, slice):
+                results[name] = [
+                    self._get_result(future) for future in futures[position]
+                ]
+            else:
+                results[name] = self._get_result(futures[position])
+        return results
+
+    def _get_result(self, future: Future):
+        try:
+            return future.result()
+        except Exception as error:
+            # The errors are handled within the called functions
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
     def _get_roles(self):
         logger.info("IAM - List Roles...")
         try:
@@ -295,24 +444,11 @@ class IAM(AWSService):
                     if not self.audit_resources or (
                         is_resource_filtered(user["Arn"], self.audit_resources)
                     ):
-                        try:
-                            user_login_profile = self.client.get_login_profile(
-                                UserName=user["UserName"]
-                            )
-                        except self.client.exceptions.NoSuchEntityException:
-                            user_login_profile = None
-                        except Exception as error:
-                            user_login_profile = None
-                            logger.error(
-                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                            )
-
                         users.append(
                             User(
                                 name=user["UserName"],
                                 arn=user["Arn"],
                                 password_last_used=user.get("PasswordLastUsed", None),
-                                console_access=True if user_login_profile else False,
                             )
                         )
         except Exception as error:
@@ -322,6 +458,18 @@ class IAM(AWSService):
         finally:
             return users
 
+    def _get_login_profile(self, user):
+        try:
+            user_login_profile = self.client.get_login_profile(UserName=user.name)
+        except self.client.exceptions.NoSuchEntityException:
+            user_login_profile = None
+        except Exception as error:
+            user_login_profile = None
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        user.console_access = True if user_login_profile else False
+
     def _list_virtual_mfa_devices(self):
         logger.info("IAM - List Virtual MFA Devices...")
         try:
@@ -340,151 +488,157 @@ class IAM(AWSService):
         finally:
             return mfa_devices
 
-    def _list_attached_group_policies(self):
-        logger.info("IAM - List Attached Group Policies...")
+    def _list_attached_group_policies(self, group):
         try:
-            for group in self.groups:
-                try:
-                    list_attached_group_policies_paginator = self.client.get_paginator(
-                        "list_attached_group_policies"
-                    )
-                    attached_group_policies = []
-                    for page in list_attached_group_policies_paginator.paginate(
-                        GroupName=group.name
-                    ):
-                        for attached_group_policy in page["AttachedPolicies"]:
-                            attached_group_policies.append(attached_group_policy)
+            list_attached_group_policies_paginator = self.client.get_paginator(
+                "list_attached_group_policies"
+            )
+            attached_group_policies = []
+            for page in list_attached_group_policies_paginator.paginate(
+                GroupName=group.name
+            ):
+                for attached_group_policy in page["AttachedPolicies"]:
+                    attached_group_policies.append(attached_group_policy)
 
-                    group.attached_policies = attached_group_policies
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            group.attached_policies = attached_group_policies
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _get_group_users(self):
-        logger.info("IAM - Get Group Users...")
+    def _get_group_users(self, group):
         try:
-            for group in self.groups:
-                get_group_paginator = self.client.get_paginator("get_group")
-                group_users = []
-                for page in get_group_paginator.paginate(GroupName=group.name):
-                    for user in page["Users"]:
-                        if "PasswordLastUsed" not in user:
-                            group_users.append(
-                                User(name=user["UserName"], arn=user["Arn"])
-                            )
-                        else:
-                            group_users.append(
-                                User(
-                                    name=user["UserName"],
-                                    arn=user["Arn"],
-                                    password_last_used=user["PasswordLastUsed"],
-                                )
+            get_group_paginator = self.client.get_paginator("get_group")
+            group_users = []
+            for page in get_group_paginator.paginate(GroupName=group.name):
+                for user in page["Users"]:
+                    if "PasswordLastUsed" not in user:
+                        group_users.append(User(name=user["UserName"], arn=user["Arn"]))
+                    else:
+                        group_users.append(
+                            User(
+                                name=user["UserName"],
+                                arn=user["Arn"],
+                                password_last_used=user["PasswordLastUsed"],
                             )
-                group.users = group_users
+                        )
+            group.users = group_users
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _list_mfa_devices(self):
-        logger.info("IAM - List MFA Devices...")
+    def _list_mfa_devices(self, user):
         try:
-            for user in self.users:
-                try:
-                    list_mfa_devices_paginator = self.client.get_paginator(
-                        "list_mfa_devices"
-                    )
-                    mfa_devices = []
-                    for page in list_mfa_devices_paginator.paginate(UserName=user.name):
-                        for mfa_device in page["MFADevices"]:
-                            mfa_serial_number = mfa_device["SerialNumber"]
-                            try:
-                                mfa_type = mfa_serial_number.split(":")[5].split("/")[0]
-                            except IndexError:
-                                mfa_type = "hardware"
-                            mfa_devices.append(
-                                MFADevice(
-                                    serial_number=mfa_serial_number, type=mfa_type
-                                )
-                            )
-                    user.mfa_devices = mfa_devices
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            list_mfa_devices_paginator = self.client.get_paginator("list_mfa_devices")
+            mfa_devices = []
+            for page in list_mfa_devices_paginator.paginate(UserName=user.name):
+                for mfa_device in page["MFADevices"]:
+                    mfa_serial_number = mfa_device["SerialNumber"]
+                    try:
+                        mfa_type = mfa_serial_number.split(":")[5].split("/")[0]
+                    except IndexError:
+                        mfa_type = "hardware"
+                    mfa_devices.append(
+                        MFADevice(serial_number=mfa_serial_number, type=mfa_type)
                     )
+            user.mfa_devices = mfa_devices
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _list_attached_user_policies(self):
-        logger.info("IAM - List Attached User Policies...")
+    def _list_attached_user_policies(self, user):
         try:
-            for user in self.users:
-                try:
-                    attached_user_policies = []
-                    get_user_attached_policies_paginator = self.client.get_paginator(
-                        "list_attached_user_policies"
-                    )
-                    for page in get_user_attached_policies_paginator.paginate(
-                        UserName=user.name
-                    ):
-                        for policy in page["AttachedPolicies"]:
-                            attached_user_policies.append(policy)
+            attached_user_policies = []
+            get_user_attached_policies_paginator = self.client.get_paginator(
+                "list_attached_user_policies"
+            )
+            for page in get_user_attached_policies_paginator.paginate(
+                UserName=user.name
+            ):
+                for policy in page["AttachedPolicies"]:
+                    attached_user_policies.append(policy)
 
-                    user.attached_policies = attached_user_policies
+            user.attached_policies = attached_user_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
+    def _list_attached_role_policies(self, role):
+        try:
+            attached_role_policies = []
+            list_attached_role_policies_paginator = self.client.get_paginator(
+                "list_attached_role_policies"
+            )
+            for page in list_attached_role_policies_paginator.paginate(
+                RoleName=role.name
+            ):
+                for policy in page["AttachedPolicies"]:
+                    attached_role_policies.append(policy)
 
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            role.attached_policies = attached_role_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _list_attached_role_policies(self):
-        logger.info("IAM - List Attached User Policies...")
+    def _list_inline_user_policies(self, user) -> list:
+        """_list_inline_user_policies returns the inline policies of the user with their documents"""
+        inline_policies = []
         try:
-            if self.roles:
-                for role in self.roles:
+            inline_user_policies = []
+            get_user_inline_policies_paginator = self.client.get_paginator(
+                "list_user_policies"
+            )
+            for page in get_user_inline_policies_paginator.paginate(UserName=user.name):
+                for policy in page["PolicyNames"]:
                     try:
-                        attached_role_policies = []
-                        list_attached_role_policies_paginator = (
-                            self.client.get_paginator("list_attached_role_policies")
+                        inline_user_policies.append(policy)
+                        # Get inline policies & their policy documents here
+                        inline_policy = self.client.get_user_policy(
+                            UserName=user.name, PolicyName=policy
+                        )
+                        inline_user_policy_doc = inline_policy["PolicyDocument"]
+                        inline_policies.append(
+                            Policy(
+                                name=policy,
+                                arn=user.arn,
+                                entity=user.name,
+                                type="Inline",
+                                attached=True,
+                                version_id="v1",
+                                document=inline_user_policy_doc,
+                            )
                         )
-                        for page in list_attached_role_policies_paginator.paginate(
-                            RoleName=role.name
-                        ):
-                            for policy in page["AttachedPolicies"]:
-                                attached_role_policies.append(policy)
-
-                        role.attached_policies = attached_role_policies
                     except ClientError as error:
                         if error.response["Error"]["Code"] == "NoSuchEntity":
                             logger.warning(
@@ -494,197 +648,147 @@ class IAM(AWSService):
                             logger.error(
                                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-
                     except Exception as error:
                         logger.error(
                             f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
-
+            user.inline_policies = inline_user_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+        return inline_policies
 
-    def _list_inline_user_policies(self):
-        logger.info("IAM - List Inline User Policies...")
-        for user in self.users:
-            try:
-                inline_user_policies = []
-                get_user_inline_policies_paginator = self.client.get_paginator(
-                    "list_user_policies"
-                )
-                for page in get_user_inline_policies_paginator.paginate(
-                    UserName=user.name
-                ):
-                    for policy in page["PolicyNames"]:
-                        try:
-                            inline_user_policies.append(policy)
-                            # Get inline policies & their policy documents here
-                            inline_policy = self.client.get_user_policy(
-                                UserName=user.name, PolicyName=policy
+    def _list_inline_group_policies(self, group) -> list:
+        """_list_inline_group_policies returns the inline policies of the group with their documents"""
+        inline_policies = []
+        try:
+            inline_group_policies = []
+            get_group_inline_policies_paginator = self.client.get_paginator(
+                "list_group_policies"
+            )
+            for page in get_group_inline_policies_paginator.paginate(
+                GroupName=group.name
+            ):
+                for policy in page["PolicyNames"]:
+                    try:
+                        inline_group_policies.append(policy)
+                        # Get inline policies & their policy documents here:
+                        inline_policy = self.client.get_group_policy(
+                            GroupName=group.name, PolicyName=policy
+                        )
+                        inline_group_policy_doc = inline_policy["PolicyDocument"]
+                        inline_policies.append(
+                            Policy(
+                                name=policy,
+                                arn=group.arn,
+                                entity=group.name,
+                                type="Inline",
+                                attached=True,
+                                version_id="v1",
+                                document=inline_group_policy_doc,
                             )
-                            inline_user_policy_doc = inline_policy["PolicyDocument"]
-                            self.policies.append(
-                                Policy(
-                                    name=policy,
-                                    arn=user.arn,
-                                    entity=user.name,
-                                    type="Inline",
-                                    attached=True,
-                                    version_id="v1",
-                                    document=inline_user_policy_doc,
-                                )
+                        )
+                    except ClientError as error:
+                        if error.response["Error"]["Code"] == "NoSuchEntity":
+                            logger.warning(
+                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-                        except ClientError as error:
-                            if error.response["Error"]["Code"] == "NoSuchEntity":
-                                logger.warning(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                            else:
-                                logger.error(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                        except Exception as error:
+                        else:
                             logger.error(
                                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-                user.inline_policies = inline_user_policies
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "NoSuchEntity":
-                    logger.warning(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                else:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-            except Exception as error:
+
+                    except Exception as error:
+                        logger.error(
+                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+            group.inline_policies = inline_group_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
                 logger.error(
                     f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def _list_inline_group_policies(self):
-        logger.info("IAM - List Inline Group Policies...")
-        for group in self.groups:
-            try:
-                inline_group_policies = []
-                get_group_inline_policies_paginator = self.client.get_paginator(
-                    "list_group_policies"
-                )
-                for page in get_group_inline_policies_paginator.paginate(
-                    GroupName=group.name
-                ):
-                    for policy in page["PolicyNames"]:
-                        try:
-                            inline_group_policies.append(policy)
-                            # Get inline policies & their policy documents here:
-                            inline_policy = self.client.get_group_policy(
-                                GroupName=group.name, PolicyName=policy
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return inline_policies
+
+    def _list_inline_role_policies(self, role) -> list:
+        """_list_inline_role_policies returns the inline policies of the role with their documents"""
+        inline_policies = []
+        try:
+            inline_role_policies = []
+            get_role_inline_policies_paginator = self.client.get_paginator(
+                "list_role_policies"
+            )
+            for page in get_role_inline_policies_paginator.paginate(RoleName=role.name):
+                for policy in page["PolicyNames"]:
+                    try:
+                        inline_role_policies.append(policy)
+                        # Get inline policies & their policy documents here:
+                        inline_policy = self.client.get_role_policy(
+                            RoleName=role.name, PolicyName=policy
+                        )
+                        inline_role_policy_doc = inline_policy["PolicyDocument"]
+                        inline_policies.append(
+                            Policy(
+                                name=policy,
+                                arn=role.arn,
+                                entity=role.name,
+                                type="Inline",
+                                attached=True,
+                                version_id="v1",
+                                document=inline_role_policy_doc,
                             )
-                            inline_group_policy_doc = inline_policy["PolicyDocument"]
-                            self.policies.append(
-                                Policy(
-                                    name=policy,
-                                    arn=group.arn,
-                                    entity=group.name,
-                                    type="Inline",
-                                    attached=True,
-                                    version_id="v1",
-                                    document=inline_group_policy_doc,
-                                )
+                        )
+                    except ClientError as error:
+                        if error.response["Error"]["Code"] == "NoSuchEntity":
+                            logger.warning(
+                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-                        except ClientError as error:
-                            if error.response["Error"]["Code"] == "NoSuchEntity":
-                                logger.warning(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                            else:
-                                logger.error(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-
-                        except Exception as error:
+                        else:
                             logger.error(
                                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-                group.inline_policies = inline_group_policies
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "NoSuchEntity":
-                    logger.warning(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                else:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
 
-    def _list_inline_role_policies(self):
-        logger.info("IAM - List Inline Role Policies...")
-        if self.roles:
-            for role in self.roles:
-                try:
-                    inline_role_policies = []
-                    get_role_inline_policies_paginator = self.client.get_paginator(
-                        "list_role_policies"
-                    )
-                    for page in get_role_inline_policies_paginator.paginate(
-                        RoleName=role.name
-                    ):
-                        for policy in page["PolicyNames"]:
-                            try:
-                                inline_role_policies.append(policy)
-                                # Get inline policies & their policy documents here:
-                                inline_policy = self.client.get_role_policy(
-                                    RoleName=role.name, PolicyName=policy
-                                )
-                                inline_role_policy_doc = inline_policy["PolicyDocument"]
-                                self.policies.append(
-                                    Policy(
-                                        name=policy,
-                                        arn=role.arn,
-                                        entity=role.name,
-                                        type="Inline",
-                                        attached=True,
-                                        version_id="v1",
-                                        document=inline_role_policy_doc,
-                                    )
-                                )
-                            except ClientError as error:
-                                if error.response["Error"]["Code"] == "NoSuchEntity":
-                                    logger.warning(
-                                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                    )
-                                else:
-                                    logger.error(
-                                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                    )
-
-                            except Exception as error:
-                                logger.error(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-
-                    role.inline_policies = inline_role_policies
-
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
+                    except Exception as error:
                         logger.error(
                             f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
 
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            role.inline_policies = inline_role_policies
+
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return inline_policies
 
     def _list_entities_role_for_policy(self, policy_arn):
         logger.info("IAM - List Entities Role For Policy...")
@@ -780,25 +884,21 @@ class IAM(AWSService):
         finally:
             return policies
 
-    def _list_policies_version(self, policies):
-        logger.info("IAM - List Policies Version...")
+    def _list_policies_version(self, policy):
         try:
-            for policy in policies:
-                try:
-                    policy_version = self.client.get_policy_version(
-                        PolicyArn=policy.arn, VersionId=policy.version_id
-                    )
-                    policy.document = policy_version["PolicyVersion"]["Document"]
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    continue
+            policy_version = self.client.get_policy_version(
+                PolicyArn=policy.arn, VersionId=policy.version_id
+            )
+            policy.document = policy_version["PolicyVersion"]["Document"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -884,72 +984,54 @@ class IAM(AWSService):
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _get_last_accessed_services(self):
-        logger.info("IAM - Getting Last Accessed Services ...")
+    def _get_last_accessed_services(self, user) -> Optional[list]:
+        """_get_last_accessed_services returns the services last accessed by the user, None if they cannot be retrieved"""
         try:
-            for user in self.users:
-                try:
-                    details = self.client.generate_service_last_accessed_details(
-                        Arn=user.arn
-                    )
-                    response = self.client.get_service_last_accessed_details(
-                        JobId=details["JobId"]
-                    )
-                    while response["JobStatus"] == "IN_PROGRESS":
-                        response = self.client.get_service_last_accessed_details(
-                            JobId=details["JobId"]
-                        )
-                    self.last_accessed_services[(user.name, user.arn)] = response.get(
-                        "ServicesLastAccessed", {}
-                    )
-
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-
+            details = self.client.generate_service_last_accessed_details(Arn=user.arn)
+            response = self.client.get_service_last_accessed_details(
+                JobId=details["JobId"]
+            )
+            while response["JobStatus"] == "IN_PROGRESS":
+                response = self.client.get_service_last_accessed_details(
+                    JobId=details["JobId"]
+                )
+            return response.get("ServicesLastAccessed", {})
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+        return None
 
-    def _get_access_keys_metadata(self):
-        logger.info("IAM - Getting Access Keys Metadata ...")
+    def _get_access_keys_metadata(self, user) -> list:
+        """_get_access_keys_metadata returns the metadata of the access keys of the user"""
+        access_keys_metadata = []
         try:
-            for user in self.users:
-                try:
-                    paginator = self.client.get_paginator("list_access_keys")
-                    self.access_keys_metadata[(user.name, user.arn)] = []
-                    for response in paginator.paginate(UserName=user.name):
-                        self.access_keys_metadata[(user.name, user.arn)] = response[
-                            "AccessKeyMetadata"
-                        ]
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            paginator = self.client.get_paginator("list_access_keys")
+            for response in paginator.paginate(UserName=user.name):
+                access_keys_metadata = response["AccessKeyMetadata"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+        return access_keys_metadata
 
     def _get_user_temporary_credentials_usage(self):
         logger.info("IAM - Getting User Temporary Credentials Usage ...")
@@ -986,9 +1068,9 @@ class IAM(AWSService):
 
     def _list_organizations_features(self):
         logger.info("IAM - List Organization Features...")
+        organization_features = []
         try:
-            organization_features = self.client.list_organizations_features()
-            self.organization_features = organization_features.get(
+            organization_features = self.client.list_organizations_features().get(
                 "EnabledFeatures", []
             )
         except ClientError as error:
@@ -1014,7 +1096,7 @@ class IAM(AWSService):
                 logger.warning(
                     f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
-                self.organization_features = None
+                organization_features = None
             else:
                 logger.error(
                     f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -1023,6 +1105,7 @@ class IAM(AWSService):
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+        return organization_features
 
 
 class MFADevice(BaseModel):
@@ -1,7 +1,137 @@
+from functools import lru_cache
 from ipaddress import ip_address, ip_network
+from json import dumps, loads
+from threading import Lock
 
 from prowler.lib.logger import logger
-from prowler.providers.aws.aws_provider import read_aws_regions_file
+from prowler.providers.aws.aws_provider import get_aws_regions_index
+
+# Maximum number of policy documents whose analysis is kept in memory
+POLICY_DOCUMENTS_CACHE_SIZE = 4096
+
+
+class PolicyDocument:
+    """
+    PolicyDocument is the analysis of a policy document shared by all the checks that evaluate the same document.
+
+    The document is normalized once and the verdict of each policy function, e.g. if the policy allows admin access
+    or if it is public, is computed once per document and arguments.
+
+    Attributes:
+        policy (dict): The normalized copy of the policy document, owned by the analysis.
+    """
+
+    def __init__(self, policy: dict):
+        self.policy = policy
+        self._verdicts = {}
+        self._lock = Lock()
+
+    def get_verdict(self, function, *args):
+        """
+        get_verdict returns the verdict of the policy function for the document, computed only once.
+        Args:
+            function (callable): The policy function, called with the policy document and the arguments.
+            args: The hashable arguments of the policy function.
+        Returns:
+            The verdict of the policy function.
+        """
+        key = (function, args)
+        with self._lock:
+            if key in self._verdicts:
+                return self._verdicts[key]
+        verdict = function(self.policy, *args)
+        with self._lock:
+            self._verdicts[key] = verdict
+        return verdict
+
+
+def get_policy_document(policy: dict) -> PolicyDocument:
+    """
+    get_policy_document returns the shared analysis of the policy document.
+    Args:
+        policy (dict): The policy document.
+    Returns:
+        PolicyDocument: The analysis of the policy document, the same for equal documents.
+    """
+    # The analyses are keyed by the normalized JSON of the document, equal documents have the same key
+    return _get_policy_document(dumps(policy, sort_keys=True, default=str))
+
+
+@lru_cache(maxsize=POLICY_DOCUMENTS_CACHE_SIZE)
+def _get_policy_document(document: str) -> PolicyDocument:
+    return PolicyDocument(loads(document))
+
+
+def get_policy_statements(policy: dict) -> list:
+    """
+    get_policy_statements returns the statements of the policy as a list.
+    Args:
+        policy (dict): The policy document.
+    Returns:
+        list: The statements of the policy.
+    """
+    statements = policy.get("Statement", [])
+    if not isinstance(statements, list):
+        statements = [statements]
+    return statements
+
+
+class PolicyActions:
+    """
+    PolicyActions holds the actions allowed and denied by the Action and NotAction elements of policy statements.
+
+    If the statements only allow NotAction or they allow NotAction with services that are not part of AWS, all the
+    AWS actions are allowed ("*").
+
+    Attributes:
+        allowed_actions (set): The actions of the Allow statements.
+        denied_actions (set): The actions of the Deny statements.
+        allowed_not_actions (set): The NotAction actions of the Allow statements.
+        denied_not_actions (set): The NotAction actions of the Deny statements.
+    """
+
+    def __init__(self, statements: list):
+        self.allowed_actions = set()
+        self.denied_actions = set()
+        self.allowed_not_actions = set()
+        self.denied_not_actions = set()
+
+        for statement in statements:
+            effect = statement.get("Effect")
+            actions = statement.get("Action")
+            not_actions = statement.get("NotAction")
+            if effect == "Allow":
+                process_actions(effect, actions, self.allowed_actions)
+                process_actions(effect, not_actions, self.allowed_not_actions)
+            elif effect == "Deny":
+                process_actions(effect, actions, self.denied_actions)
+                process_actions(effect, not_actions, self.denied_not_actions)
+
+        # If there is only NotAction, it allows the rest of the actions
+        if not self.allowed_actions and self.allowed_not_actions:
+            self.allowed_actions.add("*")
+        # Check for invalid services in allowed NotAction
+        if self.allowed_not_actions:
+            invalid_not_actions = check_invalid_not_actions(self.allowed_not_actions)
+            if invalid_not_actions:
+                # Since it is an invalid NotAction, it allows all AWS actions
+                self.allowed_actions.add("*")
+
+
+def index_actions_by_service(actions: set) -> dict:
+    """
+    index_actions_by_service indexes the service actions (service:action) by service.
+    Args:
+        actions (set): The actions to index.
+    Returns:
+        dict: The action names of each service, e.g. {"iam": {"PassRole", "*"}}.
+    """
+    actions_by_service = {}
+    for action in actions:
+        service, separator, name = action.partition(":")
+        if separator:
+            actions_by_service.setdefault(service, set()).add(name)
+    return actions_by_service
 
 
 def check_full_service_access(service: str, policy: dict) -> bool:
@@ -13,7 +143,12 @@ def check_full_service_access(service: str, policy: dict) -> bool:
     Returns:
         bool: True if the policy allows full access to the service, False otherwise.
     """
+    if not policy:
+        return False
+    return get_policy_document(policy).get_verdict(_check_full_service_access, service)
+
 
+def _check_full_service_access(policy: dict, service: str) -> bool:
     full_access = False
 
     if policy:
@@ -128,6 +263,24 @@ def is_policy_public(
     Returns:
         bool: True if the policy allows public access, False otherwise
     """
+    if not policy:
+        return False
+    return get_policy_document(policy).get_verdict(
+        _is_policy_public,
+        source_account,
+        is_cross_account_allowed,
+        tuple(not_allowed_actions),
+        check_cross_service_confused_deputy,
+    )
+
+
+def _is_policy_public(
+    policy: dict,
+    source_account: str,
+    is_cross_account_allowed: bool,
+    not_allowed_actions: tuple,
+    check_cross_service_confused_deputy: bool,
+) -> bool:
     is_public = False
     if policy:
         for statement in policy.get("Statement", []):
@@ -438,52 +591,29 @@ def check_admin_access(policy: dict) -> bool:
     Returns:
         bool: True if the policy allows admin access, False otherwise.
     """
-
     if policy:
-        allowed_actions = set()
-        allowed_not_actions = set()
-        denied_actions = set()
-        denied_not_actions = set()
-
-        statements = policy.get("Statement", [])
-        if not isinstance(statements, list):
-            statements = [statements]
-
-        for statement in statements:
-            if statement.get("Resource") in [
-                "*",
-                ["*"],
-                ["*/*"],
-                "*/*",
-                ["*:*"],
-                "*:*",
-            ] or (
-                statement.get("NotResource")
-                and statement.get("NotResource") not in ["*", ["*"]]
-            ):
-                effect = statement.get("Effect")
-                actions = statement.get("Action")
-                not_actions = statement.get("NotAction")
-                if effect == "Allow":
-                    process_actions(effect, actions, allowed_actions)
-                    process_actions(effect, not_actions, allowed_not_actions)
-                elif effect == "Deny":
-                    process_actions(effect, actions, denied_actions)
-                    process_actions(effect, not_actions, denied_not_actions)
-
-        # If there is only NotAction, it allows the rest of the actions
-        if not allowed_actions and allowed_not_actions:
-            allowed_actions.add("*")
-        # Check for invalid services in allowed NotAction
-        if allowed_not_actions:
-            invalid_not_actions = check_invalid_not_actions(allowed_not_actions)
-            if invalid_not_actions:
-                # Since it is an invalid NotAction, it allows all AWS actions
-                allowed_actions.add("*")
-
-        if "*" in allowed_actions:
-            return True
-        return False
+        return get_policy_document(policy).get_verdict(_check_admin_access)
+
+
+def _check_admin_access(policy: dict) -> bool:
+    statements = [
+        statement
+        for statement in get_policy_statements(policy)
+        if statement.get("Resource")
+        in [
+            "*",
+            ["*"],
+            ["*/*"],
+            "*/*",
+            ["*:*"],
+            "*:*",
+        ]
+        or (
+            statement.get("NotResource")
+            and statement.get("NotResource") not in ["*", ["*"]]
+        )
+    ]
+    return "*" in PolicyActions(statements).allowed_actions
 
 
 def check_invalid_not_actions(not_actions):
@@ -517,6 +647,4 @@ def is_valid_aws_service(service):
     Returns:
         bool: True if the service is valid, False otherwise.
     """
-    if service in read_aws_regions_file()["services"]:
-        return True
-    return False
+    return get_aws_regions_index().is_service(service)
@@ -1,7 +1,9 @@
 from prowler.lib.logger import logger
 from prowler.providers.aws.services.iam.lib.policy import (
-    check_invalid_not_actions,
-    process_actions,
+    PolicyActions,
+    get_policy_document,
+    get_policy_statements,
+    index_actions_by_service,
 )
 
 # Does the tool analyze both users and roles, or just one or the other? --> Everything using AttachementCount.
@@ -129,39 +131,19 @@ def find_privilege_escalation_combinations(
         # If there are denied_not_actions, means that every other action is denied
         if denied_not_actions:
             allowed_actions = allowed_actions.intersection(denied_not_actions)
+        # Index the allowed actions by service to look up the service wildcards (api:*)
+        allowed_actions_by_service = index_actions_by_service(allowed_actions)
         for values in privilege_escalation_policies_combination.values():
             for val in values:
-                val_set = set()
-                val_set.add(val)
                 # Look for specific api:action
-                if allowed_actions.intersection(val_set) == val_set:
+                if val in allowed_actions:
                     policies_combination.add(val)
                 # Look for api:*
-                else:
-                    for permission in allowed_actions:
-                        # Here we have to handle if the api-action is admin, so "*"
-                        api_action = permission.split(":")
-                        # len() == 2, so api:action
-                        if len(api_action) == 2:
-                            api = api_action[0]
-                            action = api_action[1]
-                            # Add permissions if the API is present
-                            if action == "*":
-                                val_api = val.split(":")[0]
-                                if api == val_api:
-                                    policies_combination.add(val)
-
-                        # len() == 1, so *
-                        elif len(api_action) == 1:
-                            # Unless the action is *, we have to check if the action to evaluate is in the hard_allowed_not_actions
-                            if (
-                                not hard_allowed_not_actions
-                                or val not in hard_allowed_not_actions
-                            ):
-                                api = api_action[0]
-                                # Add permissions if the API is present
-                                if api == "*":
-                                    policies_combination.add(val)
+                elif "*" in allowed_actions_by_service.get(val.split(":")[0], ()):
+                    policies_combination.add(val)
+                # Look for *, unless the action to evaluate is in the hard_allowed_not_actions
+                elif "*" in allowed_actions and val not in hard_allowed_not_actions:
+                    policies_combination.add(val)
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -179,62 +161,39 @@ def check_privilege_escalation(policy: dict) -> str:
         str: The policies affected by privilege escalation, separated by commas.
     """
 
-    policies_affected = ""
+    if not policy:
+        return ""
+    return get_policy_document(policy).get_verdict(_check_privilege_escalation)
 
-    if policy:
-        allowed_actions = set()
-        allowed_not_actions = set()
-        denied_actions = set()
-        denied_not_actions = set()
-
-        statements = policy.get("Statement", [])
-        if not isinstance(statements, list):
-            statements = [statements]
-
-        for statement in statements:
-            effect = statement.get("Effect")
-            actions = statement.get("Action")
-            not_actions = statement.get("NotAction")
-
-            if effect == "Allow":
-                process_actions(effect, actions, allowed_actions)
-                process_actions(effect, not_actions, allowed_not_actions)
-            elif effect == "Deny":
-                process_actions(effect, actions, denied_actions)
-                process_actions(effect, not_actions, denied_not_actions)
-
-        # If there is only NotAction, it allows the rest of the actions
-        if not allowed_actions and allowed_not_actions:
-            allowed_actions.add("*")
-        # Check for invalid services in allowed NotAction
-        if allowed_not_actions:
-            invalid_not_actions = check_invalid_not_actions(allowed_not_actions)
-            if invalid_not_actions:
-                # Since it is an invalid NotAction, it allows all AWS actions
-                allowed_actions.add("*")
 
-        policies_combination = find_privilege_escalation_combinations(
-            allowed_actions, denied_actions, allowed_not_actions, denied_not_actions
-        )
+def _check_privilege_escalation(policy: dict) -> str:
+    policies_affected = ""
 
-        # Check all policies combinations and see if matches with some combo key
-        combos = set()
-        for (
-            key,
-            values,
-        ) in privilege_escalation_policies_combination.items():
-            intersection = policies_combination.intersection(values)
-            if intersection == values:
-                combos.add(key)
-
-        if combos:
-            policies_affected = (
-                ", ".join(
-                    str(privilege_escalation_policies_combination[key])
-                    for key in combos
-                )
-                .replace("{", "")
-                .replace("}", "")
+    policy_actions = PolicyActions(get_policy_statements(policy))
+    policies_combination = find_privilege_escalation_combinations(
+        policy_actions.allowed_actions,
+        policy_actions.denied_actions,
+        policy_actions.allowed_not_actions,
+        policy_actions.denied_not_actions,
+    )
+
+    # Check all policies combinations and see if matches with some combo key
+    combos = set()
+    for (
+        key,
+        values,
+    ) in privilege_escalation_policies_combination.items():
+        intersection = policies_combination.intersection(values)
+        if intersection == values:
+            combos.add(key)
+
+    if combos:
+        policies_affected = (
+            ", ".join(
+                str(privilege_escalation_policies_combination[key]) for key in combos
             )
+            .replace("{", "")
+            .replace("}", "")
+        )
 
     return policies_affected
@@ -570,7 +570,7 @@ class S3Control(AWSService):
         logger.info("S3 - Listing account multi region access points...")
         try:
             region = "us-west-2"
-            client = self.session.client(self.service, region)
+            client = self.provider.get_client(self.service, region)
             list_multi_region_access_points = client.list_multi_region_access_points(
                 AccountId=self.audited_account
             ).get("AccessPoints", [])
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def metadata_cache_directory(tmp_path, monkeypatch):
+    """Isolate every test from the checks metadata cache of the user and of the other tests"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
@@ -21,6 +21,7 @@ from prowler.lib.check.check import (
     parse_checks_from_file,
     parse_checks_from_folder,
     remove_custom_checks_module,
+    run_checks,
     update_audit_metadata,
 )
 from prowler.lib.check.models import load_check_metadata
@@ -973,3 +974,88 @@ class TestCheck:
             assert caplog.record_tuples == [
                 ("root", 40, f"Check '{checks[0]}' was not found for the AWS provider")
             ]
+
+    def test_execute_checks_checkpoint(self):
+        provider = mock.MagicMock()
+        provider.type = "aws"
+        output_options = mock.MagicMock()
+        output_options.only_logs = True
+        checkpoint = mock.MagicMock()
+        checkpoint.completed_checks = {"ec2_check_one"}
+        findings_handler = mock.MagicMock(return_value=["finding_output"])
+
+        with (
+            patch(
+                "prowler.lib.check.check.run_check", return_value=["finding"]
+            ) as run_check,
+            patch("prowler.lib.check.check.report"),
+        ):
+            execute_checks(
+                ["ec2_check_one", "iam_check_one"],
+                provider,
+                custom_checks_metadata=None,
+                config_file=None,
+                output_options=output_options,
+                findings_handler=findings_handler,
+                checkpoint=checkpoint,
+            )
+
+        # The checks completed before the scan was interrupted are skipped
+        assert [call.args[0] for call in run_check.call_args_list] == ["iam_check_one"]
+        assert provider.audit_metadata.expected_checks == ["iam_check_one"]
+        findings_handler.assert_called_once_with(["finding"])
+        checkpoint.add_check.assert_called_once_with(
+            "iam_check_one", ["finding_output"]
+        )
+
+    def test_run_checks_sequential(self):
+        checks = ["ec2_check_one", "iam_check_one", "ec2_check_two"]
+        executed = []
+
+        def check_runner(check_name):
+            executed.append(check_name)
+            return [check_name]
+
+        results = list(run_checks(checks, check_runner, max_parallel_checks=1))
+
+        assert executed == checks
+        assert results == [(check, [check]) for check in checks]
+
+    def test_run_checks_parallel(self):
+        checks = [
+            "ec2_check_one",
+            "ec2_check_two",
+            "iam_check_one",
+            "s3_check_one",
+            "s3_check_two",
+        ]
+        executed = []
+
+        def check_runner(check_name):
+            executed.append(check_name)
+            return [check_name]
+
+        results = list(run_checks(checks, check_runner, max_parallel_checks=3))
+
+        assert sorted(results) == [(check, [check]) for check in checks]
+        # Checks from the same service keep their relative order
+        assert executed.index("ec2_check_one") < executed.index("ec2_check_two")
+        assert executed.index("s3_check_one") < executed.index("s3_check_two")
+
+    def test_run_checks_parallel_check_exception(self, caplog):
+        caplog.set_level(ERROR)
+        checks = ["ec2_check_one", "ec2_check_two", "iam_check_one"]
+
+        def check_runner(check_name):
+            if check_name == "ec2_check_one":
+                raise Exception("check failed")
+            return [check_name]
+
+        results = dict(run_checks(checks, check_runner, max_parallel_checks=2))
+
+        assert results == {
+            "ec2_check_one": None,
+            "ec2_check_two": ["ec2_check_two"],
+            "iam_check_one": ["iam_check_one"],
+        }
+        assert "ec2_check_one - Exception" in caplog.text
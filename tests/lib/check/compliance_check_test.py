@@ -1,6 +1,9 @@
 from unittest import mock
 
-from prowler.lib.check.compliance import update_checks_metadata_with_compliance
+from prowler.lib.check.compliance import (
+    get_checks_compliance_index,
+    update_checks_metadata_with_compliance,
+)
 from prowler.lib.check.compliance_models import (
     CIS_Requirement_Attribute,
     CIS_Requirement_Attribute_AssessmentStatus,
@@ -204,6 +207,32 @@ class TestCompliance:
         assert accessanalyzer_enabled_attribute.AdditionalInformation == "Additional"
         assert accessanalyzer_enabled_attribute.References == "References"
 
+    def test_get_checks_compliance_index(self):
+        checks_compliance = get_checks_compliance_index(custom_compliance_metadata)
+
+        assert set(checks_compliance) == {
+            "accessanalyzer_enabled",
+            "iam_user_mfa_enabled_console_access",
+        }
+        for check_compliance in checks_compliance.values():
+            assert [
+                (compliance.Framework, compliance.Provider)
+                for compliance in check_compliance
+            ] == [("Framework1", "aws")]
+            assert [
+                [requirement.Id for requirement in compliance.Requirements]
+                for compliance in check_compliance
+            ] == [["1.1.1"]]
+        # The checks of the same requirement do not share its Compliance
+        accessanalyzer_compliance = checks_compliance["accessanalyzer_enabled"][0]
+        iam_compliance = checks_compliance["iam_user_mfa_enabled_console_access"][0]
+        assert accessanalyzer_compliance is not iam_compliance
+        accessanalyzer_compliance.Version = "2.0"
+        assert iam_compliance.Version != "2.0"
+
+    def test_get_checks_compliance_index_no_frameworks(self):
+        assert get_checks_compliance_index({}) == {}
+
     def test_list_no_provider(self):
         bulk_compliance_frameworks = custom_compliance_metadata
 
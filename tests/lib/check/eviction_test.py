@@ -0,0 +1,108 @@
+import sys
+from types import ModuleType
+from unittest import mock
+
+from prowler.lib.check.eviction import (
+    ServiceClientEvictor,
+    get_check_client_modules,
+    get_memory_usage,
+    unload_module,
+)
+
+EC2_CLIENT = "prowler.providers.aws.services.ec2.ec2_client"
+VPC_CLIENT = "prowler.providers.aws.services.vpc.vpc_client"
+
+
+def add_fake_module(module_name: str) -> ModuleType:
+    module = ModuleType(module_name)
+    sys.modules[module_name] = module
+    return module
+
+
+class TestServiceClientEvictor:
+    def test_get_check_client_modules(self):
+        assert get_check_client_modules(
+            "aws", "ec2_instance_port_ssh_exposed_to_internet"
+        ) == {EC2_CLIENT, VPC_CLIENT}
+
+    def test_get_check_client_modules_multiline_import(self):
+        assert get_check_client_modules(
+            "aws", "organizations_account_part_of_organizations"
+        ) == {
+            "prowler.providers.aws.services.organizations.organizations_client",
+        }
+
+    def test_get_check_client_modules_not_found(self):
+        assert get_check_client_modules("aws", "ec2_not_existing_check") == set()
+
+    def test_get_memory_usage(self):
+        assert get_memory_usage() > 0
+
+    def test_get_memory_usage_not_available(self):
+        with mock.patch("builtins.open", side_effect=FileNotFoundError):
+            assert get_memory_usage() is None
+
+    def test_unload_module(self):
+        parent = add_fake_module("prowler_fake_parent")
+        child = add_fake_module("prowler_fake_parent.child_client")
+        parent.child_client = child
+
+        assert unload_module("prowler_fake_parent.child_client")
+        assert "prowler_fake_parent.child_client" not in sys.modules
+        assert not hasattr(parent, "child_client")
+        assert not unload_module("prowler_fake_parent.child_client")
+        sys.modules.pop("prowler_fake_parent")
+
+    def test_check_completed(self):
+        check_client_modules = {
+            "ec2_check_one": {EC2_CLIENT},
+            "ec2_check_two": {EC2_CLIENT, VPC_CLIENT},
+            "vpc_check_one": {VPC_CLIENT},
+        }
+        with (
+            mock.patch(
+                "prowler.lib.check.eviction.get_check_client_modules",
+                side_effect=lambda provider, check: check_client_modules[check],
+            ),
+            mock.patch(
+                "prowler.lib.check.eviction.unload_module",
+                side_effect=lambda module_name: module_name in (EC2_CLIENT, VPC_CLIENT),
+            ) as unload,
+            mock.patch(
+                "prowler.lib.check.eviction.get_memory_usage",
+                return_value=1024,
+            ),
+        ):
+            evictor = ServiceClientEvictor(
+                "aws", ["ec2_check_one", "ec2_check_two", "vpc_check_one"]
+            )
+
+            evictor.check_completed("ec2_check_one")
+            unloaded = [call.args[0] for call in unload.call_args_list]
+            assert EC2_CLIENT not in unloaded
+            assert evictor.service_memory_usage == {}
+
+            evictor.check_completed("vpc_check_one")
+            unloaded = [call.args[0] for call in unload.call_args_list]
+            # ec2_check_two still needs the VPC client
+            assert VPC_CLIENT not in unloaded
+            assert evictor.service_memory_usage == {"vpc": 1024}
+
+            evictor.check_completed("ec2_check_two")
+            unloaded = [call.args[0] for call in unload.call_args_list]
+            assert EC2_CLIENT in unloaded
+            assert VPC_CLIENT in unloaded
+            assert evictor.service_memory_usage == {"vpc": 1024, "ec2": 1024}
+
+    def test_check_completed_unloads_prefetched_clients(self):
+        prefetched_client = "prowler.providers.aws.services.s3.s3control_client"
+        add_fake_module(prefetched_client)
+        with mock.patch(
+            "prowler.lib.check.eviction.get_check_client_modules",
+            return_value=set(),
+        ):
+            evictor = ServiceClientEvictor("aws", ["s3_check_one"])
+            evictor.check_completed("s3_check_one")
+
+        assert prefetched_client not in sys.modules
+        assert "s3" in evictor.service_memory_usage
@@ -0,0 +1,166 @@
+import os
+import pickle
+import shutil
+from unittest import mock
+
+from prowler.lib.check.metadata_cache import MetadataCache
+from prowler.lib.check.models import CheckMetadata, load_check_metadata
+
+TEST_CHECK_METADATA_PATH = "tests/lib/check/fixtures/metadata.json"
+
+
+class TestMetadataCache:
+    def test_get_loads_and_caches(self, tmp_path):
+        metadata_file = tmp_path / "check.metadata.json"
+        metadata_file.write_text('{"CheckID": "check"}')
+        load = mock.MagicMock(return_value={"CheckID": "check"})
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        assert metadata_cache.get(str(metadata_file), load) == {"CheckID": "check"}
+        metadata_cache.save()
+        assert os.path.isfile(metadata_cache.cache_file)
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        assert metadata_cache.get(str(metadata_file), load) == {"CheckID": "check"}
+        load.assert_called_once_with(str(metadata_file))
+
+    def test_get_reloads_modified_file(self, tmp_path):
+        metadata_file = tmp_path / "check.metadata.json"
+        metadata_file.write_text('{"CheckID": "check"}')
+        load = mock.MagicMock(return_value={"CheckID": "check"})
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        metadata_cache.get(str(metadata_file), load)
+        metadata_cache.save()
+
+        metadata_file.write_text('{"CheckID": "check_modified"}')
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        metadata_cache.get(str(metadata_file), load)
+        assert load.call_count == 2
+
+    def test_get_missing_file_is_not_cached(self, tmp_path):
+        load = mock.MagicMock(return_value={"CheckID": "check"})
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        assert metadata_cache.get("/path/to/check.metadata.json", load) == {
+            "CheckID": "check"
+        }
+        metadata_cache.save()
+        assert not os.path.exists(metadata_cache.cache_file)
+
+    def test_save_keeps_entries_of_partial_loads(self, tmp_path):
+        metadata_files = []
+        for check in ["check1", "check2"]:
+            metadata_file = tmp_path / f"{check}.metadata.json"
+            metadata_file.write_text("{}")
+            metadata_files.append(str(metadata_file))
+        load = mock.MagicMock(return_value={})
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        for metadata_file in metadata_files:
+            metadata_cache.get(metadata_file, load)
+        metadata_cache.save()
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        metadata_cache.get(metadata_files[0], load)
+        metadata_cache.save()
+
+        with open(metadata_cache.cache_file, "rb") as cache_file:
+            assert list(pickle.load(cache_file)["entries"]) == metadata_files
+
+    def test_save_removes_deleted_files(self, tmp_path):
+        metadata_files = []
+        for check in ["check1", "check2"]:
+            metadata_file = tmp_path / f"{check}.metadata.json"
+            metadata_file.write_text("{}")
+            metadata_files.append(str(metadata_file))
+        load = mock.MagicMock(return_value={})
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        for metadata_file in metadata_files:
+            metadata_cache.get(metadata_file, load)
+        metadata_cache.save()
+
+        os.remove(metadata_files[1])
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        metadata_cache.save()
+
+        with open(metadata_cache.cache_file, "rb") as cache_file:
+            assert list(pickle.load(cache_file)["entries"]) == [metadata_files[0]]
+
+    def test_disabled_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PROWLER_DISABLE_METADATA_CACHE", "true")
+        metadata_file = tmp_path / "check.metadata.json"
+        metadata_file.write_text("{}")
+        load = mock.MagicMock(return_value={})
+
+        for _ in range(2):
+            metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+            assert metadata_cache.get(str(metadata_file), load) == {}
+            metadata_cache.save()
+        assert not os.path.exists(metadata_cache.cache_file)
+        assert load.call_count == 2
+
+    def test_cache_writable_by_others_is_ignored(self, tmp_path):
+        metadata_file = tmp_path / "check.metadata.json"
+        metadata_file.write_text("{}")
+        load = mock.MagicMock(return_value={})
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        metadata_cache.get(str(metadata_file), load)
+        metadata_cache.save()
+        os.chmod(metadata_cache.cache_file, 0o666)
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        metadata_cache.get(str(metadata_file), load)
+        assert load.call_count == 2
+
+    def test_version_mismatch_discards_cache(self, tmp_path):
+        metadata_file = tmp_path / "check.metadata.json"
+        metadata_file.write_text("{}")
+        load = mock.MagicMock(return_value={})
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        metadata_cache.get(str(metadata_file), load)
+        metadata_cache.save()
+
+        with mock.patch("prowler.lib.check.metadata_cache.prowler_version", "0.0.0"):
+            metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        metadata_cache.get(str(metadata_file), load)
+        assert load.call_count == 2
+
+    def test_corrupted_cache_is_discarded(self, tmp_path):
+        (tmp_path / "aws_checks_metadata.pickle").write_bytes(b"corrupted")
+        metadata_file = tmp_path / "check.metadata.json"
+        metadata_file.write_text("{}")
+        load = mock.MagicMock(return_value={})
+
+        metadata_cache = MetadataCache("aws_checks_metadata", str(tmp_path))
+        assert metadata_cache.get(str(metadata_file), load) == {}
+        load.assert_called_once()
+
+    def test_get_bulk_uses_cache(self, tmp_path):
+        check_name = "iam_user_accesskey_unused"
+        check_path = tmp_path / check_name
+        check_path.mkdir()
+        shutil.copy(
+            TEST_CHECK_METADATA_PATH, check_path / f"{check_name}.metadata.json"
+        )
+        with (
+            mock.patch(
+                "prowler.lib.check.metadata_cache.get_default_metadata_cache_directory",
+                return_value=str(tmp_path),
+            ),
+            mock.patch(
+                "prowler.lib.check.models.recover_checks_from_provider",
+                return_value=[(check_name, str(check_path))],
+            ),
+            mock.patch(
+                "prowler.lib.check.models.load_check_metadata",
+                wraps=load_check_metadata,
+            ) as mock_load_check_metadata,
+        ):
+            bulk_checks_metadata = CheckMetadata.get_bulk("aws")
+            assert CheckMetadata.get_bulk("aws") == bulk_checks_metadata
+            assert list(bulk_checks_metadata) == [check_name]
+            mock_load_check_metadata.assert_called_once()
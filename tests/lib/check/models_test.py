@@ -1,6 +1,13 @@
 from unittest import mock
 
-from prowler.lib.check.models import CheckMetadata
+from pydantic import BaseModel
+
+from prowler.lib.check.models import (
+    Check,
+    Check_Report,
+    Check_Report_AWS,
+    CheckMetadata,
+)
 from tests.lib.check.compliance_check_test import custom_compliance_metadata
 
 mock_metadata = CheckMetadata(
@@ -324,3 +331,88 @@ class TestCheckMetada:
 
         result = CheckMetadata.list(bulk_checks_metadata=bulk_metadata)
         assert result == set()
+
+
+class DummyCheck(Check):
+    def execute(self):
+        return []
+
+
+class DummyResource(BaseModel):
+    id: str
+    arn: str
+    region: str
+    tags: list = []
+
+
+class TestCheckReport:
+    @mock.patch("prowler.lib.check.models.CheckMetadata.parse_file")
+    def test_check_metadata_is_shared(self, mock_parse_file):
+        mock_parse_file.return_value = mock_metadata
+        check = DummyCheck()
+
+        metadata = check.metadata()
+
+        assert metadata is check.metadata()
+        assert type(metadata) is CheckMetadata
+        assert metadata == mock_metadata
+
+    def test_check_report_copies_the_shared_metadata(self):
+        resource = DummyResource(id="id", arn="arn", region="eu-west-1")
+        first = Check_Report_AWS(metadata=mock_metadata, resource=resource)
+        second = Check_Report_AWS(metadata=mock_metadata, resource=resource)
+
+        first.check_metadata.Severity = "critical"
+
+        assert first.check_metadata.Severity == "critical"
+        assert second.check_metadata.Severity == "high"
+        assert mock_metadata.Severity == "high"
+        # The nested models are shared, not parsed again
+        assert second.check_metadata.Remediation is mock_metadata.Remediation
+
+    def test_check_report_json_metadata(self):
+        report = Check_Report(metadata=mock_metadata.json(), resource={})
+
+        assert report.check_metadata == mock_metadata
+        assert report.check_metadata is not mock_metadata
+
+    def test_check_report_resource_is_converted_when_read(self):
+        resource = mock.MagicMock(spec=["id", "arn", "region", "to_dict"])
+        resource.id = "id"
+        resource.arn = "arn"
+        resource.region = "eu-west-1"
+        resource.to_dict.return_value = {"id": "id"}
+
+        report = Check_Report_AWS(metadata=mock_metadata, resource=resource)
+
+        resource.to_dict.assert_not_called()
+        assert report.resource == {"id": "id"}
+        assert report.resource is report.resource
+        resource.to_dict.assert_called_once()
+        assert report.resource_id == "id"
+        assert report.resource_arn == "arn"
+        assert report.region == "eu-west-1"
+
+    def test_check_report_pydantic_resource(self):
+        resource = DummyResource(id="id", arn="arn", region="eu-west-1")
+
+        report = Check_Report_AWS(metadata=mock_metadata, resource=resource)
+
+        assert report.resource == {
+            "id": "id",
+            "arn": "arn",
+            "region": "eu-west-1",
+            "tags": [],
+        }
+
+    def test_check_report_resource_setter(self):
+        report = Check_Report(metadata=mock_metadata, resource={"name": "old"})
+
+        report.resource = {"name": "new"}
+
+        assert report.resource == {"name": "new"}
+
+    def test_check_report_resource_not_convertible(self):
+        report = Check_Report(metadata=mock_metadata, resource=object())
+
+        assert report.resource == {}
@@ -0,0 +1,102 @@
+from threading import Event
+from unittest import mock
+
+from prowler.lib.check.prefetch import (
+    ServiceClientPrefetcher,
+    get_services_client_modules,
+)
+
+
+class TestServiceClientPrefetcher:
+    def test_get_services_client_modules(self):
+        assert get_services_client_modules(
+            "aws",
+            [
+                "ec2_instance_port_ssh_exposed_to_internet",
+                "ec2_ebs_default_encryption",
+                "s3_bucket_default_encryption",
+            ],
+        ) == {
+            "ec2": [
+                "prowler.providers.aws.services.ec2.ec2_client",
+                "prowler.providers.aws.services.vpc.vpc_client",
+            ],
+            "s3": ["prowler.providers.aws.services.s3.s3_client"],
+        }
+
+    def test_get_services_client_modules_azure(self):
+        assert get_services_client_modules(
+            "azure", ["storage_secure_transfer_required_is_enabled"]
+        ) == {
+            "storage": ["prowler.providers.azure.services.storage.storage_client"],
+        }
+
+    def test_service_started_prefetches_next_services(self):
+        imported = []
+        release = Event()
+
+        def import_module(module_name):
+            imported.append(module_name)
+            release.wait(5)
+
+        with (
+            mock.patch(
+                "prowler.lib.check.prefetch.get_check_client_modules",
+                side_effect=lambda provider, check_name: {
+                    f"{check_name.split('_')[0]}_client"
+                },
+            ),
+            mock.patch(
+                "prowler.lib.check.prefetch.importlib.import_module",
+                side_effect=import_module,
+            ),
+        ):
+            prefetcher = ServiceClientPrefetcher(
+                "aws",
+                [
+                    "accessanalyzer_enabled",
+                    "ec2_ebs_default_encryption",
+                    "iam_root_mfa_enabled",
+                    "s3_bucket_default_encryption",
+                ],
+                2,
+            )
+            prefetcher.service_started("accessanalyzer")
+            assert prefetcher.prefetching == {"ec2", "iam"}
+
+            # Starting a prefetched service releases it and prefetches the next one
+            prefetcher.service_started("ec2")
+            assert prefetcher.prefetching == {"iam", "s3"}
+
+            # Services already started are not prefetched again
+            prefetcher.service_started("ec2")
+            assert prefetcher.prefetching == {"iam", "s3"}
+
+            release.set()
+            prefetcher._executor.shutdown(wait=True)
+            assert sorted(imported) == ["ec2_client", "iam_client", "s3_client"]
+
+    def test_service_started_last_service(self):
+        with mock.patch(
+            "prowler.lib.check.prefetch.importlib.import_module"
+        ) as import_module:
+            prefetcher = ServiceClientPrefetcher(
+                "aws", ["ec2_ebs_default_encryption", "s3_bucket_default_encryption"], 1
+            )
+            prefetcher.service_started("s3")
+            prefetcher.service_started("unknown")
+            assert prefetcher.prefetching == set()
+            prefetcher.shutdown()
+            import_module.assert_not_called()
+
+    def test_prefetch_service_error(self, caplog):
+        with mock.patch(
+            "prowler.lib.check.prefetch.importlib.import_module",
+            side_effect=ModuleNotFoundError("No module named 's3_client'"),
+        ):
+            prefetcher = ServiceClientPrefetcher(
+                "aws", ["ec2_ebs_default_encryption", "s3_bucket_default_encryption"], 1
+            )
+            prefetcher.service_started("ec2")
+            prefetcher._executor.shutdown(wait=True)
+            assert "s3 - ModuleNotFoundError" in caplog.text
@@ -4,7 +4,11 @@ from argparse import ArgumentTypeError
 import pytest
 from mock import patch
 
-from prowler.lib.cli.parser import ProwlerArgumentParser
+from prowler.lib.cli.parser import (
+    ProwlerArgumentParser,
+    validate_max_parallel_checks,
+    validate_prefetch_services,
+)
 from prowler.providers.aws.config import ROLE_SESSION_NAME
 from prowler.providers.aws.lib.arguments.arguments import (
     validate_bucket,
@@ -60,6 +64,9 @@ class Test_Parser:
         assert not parsed.check
         assert not parsed.checks_file
         assert not parsed.checks_folder
+        assert parsed.max_parallel_checks == 1
+        assert parsed.prefetch_services == 0
+        assert not parsed.evict_completed_services
         assert not parsed.service
         assert not parsed.severity
         assert not parsed.compliance
@@ -77,6 +84,9 @@ class Test_Parser:
         assert not parsed.external_id
         assert not parsed.region
         assert not parsed.organizations_role
+        assert not parsed.organizations_scan_role
+        assert not parsed.checkpoint
+        assert not parsed.resume
         assert not parsed.security_hub
         assert not parsed.quick_inventory
         assert not parsed.output_bucket
@@ -545,6 +555,24 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.checks_folder == filename
 
+    def test_checks_parser_max_parallel_checks(self):
+        argument = "--max-parallel-checks"
+        command = [prowler_command, argument, "8"]
+        parsed = self.parser.parse(command)
+        assert parsed.max_parallel_checks == 8
+
+    def test_checks_parser_prefetch_services(self):
+        argument = "--prefetch-services"
+        command = [prowler_command, argument, "2"]
+        parsed = self.parser.parse(command)
+        assert parsed.prefetch_services == 2
+
+    def test_checks_parser_evict_completed_services(self):
+        argument = "--evict-completed-services"
+        command = [prowler_command, argument]
+        parsed = self.parser.parse(command)
+        assert parsed.evict_completed_services
+
     def test_checks_parser_services_short(self):
         argument = "-s"
         service_1 = "iam"
@@ -951,6 +979,107 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.organizations_role == organizations_role
 
+    def test_parser_checkpoint(self):
+        command = [prowler_command, "--checkpoint"]
+        parsed = self.parser.parse(command)
+        assert parsed.checkpoint
+        assert not parsed.resume
+
+    def test_parser_resume(self):
+        command = [
+            prowler_command,
+            "--resume",
+            "prowler-output-123456789012-20241019120000",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.resume == "prowler-output-123456789012-20241019120000"
+
+    def test_parser_resume_with_output_filename(self, capsys):
+        command = [
+            prowler_command,
+            "--resume",
+            "prowler-output-123456789012-20241019120000",
+            "--output-filename",
+            "output",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.value.code == 2
+        assert (
+            capsys.readouterr().err
+            == f"{prowler_default_usage_error}\nprowler: error: --resume can't be used with -F/--output-filename, the outputs of the resumed scan are used\n"
+        )
+
+    def test_parser_checkpoint_with_fixer(self, capsys):
+        command = [prowler_command, "--checkpoint", "--fixer"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.value.code == 2
+        assert (
+            capsys.readouterr().err
+            == f"{prowler_default_usage_error}\nprowler: error: --checkpoint and --resume can't be used with --fixer, since the fixer needs all the findings\n"
+        )
+
+    def test_aws_parser_organizations_scan_role(self):
+        command = [prowler_command, "--organizations-scan-role", "ProwlerScanRole"]
+        parsed = self.parser.parse(command)
+        assert parsed.organizations_scan_role == "ProwlerScanRole"
+        assert parsed.organizations_scan_processes == 4
+        assert not parsed.organizations_scan_excluded_account
+
+    def test_aws_parser_organizations_scan_options(self):
+        command = [
+            prowler_command,
+            "--organizations-scan-role",
+            "ProwlerScanRole",
+            "--organizations-scan-processes",
+            "16",
+            "--organizations-scan-excluded-accounts",
+            "111111111111",
+            "222222222222",
+            "--external-id",
+            "external-id",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.organizations_scan_processes == 16
+        assert parsed.organizations_scan_excluded_account == [
+            "111111111111",
+            "222222222222",
+        ]
+        assert parsed.external_id == "external-id"
+
+    def test_aws_parser_organizations_scan_role_with_role(self, capsys):
+        command = [
+            prowler_command,
+            "--organizations-scan-role",
+            "ProwlerScanRole",
+            "--role",
+            "arn:aws:iam::123456789012:role/ProwlerRole",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.value.code == 2
+        assert (
+            capsys.readouterr().err
+            == f"{prowler_default_usage_error}\nprowler: error: aws: -R/--role option can't be used with --organizations-scan-role\n"
+        )
+
+    def test_aws_parser_organizations_scan_processes_invalid(self, capsys):
+        command = [
+            prowler_command,
+            "--organizations-scan-role",
+            "ProwlerScanRole",
+            "--organizations-scan-processes",
+            "0",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.value.code == 2
+        assert (
+            capsys.readouterr().err
+            == f"{prowler_default_usage_error}\nprowler: error: aws: --organizations-scan-processes must be greater than 0\n"
+        )
+
     def test_aws_parser_security_hub_short(self):
         argument = "-S"
         command = [prowler_command, argument]
@@ -1363,3 +1492,31 @@ class Test_Parser:
         valid_role_names = ["prowler-role" "test@" "test=test+test,."]
         for role_name in valid_role_names:
             assert validate_role_session_name(role_name) == role_name
+
+    def test_validate_max_parallel_checks_invalid_values(self):
+        with pytest.raises(ArgumentTypeError) as argument_error:
+            validate_max_parallel_checks("0")
+        assert (
+            argument_error.value.args[0]
+            == "--max-parallel-checks must be greater than 0"
+        )
+
+        with pytest.raises(ArgumentTypeError) as argument_error:
+            validate_max_parallel_checks("all")
+        assert (
+            argument_error.value.args[0] == "--max-parallel-checks must be an integer"
+        )
+
+    def test_validate_max_parallel_checks_valid_values(self):
+        assert validate_max_parallel_checks("1") == 1
+        assert validate_max_parallel_checks("16") == 16
+
+    def test_validate_prefetch_services(self):
+        assert validate_prefetch_services("0") == 0
+        assert validate_prefetch_services("3") == 3
+
+        with pytest.raises(ArgumentTypeError) as argument_error:
+            validate_prefetch_services("-1")
+        assert (
+            argument_error.value.args[0] == "--prefetch-services must be 0 or greater"
+        )
@@ -0,0 +1,176 @@
+from prowler.lib.mutelist.matcher import (
+    ExceptionsMatcher,
+    ItemMatcher,
+    MutedCheckMatcher,
+    MutelistIndex,
+)
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGION_US_EAST_1 = "us-east-1"
+AWS_REGION_EU_WEST_1 = "eu-west-1"
+
+MUTELIST = {
+    "Accounts": {
+        "*": {
+            "Checks": {
+                "s3_*": {
+                    "Regions": ["*"],
+                    "Resources": ["prowler-*"],
+                },
+                "lambda_function_url_public": {
+                    "Regions": [AWS_REGION_US_EAST_1],
+                    "Resources": ["*"],
+                },
+            }
+        },
+        AWS_ACCOUNT_NUMBER: {
+            "Checks": {
+                "ec2_instance_public_ip": {
+                    "Regions": ["*"],
+                    "Resources": ["*"],
+                    "Exceptions": {"Regions": [AWS_REGION_EU_WEST_1]},
+                },
+                "ec2_*": {
+                    "Regions": ["*"],
+                    "Resources": ["*"],
+                },
+            }
+        },
+    }
+}
+
+
+class TestItemMatcher:
+    def test_matches_any(self):
+        matcher = ItemMatcher(["*-east-1", "eu-.*"])
+
+        assert matcher.matches(AWS_REGION_US_EAST_1)
+        assert matcher.matches(AWS_REGION_EU_WEST_1)
+        assert not matcher.matches("ap-south-1")
+        assert not matcher.matches(None)
+
+    def test_matches_all_tags(self):
+        matcher = ItemMatcher(["Name=prowler", "Environment=prod"], tag=True)
+
+        assert matcher.matches("Name=prowler | Environment=prod")
+        assert not matcher.matches("Name=prowler")
+
+    def test_matches_empty(self):
+        assert not ItemMatcher([]).matches(AWS_REGION_US_EAST_1)
+        assert not ItemMatcher(None).matches(AWS_REGION_US_EAST_1)
+        assert ItemMatcher("*", tag=True).matches("")
+
+    def test_matches_invalid_pattern(self):
+        assert not ItemMatcher(["[invalid"]).matches(AWS_REGION_US_EAST_1)
+        # The patterns are evaluated in order, the invalid one is not reached
+        assert ItemMatcher([AWS_REGION_US_EAST_1, "[invalid"]).matches(
+            AWS_REGION_US_EAST_1
+        )
+
+
+class TestExceptionsMatcher:
+    def test_is_excepted(self):
+        matcher = ExceptionsMatcher(
+            {"Accounts": [AWS_ACCOUNT_NUMBER], "Regions": [AWS_REGION_EU_WEST_1]}
+        )
+
+        assert matcher.is_excepted(
+            AWS_ACCOUNT_NUMBER, AWS_REGION_EU_WEST_1, "resource", ""
+        )
+        assert not matcher.is_excepted(
+            AWS_ACCOUNT_NUMBER, AWS_REGION_US_EAST_1, "resource", ""
+        )
+
+    def test_is_excepted_without_exceptions(self):
+        assert not ExceptionsMatcher(None).is_excepted(
+            AWS_ACCOUNT_NUMBER, AWS_REGION_EU_WEST_1, "resource", ""
+        )
+
+
+class TestMutedCheckMatcher:
+    def test_matches_check_lambda(self):
+        matcher = MutedCheckMatcher(
+            "lambda_function_url_public", {"Regions": ["*"], "Resources": ["*"]}
+        )
+
+        assert matcher.check == "awslambda_function_url_public"
+        assert matcher.matches_check("awslambda_function_url_public")
+        assert not matcher.matches_check("lambda_function_url_public")
+
+    def test_is_muted_default_tags(self):
+        matcher = MutedCheckMatcher(
+            "ec2_*", {"Regions": ["*"], "Resources": ["*"], "Tags": []}
+        )
+
+        assert matcher.is_muted(AWS_REGION_US_EAST_1, "i-123456789", "")
+        assert not matcher.is_muted(AWS_REGION_US_EAST_1, "i-123456789", None)
+
+
+class TestMutelistIndex:
+    def test_get_muted_checks(self):
+        index = MutelistIndex(MUTELIST)
+
+        muted_checks = index.get_muted_checks(
+            AWS_ACCOUNT_NUMBER, "ec2_instance_public_ip"
+        )
+        assert [muted_check.check for muted_check in muted_checks] == [
+            "ec2_instance_public_ip",
+            "ec2_*",
+        ]
+        assert (
+            index.get_muted_checks(AWS_ACCOUNT_NUMBER, "ec2_instance_public_ip")
+            is muted_checks
+        )
+        assert index.get_muted_checks("*", "ec2_instance_public_ip") == ()
+        assert index.get_muted_checks("unknown", "ec2_instance_public_ip") == ()
+
+    def test_is_muted(self):
+        index = MutelistIndex(MUTELIST)
+
+        assert index.is_muted(
+            AWS_ACCOUNT_NUMBER,
+            "s3_bucket_public_access",
+            AWS_REGION_EU_WEST_1,
+            "prowler-bucket",
+            "",
+        )
+        assert index.is_muted(
+            "111122223333",
+            "awslambda_function_url_public",
+            AWS_REGION_US_EAST_1,
+            "function",
+            "",
+        )
+        assert not index.is_muted(
+            "111122223333",
+            "ec2_instance_public_ip",
+            AWS_REGION_US_EAST_1,
+            "i-123456789",
+            "",
+        )
+
+    def test_is_muted_excepted_stops_evaluation(self):
+        index = MutelistIndex(MUTELIST)
+
+        assert index.is_muted(
+            AWS_ACCOUNT_NUMBER,
+            "ec2_instance_public_ip",
+            AWS_REGION_US_EAST_1,
+            "i-123456789",
+            "",
+        )
+        # The exception of the first entry stops the evaluation before ec2_*
+        assert not index.is_muted(
+            AWS_ACCOUNT_NUMBER,
+            "ec2_instance_public_ip",
+            AWS_REGION_EU_WEST_1,
+            "i-123456789",
+            "",
+        )
+        assert index.is_muted(
+            AWS_ACCOUNT_NUMBER,
+            "ec2_instance_imdsv2_enabled",
+            AWS_REGION_EU_WEST_1,
+            "i-123456789",
+            "",
+        )
@@ -579,6 +579,26 @@ class TestASFF:
     def test_batch_write_data_to_file_without_findings(self):
         assert not ASFF([])._file_descriptor
 
+    def test_batch_write_data_to_file_in_batches(self):
+        mock_file = StringIO()
+
+        asff = ASFF(findings=[generate_finding_output()], from_cli=False)
+        asff._file_descriptor = mock_file
+        asff.batch_write_data_to_file()
+
+        asff.data.clear()
+        asff.transform([generate_finding_output(status="FAIL")])
+        asff.close_file = True
+        with patch.object(mock_file, "close", return_value=None):
+            asff.batch_write_data_to_file()
+
+        mock_file.seek(0)
+        content = loads(mock_file.read())
+        assert [finding["Compliance"]["Status"] for finding in content] == [
+            "PASSED",
+            "FAILED",
+        ]
+
     def test_asff_generate_status(self):
         assert ASFF.generate_status("PASS") == "PASSED"
         assert ASFF.generate_status("FAIL") == "FAILED"
@@ -114,3 +114,36 @@ class TestAWSGenericCompliance:
         content = mock_file.read()
         expected_csv = f"PROVIDER;DESCRIPTION;ACCOUNTID;REGION;ASSESSMENTDATE;REQUIREMENTS_ID;REQUIREMENTS_DESCRIPTION;REQUIREMENTS_ATTRIBUTES_SECTION;REQUIREMENTS_ATTRIBUTES_SUBSECTION;REQUIREMENTS_ATTRIBUTES_SUBGROUP;REQUIREMENTS_ATTRIBUTES_SERVICE;REQUIREMENTS_ATTRIBUTES_TYPE;STATUS;STATUSEXTENDED;RESOURCEID;CHECKID;MUTED;RESOURCENAME\r\naws;NIST 800-53 is a regulatory standard that defines the minimum baseline of security controls for all U.S. federal information systems except those related to national security. The controls defined in this standard are customizable and address a diverse set of security and privacy requirements.;123456789012;eu-west-1;{datetime.now()};ac_2_4;Account Management;Access Control (AC);Account Management (AC-2);;aws;;PASS;;;test-check-id;False;\r\naws;NIST 800-53 is a regulatory standard that defines the minimum baseline of security controls for all U.S. federal information systems except those related to national security. The controls defined in this standard are customizable and address a diverse set of security and privacy requirements.;;;{datetime.now()};ac_2_5;Account Management;Access Control (AC);Account Management (AC-2);;aws;;MANUAL;Manual check;manual_check;manual;False;Manual check\r\n"
         assert content == expected_csv
+
+    @freeze_time(datetime.now())
+    def test_batch_write_data_to_file_in_batches(self):
+        mock_file = StringIO()
+        findings = [
+            generate_finding_output(compliance={"NIST-800-53-Revision-4": "ac_2_4"})
+        ]
+        output = GenericCompliance(findings, NIST_800_53_REVISION_4_AWS, from_cli=False)
+        output._file_descriptor = mock_file
+        output.batch_write_data_to_file()
+
+        output.data.clear()
+        output.transform(
+            [
+                generate_finding_output(
+                    status="FAIL", compliance={"NIST-800-53-Revision-4": "ac_2_4"}
+                )
+            ],
+            output.compliance,
+            output.compliance_name,
+        )
+        output.close_file = True
+        with patch.object(mock_file, "close", return_value=None):
+            output.batch_write_data_to_file()
+
+        mock_file.seek(0)
+        lines = mock_file.read().splitlines()
+        # The manual requirements are written once after all the findings
+        assert len(lines) == 4
+        assert lines[0].startswith("PROVIDER;")
+        assert ";ac_2_4;" in lines[1] and ";PASS;" in lines[1]
+        assert ";ac_2_4;" in lines[2] and ";FAIL;" in lines[2]
+        assert ";ac_2_5;" in lines[3] and ";MANUAL;" in lines[3]
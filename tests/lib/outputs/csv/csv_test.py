@@ -121,6 +121,28 @@ class TestCSV:
     def test_batch_write_data_to_file_without_findings(self):
         assert not CSV([])._file_descriptor
 
+    def test_batch_write_data_to_file_in_batches(self):
+        mock_file = StringIO()
+
+        output = CSV([generate_finding_output()], from_cli=False)
+        output._file_descriptor = mock_file
+        output.batch_write_data_to_file()
+        assert not mock_file.closed
+
+        output.data.clear()
+        output.transform([generate_finding_output(status="FAIL")])
+        output.close_file = True
+        with patch.object(mock_file, "close", return_value=None) as mock_close:
+            output.batch_write_data_to_file()
+            mock_close.assert_called_once()
+
+        mock_file.seek(0)
+        lines = mock_file.read().splitlines()
+        assert len(lines) == 3
+        assert lines[0].startswith("AUTH_METHOD;")
+        assert ";PASS;" in lines[1]
+        assert ";FAIL;" in lines[2]
+
     @pytest.fixture
     def mock_output_class(self):
         class MockOutput(Output):
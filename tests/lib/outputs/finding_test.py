@@ -13,7 +13,7 @@ from prowler.lib.check.models import (
     Severity,
 )
 from prowler.lib.outputs.common import Status
-from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.finding import Finding, FindingOutputContext
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
 
 
@@ -522,6 +522,121 @@ class TestFinding:
         with pytest.raises(ValidationError):
             Finding.generate_output(provider, check_output, output_options)
 
+    def test_generate_output_context(self):
+        # Mock provider
+        provider = MagicMock()
+        provider.type = "aws"
+        provider.identity.profile = "mock_auth"
+        provider.identity.account = "mock_account_uid"
+        provider.identity.partition = "aws"
+        provider.organizations_metadata.account_name = "mock_account_name"
+        provider.organizations_metadata.account_email = "mock_account_email"
+        provider.organizations_metadata.organization_arn = "mock_account_org_uid"
+        provider.organizations_metadata.organization_id = "mock_account_org_name"
+        provider.organizations_metadata.account_tags = {"tag1": "value1"}
+
+        def build_check_output(resource_id, status):
+            check_output = MagicMock()
+            check_output.resource_id = resource_id
+            check_output.resource_arn = f"arn:{resource_id}"
+            check_output.resource_details = "test_resource_details"
+            check_output.resource_tags = {"tag1": "value1"}
+            check_output.region = "us-west-1"
+            check_output.status = status
+            check_output.status_extended = "mock_status_extended"
+            check_output.muted = False
+            check_output.check_metadata = mock_check_metadata(provider="aws")
+            check_output.resource = {}
+            return check_output
+
+        check_outputs = [
+            build_check_output("resource_1", "PASS"),
+            build_check_output("resource_2", "FAIL"),
+            build_check_output("resource_3", Status.MANUAL),
+        ]
+
+        # Mock output options
+        output_options = MagicMock()
+        output_options.unix_timestamp = False
+
+        with patch(
+            "prowler.lib.outputs.finding.get_check_compliance",
+            return_value={"CIS-1.4": ["2.1.3"]},
+        ) as check_compliance:
+            expected = [
+                Finding.generate_output(provider, check_output, output_options)
+                for check_output in check_outputs
+            ]
+            check_compliance.reset_mock()
+
+            context = FindingOutputContext(provider, output_options)
+            with (
+                patch.object(
+                    Finding, "construct", wraps=Finding.construct
+                ) as construct,
+                patch.object(
+                    Finding, "get_provider_data", wraps=Finding.get_provider_data
+                ) as get_provider_data,
+            ):
+                findings = [
+                    Finding.generate_output(
+                        provider, check_output, output_options, context
+                    )
+                    for check_output in check_outputs
+                ]
+
+        # The compliance and the provider fields are resolved once
+        check_compliance.assert_called_once()
+        get_provider_data.assert_called_once_with(provider)
+        # Only the first finding of the check is validated
+        assert construct.call_count == 2
+        assert [finding.dict() for finding in findings] == [
+            finding.dict() for finding in expected
+        ]
+        assert [finding.status for finding in findings] == [
+            Status.PASS,
+            Status.FAIL,
+            Status.MANUAL,
+        ]
+        assert all(isinstance(finding.status, Status) for finding in findings)
+
+    @patch(
+        "prowler.lib.outputs.finding.get_check_compliance",
+        new=mock_get_check_compliance,
+    )
+    def test_generate_output_context_validation_error(self):
+        # Mock provider
+        provider = MagicMock()
+        provider.type = "kubernetes"
+        provider.identity.context = "In-Cluster"
+        provider.identity.cluster = "test_cluster"
+
+        # Mock check result
+        check_output = MagicMock()
+        check_output.resource_name = "test_resource_name"
+        check_output.resource_id = "test_resource_id"
+        check_output.resource_details = "test_resource_details"
+        check_output.resource_tags = {}
+        check_output.namespace = "test_namespace"
+        check_output.status = "PASS"
+        check_output.status_extended = "mock_status_extended"
+        check_output.muted = False
+        check_output.check_metadata = mock_check_metadata(provider="kubernetes")
+        check_output.resource = {}
+
+        context = FindingOutputContext(provider, SimpleNamespace())
+        Finding.generate_output(provider, check_output, SimpleNamespace(), context)
+
+        # The findings with values of unexpected types are validated
+        check_output.status = "Invalid"
+        with pytest.raises(ValidationError):
+            Finding.generate_output(provider, check_output, SimpleNamespace(), context)
+
+        check_output.status = "FAIL"
+        check_output.resource_name = None
+        with pytest.raises(ValidationError):
+            Finding.generate_output(provider, check_output, SimpleNamespace(), context)
+
     @patch(
         "prowler.lib.outputs.finding.get_check_compliance",
         new=mock_get_check_compliance,
@@ -630,6 +745,72 @@ class TestFinding:
             "mock_compliance_key": "mock_compliance_value"
         }
 
+    @patch(
+        "prowler.lib.outputs.finding.get_check_compliance",
+        new=mock_get_check_compliance,
+    )
+    def test_transform_api_finding_check_metadata_cache(self):
+        provider = DummyProvider(uid="account123")
+        check_metadata = {
+            "provider": "aws",
+            "checkid": "check-001",
+            "checktitle": "Test Check",
+            "checktype": [],
+            "servicename": "TestService",
+            "subservicename": "",
+            "severity": "high",
+            "resourcetype": "TestResource",
+            "description": "A test check",
+            "risk": "High risk",
+            "relatedurl": "",
+            "remediation": {
+                "recommendation": {"text": "Fix it", "url": ""},
+                "code": {"nativeiac": "", "terraform": "", "cli": "", "other": ""},
+            },
+            "resourceidtemplate": "",
+            "categories": [],
+            "dependson": [],
+            "relatedto": [],
+            "notes": "",
+        }
+
+        def build_api_finding(uid):
+            api_finding = DummyAPIFinding()
+            api_finding.uid = uid
+            api_finding.status = "PASS"
+            api_finding.status_extended = "extended"
+            api_finding.check_metadata = dict(check_metadata)
+            api_finding.resources = DummyResources(
+                DummyResource(
+                    uid=f"res-{uid}",
+                    name=f"Resource-{uid}",
+                    resource_arn="arn",
+                    region="us-east-1",
+                    tags=[],
+                )
+            )
+            return api_finding
+
+        check_metadata_cache = {}
+        with patch.object(
+            Finding,
+            "_transform_api_check_metadata",
+            wraps=Finding._transform_api_check_metadata,
+        ) as mock_transform_check_metadata:
+            first = Finding.transform_api_finding(
+                build_api_finding("one"), provider, check_metadata_cache
+            )
+            second = Finding.transform_api_finding(
+                build_api_finding("two"), provider, check_metadata_cache
+            )
+
+        # The check metadata is only built once per check
+        mock_transform_check_metadata.assert_called_once_with(check_metadata)
+        assert list(check_metadata_cache) == ["check-001"]
+        assert first.metadata == second.metadata == check_metadata_cache["check-001"]
+        assert first.resource_uid == "res-one"
+        assert second.resource_uid == "res-two"
+
     @patch(
         "prowler.lib.outputs.finding.get_check_compliance",
         new=mock_get_check_compliance,
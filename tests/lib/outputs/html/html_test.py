@@ -491,6 +491,34 @@ class TestHTML:
         args = sys.argv[1:]
         assert content == get_aws_html_header(args) + pass_html_finding + html_footer
 
+    def test_batch_write_data_to_file_with_stats_on_close(self):
+        mock_file = StringIO()
+        output = HTML([generate_finding_output()])
+        output._file_descriptor = mock_file
+        output.close_file = False
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+
+        # The rows are kept until the statistics of the header are known
+        output.batch_write_data_to_file(provider, None)
+        assert mock_file.tell() == 0
+
+        output.data.clear()
+        output.transform([generate_finding_output()])
+        output.close_file = True
+        with patch.object(mock_file, "close", return_value=None):
+            output.batch_write_data_to_file(provider, html_stats)
+
+        mock_file.seek(0)
+        content = mock_file.read()
+        args = sys.argv[1:]
+        assert (
+            content
+            == get_aws_html_header(args)
+            + pass_html_finding
+            + pass_html_finding
+            + html_footer
+        )
+
     def test_batch_write_data_to_file_without_findings(self):
         assert not HTML([])._file_descriptor
 
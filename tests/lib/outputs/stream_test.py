@@ -0,0 +1,316 @@
+from json import loads
+from unittest.mock import MagicMock
+
+from mock import patch
+
+from prowler.lib.outputs.asff.asff import ASFF
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.html.html import HTML
+from prowler.lib.outputs.stream import OutputStream, generate_output_writers
+from prowler.lib.outputs.summary_table import FindingsSummary
+from prowler.lib.scan.checkpoint import SQLiteScanCheckpoint
+from tests.lib.outputs.compliance.fixtures import NIST_800_53_REVISION_4_AWS
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, set_mocked_aws_provider
+
+
+def generate_check_report(
+    status: str = "PASS",
+    muted: bool = False,
+    check_id: str = "test-check-id",
+    service_name: str = "test-service",
+    severity: str = "high",
+):
+    check_report = MagicMock()
+    check_report.status = status
+    check_report.muted = muted
+    check_report.check_metadata.CheckID = check_id
+    check_report.check_metadata.ServiceName = service_name
+    check_report.check_metadata.Provider = "aws"
+    check_report.check_metadata.Severity = severity
+    return check_report
+
+
+def generate_output(_provider, check_report, _output_options, _context=None):
+    return generate_finding_output(
+        status=check_report.status,
+        muted=check_report.muted,
+        resource_uid=f"resource-{check_report.status}",
+        compliance={"NIST-800-53-Revision-4": "ac_2_4"},
+    )
+
+
+class TestOutputStream:
+    def test_add_findings_and_close(self, tmp_path):
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+        csv_output = CSV(findings=[], file_path=f"{tmp_path}/output.csv")
+        html_output = HTML(findings=[], file_path=f"{tmp_path}/output.html")
+        compliance_output = GenericCompliance(
+            findings=[],
+            compliance=NIST_800_53_REVISION_4_AWS,
+            file_path=f"{tmp_path}/output_nist.csv",
+        )
+        generated_outputs = {
+            "regular": [csv_output, html_output],
+            "compliance": [compliance_output],
+        }
+
+        with patch(
+            "prowler.lib.outputs.stream.Finding.generate_output",
+            side_effect=generate_output,
+        ):
+            output_stream = OutputStream(provider, MagicMock(), generated_outputs)
+            output_stream.add_findings([generate_check_report()])
+            # The files are kept open between checks
+            assert not csv_output.file_descriptor.closed
+            assert not csv_output.data
+            output_stream.add_findings([])
+            output_stream.add_findings(
+                [
+                    generate_check_report(status="FAIL"),
+                    generate_check_report(status="FAIL", muted=True),
+                ]
+            )
+            output_stream.close()
+
+        assert csv_output.file_descriptor.closed
+        assert html_output.file_descriptor.closed
+        assert compliance_output.file_descriptor.closed
+
+        with open(f"{tmp_path}/output.csv") as csv_file:
+            lines = csv_file.read().splitlines()
+        assert len(lines) == 4
+        assert lines[0].startswith("AUTH_METHOD;")
+
+        with open(f"{tmp_path}/output_nist.csv") as compliance_file:
+            lines = compliance_file.read().splitlines()
+        assert len(lines) == 5
+        assert ";MANUAL;" in lines[4]
+
+        with open(f"{tmp_path}/output.html") as html_file:
+            content = html_file.read()
+        assert content.startswith("\n<!DOCTYPE html>")
+        assert "<b>Total Findings:</b> 3" in content
+        assert content.count('<tr class="table-danger">') == 2
+        assert content.count("<td>MUTED (FAIL)</td>") == 1
+        assert content.rstrip().endswith("</html>")
+
+        stats = output_stream.stats
+        assert stats["findings_count"] == 3
+        assert stats["total_pass"] == 1
+        assert stats["total_fail"] == 2
+        assert stats["total_muted_fail"] == 1
+        assert stats["resources_count"] == 2
+        assert not stats["all_fails_are_muted"]
+
+        summary = output_stream.summary
+        assert summary.findings_count == 3
+        assert summary.pass_count == 1
+        assert summary.fail_count == 2
+        assert summary.muted_count == 1
+
+    def test_keep_asff_findings(self, tmp_path):
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+        asff_output = ASFF(findings=[], file_path=f"{tmp_path}/output.asff.json")
+
+        with patch(
+            "prowler.lib.outputs.stream.Finding.generate_output",
+            side_effect=generate_output,
+        ):
+            output_stream = OutputStream(
+                provider,
+                MagicMock(),
+                {"regular": [asff_output], "compliance": []},
+                keep_asff_findings=True,
+            )
+            output_stream.add_findings([generate_check_report()])
+            output_stream.add_findings([generate_check_report(status="FAIL")])
+            output_stream.close()
+
+        assert [
+            finding.Compliance.Status for finding in output_stream.asff_findings
+        ] == ["PASSED", "FAILED"]
+        with open(f"{tmp_path}/output.asff.json") as asff_file:
+            assert len(loads(asff_file.read())) == 2
+
+    def test_add_finding_outputs(self, tmp_path):
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+        account_output = CSV(findings=[], file_path=f"{tmp_path}/account.csv")
+        aggregated_output = CSV(findings=[], file_path=f"{tmp_path}/aggregated.csv")
+
+        with patch(
+            "prowler.lib.outputs.stream.Finding.generate_output",
+            side_effect=generate_output,
+        ):
+            account_stream = OutputStream(
+                provider, MagicMock(), {"regular": [account_output]}
+            )
+            aggregated_stream = OutputStream(
+                provider, MagicMock(), {"regular": [aggregated_output]}
+            )
+            finding_outputs = account_stream.add_findings(
+                [generate_check_report(), generate_check_report(status="FAIL")]
+            )
+            aggregated_stream.add_finding_outputs(finding_outputs)
+            aggregated_stream.add_finding_outputs(account_stream.add_findings([]))
+            account_stream.close()
+            aggregated_stream.close()
+
+        assert [finding.status for finding in finding_outputs] == ["PASS", "FAIL"]
+        with open(f"{tmp_path}/aggregated.csv") as csv_file:
+            lines = csv_file.read().splitlines()
+        assert len(lines) == 3
+        assert aggregated_stream.stats["total_pass"] == 1
+        assert aggregated_stream.stats["total_fail"] == 1
+        # The findings already transformed are not added to the summary tables
+        assert aggregated_stream.summary.findings_count == 0
+        assert account_stream.summary.findings_count == 2
+
+    def test_restore(self, tmp_path):
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+        checkpoint = SQLiteScanCheckpoint(f"{tmp_path}/output.checkpoint.db", "aws")
+        checkpoint.add_check(
+            "test-check-id",
+            [
+                generate_finding_output(status="PASS", resource_uid="resource-1"),
+                generate_finding_output(status="FAIL", resource_uid="resource-2"),
+            ],
+        )
+        # The output written before the scan was interrupted is not completed
+        with open(f"{tmp_path}/output.csv", "w") as csv_file:
+            csv_file.write("INTERRUPTED;SCAN\nINTERRUPTED")
+        csv_output = CSV(findings=[], file_path=f"{tmp_path}/output.csv")
+
+        with patch(
+            "prowler.lib.outputs.stream.Finding.generate_output",
+            side_effect=generate_output,
+        ):
+            output_stream = OutputStream(
+                provider, MagicMock(), {"regular": [csv_output], "compliance": []}
+            )
+            output_stream.restore(checkpoint)
+            output_stream.add_findings([generate_check_report(status="FAIL")])
+            output_stream.close()
+        checkpoint.close()
+
+        with open(f"{tmp_path}/output.csv") as csv_file:
+            lines = csv_file.read().splitlines()
+        assert len(lines) == 4
+        assert "INTERRUPTED" not in lines[0]
+        assert output_stream.stats["total_pass"] == 1
+        assert output_stream.stats["total_fail"] == 2
+        # The restored findings are added to the summary tables
+        assert output_stream.summary.findings_count == 3
+        assert output_stream.summary.pass_count == 1
+        assert output_stream.summary.fail_count == 2
+
+    def test_close_without_findings(self, tmp_path):
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+        csv_output = CSV(findings=[], file_path=f"{tmp_path}/output.csv")
+
+        output_stream = OutputStream(
+            provider, MagicMock(), {"regular": [csv_output], "compliance": []}
+        )
+        output_stream.close()
+
+        assert not csv_output.file_descriptor
+        assert output_stream.stats["findings_count"] == 0
+        assert output_stream.summary.all_manual
+
+
+class TestFindingsSummary:
+    def test_services_grouped_consecutively(self):
+        findings_summary = FindingsSummary()
+        findings_summary.add(
+            [
+                generate_check_report(service_name="ec2"),
+                generate_check_report(status="FAIL", service_name="ec2"),
+            ]
+        )
+        findings_summary.add(
+            [
+                generate_check_report(
+                    status="FAIL", service_name="s3", severity="critical"
+                ),
+                generate_check_report(status="MANUAL", service_name="s3"),
+            ]
+        )
+
+        services = findings_summary.services
+        assert [service["Service"] for service in services] == ["ec2", "s3"]
+        assert services[0]["Total"] == 2
+        assert services[0]["Pass"] == 1
+        assert services[0]["High"] == 1
+        assert services[1]["Critical"] == 1
+        assert not findings_summary.all_manual
+
+    def test_services_interleaved(self):
+        findings_summary = FindingsSummary()
+        # The checks of the services can be completed interleaved with --max-parallel-checks
+        findings_summary.add([generate_check_report(service_name="ec2")])
+        findings_summary.add([generate_check_report(status="FAIL", service_name="iam")])
+        findings_summary.add([generate_check_report(status="FAIL", service_name="ec2")])
+        findings_summary.add([generate_check_report(service_name="iam")])
+
+        services = findings_summary.services
+        assert [service["Service"] for service in services] == ["ec2", "iam"]
+        assert [service["Total"] for service in services] == [2, 2]
+        assert [service["Pass"] for service in services] == [1, 1]
+        assert [service["High"] for service in services] == [1, 1]
+
+    def test_get_findings(self):
+        findings_summary = FindingsSummary()
+        findings_summary.add(
+            [
+                generate_check_report(check_id="check_a"),
+                generate_check_report(check_id="check_b", status="FAIL"),
+                generate_check_report(check_id="check_a"),
+            ]
+        )
+
+        findings = list(findings_summary.get_findings())
+        assert [
+            (finding.check_metadata.CheckID, finding.status, finding.muted)
+            for finding in findings
+        ] == [
+            ("check_a", "PASS", False),
+            ("check_a", "PASS", False),
+            ("check_b", "FAIL", False),
+        ]
+
+    def test_all_manual(self):
+        findings_summary = FindingsSummary()
+        assert findings_summary.all_manual
+
+        findings_summary.add([generate_check_report(status="MANUAL")])
+        assert findings_summary.all_manual
+
+
+class TestGenerateOutputWriters:
+    def test_generate_output_writers(self, tmp_path):
+        output_options = MagicMock()
+        output_options.output_directory = str(tmp_path)
+        output_options.output_filename = "prowler-output"
+        output_options.output_modes = ["csv", "html", "nist_800_53_revision_4_aws"]
+
+        generated_outputs = generate_output_writers(
+            "aws",
+            ["csv", "html", "nist_800_53_revision_4_aws"],
+            output_options,
+            {"nist_800_53_revision_4_aws": NIST_800_53_REVISION_4_AWS},
+        )
+
+        assert [type(writer) for writer in generated_outputs["regular"]] == [
+            CSV,
+            HTML,
+        ]
+        assert generated_outputs["regular"][0].file_path == (
+            f"{tmp_path}/prowler-output.csv"
+        )
+        assert [type(writer) for writer in generated_outputs["compliance"]] == [
+            GenericCompliance
+        ]
+        assert generated_outputs["compliance"][0].file_path == (
+            f"{tmp_path}/compliance/prowler-output_nist_800_53_revision_4_aws.csv"
+        )
@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from prowler.lib.scan.checkpoint import SQLiteScanCheckpoint
+from prowler.lib.scan.exceptions.exceptions import ScanCheckpointMismatchError
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+
+
+class TestSQLiteScanCheckpoint:
+    def test_add_check(self, tmp_path):
+        file_path = f"{tmp_path}/scan.checkpoint.db"
+        findings = [
+            generate_finding_output(status="FAIL", resource_uid="resource-1"),
+            generate_finding_output(
+                status="PASS", muted=True, resource_uid="resource-2"
+            ),
+        ]
+
+        checkpoint = SQLiteScanCheckpoint(file_path, "aws")
+        assert checkpoint.completed_checks == set()
+        checkpoint.add_check("service_test_check_id", findings)
+        checkpoint.add_check("service_check_without_findings", [])
+        checkpoint.close()
+
+        # The checkpoint is kept when the scan is interrupted
+        checkpoint = SQLiteScanCheckpoint(file_path, "aws")
+        assert checkpoint.file_path == file_path
+        assert checkpoint.completed_checks == {
+            "service_test_check_id",
+            "service_check_without_findings",
+        }
+        assert list(checkpoint.get_findings()) == [findings]
+        checkpoint.close()
+
+    def test_add_check_again(self, tmp_path):
+        checkpoint = SQLiteScanCheckpoint(f"{tmp_path}/scan.checkpoint.db", "aws")
+        checkpoint.add_check(
+            "service_test_check_id", [generate_finding_output(status="FAIL")]
+        )
+        finding = generate_finding_output(status="PASS")
+        checkpoint.add_check("service_test_check_id", [finding])
+
+        assert list(checkpoint.get_findings()) == [[finding]]
+        checkpoint.close()
+
+    def test_provider_mismatch(self, tmp_path):
+        file_path = f"{tmp_path}/scan.checkpoint.db"
+        SQLiteScanCheckpoint(file_path, "aws").close()
+
+        with pytest.raises(ScanCheckpointMismatchError):
+            SQLiteScanCheckpoint(file_path, "gcp")
+
+    def test_delete(self, tmp_path):
+        file_path = f"{tmp_path}/scan.checkpoint.db"
+        checkpoint = SQLiteScanCheckpoint(file_path, "aws")
+        checkpoint.add_check("service_test_check_id", [generate_finding_output()])
+        checkpoint.delete()
+
+        assert os.listdir(tmp_path) == []
@@ -5,6 +5,7 @@ from unittest import mock
 import pytest
 from mock import MagicMock, patch
 
+from prowler.lib.scan.checkpoint import SQLiteScanCheckpoint
 from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidCategoryError,
     ScanInvalidCheckError,
@@ -75,7 +76,9 @@ def mock_generate_output():
     with mock.patch(
         "prowler.lib.outputs.finding.Finding.generate_output", autospec=True
     ) as mock_gen_output:
-        mock_gen_output.side_effect = lambda provider, finding, output_options: finding
+        mock_gen_output.side_effect = (
+            lambda provider, finding, output_options, context=None: finding
+        )
         yield mock_gen_output
 
 
@@ -423,3 +426,135 @@ class TestScan:
         results = list(scan.scan(custom_checks_metadata))
 
         assert results[0] == (100.0, [])
+
+    @patch("importlib.import_module")
+    def test_scan_max_parallel_checks(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_generate_output,
+        mock_recover_checks_from_provider,
+        mock_load_check_metadata,
+    ):
+        mock_check_class = MagicMock()
+        mock_check_instance = mock_check_class.return_value
+        mock_check_instance.Provider = "aws"
+        mock_check_instance.CheckID = "accessanalyzer_enabled"
+        mock_check_instance.CheckTitle = "Check if IAM Access Analyzer is enabled"
+        mock_check_instance.Categories = []
+
+        mock_import_module.return_value = MagicMock(
+            accessanalyzer_enabled=mock_check_class
+        )
+
+        checks_to_execute = {"accessanalyzer_enabled"}
+        mock_global_provider.type = "aws"
+
+        scan = Scan(
+            mock_global_provider, checks=checks_to_execute, max_parallel_checks=4
+        )
+        assert scan.max_parallel_checks == 4
+        results = list(scan.scan({}))
+
+        assert mock_execute.call_count == 1
+        assert len(results) == 1
+        assert results[0][0] == 100.0
+        assert scan.service_checks_to_execute == {}
+        assert scan.service_checks_completed == {
+            "accessanalyzer": {"accessanalyzer_enabled"},
+        }
+        assert mock_global_provider.audit_metadata.completed_checks == 1
+        assert mock_global_provider.audit_metadata.services_scanned == 1
+
+    @patch("importlib.import_module")
+    def test_scan_evict_completed_services(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_generate_output,
+        mock_recover_checks_from_provider,
+        mock_load_check_metadata,
+    ):
+        mock_check_class = MagicMock()
+        mock_check_instance = mock_check_class.return_value
+        mock_check_instance.Provider = "aws"
+        mock_check_instance.CheckID = "accessanalyzer_enabled"
+        mock_check_instance.CheckTitle = "Check if IAM Access Analyzer is enabled"
+        mock_check_instance.Categories = []
+
+        mock_import_module.return_value = MagicMock(
+            accessanalyzer_enabled=mock_check_class
+        )
+
+        checks_to_execute = {"accessanalyzer_enabled"}
+        mock_global_provider.type = "aws"
+
+        scan = Scan(
+            mock_global_provider,
+            checks=checks_to_execute,
+            evict_completed_services=True,
+        )
+        with patch("prowler.lib.check.eviction.get_memory_usage", return_value=2048):
+            results = list(scan.scan({}))
+
+        assert len(results) == 1
+        assert results[0][0] == 100.0
+        assert scan.service_memory_usage == {"accessanalyzer": 2048}
+
+    @patch("importlib.import_module")
+    def test_scan_checkpoint(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_generate_output,
+        mock_recover_checks_from_provider,
+        mock_load_check_metadata,
+        tmp_path,
+    ):
+        mock_check_class = MagicMock()
+        mock_import_module.return_value = MagicMock(
+            accessanalyzer_enabled=mock_check_class
+        )
+        mock_global_provider.type = "aws"
+        checkpoint = SQLiteScanCheckpoint(f"{tmp_path}/scan.checkpoint.db", "aws")
+
+        scan = Scan(
+            mock_global_provider,
+            checks={"accessanalyzer_enabled"},
+            checkpoint=checkpoint,
+        )
+        results = list(scan.scan({}))
+
+        assert len(results) == 1
+        # The check is recorded once its findings are consumed
+        assert checkpoint.completed_checks == {"accessanalyzer_enabled"}
+        assert list(checkpoint.get_findings()) == [[finding]]
+
+    @patch("importlib.import_module")
+    def test_scan_checkpoint_resumed(
+        mock_import_module,
+        mock_global_provider,
+        mock_execute,
+        mock_generate_output,
+        mock_recover_checks_from_provider,
+        mock_load_check_metadata,
+    ):
+        mock_global_provider.type = "aws"
+        checkpoint = MagicMock()
+        checkpoint.completed_checks = {"accessanalyzer_enabled"}
+
+        scan = Scan(
+            mock_global_provider,
+            checks={"accessanalyzer_enabled"},
+            checkpoint=checkpoint,
+        )
+        # The checks completed before the scan was interrupted count as completed
+        assert scan.progress == 100.0
+        assert scan.service_checks_to_execute == {}
+        assert scan.service_checks_completed == {
+            "accessanalyzer": {"accessanalyzer_enabled"},
+        }
+
+        assert list(scan.scan({})) == []
+        mock_execute.assert_not_called()
+        checkpoint.add_check.assert_not_called()
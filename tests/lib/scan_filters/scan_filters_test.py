@@ -1,4 +1,8 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import (
+    AuditResourcesFilter,
+    get_audit_resources_filter,
+    is_resource_filtered,
+)
 
 
 class Test_Scan_Filters:
@@ -15,3 +19,52 @@ class Test_Scan_Filters:
         )
         assert is_resource_filtered("test_bucket", audit_resources)
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_prefix(self):
+        audit_resources = ["arn:aws:s3:::test_bucket/object"]
+        assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+        assert not is_resource_filtered("arn:aws:s3:::test_bucket2", audit_resources)
+
+    def test_is_resource_filtered_nested_arn(self):
+        audit_resources = [
+            "arn:aws:iam::123456789012:role/arn:aws:s3:::test_bucket",
+        ]
+        assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+        assert not is_resource_filtered("arn:aws:s3:::other_bucket", audit_resources)
+
+    def test_is_resource_filtered_with_filter(self):
+        audit_resources = AuditResourcesFilter(["arn:aws:s3:::test_bucket"])
+        assert is_resource_filtered("test_bucket", audit_resources)
+        assert not is_resource_filtered("other_bucket", audit_resources)
+
+    def test_is_resource_filtered_substring(self):
+        audit_resources = AuditResourcesFilter(
+            [
+                "arn:aws:ec2:eu-west-1:123456789012:instance/i-0123456789abcdef0",
+                "arn:aws:s3:::test_bucket",
+            ]
+        )
+        assert audit_resources.is_filtered("i-0123456789abcdef0")
+        assert audit_resources.is_filtered("instance/i-0123456789abcdef0")
+        assert audit_resources.is_filtered("test_buck")
+        assert audit_resources.is_filtered("s3")
+        assert not audit_resources.is_filtered("i-0123456789abcdef1")
+        assert not audit_resources.is_filtered("test_bucket_instance")
+        assert not audit_resources.is_filtered("zz")
+
+    def test_audit_resources_filter_empty(self):
+        audit_resources = AuditResourcesFilter([])
+        assert not audit_resources
+        assert len(audit_resources) == 0
+        assert not audit_resources.is_filtered("test_bucket")
+
+    def test_get_audit_resources_filter_reused(self):
+        audit_resources = ["arn:aws:s3:::test_bucket"]
+        audit_resources_filter = get_audit_resources_filter(audit_resources)
+
+        assert audit_resources_filter.audit_resources is audit_resources
+        assert get_audit_resources_filter(audit_resources) is audit_resources_filter
+        assert (
+            get_audit_resources_filter(list(audit_resources))
+            is not audit_resources_filter
+        )
@@ -11,12 +11,20 @@ import botocore
 import botocore.exceptions
 import pytest
 from boto3 import client, resource, session
+from botocore.config import Config
 from mock import patch
 from moto import mock_aws
 from pytest import raises
 from tzlocal import get_localzone
 
-from prowler.providers.aws.aws_provider import AwsProvider, get_aws_region_for_sts
+from prowler.lib.utils.utils import parse_json_file
+from prowler.providers.aws.aws_provider import (
+    AwsProvider,
+    get_aws_region_for_sts,
+    get_aws_regions_index,
+    invalidate_aws_regions_cache,
+    read_aws_regions_file,
+)
 from prowler.providers.aws.config import (
     AWS_STS_GLOBAL_ENDPOINT_REGION,
     BOTO3_USER_AGENT_EXTRA,
@@ -869,6 +877,51 @@ aws:
 
         assert response == {}
 
+    @mock_aws
+    def test_get_client_memoized(self):
+        aws_provider = AwsProvider()
+        aws_provider._audit_config = {"threading_max_workers": 20}
+
+        client = aws_provider.get_client("ec2", AWS_REGION_EU_WEST_1)
+
+        assert aws_provider.get_client("ec2", AWS_REGION_EU_WEST_1) is client
+        assert aws_provider.get_client("ec2", AWS_REGION_US_EAST_1) is not client
+        assert (
+            aws_provider.generate_regional_clients("ec2")[AWS_REGION_EU_WEST_1]
+            is client
+        )
+        assert client.meta.config.max_pool_connections == 20
+        assert client.meta.config.retries["mode"] == "standard"
+
+    @mock_aws
+    def test_get_client_with_config(self):
+        aws_provider = AwsProvider()
+        client = aws_provider.get_client("iam", AWS_REGION_US_EAST_1)
+
+        adaptive_client = aws_provider.get_client(
+            "iam", AWS_REGION_US_EAST_1, config=Config(retries={"mode": "adaptive"})
+        )
+
+        assert adaptive_client is not client
+        assert adaptive_client.meta.config.retries["mode"] == "adaptive"
+        assert (
+            aws_provider.get_client(
+                "iam",
+                AWS_REGION_US_EAST_1,
+                config=Config(retries={"mode": "adaptive"}),
+            )
+            is adaptive_client
+        )
+
+    @mock_aws
+    def test_get_client_new_session(self):
+        aws_provider = AwsProvider()
+        client = aws_provider.get_client("ec2", AWS_REGION_EU_WEST_1)
+
+        aws_provider._session.current_session = session.Session()
+
+        assert aws_provider.get_client("ec2", AWS_REGION_EU_WEST_1) is not client
+
     @mock_aws
     def test_get_default_region(self):
         region = [AWS_REGION_EU_WEST_1]
@@ -972,9 +1025,12 @@ aws:
                 }
             },
         ):
+            # Read the patched file instead of the cached one
+            invalidate_aws_regions_cache()
             assert aws_provider.get_available_aws_service_regions(
                 "ec2", "aws", {AWS_REGION_US_EAST_1}
             ) == {AWS_REGION_US_EAST_1}
+        invalidate_aws_regions_cache()
 
     @mock_aws
     def test_get_available_aws_service_regions_with_all_regions_audited(self):
@@ -1010,9 +1066,12 @@ aws:
                 }
             },
         ):
+            # Read the patched file instead of the cached one
+            invalidate_aws_regions_cache()
             assert (
                 len(aws_provider.get_available_aws_service_regions("ec2", "aws")) == 17
             )
+        invalidate_aws_regions_cache()
 
     @mock_aws
     def test_get_tagged_resources(self):
@@ -1073,6 +1132,10 @@ aws:
         )
 
         assert aws_provider.audit_resources == [AWS_ACCOUNT_ARN]
+        assert aws_provider.audit_resources_filter is (
+            aws_provider.audit_resources_filter
+        )
+        assert aws_provider.audit_resources_filter.is_filtered(AWS_ACCOUNT_ARN)
 
     @mock_aws
     def test_validate_credentials_commercial_partition_with_regions(self):
@@ -1850,6 +1913,65 @@ aws:
             assert exception.type == AWSInvalidPartitionError
         assert f"Invalid partition: {partition}" in exception.value.args[0]
 
+    def test_get_regions_with_partition_not_in_file(self):
+        with patch(
+            "prowler.providers.aws.aws_provider.read_aws_regions_file",
+            return_value={
+                "services": {
+                    "acm": {
+                        "regions": {
+                            "aws": [
+                                "af-south-1",
+                            ],
+                        }
+                    }
+                }
+            },
+        ):
+            with pytest.raises(AWSInvalidPartitionError) as exception:
+                AwsProvider.get_regions("aws-cn")
+
+        assert "Invalid partition: aws-cn" in exception.value.args[0]
+
+    def test_read_aws_regions_file_is_cached(self):
+        invalidate_aws_regions_cache()
+        with patch(
+            "prowler.providers.aws.aws_provider.parse_json_file",
+            wraps=parse_json_file,
+        ) as mock_parse_json_file:
+            data = read_aws_regions_file()
+            assert read_aws_regions_file() is data
+            assert get_aws_regions_index() is get_aws_regions_index()
+            assert mock_parse_json_file.call_count == 1
+
+            invalidate_aws_regions_cache()
+            assert read_aws_regions_file() is not data
+            assert mock_parse_json_file.call_count == 2
+
+    def test_read_aws_regions_file_is_read_only(self):
+        data = read_aws_regions_file()
+        with pytest.raises(TypeError):
+            data["services"]["acm"] = {}
+        with pytest.raises(TypeError):
+            data["services"]["acm"]["regions"]["aws"] = []
+        assert isinstance(data["services"]["acm"]["regions"]["aws"], tuple)
+
+    def test_get_aws_regions_index_rebuilt_when_data_changes(self):
+        index = get_aws_regions_index()
+        with patch(
+            "prowler.providers.aws.aws_provider.read_aws_regions_file",
+            return_value={"services": {"acm": {"regions": {"aws": ["af-south-1"]}}}},
+        ):
+            assert get_aws_regions_index() is not index
+            assert get_aws_regions_index().services == {"acm"}
+        assert get_aws_regions_index().source is read_aws_regions_file()
+
+    def test_get_available_aws_service_regions_returns_a_copy(self):
+        regions = AwsProvider.get_available_aws_service_regions("acm", "aws")
+        regions.clear()
+
+        assert AwsProvider.get_available_aws_service_regions("acm", "aws")
+
     def test_get_aws_region_for_sts_input_regions_none_session_region_none(self):
         input_regions = None
         session_region = None
@@ -1001,6 +1001,33 @@ class TestAWSMutelist:
             mutelist.is_muted(AWS_ACCOUNT_NUMBER, "check_test", "us-east-2", "test", "")
         )
 
+    def test_mutelist_index_rebuilt_when_mutelist_replaced(self):
+        mutelist_content = {
+            "Accounts": {
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "check_test": {
+                            "Regions": [AWS_REGION_US_EAST_1],
+                            "Resources": ["prowler"],
+                        }
+                    }
+                }
+            }
+        }
+        mutelist = AWSMutelist(mutelist_content=mutelist_content)
+
+        mutelist_index = mutelist.mutelist_index
+        assert mutelist.mutelist_index is mutelist_index
+        assert mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER, "check_test", AWS_REGION_US_EAST_1, "prowler", ""
+        )
+
+        mutelist._mutelist = {}
+        assert mutelist.mutelist_index is not mutelist_index
+        assert not mutelist.is_muted(
+            AWS_ACCOUNT_NUMBER, "check_test", AWS_REGION_US_EAST_1, "prowler", ""
+        )
+
     def test_is_muted_search(self):
         # Mutelist
         mutelist_content = {
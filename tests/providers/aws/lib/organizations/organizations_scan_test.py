@@ -0,0 +1,338 @@
+import os
+from argparse import Namespace
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from prowler.providers.aws.exceptions.exceptions import AWSAssumeRoleError
+from prowler.providers.aws.lib.organizations.organizations import (
+    list_organizations_accounts,
+)
+from prowler.providers.aws.lib.organizations.organizations_scan import (
+    STS_THROTTLING_MAX_ATTEMPTS,
+    init_organizations_account_provider,
+    is_throttling_error,
+    scan_organizations_accounts,
+)
+from prowler.providers.aws.models import AWSOrganizationsScanCatalog
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_US_EAST_1
+
+ORGANIZATIONS_SCAN_ROLE = "ProwlerScanRole"
+
+
+def generate_arguments(**kwargs) -> Namespace:
+    arguments = Namespace(
+        organizations_scan_role=ORGANIZATIONS_SCAN_ROLE,
+        organizations_role=None,
+        aws_retries_max_attempts=None,
+        session_duration=3600,
+        external_id=None,
+        role_session_name="ProwlerAssessmentSession",
+        profile=None,
+        region=None,
+        scan_unused_services=False,
+        resource_tag=None,
+        config_file=None,
+        mutelist_file=None,
+        fixer_config=None,
+        output_filename=None,
+        output_formats=["csv"],
+        only_logs=False,
+        max_parallel_checks=1,
+        prefetch_services=0,
+        evict_completed_services=False,
+    )
+    for key, value in kwargs.items():
+        setattr(arguments, key, value)
+    return arguments
+
+
+def throttling_error() -> AWSAssumeRoleError:
+    return AWSAssumeRoleError(
+        original_exception=ClientError(
+            {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}},
+            "AssumeRole",
+        )
+    )
+
+
+class FakeOutputStream:
+    def __init__(self, provider, output_options, generated_outputs):
+        self._account_id = provider.identity.account
+        self._findings_count = 0
+
+    def add_findings(self, check_findings: list) -> list:
+        finding_outputs = [
+            generate_finding_output(
+                account_uid=self._account_id,
+                resource_uid=f"{self._account_id}-{check_finding}",
+            )
+            for check_finding in check_findings
+        ]
+        self._findings_count += len(finding_outputs)
+        return finding_outputs
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def stats(self) -> dict:
+        return {"total_pass": self._findings_count, "total_fail": 0}
+
+
+def init_account_provider(arguments, account_id, partition):
+    if account_id == "222222222222":
+        raise AWSAssumeRoleError(message="Access denied")
+    provider = MagicMock()
+    provider.identity.account = account_id
+    return provider
+
+
+def execute_account_checks(*args):
+    findings_handler = args[-1]
+    findings_handler(["check_1", "check_2"])
+    findings_handler([])
+    findings_handler(["check_3"])
+
+
+def execute_account_checks_killed(*args):
+    findings_handler = args[-1]
+    findings_handler(["check_1"])
+    # The process is killed by the OS, e.g. when it runs out of memory
+    if args[1].identity.account == "333333333333":
+        os._exit(137)
+
+
+class Test_AWS_Organizations_Scan:
+    @mock_aws
+    def test_list_organizations_accounts(self):
+        client = boto3.client("organizations", region_name=AWS_REGION_US_EAST_1)
+        client.create_organization(FeatureSet="ALL")
+        account_ids = [
+            client.create_account(
+                AccountName=f"account-{account}",
+                Email=f"account-{account}@example.com",
+            )["CreateAccountStatus"]["AccountId"]
+            for account in range(3)
+        ]
+
+        accounts = list_organizations_accounts(
+            boto3.Session(), excluded_accounts=[account_ids[0]]
+        )
+
+        assert sorted(account["Id"] for account in accounts) == sorted(
+            [AWS_ACCOUNT_NUMBER] + account_ids[1:]
+        )
+        assert all(account["Status"] == "ACTIVE" for account in accounts)
+
+    def test_is_throttling_error(self):
+        assert is_throttling_error(throttling_error())
+        assert is_throttling_error(
+            ClientError(
+                {"Error": {"Code": "RequestLimitExceeded", "Message": ""}},
+                "GetCallerIdentity",
+            )
+        )
+        assert not is_throttling_error(
+            AWSAssumeRoleError(
+                original_exception=ClientError(
+                    {"Error": {"Code": "AccessDenied", "Message": ""}},
+                    "AssumeRole",
+                )
+            )
+        )
+        assert not is_throttling_error(Exception("Throttling"))
+
+    @patch("prowler.providers.aws.lib.organizations.organizations_scan.time.sleep")
+    def test_init_organizations_account_provider_retries_throttling(self, sleep):
+        provider = MagicMock()
+        with patch(
+            "prowler.providers.aws.lib.organizations.organizations_scan.AwsProvider",
+            side_effect=[throttling_error(), throttling_error(), provider],
+        ) as aws_provider:
+            assert (
+                init_organizations_account_provider(
+                    generate_arguments(), "111111111111", "aws"
+                )
+                is provider
+            )
+
+        assert aws_provider.call_count == 3
+        assert (
+            aws_provider.call_args.kwargs["role_arn"]
+            == f"arn:aws:iam::111111111111:role/{ORGANIZATIONS_SCAN_ROLE}"
+        )
+        assert sleep.call_count == 2
+
+    @patch("prowler.providers.aws.lib.organizations.organizations_scan.time.sleep")
+    def test_init_organizations_account_provider_throttling_attempts(self, sleep):
+        with patch(
+            "prowler.providers.aws.lib.organizations.organizations_scan.AwsProvider",
+            side_effect=throttling_error(),
+        ) as aws_provider:
+            with pytest.raises(AWSAssumeRoleError):
+                init_organizations_account_provider(
+                    generate_arguments(), "111111111111", "aws"
+                )
+
+        assert aws_provider.call_count == STS_THROTTLING_MAX_ATTEMPTS
+        assert sleep.call_count == STS_THROTTLING_MAX_ATTEMPTS - 1
+
+    @patch("prowler.providers.aws.lib.organizations.organizations_scan.time.sleep")
+    def test_init_organizations_account_provider_other_errors(self, sleep):
+        with patch(
+            "prowler.providers.aws.lib.organizations.organizations_scan.AwsProvider",
+            side_effect=AWSAssumeRoleError(message="Access denied"),
+        ) as aws_provider:
+            with pytest.raises(AWSAssumeRoleError):
+                init_organizations_account_provider(
+                    generate_arguments(), "111111111111", "aws"
+                )
+
+        aws_provider.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_scan_organizations_accounts(self):
+        accounts = [
+            {"Id": "111111111111", "Name": "account-1"},
+            {"Id": "222222222222", "Name": "account-2"},
+            {"Id": "333333333333", "Name": "account-3"},
+        ]
+        catalog = AWSOrganizationsScanCatalog(
+            bulk_checks_metadata={},
+            bulk_compliance_frameworks={},
+            checks_to_execute=["check_1"],
+        )
+        aggregated_findings = []
+
+        # The processes of the pool are forked, so they use the patched functions
+        with (
+            patch(
+                "prowler.providers.aws.lib.organizations.organizations_scan.init_organizations_account_provider",
+                new=init_account_provider,
+            ),
+            patch(
+                "prowler.providers.aws.lib.organizations.organizations_scan.execute_checks",
+                new=execute_account_checks,
+            ),
+            patch(
+                "prowler.providers.aws.lib.organizations.organizations_scan.OutputStream",
+                new=FakeOutputStream,
+            ),
+            patch(
+                "prowler.providers.aws.lib.organizations.organizations_scan.AWSOutputOptions"
+            ),
+            patch(
+                "prowler.providers.aws.lib.organizations.organizations_scan.generate_output_writers",
+                return_value={"regular": [], "compliance": []},
+            ),
+        ):
+            account_scans = scan_organizations_accounts(
+                generate_arguments(),
+                accounts,
+                "aws",
+                catalog,
+                aggregated_findings.extend,
+                processes=2,
+            )
+
+        assert [account_scan.account_id for account_scan in account_scans] == [
+            "111111111111",
+            "222222222222",
+            "333333333333",
+        ]
+        assert [account_scan.status for account_scan in account_scans] == [
+            "completed",
+            "failed",
+            "completed",
+        ]
+        # The error of an account does not stop the scan of the others
+        assert "Access denied" in account_scans[1].error
+        assert account_scans[0].stats == {"total_pass": 3, "total_fail": 0}
+        assert account_scans[1].stats == {}
+        assert sorted(finding.resource_uid for finding in aggregated_findings) == [
+            "111111111111-check_1",
+            "111111111111-check_2",
+            "111111111111-check_3",
+            "333333333333-check_1",
+            "333333333333-check_2",
+            "333333333333-check_3",
+        ]
+
+    def test_scan_organizations_accounts_process_killed(self):
+        accounts = [
+            {"Id": "111111111111", "Name": "account-1"},
+            {"Id": "222222222222", "Name": "account-2"},
+            {"Id": "333333333333", "Name": "account-3"},
+        ]
+        catalog = AWSOrganizationsScanCatalog(
+            bulk_checks_metadata={},
+            bulk_compliance_frameworks={},
+            checks_to_execute=["check_1"],
+        )
+        aggregated_findings = []
+
+        with (
+            patch(
+                "prowler.providers.aws.lib.organizations.organizations_scan.init_organizations_account_provider",
+                new=init_account_provider,
+            ),
+            patch(
+                "prowler.providers.aws.lib.organizations.organizations_scan.execute_checks",
+                new=execute_account_checks_killed,
+            ),
+            patch(
+                "prowler.providers.aws.lib.organizations.organizations_scan.OutputStream",
+                new=FakeOutputStream,
+            ),
+            patch(
+                "prowler.providers.aws.lib.organizations.organizations_scan.AWSOutputOptions"
+            ),
+            patch(
+                "prowler.providers.aws.lib.organizations.organizations_scan.generate_output_writers",
+                return_value={"regular": [], "compliance": []},
+            ),
+        ):
+            account_scans = scan_organizations_accounts(
+                generate_arguments(),
+                accounts,
+                "aws",
+                catalog,
+                aggregated_findings.extend,
+                processes=2,
+            )
+
+        # The account whose process was killed is failed instead of blocking the scan
+        assert [account_scan.status for account_scan in account_scans] == [
+            "completed",
+            "failed",
+            "failed",
+        ]
+        assert "Access denied" in account_scans[1].error
+        assert account_scans[2].account_name == "account-3"
+        assert (
+            account_scans[2].error
+            == "The process scanning the account exited with code 137"
+        )
+        # The findings not yet sent by the killed process are lost
+        assert "111111111111-check_1" in [
+            finding.resource_uid for finding in aggregated_findings
+        ]
+
+    def test_scan_organizations_accounts_without_accounts(self):
+        findings_handler = MagicMock()
+        assert (
+            scan_organizations_accounts(
+                generate_arguments(),
+                [],
+                "aws",
+                AWSOrganizationsScanCatalog({}, {}, []),
+                findings_handler,
+            )
+            == []
+        )
+        findings_handler.assert_not_called()
@@ -0,0 +1,76 @@
+from types import MappingProxyType
+
+import pytest
+
+from prowler.providers.aws.lib.regions.regions import AWSRegionsIndex
+
+AWS_REGIONS_DATA = {
+    "services": {
+        "acm": {
+            "regions": {
+                "aws": ["eu-west-1", "us-east-1"],
+                "aws-cn": ["cn-north-1"],
+                "aws-us-gov": ["us-gov-west-1"],
+            }
+        },
+        "bedrock": {
+            "regions": {
+                "aws": ["us-east-1", "us-west-2"],
+                "aws-cn": [],
+                "aws-us-gov": ["us-gov-west-1"],
+            }
+        },
+    }
+}
+
+
+class TestAWSRegionsIndex:
+    def test_services_and_partitions(self):
+        index = AWSRegionsIndex(AWS_REGIONS_DATA)
+
+        assert index.source is AWS_REGIONS_DATA
+        assert index.services == {"acm", "bedrock"}
+        assert index.partitions == {"aws", "aws-cn", "aws-us-gov"}
+        assert index.is_service("acm")
+        assert not index.is_service("unknown")
+
+    def test_get_service_regions(self):
+        index = AWSRegionsIndex(AWS_REGIONS_DATA)
+
+        assert index.get_service_regions("acm", "aws") == {"eu-west-1", "us-east-1"}
+        assert index.get_service_regions("bedrock", "aws-cn") == frozenset()
+        assert isinstance(index.get_service_regions("acm", "aws"), frozenset)
+
+    def test_get_service_regions_unknown(self):
+        index = AWSRegionsIndex(AWS_REGIONS_DATA)
+
+        with pytest.raises(KeyError):
+            index.get_service_regions("unknown", "aws")
+        with pytest.raises(KeyError):
+            index.get_service_regions("acm", "aws-iso")
+
+    def test_get_partition_regions(self):
+        index = AWSRegionsIndex(AWS_REGIONS_DATA)
+
+        assert index.get_partition_regions("aws") == {
+            "eu-west-1",
+            "us-east-1",
+            "us-west-2",
+        }
+        assert index.get_partition_regions("aws-cn") == {"cn-north-1"}
+        assert index.get_partition_regions() == {
+            "eu-west-1",
+            "us-east-1",
+            "us-west-2",
+            "cn-north-1",
+            "us-gov-west-1",
+        }
+        with pytest.raises(KeyError):
+            index.get_partition_regions("aws-iso")
+
+    def test_index_is_immutable(self):
+        index = AWSRegionsIndex(AWS_REGIONS_DATA)
+
+        assert isinstance(index._service_regions, MappingProxyType)
+        with pytest.raises(TypeError):
+            index._service_regions["acm"]["aws"] = frozenset()
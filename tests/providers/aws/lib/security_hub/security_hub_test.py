@@ -4,14 +4,17 @@ from logging import WARNING
 import botocore
 from boto3 import session
 from botocore.client import ClientError
-from mock import patch
+from mock import MagicMock, patch
 
 from prowler.lib.outputs.asff.asff import ASFF
 from prowler.providers.aws.lib.security_hub.exceptions.exceptions import (
     SecurityHubInvalidRegionError,
     SecurityHubNoEnabledRegionsError,
 )
-from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
+from prowler.providers.aws.lib.security_hub.security_hub import (
+    SECURITY_HUB_MAX_RETRIES,
+    SecurityHub,
+)
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
@@ -409,6 +412,186 @@ class TestSecurityHub:
 
         assert security_hub.batch_send_to_security_hub() == 2
 
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_batch_send_to_security_hub_in_batches(self):
+        findings = [
+            generate_finding_output(resource_uid=f"resource-{finding}")
+            for finding in range(250)
+        ]
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+            findings=ASFF(findings=findings).data,
+        )
+        security_hub_client = MagicMock()
+        security_hub_client.batch_import_findings.side_effect = lambda Findings: {
+            "FailedCount": 0,
+            "SuccessCount": len(Findings),
+        }
+        security_hub._enabled_regions[AWS_REGION_EU_WEST_1] = security_hub_client
+
+        assert security_hub.batch_send_to_security_hub() == 250
+        assert sorted(
+            len(call.kwargs["Findings"])
+            for call in security_hub_client.batch_import_findings.call_args_list
+        ) == [50, 100, 100]
+
+    @patch("prowler.providers.aws.lib.security_hub.security_hub.sleep")
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_batch_send_to_security_hub_retries_failed_findings(self, sleep):
+        findings = ASFF(
+            findings=[
+                generate_finding_output(resource_uid=f"resource-{finding}")
+                for finding in range(3)
+            ]
+        ).data
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+            findings=findings,
+        )
+        security_hub_client = MagicMock()
+        security_hub_client.batch_import_findings.side_effect = [
+            {
+                "FailedCount": 2,
+                "SuccessCount": 1,
+                "FailedFindings": [
+                    {
+                        "Id": findings[1].Id,
+                        "ErrorCode": "InternalException",
+                        "ErrorMessage": "Internal error",
+                    },
+                    {
+                        "Id": findings[2].Id,
+                        "ErrorCode": "InvalidInput",
+                        "ErrorMessage": "Invalid finding",
+                    },
+                ],
+            },
+            {"FailedCount": 0, "SuccessCount": 1},
+        ]
+        security_hub._enabled_regions[AWS_REGION_EU_WEST_1] = security_hub_client
+
+        assert security_hub.batch_send_to_security_hub() == 2
+        # Only the finding with a retryable error is sent again
+        retried_findings = security_hub_client.batch_import_findings.call_args_list[
+            1
+        ].kwargs["Findings"]
+        assert [finding["Id"] for finding in retried_findings] == [findings[1].Id]
+        sleep.assert_called_once()
+
+    @patch("prowler.providers.aws.lib.security_hub.security_hub.sleep")
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_batch_send_to_security_hub_retries_exhausted(self, sleep, caplog):
+        findings = ASFF(findings=[generate_finding_output()]).data
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+            findings=findings,
+        )
+        security_hub_client = MagicMock()
+        security_hub_client.batch_import_findings.return_value = {
+            "FailedCount": 1,
+            "SuccessCount": 0,
+            "FailedFindings": [
+                {
+                    "Id": findings[0].Id,
+                    "ErrorCode": "InternalException",
+                    "ErrorMessage": "Internal error",
+                }
+            ],
+        }
+        security_hub._enabled_regions[AWS_REGION_EU_WEST_1] = security_hub_client
+
+        assert security_hub.batch_send_to_security_hub() == 0
+        assert (
+            security_hub_client.batch_import_findings.call_count
+            == SECURITY_HUB_MAX_RETRIES + 1
+        )
+        assert sleep.call_count == SECURITY_HUB_MAX_RETRIES
+        assert (
+            f"Failed to send 1 findings to AWS Security Hub in region {AWS_REGION_EU_WEST_1} -- InternalException -- Internal error"
+            in caplog.text
+        )
+
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_archive_previous_findings(self):
+        findings = ASFF(
+            findings=[
+                generate_finding_output(resource_uid=f"resource-{finding}")
+                for finding in range(2)
+            ]
+        ).data
+        security_hub = SecurityHub(
+            aws_session=session.Session(
+                region_name=AWS_REGION_EU_WEST_1,
+            ),
+            aws_account_id=AWS_ACCOUNT_NUMBER,
+            aws_partition=AWS_COMMERCIAL_PARTITION,
+            aws_security_hub_available_regions=[AWS_REGION_EU_WEST_1],
+            findings=findings,
+        )
+        previous_findings_ids = [
+            f"previous-finding-{finding}" for finding in range(150)
+        ]
+        security_hub_client = MagicMock()
+        security_hub_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Findings": [{"Id": findings[0].Id, "RecordState": "ACTIVE"}]
+                + [
+                    {"Id": finding_id, "RecordState": "ACTIVE"}
+                    for finding_id in previous_findings_ids[:99]
+                ]
+            },
+            {
+                "Findings": [{"Id": findings[1].Id, "RecordState": "ACTIVE"}]
+                + [
+                    {"Id": finding_id, "RecordState": "ACTIVE"}
+                    for finding_id in previous_findings_ids[99:]
+                ]
+            },
+        ]
+        security_hub_client.batch_import_findings.side_effect = lambda Findings: {
+            "FailedCount": 0,
+            "SuccessCount": len(Findings),
+        }
+        security_hub._enabled_regions[AWS_REGION_EU_WEST_1] = security_hub_client
+
+        assert security_hub.archive_previous_findings() == 150
+        archived_findings = [
+            finding
+            for call in security_hub_client.batch_import_findings.call_args_list
+            for finding in call.kwargs["Findings"]
+        ]
+        # The findings of the current execution are not archived
+        assert sorted(finding["Id"] for finding in archived_findings) == sorted(
+            previous_findings_ids
+        )
+        assert all(
+            finding["RecordState"] == "ARCHIVED" for finding in archived_findings
+        )
+        security_hub_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Filters={
+                "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
+                "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
+                "AwsAccountId": [{"Value": AWS_ACCOUNT_NUMBER, "Comparison": "EQUALS"}],
+                "Region": [{"Value": AWS_REGION_EU_WEST_1, "Comparison": "EQUALS"}],
+            },
+            PaginationConfig={"PageSize": 100},
+        )
+
     @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
     def test_security_hub_test_connection_success(self):
         session_mock = session.Session(region_name=AWS_REGION_EU_WEST_1)
@@ -0,0 +1,70 @@
+from threading import Condition
+
+from mock import patch
+
+from prowler.providers.aws.lib.service.concurrency import (
+    THROTTLING_COOLDOWN,
+    ConcurrencyController,
+    is_throttling_response,
+)
+
+
+class TestConcurrency:
+    def test_is_throttling_response(self):
+        assert is_throttling_response(
+            (None, {"Error": {"Code": "ThrottlingException"}})
+        )
+        assert is_throttling_response(
+            (None, {"Error": {"Code": "TooManyRequestsException"}})
+        )
+        assert not is_throttling_response((None, {"Error": {"Code": "AccessDenied"}}))
+        assert not is_throttling_response((None, {"ResponseMetadata": {}}))
+        assert not is_throttling_response(None)
+
+    def test_try_acquire_up_to_the_limit(self):
+        controller = ConcurrencyController(Condition(), initial=2)
+
+        assert controller.try_acquire()
+        assert controller.try_acquire()
+        assert not controller.try_acquire()
+        assert controller.in_flight == 2
+
+    def test_release_increases_the_limit(self):
+        controller = ConcurrencyController(Condition(), initial=2, maximum=3)
+
+        for _ in range(4):
+            controller.try_acquire()
+            controller.release(0.5)
+
+        stats = controller.stats
+        assert stats["calls"] == 4
+        assert stats["average_latency"] == 0.5
+        assert stats["max_latency"] == 0.5
+        # The limit grows by one call after a window of calls and is kept within the maximum
+        assert stats["limit"] == 3
+        assert controller.in_flight == 0
+
+    def test_throttled_backs_off_once_per_burst(self):
+        controller = ConcurrencyController(
+            Condition(), initial=16, minimum=2, maximum=16
+        )
+
+        with patch(
+            "prowler.providers.aws.lib.service.concurrency.monotonic",
+            side_effect=[10.0, 10.5, 10.0 + THROTTLING_COOLDOWN + 1],
+        ):
+            controller.throttled()
+            assert controller.limit == 8
+            controller.throttled()
+            assert controller.limit == 8
+            controller.throttled()
+            assert controller.limit == 4
+
+        assert controller.stats["throttles"] == 3
+
+    def test_throttled_within_the_minimum(self):
+        controller = ConcurrencyController(Condition(), initial=1, minimum=1)
+
+        controller.throttled()
+
+        assert controller.limit == 1
@@ -1,3 +1,7 @@
+from dataclasses import dataclass
+from threading import Lock
+from unittest.mock import MagicMock
+
 from mock import patch
 
 from prowler.providers.aws.lib.service.service import AWSService
@@ -5,11 +9,18 @@ from tests.providers.aws.utils import (
     AWS_ACCOUNT_ARN,
     AWS_ACCOUNT_NUMBER,
     AWS_COMMERCIAL_PARTITION,
+    AWS_REGION_EU_WEST_1,
     AWS_REGION_US_EAST_1,
     set_mocked_aws_provider,
 )
 
 
+@dataclass
+class Resource:
+    name: str
+    region: str
+
+
 def mock_generate_regional_clients(provider, service):
     regional_client = provider._session.current_session.client(
         service, region_name=AWS_REGION_US_EAST_1
@@ -152,3 +163,76 @@ class TestAWSService:
             service.get_unknown_arn(region="eu-west-1", resource_type="bucket")
             == f"arn:aws:{service_name}:eu-west-1:{AWS_ACCOUNT_NUMBER}:bucket/unknown"
         )
+
+    def test_AWSService_concurrency_config(self):
+        provider = set_mocked_aws_provider(
+            audit_config={
+                "threading_min_workers": 2,
+                "threading_initial_workers": 4,
+                "threading_max_workers": 8,
+            }
+        )
+        service = AWSService("s3", provider)
+
+        controller = service.get_concurrency_controller(AWS_REGION_US_EAST_1)
+        assert controller.limit == 4
+        assert service.thread_pool._max_workers == 8
+        assert service.get_concurrency_controller() is controller
+
+    def test_AWSService_threading_call(self):
+        provider = set_mocked_aws_provider(
+            audit_config={"threading_initial_workers": 2, "threading_max_workers": 2}
+        )
+        service = AWSService("s3", provider)
+        lock = Lock()
+        in_flight = []
+        results = []
+
+        def _call(item):
+            with lock:
+                in_flight.append(
+                    service.get_concurrency_controller(item.region).in_flight
+                )
+            results.append(item.name)
+            if item.name == "error":
+                raise ValueError("error")
+
+        items = [
+            Resource(name=str(index), region=AWS_REGION_EU_WEST_1)
+            for index in range(10)
+        ] + [Resource(name="error", region=AWS_REGION_US_EAST_1)]
+        service.__threading_call__(_call, items)
+
+        assert sorted(results) == sorted(item.name for item in items)
+        assert max(in_flight) <= 2
+        stats = service.get_concurrency_stats()
+        assert stats[AWS_REGION_EU_WEST_1]["calls"] == 10
+        assert stats[AWS_REGION_US_EAST_1]["calls"] == 1
+        assert stats[AWS_REGION_EU_WEST_1]["throttles"] == 0
+
+    def test_AWSService_track_throttling_shared_client(self):
+        provider = set_mocked_aws_provider()
+        # Both services call the EC2 API with the same client
+        ec2_service = AWSService("ec2", provider)
+        vpc_service = AWSService("ec2", provider)
+        assert ec2_service.client is vpc_service.client
+
+        ec2_service.client.meta.events.emit(
+            "needs-retry.ec2.DescribeVpcs",
+            response=(
+                MagicMock(status_code=503),
+                {
+                    "Error": {"Code": "RequestLimitExceeded"},
+                    "ResponseMetadata": {"HTTPStatusCode": 503},
+                },
+            ),
+            attempts=1,
+            caught_exception=None,
+            request_dict={"context": {}},
+            operation=MagicMock(),
+        )
+
+        controller = ec2_service.get_concurrency_controller(AWS_REGION_US_EAST_1)
+        assert vpc_service.get_concurrency_controller() is controller
+        assert controller.stats["throttles"] == 1
+        assert controller.limit == 5
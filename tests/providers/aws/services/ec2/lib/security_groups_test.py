@@ -1,6 +1,8 @@
 import pytest
 
+from prowler.providers.aws.services.ec2.ec2_service import SecurityGroup
 from prowler.providers.aws.services.ec2.lib.security_groups import (
+    SecurityGroupExposure,
     _is_cidr_public,
     check_security_group,
 )
@@ -390,3 +392,120 @@ class Test_check_security_group:
             port, port, TRANSPORT_PROTOCOL_ALL, [], [IP_V6_ALL_CIDRS]
         )
         assert check_security_group(ingress_rule, TRANSPORT_PROTOCOL_ALL, None, True)
+
+
+def ingress_rule(
+    from_port: int,
+    to_port: int,
+    ip_protocol: str = TRANSPORT_PROTOCOL_TCP,
+    ipv4_ranges: list = [IP_V4_ALL_CIDRS],
+    ipv6_ranges: list = [],
+):
+    return {
+        "FromPort": from_port,
+        "ToPort": to_port,
+        "IpProtocol": ip_protocol,
+        "IpRanges": [{"CidrIp": cidr} for cidr in ipv4_ranges],
+        "Ipv6Ranges": [{"CidrIpv6": cidr} for cidr in ipv6_ranges],
+    }
+
+
+class Test_SecurityGroupExposure:
+    def test_no_ingress_rules(self):
+        exposure = SecurityGroupExposure([])
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_TCP, [22])
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_ALL)
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_ALL, None)
+
+    def test_port_ranges_merged(self):
+        exposure = SecurityGroupExposure(
+            [
+                ingress_rule(20, 22),
+                ingress_rule(23, 25),
+                ingress_rule(80, 80, ipv4_ranges=[], ipv6_ranges=[IP_V6_ALL_CIDRS]),
+                ingress_rule(3306, 3306, ipv4_ranges=[IP_V4_PRIVATE_CIDR]),
+                ingress_rule(53, 53, ip_protocol="udp"),
+            ]
+        )
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [20])
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [24])
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [443, 80])
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_TCP, [19, 26, 3306])
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_TCP, [53])
+        assert exposure.is_open("udp", [53])
+        assert not exposure.is_open(TRANSPORT_PROTOCOL_ALL)
+        assert exposure.is_open(TRANSPORT_PROTOCOL_ALL, None)
+
+    def test_all_traffic(self):
+        exposure = SecurityGroupExposure(
+            [
+                {
+                    "IpProtocol": TRANSPORT_PROTOCOL_ALL,
+                    "IpRanges": [],
+                    "Ipv6Ranges": [{"CidrIpv6": IP_V6_ALL_CIDRS}],
+                }
+            ]
+        )
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [22])
+        assert exposure.is_open(TRANSPORT_PROTOCOL_ALL)
+        assert exposure.is_open(TRANSPORT_PROTOCOL_ALL, None)
+
+    def test_all_ports_of_any_protocol(self):
+        exposure = SecurityGroupExposure([ingress_rule(0, 65535, ip_protocol="udp")])
+        assert exposure.is_open(TRANSPORT_PROTOCOL_TCP, [22])
+        assert exposure.is_open(TRANSPORT_PROTOCOL_ALL)
+
+    def test_same_as_check_security_group(self):
+        ingress_rules_list = [
+            [ingress_rule(22, 22)],
+            [ingress_rule(1000, 2000), ingress_rule(1500, 3000)],
+            [ingress_rule(0, 65535)],
+            [ingress_rule(-1, -1, ip_protocol="icmp")],
+            [ingress_rule(22, 22, ipv4_ranges=[IP_V4_PUBLIC_CIDR])],
+            [ingress_rule(22, 22, ip_protocol=TRANSPORT_PROTOCOL_ALL)],
+            [ingress_rule(30, 20), ingress_rule(15, 19)],
+        ]
+        queries = [
+            (TRANSPORT_PROTOCOL_TCP, [22]),
+            (TRANSPORT_PROTOCOL_TCP, [20, 2500]),
+            (TRANSPORT_PROTOCOL_TCP, [25]),
+            (TRANSPORT_PROTOCOL_ALL, []),
+            (TRANSPORT_PROTOCOL_ALL, None),
+            (TRANSPORT_PROTOCOL_ALL, [22]),
+        ]
+        for ingress_rules in ingress_rules_list:
+            exposure = SecurityGroupExposure(ingress_rules)
+            for protocol, ports in queries:
+                assert exposure.is_open(protocol, ports) == any(
+                    check_security_group(rule, protocol, ports, any_address=True)
+                    for rule in ingress_rules
+                ), (ingress_rules, protocol, ports)
+
+    def test_security_group_exposure_follows_ingress_rules(self):
+        security_group_data = {
+            "name": "sg",
+            "region": "eu-west-1",
+            "arn": "arn:aws:ec2:eu-west-1:123456789012:security-group/sg-1",
+            "id": "sg-1",
+            "vpc_id": "vpc-1",
+            "associated_sgs": [],
+            "ingress_rules": [ingress_rule(22, 22)],
+            "egress_rules": [],
+        }
+        for security_group in [
+            SecurityGroup(**security_group_data),
+            SecurityGroup.construct(**security_group_data),
+        ]:
+            assert security_group.exposure.is_open(TRANSPORT_PROTOCOL_TCP, [22])
+
+            security_group.ingress_rules = [ingress_rule(3389, 3389)]
+            assert not security_group.exposure.is_open(TRANSPORT_PROTOCOL_TCP, [22])
+            assert security_group.exposure.is_open(TRANSPORT_PROTOCOL_TCP, [3389])
+
+            security_group_copy = security_group.copy(
+                update={"ingress_rules": [ingress_rule(80, 80)]}
+            )
+            assert security_group_copy.exposure.is_open(TRANSPORT_PROTOCOL_TCP, [80])
+            assert not security_group_copy.exposure.is_open(
+                TRANSPORT_PROTOCOL_TCP, [3389]
+            )
@@ -85,6 +85,21 @@ class Test_IAM_Service:
         iam = IAM(aws_provider)
         assert iam.client.__class__.__name__ == "IAM"
 
+    # Test IAM Client Retries
+    @mock_aws
+    def test_get_client_adaptive_retries(self):
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        aws_provider._session.session_config = botocore.config.Config(
+            retries={"max_attempts": 7, "mode": "standard"},
+            user_agent_extra="test",
+        )
+        iam = IAM(aws_provider)
+        assert iam.client.meta.config.retries == {
+            "total_max_attempts": 8,
+            "mode": "adaptive",
+        }
+        assert iam.client.meta.config.user_agent_extra == "test"
+
     # Test IAM Session
     @mock_aws
     def test__get_session__(self):
@@ -859,6 +874,42 @@ nTTxU4a7x1naFxzYXK1iQ1vMARKMjDb19QEJIEJKZlDK4uS7yMlf1nFS
                     entity=user_name,
                 )
 
+    # Test IAM Inline Policies Order
+    @mock_aws
+    def test_list_inline_policies_order(self):
+        iam_client = client("iam")
+        user_names = [f"test_user_{index}" for index in range(5)]
+        for user_name in user_names:
+            iam_client.create_user(UserName=user_name)
+            iam_client.put_user_policy(
+                UserName=user_name,
+                PolicyName=f"{user_name}_inline_policy",
+                PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+            )
+        iam_client.create_group(GroupName="test_group")
+        iam_client.put_group_policy(
+            GroupName="test_group",
+            PolicyName="test_group_inline_policy",
+            PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+        )
+
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        iam = IAM(aws_provider)
+
+        # The inline policies follow the managed policies in the order of their entities
+        inline_policies = [
+            policy.name for policy in iam.policies if policy.type == "Inline"
+        ]
+        assert inline_policies == [
+            f"{user.name}_inline_policy" for user in iam.users
+        ] + ["test_group_inline_policy"]
+        assert iam.policies[-len(inline_policies) :] == [
+            policy for policy in iam.policies if policy.type == "Inline"
+        ]
+        for user in iam.users:
+            assert user.inline_policies == [f"{user.name}_inline_policy"]
+            assert iam.access_keys_metadata[(user.name, user.arn)] == []
+
     # Test IAM Group Inline Policy
     @mock_aws
     def test_list_inline_group_policies(self):
@@ -1023,3 +1074,49 @@ nTTxU4a7x1naFxzYXK1iQ1vMARKMjDb19QEJIEJKZlDK4uS7yMlf1nFS
         assert iam.entities_attached_to_cloudshell_policy["Users"] == [user_name]
         assert iam.entities_attached_to_cloudshell_policy["Groups"] == [group_name]
         assert iam.entities_attached_to_cloudshell_policy["Roles"] == [role_name]
+
+    # Test IAM List Organizations Features
+    @mock_aws
+    def test_list_organizations_features(self):
+        def mock_make_api_call_organizations_features(self, operation_name, kwargs):
+            if operation_name == "ListOrganizationsFeatures":
+                return {
+                    "OrganizationId": "o-test",
+                    "EnabledFeatures": ["RootSessions", "RootCredentialsManagement"],
+                }
+            return mock_make_api_call(self, operation_name, kwargs)
+
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        with patch(
+            "botocore.client.BaseClient._make_api_call",
+            new=mock_make_api_call_organizations_features,
+        ):
+            iam = IAM(aws_provider)
+        assert iam.organization_features == [
+            "RootSessions",
+            "RootCredentialsManagement",
+        ]
+
+    # Test IAM List Organizations Features from an account that is not the management account
+    @mock_aws
+    def test_list_organizations_features_not_management_account(self):
+        def mock_make_api_call_organizations_features(self, operation_name, kwargs):
+            if operation_name == "ListOrganizationsFeatures":
+                raise botocore.exceptions.ClientError(
+                    {
+                        "Error": {
+                            "Code": "AccountNotManagementOrDelegatedAdministratorException",
+                            "Message": "Not the management account",
+                        }
+                    },
+                    operation_name,
+                )
+            return mock_make_api_call(self, operation_name, kwargs)
+
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        with patch(
+            "botocore.client.BaseClient._make_api_call",
+            new=mock_make_api_call_organizations_features,
+        ):
+            iam = IAM(aws_provider)
+        assert iam.organization_features is None
@@ -1,6 +1,9 @@
 from prowler.providers.aws.services.iam.lib.policy import (
+    PolicyActions,
     check_admin_access,
     check_full_service_access,
+    get_policy_document,
+    index_actions_by_service,
     is_condition_block_restrictive,
     is_condition_block_restrictive_organization,
     is_condition_restricting_from_private_ip,
@@ -2073,3 +2076,61 @@ class Test_Policy:
             ],
         }
         assert check_admin_access(policy)
+
+    def test_get_policy_document_shared_by_equal_documents(self):
+        policy = {
+            "Version": "2012-10-17",
+            "Statement": [{"Effect": "Allow", "Action": "*", "Resource": "*"}],
+        }
+        same_policy = {
+            "Statement": [{"Resource": "*", "Action": "*", "Effect": "Allow"}],
+            "Version": "2012-10-17",
+        }
+
+        policy_document = get_policy_document(policy)
+
+        assert get_policy_document(same_policy) is policy_document
+        # The analysis owns a copy of the document
+        assert policy_document.policy == policy
+        assert policy_document.policy is not policy
+
+    def test_policy_document_get_verdict_computed_once(self):
+        calls = []
+
+        def verdict(policy, service):
+            calls.append(service)
+            return service in str(policy)
+
+        policy_document = get_policy_document(
+            {"Statement": [{"Effect": "Allow", "Action": "kms:*"}]}
+        )
+
+        assert policy_document.get_verdict(verdict, "kms")
+        assert policy_document.get_verdict(verdict, "kms")
+        assert not policy_document.get_verdict(verdict, "s3")
+        assert calls == ["kms", "s3"]
+
+    def test_policy_actions(self):
+        policy_actions = PolicyActions(
+            [
+                {"Effect": "Allow", "Action": ["iam:PassRole", "ec2:*"]},
+                {"Effect": "Deny", "Action": "ec2:RunInstances"},
+                {"Effect": "Deny", "NotAction": "s3:*"},
+            ]
+        )
+
+        assert policy_actions.allowed_actions == {"iam:PassRole", "ec2:*"}
+        assert policy_actions.denied_actions == {"ec2:RunInstances"}
+        assert policy_actions.allowed_not_actions == set()
+        assert policy_actions.denied_not_actions == {"s3:*"}
+
+    def test_policy_actions_only_not_action(self):
+        policy_actions = PolicyActions([{"Effect": "Allow", "NotAction": "s3:*"}])
+
+        assert policy_actions.allowed_actions == {"*"}
+
+    def test_index_actions_by_service(self):
+        assert index_actions_by_service({"iam:PassRole", "iam:*", "ec2:*", "*"}) == {
+            "iam": {"PassRole", "*"},
+            "ec2": {"*"},
+        }